@@ -20,6 +20,81 @@ class Settings(BaseSettings):
     brave_ai_api_key: str
     google_api_key: str
     
+    # --- Redis 커넥션 풀 (URL당 하나를 모든 핸들러가 공유) ---
+    redis_max_connections: int = 50          # 워커당 최대 연결 수
+    redis_pool_timeout_seconds: float = 5.0  # 연결이 모두 사용 중일 때 대기 시간
+    redis_health_check_interval: int = 30
+    redis_socket_keepalive: bool = True
+
+    # --- 임베딩 / 벡터 저장 형식 ---
+    embedding_model: str = "text-embedding-3-small"
+    # 임베딩 차원 (None이면 모델 기본 1536, text-embedding-3 계열은 512/256 등으로 축소 가능)
+    embedding_dimensions: int | None = None
+    # 벡터 저장 타입: FLOAT32 / FLOAT16 / BFLOAT16 (변경 시 python -m app.redis.vector_migration 실행)
+    vector_type: str = "FLOAT32"
+
+    # --- 벡터 백엔드 ---
+    # redis(RediSearch FT.*) / numpy(프로세스 내 인덱스, 단일 노드/로컬 개발용)
+    vector_backend: str = "redis"
+    numpy_index_dir: str | None = None     # numpy 백엔드 저장 디렉터리 (None이면 메모리에만 유지)
+    numpy_index_ann: bool = False          # numpy 백엔드 IVF 근사 검색 사용 여부
+    numpy_index_flush_interval_seconds: float = 5.0  # 단건 쓰기 변경분을 디스크에 기록하는 주기 (0이면 종료 시에만)
+
+    # --- Redis Vector Search ---
+    # 인덱스 존재/문서 수 상태를 FT.INFO로 다시 확인하는 주기 (초)
+    vector_index_state_refresh_seconds: float = 60.0
+    # 시작 시 Redis 전체 진단 방식: lazy(실행 안 함, 관리자 API로 요청 시 실행) / background / full(동기 실행)
+    redis_startup_diagnostics: str = "lazy"
+    # HNSW 구축 파라미터 (새로 만드는 인덱스에만 적용, python -m app.redis.hnsw_benchmark로 recall/지연 비교)
+    hnsw_m: int = 16
+    hnsw_ef_construction: int = 200
+    hnsw_initial_cap: int = 10000
+    # 쿼리별 검색 파라미터 기본값 (None이면 서버 기본값, EPSILON 지정 시 임계값 기반 범위 쿼리 사용)
+    hnsw_ef_runtime: int | None = None
+    hnsw_epsilon: float | None = None
+    # document_index 검색 결과 캐시 유효 시간 (초, 0이면 사용 안 함, 문서 추가/삭제 시 세대 카운터로 무효화)
+    vector_search_cache_ttl_seconds: float = 30.0
+    # 관리자 API(/admin/*) 토큰 (X-Admin-Token 헤더, None이면 관리자 API 사용 불가)
+    admin_api_token: str | None = None
+
+    # --- 스크래핑 브라우저 풀 (프로세스당 Chromium 하나, 컨텍스트 재사용) ---
+    browser_pool_max_concurrency: int = 4      # 동시에 사용할 수 있는 최대 브라우저 컨텍스트 수
+    browser_pool_context_max_uses: int = 20    # 컨텍스트 재사용 횟수 (넘으면 새로 만듦)
+    # 스크래핑 공유 HTTP 클라이언트 (Brave/Google 검색, 페이지 다운로드, keep-alive 연결 풀, h2 설치 시 HTTP/2)
+    scrap_http_max_concurrency: int = 16       # 전체 동시 요청 수 (연결 풀 크기)
+    scrap_http_max_per_host: int = 4           # 호스트별 동시 요청 수
+    scrap_brave_max_concurrency: int = 2       # Brave 검색 API 동시 요청 수 (요청 한도가 낮아 따로 제한)
+    scrap_http_timeout_seconds: float = 10.0   # 요청 기본 타임아웃 (초)
+    scrap_http_connect_timeout_seconds: float = 3.0   # 연결 타임아웃 (초)
+    # 스크랩 단계: 모을 문서 수(모이면 남은 스크랩 취소) / 동시에 스크랩할 URL 수
+    scrap_target_docs: int = 3
+    scrap_concurrency: int = 4
+    # True이면 URL마다 정적 추출/Google/브라우저를 모두 실행 (기본은 정적 추출 실패 시에만 다음 단계)
+    scrap_all_sources: bool = False
+
+    # --- 스크랩 문서 document_index 적재 (벡터 검색 MISS 시 수집한 문서를 청크로 저장) ---
+    document_ingestion_enabled: bool = True
+    document_chunk_size: int = 1000      # 청크 길이 (문자 수)
+    document_chunk_overlap: int = 200    # 인접 청크가 겹치는 길이 (문자 수)
+
+    # --- document_index 검색 사전 필터 (KNN 쿼리 안에서 적용, TAG 값이 없는 기존 문서는 조건이 있으면 제외) ---
+    document_filter_allowed_sites: bool = False          # brave_search_impl.ALLOWED_SITES 도메인 문서만
+    document_filter_languages: list[str] | None = None   # 허용 언어 (예: ["ko"])
+    document_filter_max_age_days: float | None = None    # 최근 N일 안에 수집된 문서만
+
+    # --- 시멘틱 캐시 용량 관리 ---
+    semantic_cache_ttl_seconds: int = 7 * 24 * 3600   # 항목 만료 시간 (0이면 만료 없음)
+    semantic_cache_max_entries: int = 10000           # 최대 항목 수 (0이면 제한 없음)
+    semantic_cache_eviction_policy: str = "lru"       # lru / lfu (검색 히트 기준)
+    semantic_cache_memory_budget_mb: float | None = None  # 인덱스+Hash 추정 메모리 상한
+    semantic_cache_sweep_interval_seconds: float = 60.0   # 스위퍼 실행 주기 (0이면 실행 안 함)
+
+    # --- 워커 내 L1 답변 캐시 (시멘틱 캐시 앞단, 핫 질문용) ---
+    local_answer_cache_enabled: bool = True
+    local_answer_cache_max_entries: int = 1000
+    local_answer_cache_max_mb: float = 32.0
+    local_answer_cache_ttl_seconds: float = 30.0   # 다른 워커 변경이 반영되는 최대 지연
+
     # --- 이메일 (선택) ---
     naver_email: str | None = None
     naver_password: str | None = None
@@ -0,0 +1,506 @@
+# cache_eviction.py
+"""
+시멘틱 캐시 용량 관리 (TTL, 최대 항목 수, LRU/LFU 축출, 메모리 예산)
+
+캐시 항목(doc:<index>:<uuid> Hash)마다 접근 점수를 sorted set에 기록한다.
+- lru: 마지막 히트 시각 (저장 시각으로 시작)
+- lfu: 히트 횟수 (저장 시 1로 시작)
+점수가 가장 낮은 항목부터 축출하며, Hash를 삭제하면 RediSearch 인덱스에서도 함께 제거된다.
+TTL은 Hash 키 자체의 EXPIRE로 처리하고, 만료된 키의 점수 항목은 스위퍼가 정리한다.
+스위퍼는 워커 간 잠금을 잡았을 때만 sweep한다 (워커마다 같은 초과분을 중복 축출하지 않도록).
+
+벡터 백엔드가 Redis 밖(numpy)에 있으면 항목이 Redis 키가 아니므로, 항목별 만료 시각과 정확 일치 키를
+별도 Hash(semantic_cache:<index>:entries)에 기록하고 존재 확인/삭제는 백엔드(has_documents/delete_document)로 한다.
+"""
+
+import json
+import math
+import threading
+import time
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import redis
+import redis.asyncio
+
+from app.redis.debug_utils import RedisIndexDebugger, parse_index_prefix
+from app.redis.vector_backend import VectorBackend
+from app.redis.vector_search import rebuild_deletes_key, rebuild_lock_key
+
+
+# 기본 정책 (config.py의 semantic_cache_* 설정으로 변경)
+DEFAULT_EVICTION_POLICY = "lru"
+DEFAULT_CACHE_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_SWEEP_INTERVAL = 60.0
+
+EVICTION_POLICIES = ("lru", "lfu")
+
+# 스위퍼가 한 번에 처리할 항목 수 / 메모리 추정 시 MEMORY USAGE로 샘플링할 항목 수
+SWEEP_BATCH_SIZE = 500
+MEMORY_SAMPLE_SIZE = 20
+
+# 워커 간 sweep 잠금 유지 시간 (초, 잠금을 쥔 워커가 죽어도 이 시간 뒤에는 다른 워커가 실행)
+SWEEP_LOCK_TIMEOUT = 30.0
+
+_MB = 1024 * 1024
+
+
+def _to_str(value) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+
+def access_key_for(index_name: str) -> str:
+    """캐시 항목 접근 점수 sorted set 키 (멤버는 항목 Hash 키)"""
+    return f"semantic_cache:{index_name}:access"
+
+
+class _EvictionPolicyBase:
+    """동기/비동기 축출 정책이 공유하는 키 이름과 점수 계산"""
+
+    def _init_common(self, index_name: str, policy: str, max_entries: int,
+                     ttl_seconds: int, memory_budget_mb: Optional[float], vector_backend):
+        if policy not in EVICTION_POLICIES:
+            raise ValueError(f"지원하지 않는 축출 정책: {policy} (가능: {', '.join(EVICTION_POLICIES)})")
+        self.index_name = index_name
+        self.policy = policy
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.memory_budget_mb = memory_budget_mb
+        # 접근 점수 sorted set / 축출 횟수 Hash (모든 워커가 공유)
+        self.access_key = access_key_for(index_name)
+        self.evictions_key = f"semantic_cache:{index_name}:evictions"
+        # 여러 워커가 동시에 sweep해 중복 축출하지 않도록 잡는 잠금 키
+        self.sweep_lock_key = f"semantic_cache:{index_name}:sweep_lock"
+        # Redis 밖 벡터 백엔드 (None이면 항목이 RediSearch Hash) / 그때 쓰는 항목별 만료 시각·정확 일치 키 Hash
+        self.vector_backend = vector_backend
+        self.entries_key = f"semantic_cache:{index_name}:entries"
+        # 덮어쓰기/축출된 키를 알리는 채널 (워커별 L1 캐시 무효화)
+        self.invalidation_channel = f"semantic_cache:{index_name}:invalidations"
+
+    def queue_invalidation(self, pipe, keys: List):
+        """L1 캐시 무효화 메시지 발행 명령을 파이프라인에 추가"""
+        if keys:
+            pipe.publish(self.invalidation_channel, json.dumps([_to_str(key) for key in keys]))
+
+    def queue_insert(self, pipe, key: str, exact_key: Optional[str] = None):
+        """저장 직후 TTL과 초기 점수 기록 명령을 파이프라인에 추가 (다른 쓰기와 한 번에 전송할 때 사용)"""
+        if self.vector_backend is not None:
+            # 항목이 Redis 키가 아니므로 EXPIRE 대신 만료 시각을 기록 (스위퍼가 백엔드에서 삭제)
+            expires_at = time.time() + self.ttl_seconds if self.ttl_seconds else None
+            pipe.hset(self.entries_key, key, json.dumps({"exact_key": exact_key, "expires_at": expires_at}))
+        elif self.ttl_seconds:
+            pipe.expire(key, self.ttl_seconds)
+        initial_score = time.time() if self.policy == "lru" else 1
+        pipe.zadd(self.access_key, {key: initial_score})
+
+    def _queue_hits(self, pipe, keys: Iterable[str]):
+        """히트한 항목의 점수 갱신 명령을 파이프라인에 추가 (이미 축출된 항목은 다시 추가하지 않음)"""
+        now = time.time()
+        for key in keys:
+            if self.policy == "lru":
+                pipe.zadd(self.access_key, {key: now}, xx=True)
+            else:
+                pipe.zadd(self.access_key, {key: 1}, xx=True, incr=True)
+
+    def _queue_hit_counts(self, pipe, hits: Dict[str, Tuple[int, float]]):
+        """모아 둔 히트(키 -> (횟수, 마지막 히트 시각))의 점수 갱신 명령을 파이프라인에 추가"""
+        for key, (count, last_hit) in hits.items():
+            if self.policy == "lru":
+                # 다른 워커가 더 최근 시각을 기록했으면 유지
+                pipe.zadd(self.access_key, {key: last_hit}, xx=True, gt=True)
+            else:
+                pipe.zadd(self.access_key, {key: count}, xx=True, incr=True)
+
+
+class CacheEvictionPolicy(_EvictionPolicyBase):
+    """시멘틱 캐시 축출 정책 (동기 Redis 클라이언트, 스위퍼와 통계 조회 포함)"""
+
+    def __init__(self,
+                 redis_client: redis.Redis,
+                 index_name: str,
+                 policy: str = DEFAULT_EVICTION_POLICY,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 ttl_seconds: int = DEFAULT_CACHE_TTL_SECONDS,
+                 memory_budget_mb: Optional[float] = None,
+                 vector_backend: Optional[VectorBackend] = None):
+        """
+        Args:
+            redis_client: Redis 클라이언트 (decode_responses=False)
+            index_name: 시멘틱 캐시 인덱스 이름
+            policy: 축출 정책 (lru: 가장 오래 전에 히트, lfu: 히트 횟수가 가장 적음)
+            max_entries: 최대 항목 수 (0이면 제한 없음)
+            ttl_seconds: 항목 만료 시간 (0이면 만료 없음)
+            memory_budget_mb: 인덱스+Hash 추정 메모리 상한 (None이면 제한 없음)
+            vector_backend: 캐시 항목을 저장하는 Redis 밖 벡터 백엔드 (None이면 RediSearch)
+        """
+        self._init_common(index_name, policy, max_entries, ttl_seconds, memory_budget_mb, vector_backend)
+        self.redis_client = redis_client
+        self.last_sweep: Optional[Dict[str, Any]] = None
+
+    def record_insert(self, key: str, exact_key: Optional[str] = None):
+        """새 캐시 항목의 TTL 설정 및 접근 점수 등록 (실패해도 저장 자체는 유지)"""
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            self.queue_insert(pipe, key, exact_key)
+            pipe.execute()
+        except Exception as e:
+            print(f"⚠️ [SemanticCache] 축출 정책 등록 오류: {e}")
+
+    def record_hits(self, keys: List[str]):
+        """검색에서 반환된 항목의 접근 점수 갱신"""
+        if not keys:
+            return
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            self._queue_hits(pipe, keys)
+            pipe.execute()
+        except Exception as e:
+            print(f"⚠️ [SemanticCache] 히트 기록 오류: {e}")
+
+    def record_hit_counts(self, hits: Dict[str, Tuple[int, float]]):
+        """워커 L1 캐시에서 모아 둔 히트를 접근 점수에 반영 (LocalAnswerCache.drain_hits 결과)"""
+        if not hits:
+            return
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            self._queue_hit_counts(pipe, hits)
+            pipe.execute()
+        except Exception as e:
+            print(f"⚠️ [SemanticCache] L1 히트 기록 오류: {e}")
+
+    def adopt_untracked(self) -> int:
+        """
+        점수가 없는 기존 항목(정책 도입 이전 저장분)을 등록하고 TTL이 없으면 설정
+
+        Returns:
+            int: 새로 등록한 항목 수
+        """
+        if self.vector_backend is not None:
+            # 백엔드 항목은 Redis에서 순회할 수 없음 (정책 도입 이후 저장분만 관리)
+            return 0
+        adopted = 0
+        batch = []
+        # 별칭 인덱스는 재구축 후 접두사가 바뀌므로 현재 물리 인덱스의 접두사로 순회
+        try:
+            info = RedisIndexDebugger(self.redis_client).get_index_info_or_none(self.index_name)
+        except redis.exceptions.RedisError:
+            info = None
+        key_prefix = (info and parse_index_prefix(info)) or f"doc:{self.index_name}:"
+        for key in self.redis_client.scan_iter(match=f"{key_prefix}*", count=SWEEP_BATCH_SIZE):
+            batch.append(key)
+            if len(batch) >= SWEEP_BATCH_SIZE:
+                adopted += self._adopt_batch(batch)
+                batch = []
+        if batch:
+            adopted += self._adopt_batch(batch)
+        if adopted:
+            print(f"🧹 [SemanticCache] 기존 항목 {adopted}개를 축출 정책에 등록")
+        return adopted
+
+    def _adopt_batch(self, keys: List[bytes]) -> int:
+        pipe = self.redis_client.pipeline(transaction=False)
+        initial_score = time.time() if self.policy == "lru" else 1
+        for key in keys:
+            pipe.zadd(self.access_key, {key: initial_score}, nx=True)
+            if self.ttl_seconds:
+                # TTL이 없는 키에만 설정 (Redis 7 EXPIRE NX)
+                pipe.expire(key, self.ttl_seconds, nx=True)
+        results = pipe.execute()
+        step = 2 if self.ttl_seconds else 1
+        return sum(int(added) for added in results[::step])
+
+    def _prune_expired(self) -> int:
+        """TTL로 만료된 키의 점수 항목 제거"""
+        pruned = 0
+        members = []
+        for member, _ in self.redis_client.zscan_iter(self.access_key, count=SWEEP_BATCH_SIZE):
+            members.append(member)
+            if len(members) >= SWEEP_BATCH_SIZE:
+                pruned += self._prune_batch(members)
+                members = []
+        if members:
+            pruned += self._prune_batch(members)
+        return pruned
+
+    def _prune_batch(self, members: List[bytes]) -> int:
+        if self.vector_backend is not None:
+            return self._prune_backend_batch(members)
+        pipe = self.redis_client.pipeline(transaction=False)
+        for member in members:
+            pipe.exists(member)
+        missing = [member for member, exists in zip(members, pipe.execute()) if not exists]
+        if missing:
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.zrem(self.access_key, *missing)
+            self.queue_invalidation(pipe, missing)
+            pipe.execute()
+        return len(missing)
+
+    def _prune_backend_batch(self, members: List[bytes]) -> int:
+        """백엔드에 없거나 만료 시각이 지난 항목 정리 (만료된 항목은 백엔드에서도 삭제)"""
+        entries = self._backend_entries(members)
+        exists = self.vector_backend.has_documents(self._backend_ids(members))
+        now = time.time()
+        stale = [
+            (member, entry) for member, entry, present in zip(members, entries, exists)
+            if not present or (entry.get("expires_at") and entry["expires_at"] <= now)
+        ]
+        if stale:
+            self._remove_backend_entries([member for member, _ in stale], [entry for _, entry in stale])
+        return len(stale)
+
+    def _backend_ids(self, members: List[bytes]) -> List[str]:
+        """캐시 항목 키(doc:<index>:<id>) -> 백엔드 문서 ID"""
+        prefix_length = len(self.vector_backend.doc_key(""))
+        return [_to_str(member)[prefix_length:] for member in members]
+
+    def _backend_entries(self, members: List[bytes]) -> List[Dict[str, Any]]:
+        """항목별 만료 시각/정확 일치 키 (기록이 없으면 빈 dict)"""
+        values = self.redis_client.hmget(self.entries_key, members)
+        return [json.loads(value) if value else {} for value in values]
+
+    def _remove_backend_entries(self, members: List[bytes], entries: List[Dict[str, Any]]) -> int:
+        """백엔드 문서와 정확 일치 키/점수/만료 기록 삭제 (실제로 삭제된 백엔드 문서 수 반환)"""
+        deleted = sum(1 for doc_id in self._backend_ids(members) if self.vector_backend.delete_document(doc_id))
+        exact_keys = [entry["exact_key"] for entry in entries if entry.get("exact_key")]
+        pipe = self.redis_client.pipeline(transaction=False)
+        if exact_keys:
+            pipe.delete(*exact_keys)
+        pipe.zrem(self.access_key, *members)
+        pipe.hdel(self.entries_key, *members)
+        self.queue_invalidation(pipe, list(members) + exact_keys)
+        pipe.execute()
+        return deleted
+
+    def _evict_lowest(self, count: int) -> int:
+        """점수가 가장 낮은 항목부터 count개 삭제 (실제로 삭제된 Hash/백엔드 문서 수 반환)"""
+        evicted = 0
+        while count > 0:
+            members = self.redis_client.zrange(self.access_key, 0, min(count, SWEEP_BATCH_SIZE) - 1)
+            if not members:
+                break
+            if self.vector_backend is not None:
+                evicted += self._remove_backend_entries(members, self._backend_entries(members))
+                count -= len(members)
+                continue
+            # 항목과 연결된 정확 일치 키도 함께 삭제
+            pipe = self.redis_client.pipeline(transaction=False)
+            for member in members:
+                pipe.hget(member, "exact_key")
+            exact_keys = [key for key in pipe.execute() if key]
+            pipe = self.redis_client.pipeline(transaction=False)
+            if exact_keys:
+                pipe.delete(*exact_keys)
+            pipe.delete(*members)
+            pipe.zrem(self.access_key, *members)
+            self.queue_invalidation(pipe, members + exact_keys)
+            pipe.exists(rebuild_lock_key(self.index_name))
+            results = pipe.execute()
+            deleted, rebuilding = results[-4], results[-1]
+            # 재구축 중이면 새 버전으로 복사된 항목도 지워지도록 기록
+            if rebuilding:
+                self.redis_client.sadd(rebuild_deletes_key(self.index_name), *members)
+            evicted += deleted
+            count -= len(members)
+        return evicted
+
+    def estimate_memory_mb(self, entries: Optional[int] = None) -> Optional[float]:
+        """
+        캐시 메모리 사용량 추정 (FT.INFO 벡터 인덱스 크기 + Hash 샘플 MEMORY USAGE 평균 x 항목 수)
+
+        Redis 밖 백엔드는 백엔드가 보고하는 벡터 메모리 (없으면 None)
+        """
+        if self.vector_backend is not None:
+            return self.vector_backend.get_index_info().get("vector_memory_mb")
+        try:
+            info = self.redis_client.ft(self.index_name).info()
+        except redis.exceptions.ResponseError:
+            return None
+        if entries is None:
+            entries = self.redis_client.zcard(self.access_key)
+        index_mb = sum(
+            float(info.get(name, 0) or 0)
+            for name in ("vector_index_sz_mb", "inverted_sz_mb", "doc_table_size_mb")
+        )
+        sample = self.redis_client.zrandmember(self.access_key, MEMORY_SAMPLE_SIZE) or []
+        # 샘플 MEMORY USAGE를 파이프라인 한 번으로 조회
+        pipe = self.redis_client.pipeline(transaction=False)
+        for member in sample:
+            pipe.memory_usage(member)
+        usages = [usage for usage in (pipe.execute() if sample else []) if usage]
+        hash_mb = (sum(usages) / len(usages)) * entries / _MB if usages else 0.0
+        return index_mb + hash_mb
+
+    def sweep(self) -> Dict[str, Any]:
+        """
+        만료 항목 정리 후 최대 항목 수와 메모리 예산을 넘는 만큼 점수가 낮은 항목 축출
+
+        Returns:
+            Dict: 이번 실행에서 정리/축출한 항목 수와 현재 크기
+        """
+        started = time.perf_counter()
+        result = {"expired": 0, "evicted_size": 0, "evicted_memory": 0}
+
+        result["expired"] = self._prune_expired()
+
+        entries = self.redis_client.zcard(self.access_key)
+        if self.max_entries and entries > self.max_entries:
+            result["evicted_size"] = self._evict_lowest(entries - self.max_entries)
+            entries = self.redis_client.zcard(self.access_key)
+
+        memory_mb = None
+        if self.memory_budget_mb:
+            memory_mb = self.estimate_memory_mb(entries)
+            if memory_mb is not None and memory_mb > self.memory_budget_mb and entries:
+                per_entry_mb = memory_mb / entries
+                excess = math.ceil((memory_mb - self.memory_budget_mb) / per_entry_mb)
+                result["evicted_memory"] = self._evict_lowest(excess)
+                entries = self.redis_client.zcard(self.access_key)
+                memory_mb = self.estimate_memory_mb(entries)
+
+        # 누적 축출 횟수 (워커 간 공유)
+        counts = {name: count for name, count in result.items() if count}
+        if counts:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for name, count in counts.items():
+                pipe.hincrby(self.evictions_key, name, count)
+            pipe.execute()
+            print(f"🧹 [SemanticCache] 정리 완료: {counts} (현재 {entries}개)")
+
+        result["entries"] = entries
+        result["estimated_memory_mb"] = memory_mb
+        result["elapsed"] = time.perf_counter() - started
+        result["finished_at"] = time.time()
+        self.last_sweep = result
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """현재 크기, 누적 축출 횟수, 정책 설정"""
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.zcard(self.access_key)
+        pipe.hgetall(self.evictions_key)
+        entries, evictions = pipe.execute()
+        return {
+            "index": self.index_name,
+            "policy": self.policy,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "memory_budget_mb": self.memory_budget_mb,
+            "vector_backend": "redis" if self.vector_backend is None else type(self.vector_backend).__name__,
+            "evictions": {_to_str(name): int(count) for name, count in evictions.items()},
+            "last_sweep": self.last_sweep,
+        }
+
+
+class AsyncCacheEvictionPolicy(_EvictionPolicyBase):
+    """redis.asyncio 기반 축출 정책 (저장/히트 기록만 담당, 스위퍼는 동기 정책이 실행)"""
+
+    def __init__(self,
+                 redis_client: redis.asyncio.Redis,
+                 index_name: str,
+                 policy: str = DEFAULT_EVICTION_POLICY,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 ttl_seconds: int = DEFAULT_CACHE_TTL_SECONDS,
+                 memory_budget_mb: Optional[float] = None,
+                 vector_backend: Optional[VectorBackend] = None):
+        # vector_backend는 저장 시 기록 방식(EXPIRE / 만료 시각 Hash) 결정에만 사용 (삭제는 동기 정책의 스위퍼)
+        self._init_common(index_name, policy, max_entries, ttl_seconds, memory_budget_mb, vector_backend)
+        self.redis_client = redis_client
+
+    async def record_insert(self, key: str, exact_key: Optional[str] = None):
+        """새 캐시 항목의 TTL 설정 및 접근 점수 등록"""
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            self.queue_insert(pipe, key, exact_key)
+            await pipe.execute()
+        except Exception as e:
+            print(f"⚠️ [SemanticCache] 축출 정책 등록 오류: {e}")
+
+    async def record_hits(self, keys: List[str]):
+        """검색에서 반환된 항목의 접근 점수 갱신"""
+        if not keys:
+            return
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            self._queue_hits(pipe, keys)
+            await pipe.execute()
+        except Exception as e:
+            print(f"⚠️ [SemanticCache] 히트 기록 오류: {e}")
+
+
+class CacheSweeper:
+    """축출 정책의 sweep을 주기적으로 실행하는 백그라운드 스레드 (실행 전 L1 히트를 접근 점수에 반영)"""
+
+    def __init__(self, policy: CacheEvictionPolicy, interval: float = DEFAULT_SWEEP_INTERVAL,
+                 local_cache=None):
+        """
+        Args:
+            policy: 축출 정책
+            interval: 실행 주기 (초, 0이면 실행하지 않음)
+            local_cache: 히트를 모아 둔 워커 L1 캐시 (LocalAnswerCache, 없으면 None)
+        """
+        self.policy = policy
+        self.interval = interval
+        self.local_cache = local_cache
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread is not None or not self.interval:
+            return
+        self._thread = threading.Thread(target=self._run, name="semantic-cache-sweeper", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        # 마지막 주기 이후의 L1 히트 반영
+        self.flush_local_hits()
+
+    def flush_local_hits(self):
+        """L1 캐시에서 모아 둔 히트를 접근 점수에 반영"""
+        if self.local_cache is not None:
+            self.policy.record_hit_counts(self.local_cache.drain_hits())
+
+    def _run(self):
+        try:
+            self.policy.adopt_untracked()
+        except Exception as e:
+            print(f"⚠️ [SemanticCache] 기존 항목 등록 오류: {e}")
+        while not self._stop.wait(self.interval):
+            try:
+                # 축출 순위가 L1 히트까지 반영하도록 sweep 전에 기록
+                self.flush_local_hits()
+                self.sweep_once()
+            except Exception as e:
+                print(f"⚠️ [SemanticCache] 스위퍼 오류: {e}")
+
+    def sweep_once(self) -> Optional[Dict[str, Any]]:
+        """
+        워커 간 잠금(SET NX PX)을 잡은 경우에만 sweep 실행
+
+        Returns:
+            Optional[Dict]: sweep 결과 (다른 워커가 실행 중이라 건너뛰면 None)
+        """
+        redis_client = self.policy.redis_client
+        lock_key = self.policy.sweep_lock_key
+        token = uuid.uuid4().hex
+        if not redis_client.set(lock_key, token, nx=True, px=int(SWEEP_LOCK_TIMEOUT * 1000)):
+            return None
+        try:
+            return self.policy.sweep()
+        finally:
+            # 잠금이 만료되어 다른 워커가 잡았으면 지우지 않음
+            with redis_client.pipeline() as pipe:
+                try:
+                    pipe.watch(lock_key)
+                    if _to_str(pipe.get(lock_key) or b"") == token:
+                        pipe.multi()
+                        pipe.delete(lock_key)
+                        pipe.execute()
+                except redis.exceptions.WatchError:
+                    pass
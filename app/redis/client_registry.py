@@ -0,0 +1,231 @@
+# client_registry.py
+"""
+프로세스 단위 Redis 클라이언트 레지스트리
+
+같은 URL에 대해 동기/비동기 클라이언트를 하나씩만 만들어 모든 핸들러가 커넥션 풀을 공유한다.
+풀은 최대 연결 수가 제한된 BlockingConnectionPool이며, 연결 대기/고갈 횟수 등
+사용 현황을 get_pool_stats()로 확인할 수 있다.
+"""
+
+import re
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import redis
+import redis.asyncio
+
+
+# 풀 기본 설정 (configure_redis_pools로 변경 가능)
+DEFAULT_MAX_CONNECTIONS = 50
+DEFAULT_POOL_TIMEOUT = 5.0
+DEFAULT_HEALTH_CHECK_INTERVAL = 30
+DEFAULT_SOCKET_KEEPALIVE = True
+
+_pool_options: Dict[str, Any] = {
+    "max_connections": DEFAULT_MAX_CONNECTIONS,
+    "timeout": DEFAULT_POOL_TIMEOUT,
+    "health_check_interval": DEFAULT_HEALTH_CHECK_INTERVAL,
+    "socket_keepalive": DEFAULT_SOCKET_KEEPALIVE,
+}
+
+_sync_clients: Dict[str, redis.Redis] = {}
+_async_clients: Dict[str, redis.asyncio.Redis] = {}
+_registry_lock = threading.Lock()
+
+
+class PoolStats:
+    """커넥션 풀 사용 현황 (획득/반납/대기/고갈 횟수)"""
+
+    def __init__(self, max_connections: int):
+        self.max_connections = max_connections
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.acquired = 0
+        self.exhausted = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self._checked_out = set()
+        self._lock = threading.Lock()
+
+    def record_acquire(self, connection, wait_seconds: float):
+        with self._lock:
+            self._checked_out.add(id(connection))
+            self.in_use += 1
+            self.acquired += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+            self.total_wait_seconds += wait_seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    def record_release(self, connection):
+        # 풀 내부에서 연결 실패로 반납되는 경우는 획득으로 집계되지 않았으므로 제외
+        with self._lock:
+            if id(connection) in self._checked_out:
+                self._checked_out.discard(id(connection))
+                self.in_use -= 1
+
+    def record_exhausted(self, wait_seconds: float):
+        with self._lock:
+            self.exhausted += 1
+            self.total_wait_seconds += wait_seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_connections": self.max_connections,
+                "in_use": self.in_use,
+                "peak_in_use": self.peak_in_use,
+                "utilization": self.in_use / self.max_connections if self.max_connections else 0.0,
+                "acquired": self.acquired,
+                "exhausted": self.exhausted,
+                "avg_wait_ms": (self.total_wait_seconds / self.acquired * 1000) if self.acquired else 0.0,
+                "max_wait_ms": self.max_wait_seconds * 1000,
+            }
+
+
+def _is_pool_exhausted(error: Exception) -> bool:
+    """BlockingConnectionPool 대기 시간 초과 여부 (일반 연결 오류와 구분)"""
+    return "no connection available" in str(error).lower()
+
+
+class InstrumentedBlockingConnectionPool(redis.BlockingConnectionPool):
+    """사용 현황을 기록하는 동기 BlockingConnectionPool"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats(self.max_connections)
+
+    def get_connection(self, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            connection = super().get_connection(*args, **kwargs)
+        except redis.exceptions.ConnectionError as e:
+            if _is_pool_exhausted(e):
+                self.stats.record_exhausted(time.perf_counter() - started)
+                print(f"⚠️ Redis 커넥션 풀 고갈: {self.max_connections}개 모두 사용 중 ({self.timeout}초 대기 후 실패)")
+            raise
+        self.stats.record_acquire(connection, time.perf_counter() - started)
+        return connection
+
+    def release(self, connection):
+        super().release(connection)
+        self.stats.record_release(connection)
+
+
+class AsyncInstrumentedBlockingConnectionPool(redis.asyncio.BlockingConnectionPool):
+    """사용 현황을 기록하는 비동기 BlockingConnectionPool"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats(self.max_connections)
+
+    async def get_connection(self, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            connection = await super().get_connection(*args, **kwargs)
+        except redis.exceptions.ConnectionError as e:
+            if _is_pool_exhausted(e):
+                self.stats.record_exhausted(time.perf_counter() - started)
+                print(f"⚠️ Redis 비동기 커넥션 풀 고갈: {self.max_connections}개 모두 사용 중 ({self.timeout}초 대기 후 실패)")
+            raise
+        self.stats.record_acquire(connection, time.perf_counter() - started)
+        return connection
+
+    async def release(self, connection):
+        await super().release(connection)
+        self.stats.record_release(connection)
+
+
+def configure_redis_pools(max_connections: Optional[int] = None,
+                          timeout: Optional[float] = None,
+                          health_check_interval: Optional[int] = None,
+                          socket_keepalive: Optional[bool] = None):
+    """
+    이후 생성되는 커넥션 풀의 설정 변경 (이미 생성된 풀에는 적용되지 않음)
+
+    Args:
+        max_connections: 풀당 최대 연결 수 (워커당 Redis 연결 수 상한)
+        timeout: 연결이 모두 사용 중일 때 대기할 최대 시간 (초)
+        health_check_interval: 유휴 연결 상태 확인 주기 (초)
+        socket_keepalive: TCP keepalive 사용 여부
+    """
+    updates = {
+        "max_connections": max_connections,
+        "timeout": timeout,
+        "health_check_interval": health_check_interval,
+        "socket_keepalive": socket_keepalive,
+    }
+    with _registry_lock:
+        _pool_options.update({key: value for key, value in updates.items() if value is not None})
+
+
+def get_redis_client(redis_url: str) -> redis.Redis:
+    """
+    URL별로 공유되는 동기 Redis 클라이언트 조회 (decode_responses=False 고정)
+    """
+    client = _sync_clients.get(redis_url)
+    if client is not None:
+        return client
+    with _registry_lock:
+        client = _sync_clients.get(redis_url)
+        if client is None:
+            pool = InstrumentedBlockingConnectionPool.from_url(
+                redis_url, decode_responses=False, **_pool_options
+            )
+            client = redis.Redis(connection_pool=pool)
+            _sync_clients[redis_url] = client
+    return client
+
+
+def get_async_redis_client(redis_url: str) -> redis.asyncio.Redis:
+    """
+    URL별로 공유되는 redis.asyncio 클라이언트 조회 (decode_responses=False 고정)
+    """
+    client = _async_clients.get(redis_url)
+    if client is not None:
+        return client
+    with _registry_lock:
+        client = _async_clients.get(redis_url)
+        if client is None:
+            pool = AsyncInstrumentedBlockingConnectionPool.from_url(
+                redis_url, decode_responses=False, **_pool_options
+            )
+            client = redis.asyncio.Redis(connection_pool=pool)
+            _async_clients[redis_url] = client
+    return client
+
+
+def _mask_url(redis_url: str) -> str:
+    """통계 출력용 URL (비밀번호 제거)"""
+    return re.sub(r"//[^@/]*@", "//***@", redis_url)
+
+
+def get_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """URL별 동기/비동기 커넥션 풀 사용 현황"""
+    stats: Dict[str, Dict[str, Any]] = {}
+    for kind, clients in (("sync", _sync_clients), ("async", _async_clients)):
+        for redis_url, client in list(clients.items()):
+            pool_stats = getattr(client.connection_pool, "stats", None)
+            if pool_stats is not None:
+                stats.setdefault(_mask_url(redis_url), {})[kind] = pool_stats.to_dict()
+    return stats
+
+
+def close_redis_clients():
+    """공유 동기 Redis 클라이언트와 커넥션 풀 정리"""
+    with _registry_lock:
+        clients = list(_sync_clients.values())
+        _sync_clients.clear()
+    for client in clients:
+        client.connection_pool.disconnect()
+
+
+async def close_async_redis_clients():
+    """공유 비동기 Redis 클라이언트와 커넥션 풀 정리 (애플리케이션 종료 시 호출)"""
+    with _registry_lock:
+        clients = list(_async_clients.values())
+        _async_clients.clear()
+    for client in clients:
+        await client.aclose()
+        await client.connection_pool.disconnect()
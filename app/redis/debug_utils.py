@@ -4,7 +4,93 @@ Redis 인덱스 상태 확인을 위한 디버깅 유틸리티
 """
 
 import redis
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+
+
+def parse_num_docs(info) -> int:
+    """FT.INFO 응답(dict 또는 리스트)에서 num_docs 추출"""
+    if isinstance(info, dict):
+        doc_count = info.get('num_docs', 0)
+    else:
+        # info가 리스트인 경우 파싱
+        doc_count = 0
+        for i, item in enumerate(info):
+            if item == 'num_docs' and i + 1 < len(info):
+                doc_count = info[i + 1]
+                break
+    return int(doc_count)
+
+
+def _decode(value):
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def _flatten(items):
+    for item in items:
+        if isinstance(item, (list, tuple)):
+            yield from _flatten(item)
+        else:
+            yield _decode(item)
+
+
+def _attribute_pairs(attribute) -> Dict[str, Any]:
+    flat = list(_flatten(attribute))
+    return {str(k).lower(): v for k, v in zip(flat[::2], flat[1::2])}
+
+
+def parse_field_names(info) -> set:
+    """FT.INFO 응답의 attributes에서 필드 이름(attribute 별칭 우선) 집합 추출"""
+    attributes = info.get("attributes", []) if isinstance(info, dict) else []
+    names = set()
+    for attribute in attributes:
+        pairs = _attribute_pairs(attribute)
+        name = pairs.get("attribute") or pairs.get("identifier")
+        if name is not None:
+            names.add(str(name))
+    return names
+
+
+def parse_index_name(info) -> Optional[str]:
+    """FT.INFO 응답의 실제 인덱스 이름 (별칭으로 조회했으면 별칭이 가리키는 물리 인덱스)"""
+    name = info.get("index_name") if isinstance(info, dict) else None
+    return str(_decode(name)) if name is not None else None
+
+
+def parse_index_prefix(info) -> Optional[str]:
+    """FT.INFO 응답의 index_definition에서 첫 번째 키 접두사 추출 (없으면 None)"""
+    definition = info.get("index_definition", []) if isinstance(info, dict) else []
+    flat = list(_flatten(definition))
+    for i, value in enumerate(flat[:-1]):
+        if str(value).lower() == "prefixes":
+            return str(flat[i + 1])
+    return None
+
+
+def parse_vector_field_spec(info, field_name: str) -> Dict[str, Any]:
+    """
+    FT.INFO 응답의 attributes에서 벡터 필드의 TYPE/DIM 추출
+
+    RediSearch 버전마다 속성 목록의 중첩 형태가 달라 평탄화한 뒤 키-값 쌍으로 찾는다.
+
+    Returns:
+        Dict: {"type": "FLOAT32", "dim": 1536} (찾지 못한 항목은 없음)
+    """
+    attributes = info.get("attributes", []) if isinstance(info, dict) else []
+    for attribute in attributes:
+        flat = list(_flatten(attribute))
+        pairs = _attribute_pairs(attribute)
+        if pairs.get("identifier") != field_name and pairs.get("attribute") != field_name:
+            continue
+        spec = {}
+        # 버전에 따라 data_type 또는 짝이 어긋난 목록으로 올 수 있어 위치 기반으로도 확인
+        for i, value in enumerate(flat[:-1]):
+            key = str(value).lower()
+            if key in ("data_type", "type") and str(flat[i + 1]).upper() in ("FLOAT32", "FLOAT16", "BFLOAT16", "FLOAT64"):
+                spec["type"] = str(flat[i + 1]).upper()
+            elif key == "dim":
+                spec["dim"] = int(flat[i + 1])
+        return spec
+    return {}
 
 
 class RedisIndexDebugger:
@@ -77,28 +163,47 @@ class RedisIndexDebugger:
         """인덱스 내 문서 개수 확인 (출력 없이)"""
         try:
             info = self.redis_client.ft(index_name).info()
-            if isinstance(info, dict):
-                doc_count = info.get('num_docs', 0)
-            else:
-                # info가 리스트인 경우 파싱
-                doc_count = 0
-                for i, item in enumerate(info):
-                    if item == 'num_docs' and i + 1 < len(info):
-                        doc_count = info[i + 1]
-                        break
-            
-            return int(doc_count)
+            return parse_num_docs(info)
         except Exception as e:
             return 0
     
-    def check_redis_keys_by_pattern(self, pattern: str) -> List[str]:
-        """패턴으로 Redis 키 확인 (출력 없이)"""
+    def get_index_info_or_none(self, index_name: str) -> Optional[Dict[str, Any]]:
+        """FT.INFO 조회 (출력 없이, 인덱스가 없으면 None)"""
         try:
-            keys = self.redis_client.keys(pattern)
-            key_list = [key.decode('utf-8') if isinstance(key, bytes) else str(key) for key in keys]
-            return key_list
+            return self.redis_client.ft(index_name).info()
+        except redis.exceptions.ResponseError as e:
+            if "no such index" in str(e).lower():
+                return None
+            raise
+
+    def get_index_state(self, index_name: str) -> Tuple[bool, int]:
+        """
+        FT.INFO 한 번으로 인덱스 존재 여부와 문서 개수를 함께 조회 (출력 없이)
+
+        Returns:
+            Tuple[bool, int]: (존재 여부, 문서 개수)
+        """
+        info = self.get_index_info_or_none(index_name)
+        if info is None:
+            return False, 0
+        return True, parse_num_docs(info)
+
+    def check_redis_keys_by_pattern(self, pattern: str, count: int = 1000) -> List[str]:
+        """패턴으로 Redis 키 확인 (출력 없이, KEYS 대신 SCAN 사용)"""
+        try:
+            return [
+                key.decode('utf-8') if isinstance(key, bytes) else str(key)
+                for key in self.redis_client.scan_iter(match=pattern, count=count)
+            ]
         except Exception as e:
             return []
+
+    def count_keys_by_pattern(self, pattern: str, count: int = 1000) -> int:
+        """패턴에 맞는 Redis 키 개수 (SCAN으로 세기만 하고 목록은 만들지 않음)"""
+        try:
+            return sum(1 for _ in self.redis_client.scan_iter(match=pattern, count=count))
+        except Exception as e:
+            return 0
     
     def full_diagnosis(self, index_names: List[str] = None) -> Dict[str, Any]:
         """전체 진단 실행 (간단 버전)"""
@@ -138,10 +243,10 @@ class RedisIndexDebugger:
                 # 문서 개수 확인
                 index_status["doc_count"] = self.count_documents_in_index(index_name)
             
-            # 관련 키 패턴 확인
-            key_pattern = f"doc:{index_name}:*"
-            related_keys = self.check_redis_keys_by_pattern(key_pattern)
-            index_status["related_keys_count"] = len(related_keys)
+            # 관련 키 패턴 확인 (별칭이면 현재 물리 인덱스의 접두사)
+            key_prefix = parse_index_prefix(index_status["info"]) or f"doc:{index_name}:"
+            key_pattern = f"{key_prefix}*"
+            index_status["related_keys_count"] = self.count_keys_by_pattern(key_pattern)
             
             diagnosis["target_indices_status"][index_name] = index_status
         
@@ -0,0 +1,186 @@
+# document_ingestion.py
+"""
+MCP로 수집한 웹 문서를 document_index에 적재하는 단계
+
+벡터 검색이 빗나가 웹 검색/스크래핑으로 가져온 문서를 한 번 쓰고 버리지 않고,
+겹치는 청크로 나누어 일괄 임베딩한 뒤 저장한다. 이후 관련 질문은 웹 I/O 없이 벡터 검색으로 처리된다.
+- 청크: chunk_size자 창을 chunk_overlap자씩 겹쳐 이동 (문장/단어 경계에서 자름)
+- 중복 제거: 정규화한 청크 내용의 SHA-256을 문서 ID로 사용하고, 이미 있는 청크는 임베딩하지 않음
+- 메타데이터: source_url, timestamp(수집 시각), content_hash, chunk_index, type="scraped"
+"""
+
+import hashlib
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+# 청크 기본값 (문자 수, 한국어 1000자는 대략 임베딩 토큰 500~1000개)
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_CHUNK_OVERLAP = 200
+# 이보다 짧은 꼬리 청크는 버림 (문서 전체가 짧은 경우는 제외)
+MIN_CHUNK_CHARS = 50
+
+# 스크랩 청크 문서 ID 접두사 (doc:<index>:scrap:<hash>)
+SCRAP_DOC_PREFIX = "scrap"
+
+_WHITESPACE = re.compile(r"\s+")
+# 청크를 자를 위치 우선순위: 문장 끝 → 단어 경계
+_SENTENCE_ENDS = (". ", "? ", "! ", "。", "\n")
+
+
+def chunk_text(text: str,
+               chunk_size: int = DEFAULT_CHUNK_SIZE,
+               chunk_overlap: int = DEFAULT_CHUNK_OVERLAP) -> List[str]:
+    """
+    텍스트를 chunk_overlap자씩 겹치는 chunk_size자 이하 청크로 분할
+
+    창의 뒤쪽 절반 안에 문장 끝이 있으면 그 뒤에서, 없으면 마지막 공백에서 자른다.
+    """
+    if chunk_overlap >= chunk_size:
+        raise ValueError(f"chunk_overlap({chunk_overlap})은 chunk_size({chunk_size})보다 작아야 합니다.")
+    text = text.strip()
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = min(start + chunk_size, len(text))
+        if end < len(text):
+            end = _find_cut(text, start + chunk_size // 2, end)
+        chunk = _WHITESPACE.sub(" ", text[start:end]).strip()
+        if chunk and (len(chunk) >= MIN_CHUNK_CHARS or not chunks):
+            chunks.append(chunk)
+        if end >= len(text):
+            break
+        # 다음 청크는 chunk_overlap자 앞에서, 단어 중간이면 다음 단어부터 시작
+        next_start = max(end - chunk_overlap, start + 1)
+        space = text.find(" ", next_start, end)
+        start = space + 1 if space != -1 else next_start
+    return chunks
+
+
+def _find_cut(text: str, lower: int, upper: int) -> int:
+    """[lower, upper) 안에서 문장 끝, 없으면 공백 바로 뒤 위치 (둘 다 없으면 upper)"""
+    for separators in (_SENTENCE_ENDS, (" ",)):
+        cut = -1
+        for separator in separators:
+            position = text.rfind(separator, lower, upper)
+            if position != -1:
+                cut = max(cut, position + len(separator))
+        if cut > lower:
+            return cut
+    return upper
+
+
+def content_hash(text: str) -> str:
+    """공백을 정규화한 청크 내용의 SHA-256 (같은 내용이면 출처가 달라도 같은 값)"""
+    return hashlib.sha256(_WHITESPACE.sub(" ", text).strip().encode("utf-8")).hexdigest()
+
+
+def build_chunk_items(docs: Iterable[Dict[str, Any]],
+                      chunk_size: int = DEFAULT_CHUNK_SIZE,
+                      chunk_overlap: int = DEFAULT_CHUNK_OVERLAP) -> List[Tuple[str, str, dict]]:
+    """
+    스크랩 문서 목록을 (문서 ID, 청크 텍스트, 메타데이터) 목록으로 변환 (같은 내용의 청크는 하나만)
+
+    Args:
+        docs: search_scrap 결과 ({"url", "content", "full_content"(선택), "fetched_at"(선택)})
+    """
+    items: Dict[str, Tuple[str, str, dict]] = {}
+    for doc in docs:
+        text = doc.get("full_content") or doc.get("content") or ""
+        fetched_at = doc.get("fetched_at") or time.time()
+        for chunk_index, chunk in enumerate(chunk_text(text, chunk_size, chunk_overlap)):
+            digest = content_hash(chunk)
+            doc_id = f"{SCRAP_DOC_PREFIX}:{digest}"
+            if doc_id in items:
+                continue
+            items[doc_id] = (doc_id, chunk, {
+                "source_url": doc.get("url", ""),
+                "timestamp": fetched_at,
+                "content_hash": digest,
+                "chunk_index": chunk_index,
+                "type": "scraped",
+            })
+    return list(items.values())
+
+
+class DocumentIngestor:
+    """
+    스크랩 문서를 청크 단위로 document_index에 적재 (중복 청크는 임베딩/저장 생략)
+
+    handler는 RedisVectorSearchHandler (save_embeddings_bulk와 vector_index.has_documents 사용).
+    submit()은 답변 응답을 늦추지 않도록 단일 백그라운드 스레드에서 순서대로 적재한다.
+    """
+
+    def __init__(self, handler,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 chunk_overlap: int = DEFAULT_CHUNK_OVERLAP):
+        self.handler = handler
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._counters = {"documents": 0, "chunks": 0, "duplicates": 0, "stored": 0, "failed": 0}
+
+    def ingest(self, docs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        문서를 청크로 나누고 새 청크만 일괄 임베딩하여 저장
+
+        Returns:
+            Dict: documents/chunks/duplicates/stored/failed/elapsed
+        """
+        started = time.perf_counter()
+        items = build_chunk_items(docs, self.chunk_size, self.chunk_overlap)
+        exists = self.handler.vector_index.has_documents([doc_id for doc_id, _, _ in items])
+        new_items = [item for item, found in zip(items, exists) if not found]
+
+        stored, failed = 0, 0
+        if new_items:
+            bulk_report = self.handler.save_embeddings_bulk(new_items)
+            stored, failed = bulk_report["succeeded"], len(bulk_report["failed"])
+
+        report = {
+            "documents": len(docs),
+            "chunks": len(items),
+            "duplicates": len(items) - len(new_items),
+            "stored": stored,
+            "failed": failed,
+        }
+        with self._lock:
+            for name, value in report.items():
+                self._counters[name] += value
+        report["elapsed"] = time.perf_counter() - started
+        print(f"📥 문서 적재 완료: 문서 {report['documents']}개 → 청크 {report['chunks']}개 "
+              f"(중복 {report['duplicates']}개, 저장 {stored}개, 실패 {failed}개, {report['elapsed']:.2f}초)")
+        return report
+
+    def submit(self, docs: List[Dict[str, Any]]) -> Optional[Future]:
+        """백그라운드 적재 예약 (문서가 없으면 None)"""
+        if not docs:
+            return None
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="document-ingestion")
+            executor = self._executor
+        future = executor.submit(self.ingest, docs)
+        future.add_done_callback(_log_failure)
+        return future
+
+    def close(self, wait: bool = True):
+        """백그라운드 스레드 종료 (wait=True이면 예약된 적재를 마칠 때까지 대기)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def stats(self) -> Dict[str, int]:
+        """누적 적재 통계 (워커 단위)"""
+        with self._lock:
+            return dict(self._counters)
+
+
+def _log_failure(future: Future):
+    if not future.cancelled() and future.exception() is not None:
+        print(f"❌ 문서 적재 오류: {future.exception()}")
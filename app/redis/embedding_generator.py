@@ -1,22 +1,31 @@
 # embedding_generator.py (LangChain 버전)
 import sys
-from typing import List, Optional
+from typing import Dict, List, Optional
 from langchain_openai import OpenAIEmbeddings
-from app.redis.redis_handler import EmbeddingsCacheHandler
+from app.redis.redis_handler import EmbeddingsCacheHandler, AsyncEmbeddingsCacheHandler
+from app.redis.vector_codec import validate_vector_type
 from app.config import settings
 import numpy as np
 
+# embed_documents 한 번에 보낼 최대 텍스트 수 (OpenAI 요청 크기 제한 대비)
+EMBEDDING_BATCH_SIZE = 256
+
 
 class EmbeddingGenerator:
     """LangChain을 사용하여 텍스트 임베딩을 생성하는 클래스 (리팩토링)"""
 
-    def __init__(self, model_name: str = "text-embedding-3-small", redis_url: str = None):
+    def __init__(self, model_name: str = "text-embedding-3-small", redis_url: str = None,
+                 batch_size: int = EMBEDDING_BATCH_SIZE, dimensions: Optional[int] = None,
+                 vector_type: str = "FLOAT32"):
         """
         임베딩 생성기 초기화
 
         Args:
             model_name (str): 사용할 OpenAI 임베딩 모델명
             redis_url (str): Redis 서버의 URL (None이면 config에서 가져옴)
+            batch_size (int): embed_documents 호출당 최대 텍스트 수
+            dimensions (int): 축소할 임베딩 차원 (None이면 모델 기본 차원, text-embedding-3 계열만 지원)
+            vector_type (str): 임베딩 캐시에 저장할 벡터 타입 (FLOAT32, FLOAT16, BFLOAT16)
         """
         try:
             # config에서 API 키 가져오기
@@ -31,44 +40,188 @@ class EmbeddingGenerator:
 
             # 모델명 저장
             self.model_name = model_name
+            self.batch_size = max(1, batch_size)
+            self.dimensions = dimensions
+            self.vector_type = validate_vector_type(vector_type)
 
-            # LangChain OpenAI 임베딩 모델 초기화
+            # LangChain OpenAI 임베딩 모델 초기화 (dimensions는 API에서 잘라서 정규화한 벡터를 반환)
             self.embeddings = OpenAIEmbeddings(
                 model=model_name,
-                openai_api_key=self.api_key
+                openai_api_key=self.api_key,
+                dimensions=dimensions
             )
 
-            # Redis 캐시 초기화
-            self.cache = EmbeddingsCacheHandler(redis_url=redis_url)
+            # Redis 캐시 초기화 (동기/비동기 경로가 같은 키를 공유)
+            namespace = self._cache_namespace()
+            self.cache = EmbeddingsCacheHandler(redis_url=redis_url, vector_type=self.vector_type,
+                                                namespace=namespace)
+            self.async_cache = AsyncEmbeddingsCacheHandler(redis_url=redis_url, vector_type=self.vector_type,
+                                                           namespace=namespace)
 
-            print(f"임베딩 생성기 초기화 완료: 모델 {model_name}")
+            print(f"임베딩 생성기 초기화 완료: 모델 {model_name} "
+                  f"(차원 {dimensions or '기본'}, 타입 {self.vector_type})")
             
         except Exception as e:
             print(f"임베딩 생성기 초기화 오류: {e}")
             sys.exit(1)
 
-    def embed(self, text: str) -> Optional[List[float]]:
+    def _cache_namespace(self) -> Optional[str]:
+        """
+        임베딩 캐시 키 공간 (모델/차원/타입이 다르면 캐시 값을 공유할 수 없음)
+
+        기본 설정(text-embedding-3-small, 기본 차원, FLOAT32)은 기존 키를 그대로 사용한다.
+        """
+        if (self.model_name == "text-embedding-3-small" and self.dimensions is None
+                and self.vector_type == "FLOAT32"):
+            return None
+        return f"{self.model_name}:{self.dimensions or 'default'}:{self.vector_type}"
+
+    def embed(self, text: str) -> Optional[np.ndarray]:
         """
         텍스트를 임베딩 벡터로 변환 (캐시 우선)
         Args:
             text (str): 임베딩할 텍스트
         Returns:
-            Optional[List[float]]: 임베딩 벡터 (실패 시 None)
+            Optional[np.ndarray]: 임베딩 벡터 (실패 시 None)
         """
         if not text or text.strip() == "":
             print("오류: 임베딩할 텍스트가 비어 있습니다.")
             return None
         try:
-            # 1. 캐시 조회
-            cached = self.cache.get_embedding(text)
-            if cached is not None:
-                return cached
-            # 2. 임베딩 생성
-            embedding = self.embeddings.embed_query(text)
-            embedding_np = np.array(embedding, dtype=np.float32)
-            # 3. 캐시에 저장
-            self.cache.set_embedding(text, embedding_np)
-            return embedding_np
+            return self.embed_many([text])[0]
+        except Exception as e:
+            print(f"임베딩 생성 오류: {e}")
+            return None
+
+    async def aembed(self, text: str) -> Optional[np.ndarray]:
+        """embed의 비동기 버전 (실패 시 None)"""
+        if not text or text.strip() == "":
+            print("오류: 임베딩할 텍스트가 비어 있습니다.")
+            return None
+        try:
+            return (await self.aembed_many([text]))[0]
         except Exception as e:
             print(f"임베딩 생성 오류: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    def embed_many(self, texts: List[str]) -> np.ndarray:
+        """
+        여러 텍스트를 한 번에 임베딩 (캐시 우선, 배치 처리)
+
+        1. 중복 텍스트 제거
+        2. 캐시를 MGET 한 번으로 조회
+        3. 캐시 미스만 batch_size 단위로 embed_documents 호출
+        4. 새 벡터를 파이프라인 MSET 한 번으로 캐시에 저장
+
+        Args:
+            texts (List[str]): 임베딩할 텍스트 목록
+        Returns:
+            np.ndarray: (len(texts), dim) 크기의 연속된 float32 행렬 (입력 순서 유지)
+        Raises:
+            ValueError: 비어 있는 텍스트가 포함된 경우
+            Exception: 임베딩 API 호출이 실패한 경우 (그 전 배치의 벡터는 캐시에 저장됨)
+        """
+        unique_texts = self._dedupe(texts)
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+
+        # 1. 캐시 조회 (MGET 1회) - 캐시 장애 시 전부 미스로 처리
+        try:
+            cached = self.cache.get_embeddings(unique_texts)
+        except Exception as e:
+            print(f"임베딩 캐시 조회 오류: {e}")
+            cached = [None] * len(unique_texts)
+
+        vectors = self._cached_vectors(unique_texts, cached)
+        misses = [text for text in unique_texts if text not in vectors]
+
+        # 2. 캐시 미스만 배치 단위로 임베딩 생성
+        new_vectors: Dict[str, np.ndarray] = {}
+        try:
+            for batch in self._batches(misses):
+                embeddings = self.embeddings.embed_documents(batch)
+                new_vectors.update(self._to_vectors(batch, embeddings))
+        finally:
+            # 3. 새 벡터 캐시에 저장 (파이프라인 MSET 1회, 중간 배치가 실패해도 받은 벡터는 저장해 재시도 시 재사용)
+            if new_vectors:
+                try:
+                    self.cache.set_embeddings(new_vectors)
+                except Exception as e:
+                    print(f"임베딩 캐시 저장 오류: {e}")
+        vectors.update(new_vectors)
+
+        # 4. 입력 순서대로 연속 행렬 구성
+        return self._assemble(texts, vectors)
+
+    async def aembed_many(self, texts: List[str]) -> np.ndarray:
+        """
+        embed_many의 비동기 버전 (redis.asyncio 캐시 + aembed_documents 사용)
+
+        Args:
+            texts (List[str]): 임베딩할 텍스트 목록
+        Returns:
+            np.ndarray: (len(texts), dim) 크기의 연속된 float32 행렬 (입력 순서 유지)
+        Raises:
+            ValueError: 비어 있는 텍스트가 포함된 경우
+        """
+        unique_texts = self._dedupe(texts)
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+
+        try:
+            cached = await self.async_cache.get_embeddings(unique_texts)
+        except Exception as e:
+            print(f"임베딩 캐시 조회 오류: {e}")
+            cached = [None] * len(unique_texts)
+
+        vectors = self._cached_vectors(unique_texts, cached)
+        misses = [text for text in unique_texts if text not in vectors]
+
+        new_vectors: Dict[str, np.ndarray] = {}
+        try:
+            for batch in self._batches(misses):
+                embeddings = await self.embeddings.aembed_documents(batch)
+                new_vectors.update(self._to_vectors(batch, embeddings))
+        finally:
+            if new_vectors:
+                try:
+                    await self.async_cache.set_embeddings(new_vectors)
+                except Exception as e:
+                    print(f"임베딩 캐시 저장 오류: {e}")
+        vectors.update(new_vectors)
+
+        return self._assemble(texts, vectors)
+
+    @staticmethod
+    def _dedupe(texts: List[str]) -> List[str]:
+        """빈 텍스트 검증 후 순서를 유지한 채 중복 제거"""
+        if any(not text or text.strip() == "" for text in texts):
+            raise ValueError("임베딩할 텍스트가 비어 있습니다.")
+        return list(dict.fromkeys(texts))
+
+    @staticmethod
+    def _cached_vectors(texts: List[str], cached: List[Optional[np.ndarray]]) -> Dict[str, np.ndarray]:
+        """캐시 조회 결과 중 히트만 텍스트별로 모음"""
+        return {text: vector for text, vector in zip(texts, cached) if vector is not None}
+
+    def _batches(self, texts: List[str]):
+        """batch_size 단위로 나눈 텍스트 목록"""
+        for start in range(0, len(texts), self.batch_size):
+            yield texts[start:start + self.batch_size]
+
+    @staticmethod
+    def _to_vectors(batch: List[str], embeddings: List[List[float]]) -> Dict[str, np.ndarray]:
+        """임베딩 API 응답을 텍스트별 float32 벡터로 변환"""
+        return {
+            text: np.asarray(embedding, dtype=np.float32)
+            for text, embedding in zip(batch, embeddings)
+        }
+
+    @staticmethod
+    def _assemble(texts: List[str], vectors: Dict[str, np.ndarray]) -> np.ndarray:
+        """입력 순서대로 연속된 float32 행렬 구성"""
+        dimension = len(next(iter(vectors.values())))
+        matrix = np.empty((len(texts), dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            matrix[row] = vectors[text]
+        return matrix
@@ -0,0 +1,72 @@
+# exact_match.py
+"""
+시멘틱 캐시 앞단의 정확 일치(정규화 질문 해시) 조회 유틸리티
+
+같은 질문이 반복되면 임베딩 API 호출과 KNN 검색 없이 GET 한 번으로 답변을 돌려주기 위해
+질문을 정규화(NFKC, 대소문자, 공백/문장부호)한 뒤 SHA-256 해시를 키로 사용한다.
+"""
+
+import hashlib
+import re
+import threading
+import unicodedata
+from typing import Any, Dict, Optional
+
+
+_WHITESPACE = re.compile(r"\s+")
+# 공백으로 바꿀 문장부호: 물음표/느낌표 등 문장 부호, 따옴표/괄호, 숫자 사이가 아닌 마침표/쉼표
+# (부호 -, +, %, #, °, ~ 등과 "1.5", "1,000"의 구분자는 뜻이 달라지므로 유지)
+_SENTENCE_PUNCTUATION = re.compile(
+    r"[?!;:…。、'\"“”‘’«»()\[\]{}「」『』]|(?<!\d)[.,]|[.,](?!\d)"
+)
+
+
+def normalize_question(question: str) -> str:
+    """
+    질문 정규화 (한국어/영어 공통)
+
+    - 유니코드 NFKC (전각 문자, 호환 자모 등 통일)
+    - casefold (영문 대소문자)
+    - 문장부호만 공백으로 치환 ("지구온난화?" == "지구온난화", "-2°C" != "2°C", "C++" != "C")
+    - 연속 공백을 하나로 합치고 양끝 공백 제거
+
+    정확 일치는 유사도 확인 없이 저장된 답변을 돌려주므로, 뜻이 바뀔 수 있는 기호는 지우지 않는다.
+    """
+    text = unicodedata.normalize("NFKC", question).casefold()
+    text = _SENTENCE_PUNCTUATION.sub(" ", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def question_hash(question: str) -> Optional[str]:
+    """정규화한 질문의 SHA-256 해시 (정규화 결과가 비어 있으면 None)"""
+    normalized = normalize_question(question)
+    if not normalized:
+        return None
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class CacheHitStats:
+    """요청별 캐시 조회 결과 집계 (정확 일치 / 시멘틱 / 미스, 프로세스 단위)"""
+
+    OUTCOMES = ("exact", "semantic", "miss")
+
+    def __init__(self):
+        self._counts = {outcome: 0 for outcome in self.OUTCOMES}
+        self._lock = threading.Lock()
+
+    def record(self, outcome: str):
+        with self._lock:
+            self._counts[outcome] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = dict(self._counts)
+        total = sum(counts.values())
+        return {
+            "requests": total,
+            "exact_hits": counts["exact"],
+            "semantic_hits": counts["semantic"],
+            "misses": counts["miss"],
+            "exact_hit_rate": counts["exact"] / total if total else 0.0,
+            "semantic_hit_rate": counts["semantic"] / total if total else 0.0,
+        }
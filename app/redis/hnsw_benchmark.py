@@ -0,0 +1,273 @@
+# hnsw_benchmark.py
+"""
+HNSW 파라미터 recall/지연 시간 비교 도구
+
+합성 코퍼스 또는 내보낸 벡터(.npy, 기존 인덱스)로 M/EF_CONSTRUCTION 조합별 임시 인덱스를 만들고,
+EF_RUNTIME 값마다 브루트포스 정답 대비 recall@k와 쿼리 지연 시간(p50/p99)을 보고한다.
+결과를 보고 config의 hnsw_* 값을 정한다.
+
+사용 예:
+    python -m app.redis.hnsw_benchmark --synthetic 50000 --dim 512 --m 8,16,32 --ef-construction 100,200 --ef-runtime 10,50,100
+    python -m app.redis.hnsw_benchmark --from-index document_index --limit 20000 --k 5
+    python -m app.redis.hnsw_benchmark --npy vectors.npy --queries 200 --output report.json
+
+주의: 지연 시간은 클라이언트에서 잰 왕복 시간(네트워크 포함)이다. 임시 인덱스(hnsw_bench_*)와 문서는 끝나면 삭제한다.
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import redis
+
+from app.redis.client_registry import get_redis_client
+from app.redis.debug_utils import RedisIndexDebugger, parse_index_prefix, parse_vector_field_spec
+from app.redis.vector_migration import MIGRATION_BATCH_SIZE, wait_for_indexing
+from app.redis.vector_scan import iter_doc_keys, normalize_rows, read_vectors
+from app.redis.vector_search import HNSW_EF_CONSTRUCTION, HNSW_M, VectorSearchIndex, iter_chunks
+
+
+# 임시 인덱스 이름 접두사
+BENCHMARK_INDEX_PREFIX = "hnsw_bench"
+
+# 기본 비교 대상
+DEFAULT_EF_RUNTIMES = (10, 20, 50, 100, 200)
+DEFAULT_QUERY_COUNT = 100
+WARMUP_QUERIES = 10
+
+# 합성 코퍼스 클러스터 수 (실제 임베딩처럼 주제별로 뭉친 분포)
+SYNTHETIC_CLUSTERS = 64
+
+# 정답 계산 시 한 번에 처리할 쿼리 수
+_GROUND_TRUTH_BATCH = 64
+
+
+def synthetic_corpus(size: int, dimension: int, seed: int = 0) -> np.ndarray:
+    """클러스터 중심 주변에 분포한 정규화 벡터 생성 (균일 난수보다 실제 임베딩 분포에 가까움)"""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(SYNTHETIC_CLUSTERS, dimension)).astype(np.float32)
+    assignments = rng.integers(0, SYNTHETIC_CLUSTERS, size=size)
+    vectors = centers[assignments] + rng.normal(scale=0.5, size=(size, dimension)).astype(np.float32)
+    return normalize_rows(vectors)
+
+
+def load_index_vectors(redis_client: redis.Redis, index_name: str, limit: Optional[int] = None) -> np.ndarray:
+    """기존 인덱스의 문서 벡터를 SCAN으로 읽어 float32 행렬로 반환 (limit개까지)"""
+    info = RedisIndexDebugger(redis_client).get_index_info_or_none(index_name)
+    if info is None:
+        raise ValueError(f"인덱스 '{index_name}'가 존재하지 않습니다.")
+    spec = parse_vector_field_spec(info, "embedding_vector")
+    if spec.get("dim") is None:
+        raise ValueError(f"인덱스 '{index_name}'의 벡터 차원을 확인할 수 없습니다.")
+
+    key_prefix = parse_index_prefix(info) or f"doc:{index_name}:"
+    chunks, loaded = [], 0
+    for keys in iter_chunks(iter_doc_keys(redis_client, key_prefix, MIGRATION_BATCH_SIZE), MIGRATION_BATCH_SIZE):
+        _, vectors = read_vectors(redis_client, keys, spec.get("type", "FLOAT32"), spec["dim"])
+        chunks.append(vectors)
+        loaded += len(vectors)
+        if limit is not None and loaded >= limit:
+            break
+    if not loaded:
+        raise ValueError(f"인덱스 '{index_name}'에서 읽은 벡터가 없습니다.")
+    return np.vstack(chunks)[:limit]
+
+
+def split_queries(vectors: np.ndarray, query_count: int, seed: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """임의의 query_count개 행을 쿼리로 떼어내고 나머지를 코퍼스로 반환"""
+    if query_count >= len(vectors):
+        raise ValueError(f"쿼리 수({query_count})가 전체 벡터 수({len(vectors)})보다 작아야 합니다.")
+    order = np.random.default_rng(seed).permutation(len(vectors))
+    return vectors[order[query_count:]], vectors[order[:query_count]]
+
+
+def exact_top_k(corpus: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    """코사인 유사도 기준 정확한 top-k 행 번호 (쿼리별, 유사도 내림차순)"""
+    corpus = normalize_rows(corpus.astype(np.float32))
+    queries = normalize_rows(queries.astype(np.float32))
+    k = min(k, len(corpus))
+    results = []
+    for start in range(0, len(queries), _GROUND_TRUTH_BATCH):
+        scores = queries[start:start + _GROUND_TRUTH_BATCH] @ corpus.T
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        order = np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1)
+        results.append(np.take_along_axis(top, order, axis=1))
+    return np.vstack(results)
+
+
+def _build_index(redis_client: redis.Redis, index_name: str, corpus: np.ndarray,
+                 m: int, ef_construction: int, vector_type: str) -> Tuple[VectorSearchIndex, float]:
+    """임시 인덱스 생성 후 코퍼스 적재, 색인 완료까지 걸린 시간과 함께 반환"""
+    _drop_index(redis_client, index_name)
+    started = time.perf_counter()
+    index = VectorSearchIndex(
+        redis_client=redis_client,
+        index_name=index_name,
+        vector_dimension=corpus.shape[1],
+        distance_metric="COSINE",
+        vector_type=vector_type,
+        hnsw_m=m,
+        hnsw_ef_construction=ef_construction,
+        hnsw_initial_cap=len(corpus)
+    )
+    index.add_documents((str(i), vector, {}) for i, vector in enumerate(corpus))
+    if not wait_for_indexing(redis_client, index_name):
+        print(f"⚠️ '{index_name}' 색인이 제한 시간 안에 끝나지 않았습니다 (recall 값이 낮게 나올 수 있음)")
+    index._refresh_state()
+    return index, time.perf_counter() - started
+
+
+def _drop_index(redis_client: redis.Redis, index_name: str):
+    """임시 인덱스와 문서 삭제 (없으면 무시)"""
+    try:
+        redis_client.ft(index_name).dropindex(delete_documents=True)
+    except redis.exceptions.ResponseError:
+        pass
+
+
+def _measure(index: VectorSearchIndex, queries: np.ndarray, truth: np.ndarray,
+             k: int, ef_runtime: Optional[int]) -> Dict[str, Any]:
+    """EF_RUNTIME 하나에 대해 쿼리별 지연 시간과 recall@k 측정"""
+    for query in queries[:WARMUP_QUERIES]:
+        index.search_similar(query, top_k=k, score_threshold=-1.0, return_fields=(), ef_runtime=ef_runtime)
+
+    latencies, matched = [], 0
+    for query, expected in zip(queries, truth):
+        started = time.perf_counter()
+        hits = index.search_similar(query, top_k=k, score_threshold=-1.0, return_fields=(), ef_runtime=ef_runtime)
+        latencies.append(time.perf_counter() - started)
+        matched += len({index.doc_key(str(row)) for row in expected} & {hit.key for hit in hits})
+    latencies_ms = np.array(latencies) * 1000
+    return {
+        "ef_runtime": ef_runtime,
+        "recall_at_k": matched / truth.size if truth.size else None,
+        "p50_ms": float(np.percentile(latencies_ms, 50)),
+        "p99_ms": float(np.percentile(latencies_ms, 99)),
+        "mean_ms": float(latencies_ms.mean()),
+    }
+
+
+def run_benchmark(redis_client: redis.Redis,
+                  corpus: np.ndarray,
+                  queries: np.ndarray,
+                  k: int = 10,
+                  m_values: Sequence[int] = (HNSW_M,),
+                  ef_construction_values: Sequence[int] = (HNSW_EF_CONSTRUCTION,),
+                  ef_runtimes: Sequence[Optional[int]] = DEFAULT_EF_RUNTIMES,
+                  vector_type: str = "FLOAT32",
+                  keep: bool = False) -> List[Dict[str, Any]]:
+    """
+    M/EF_CONSTRUCTION 조합마다 임시 인덱스를 만들고 EF_RUNTIME별 recall@k와 지연 시간 측정
+
+    Args:
+        redis_client: Redis 클라이언트 (decode_responses=False)
+        corpus: 색인할 벡터 행렬
+        queries: 쿼리 벡터 행렬 (코퍼스에 포함되지 않은 벡터 권장)
+        k: recall@k의 k (검색 top_k)
+        m_values: 비교할 M 값들
+        ef_construction_values: 비교할 EF_CONSTRUCTION 값들
+        ef_runtimes: 비교할 EF_RUNTIME 값들 (None은 서버 기본값)
+        vector_type: 벡터 저장 타입
+        keep: 측정 후 임시 인덱스를 남길지 여부
+
+    Returns:
+        List[Dict]: 조합/EF_RUNTIME별 결과 (m, ef_construction, build_seconds, index_mb, recall_at_k, p50_ms, p99_ms, ...)
+    """
+    truth = exact_top_k(corpus, queries, k)
+    print(f"📏 브루트포스 정답 계산 완료: 코퍼스 {len(corpus)}개, 쿼리 {len(queries)}개, k={k}")
+
+    results = []
+    for m in m_values:
+        for ef_construction in ef_construction_values:
+            index_name = f"{BENCHMARK_INDEX_PREFIX}_m{m}_efc{ef_construction}"
+            print(f"🔧 {index_name} 구축 중...")
+            index, build_seconds = _build_index(redis_client, index_name, corpus, m, ef_construction, vector_type)
+            info = index.get_index_info()
+            try:
+                for ef_runtime in ef_runtimes:
+                    row = {
+                        "m": m,
+                        "ef_construction": ef_construction,
+                        "build_seconds": build_seconds,
+                        "index_mb": float(info.get("vector_index_sz_mb", 0) or 0),
+                        **_measure(index, queries, truth, k, ef_runtime),
+                    }
+                    results.append(row)
+                    print(f"   EF_RUNTIME {str(ef_runtime):>5}: recall@{k} {row['recall_at_k']:.4f}, "
+                          f"p50 {row['p50_ms']:.2f}ms, p99 {row['p99_ms']:.2f}ms")
+            finally:
+                if not keep:
+                    _drop_index(redis_client, index_name)
+    return results
+
+
+def print_report(results: List[Dict[str, Any]], k: int):
+    """결과 표 출력"""
+    print(f"\n{'M':>4} {'EF_C':>6} {'EF_R':>6} {f'recall@{k}':>10} {'p50(ms)':>9} {'p99(ms)':>9} "
+          f"{'build(s)':>9} {'index(MB)':>10}")
+    for row in results:
+        print(f"{row['m']:>4} {row['ef_construction']:>6} {str(row['ef_runtime']):>6} "
+              f"{row['recall_at_k']:>10.4f} {row['p50_ms']:>9.2f} {row['p99_ms']:>9.2f} "
+              f"{row['build_seconds']:>9.1f} {row['index_mb']:>10.1f}")
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def main():
+    from app.config import settings
+
+    parser = argparse.ArgumentParser(description="HNSW 파라미터 recall/지연 시간 비교")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--synthetic", type=int, help="합성 코퍼스 크기")
+    source.add_argument("--npy", help="내보낸 벡터 파일 (.npy, [문서 수, 차원])")
+    source.add_argument("--from-index", help="벡터를 읽어올 기존 인덱스 이름 (예: document_index)")
+    parser.add_argument("--dim", type=int, default=settings.embedding_dimensions or 1536, help="합성 코퍼스 차원")
+    parser.add_argument("--limit", type=int, default=None, help="--from-index/--npy에서 사용할 최대 벡터 수")
+    parser.add_argument("--queries", type=int, default=DEFAULT_QUERY_COUNT, help="쿼리 수 (코퍼스에서 떼어냄)")
+    parser.add_argument("--k", type=int, default=10, help="recall@k의 k")
+    parser.add_argument("--m", type=_int_list, default=[settings.hnsw_m], help="비교할 M 값 (쉼표 구분)")
+    parser.add_argument("--ef-construction", type=_int_list, default=[settings.hnsw_ef_construction],
+                        help="비교할 EF_CONSTRUCTION 값 (쉼표 구분)")
+    parser.add_argument("--ef-runtime", type=_int_list, default=list(DEFAULT_EF_RUNTIMES),
+                        help="비교할 EF_RUNTIME 값 (쉼표 구분)")
+    parser.add_argument("--type", default=settings.vector_type, help="벡터 저장 타입 (FLOAT32/FLOAT16/BFLOAT16)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--keep", action="store_true", help="측정 후 임시 인덱스 유지")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--redis-url", default=settings.redis_url)
+    args = parser.parse_args()
+
+    redis_client = get_redis_client(args.redis_url)
+    if args.synthetic:
+        vectors = synthetic_corpus(args.synthetic + args.queries, args.dim, args.seed)
+    elif args.npy:
+        vectors = np.load(args.npy, mmap_mode="r")[:args.limit].astype(np.float32)
+    else:
+        vectors = load_index_vectors(redis_client, args.from_index, args.limit)
+    corpus, queries = split_queries(vectors, args.queries, args.seed)
+
+    results = run_benchmark(
+        redis_client,
+        corpus,
+        queries,
+        k=args.k,
+        m_values=args.m,
+        ef_construction_values=args.ef_construction,
+        ef_runtimes=args.ef_runtime,
+        vector_type=args.type,
+        keep=args.keep,
+    )
+    print_report(results, args.k)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"corpus_size": len(corpus), "query_count": len(queries), "k": args.k, "results": results},
+                      f, ensure_ascii=False, indent=2)
+        print(f"💾 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,512 @@
+# index_rebuild.py
+"""
+별칭 기반 블루/그린 인덱스 재구축 (검색 공백 없는 스키마 변경)
+
+애플리케이션은 고정된 이름(document_index, semantic_cache_index)으로 검색하고, 그 이름은
+버전이 붙은 물리 인덱스(<이름>_v<N>, 키 접두사 doc:<이름>_v<N>:)를 가리키는 별칭(FT.ALIASADD)이다.
+차원/벡터 타입/HNSW 파라미터/TAG 필드가 바뀌면 다음 순서로 새 버전을 만든다.
+
+1. 새 스키마로 <이름>_v<N+1> 생성
+2. 기존 접두사의 Hash를 SCAN + 파이프라인으로 읽어 재인코딩 후 새 접두사로 복사 (초당 문서 수 제한, TTL/접근 점수 유지)
+3. 새 인덱스 색인 완료 대기 후, 복사 중 삭제된 문서(워커가 락을 보고 index_rebuild:<alias>:deleted에 기록)를 새 접두사에서도 삭제
+4. 별칭을 새 인덱스로 원자적으로 전환 (FT.ALIASUPDATE, 별칭 도입 전 인덱스는 DROPINDEX + ALIASADD를 MULTI로)
+5. 유예 시간 뒤(워커들이 새 접두사로 쓰기 시작한 뒤) 복사 중 기존 접두사에 새로 저장된 문서 추가 복사
+   (새로 복사할 문서가 없는 패스가 나올 때까지 반복, 아직 이전 접두사로 쓰는 워커가 없음을 확인) 및 그사이 삭제 반영
+6. 이전 버전 인덱스와 문서 삭제 (keep_old이면 유지)
+
+전환 전까지 검색은 이전 인덱스가, 전환 후에는 색인이 끝난 새 인덱스가 처리하므로 빈/반쯤 만든 인덱스가 보이지 않는다.
+같은 별칭의 재구축은 클러스터 전체에서 하나만 실행된다 (버전 계산 전에 Redis 락을 잡고 끝날 때까지 갱신).
+
+사용 예:
+    python -m app.redis.index_rebuild --index document_index --type FLOAT16 --dim 512 --rate 2000
+"""
+
+import argparse
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import redis
+
+from app.redis.cache_eviction import access_key_for
+from app.redis.client_registry import get_redis_client
+from app.redis.debug_utils import (
+    RedisIndexDebugger,
+    parse_index_name,
+    parse_index_prefix,
+    parse_num_docs,
+    parse_vector_field_spec,
+)
+from app.redis.search_filter import detect_language, domain_tags
+from app.redis.search_result_cache import generation_key_for
+from app.redis.vector_codec import bytes_per_vector, decode_vector, encode_vector, reduce_dimension
+from app.redis.vector_migration import MIGRATION_BATCH_SIZE, wait_for_indexing
+from app.redis.vector_search import (
+    HNSW_EF_CONSTRUCTION,
+    HNSW_INITIAL_CAP,
+    HNSW_M,
+    VectorSearchIndex,
+    iter_chunks,
+    rebuild_deletes_key,
+    rebuild_lock_key,
+)
+
+
+# 기본 복사 속도 제한 (초당 문서 수, None이면 제한 없음)
+DEFAULT_MAX_DOCS_PER_SECOND = 2000.0
+
+# 전환 후 추가 복사 전 대기 시간 (워커의 인덱스 상태 재확인 주기 이상)
+DEFAULT_GRACE_SECONDS = 60.0
+
+# 추가 복사 최대 반복 횟수 (새 문서가 계속 들어오면 이 횟수 뒤 멈춤)
+CATCH_UP_MAX_PASSES = 5
+
+# 재구축 락 만료 시간 (초, 실행 중에는 1/3 주기로 갱신하므로 프로세스가 죽으면 이 시간 뒤 풀림)
+REBUILD_LOCK_TIMEOUT = 60.0
+
+_VECTOR_FIELD = b"embedding_vector"
+
+
+def physical_index_name(alias: str, version: int) -> str:
+    """별칭 뒤의 버전 인덱스 이름"""
+    return f"{alias}_v{version}"
+
+
+def next_version(redis_client: redis.Redis, alias: str) -> int:
+    """FT._LIST에서 <alias>_v<N> 중 가장 큰 N + 1"""
+    pattern = re.compile(rf"^{re.escape(alias)}_v(\d+)$")
+    versions = [0]
+    for name in redis_client.execute_command("FT._LIST"):
+        name = name.decode("utf-8") if isinstance(name, bytes) else str(name)
+        match = pattern.match(name)
+        if match:
+            versions.append(int(match.group(1)))
+    return max(versions) + 1
+
+
+class IndexRebuilder:
+    """
+    별칭 인덱스를 새 스키마 버전으로 재구축하고 별칭을 전환하는 작업
+
+    run()을 직접 호출하거나 start()로 백그라운드 스레드에서 실행하고 progress로 진행 상황을 확인한다.
+    """
+
+    def __init__(self,
+                 redis_client: redis.Redis,
+                 alias: str,
+                 vector_dimension: Optional[int] = None,
+                 vector_type: Optional[str] = None,
+                 hnsw_m: int = HNSW_M,
+                 hnsw_ef_construction: int = HNSW_EF_CONSTRUCTION,
+                 hnsw_initial_cap: Optional[int] = None,
+                 batch_size: int = MIGRATION_BATCH_SIZE,
+                 max_docs_per_second: Optional[float] = DEFAULT_MAX_DOCS_PER_SECOND,
+                 grace_seconds: float = DEFAULT_GRACE_SECONDS,
+                 keep_old: bool = False,
+                 score_key: Optional[str] = None,
+                 on_switched: Optional[Callable[[str], None]] = None):
+        """
+        Args:
+            redis_client: Redis 클라이언트 (decode_responses=False)
+            alias: 애플리케이션이 검색하는 인덱스 이름 (별칭 도입 전 인덱스도 가능)
+            vector_dimension: 새 벡터 차원 (None이면 유지, 작으면 앞쪽 성분만 남기고 재정규화)
+            vector_type: 새 벡터 타입 (None이면 유지)
+            hnsw_m, hnsw_ef_construction: 새 인덱스 HNSW 파라미터
+            hnsw_initial_cap: 새 인덱스 초기 용량 (None이면 기존 문서 수)
+            batch_size: SCAN/파이프라인 배치 크기
+            max_docs_per_second: 복사 속도 제한 (운영 트래픽 보호, None이면 제한 없음)
+            grace_seconds: 전환 후 추가 복사 전 대기 시간
+            keep_old: 이전 버전 인덱스와 문서 유지 여부
+            score_key: 멤버가 문서 키인 sorted set (시멘틱 캐시 접근 점수, None이면 자동 확인)
+            on_switched: 별칭 전환 직후 새 인덱스 이름으로 호출 (현재 프로세스 핸들러 상태 무효화용)
+        """
+        self.redis_client = redis_client
+        self.alias = alias
+        self.vector_dimension = vector_dimension
+        self.vector_type = vector_type
+        self.hnsw_m = hnsw_m
+        self.hnsw_ef_construction = hnsw_ef_construction
+        self.hnsw_initial_cap = hnsw_initial_cap
+        self.batch_size = batch_size
+        self.max_docs_per_second = max_docs_per_second
+        self.grace_seconds = grace_seconds
+        self.keep_old = keep_old
+        self.score_key = score_key
+        self.on_switched = on_switched
+        self.progress: Dict[str, Any] = {"phase": "idle"}
+        self._thread: Optional[threading.Thread] = None
+        # 클러스터 락과 갱신 스레드
+        self._lock: Optional[redis.lock.Lock] = None
+        self._lock_lost = False
+        self._lock_stop = threading.Event()
+        self._lock_refresher: Optional[threading.Thread] = None
+
+    # --- 실행 ---
+
+    def start(self) -> bool:
+        """
+        백그라운드 스레드에서 재구축 시작 (이미 실행 중이면 False)
+
+        락은 호출한 스레드에서 잡으므로 다른 프로세스가 재구축 중이면 바로 RuntimeError가 난다.
+        """
+        if self.is_running:
+            return False
+        self._acquire_lock()
+        self._thread = threading.Thread(target=self._run_safely, name=f"index-rebuild-{self.alias}", daemon=True)
+        self._thread.start()
+        return True
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run_safely(self):
+        try:
+            self.run()
+        except Exception as e:
+            self.progress.update({"phase": "failed", "error": str(e)})
+            print(f"❌ 인덱스 재구축 실패 ({self.alias}): {e}")
+
+    def run(self) -> Dict[str, Any]:
+        """
+        재구축 실행 (동기)
+
+        Returns:
+            Dict: 이전/새 인덱스, 복사/건너뜀/추가 복사 문서 수, 소요 시간
+        """
+        if self._lock is None:
+            self._acquire_lock()
+        try:
+            return self._run_locked()
+        finally:
+            self._release_lock()
+            # 락이 풀린 뒤에는 워커가 삭제를 기록하지 않으므로 남은 기록 정리
+            self.redis_client.delete(rebuild_deletes_key(self.alias))
+
+    def _run_locked(self) -> Dict[str, Any]:
+        started = time.perf_counter()
+        info = RedisIndexDebugger(self.redis_client).get_index_info_or_none(self.alias)
+        if info is None:
+            raise ValueError(f"인덱스 '{self.alias}'가 존재하지 않습니다.")
+        old_name = parse_index_name(info) or self.alias
+        old_prefix = parse_index_prefix(info) or f"doc:{old_name}:"
+        spec = parse_vector_field_spec(info, "embedding_vector")
+        source_type = spec.get("type", "FLOAT32")
+        source_dimension = spec.get("dim")
+        if source_dimension is None:
+            raise ValueError(f"인덱스 '{self.alias}'의 벡터 차원을 확인할 수 없습니다.")
+        target_type = self.vector_type or source_type
+        target_dimension = self.vector_dimension or source_dimension
+        if target_dimension > source_dimension:
+            raise ValueError(f"차원을 늘릴 수 없습니다: {source_dimension} -> {target_dimension}")
+        if self.score_key is None and self.redis_client.exists(access_key_for(self.alias)):
+            self.score_key = access_key_for(self.alias)
+
+        # 1. 새 버전 인덱스 생성
+        new_name = physical_index_name(self.alias, next_version(self.redis_client, self.alias))
+        self.progress = {"phase": "creating", "old_index": old_name, "new_index": new_name,
+                         "total": parse_num_docs(info), "copied": 0, "skipped": 0, "caught_up": 0, "deleted": 0}
+        # 이전 재구축이 비정상 종료하며 남긴 삭제 기록 제거 (락을 잡은 뒤 기록된 삭제만 반영)
+        self.redis_client.delete(rebuild_deletes_key(self.alias))
+        print(f"🔧 인덱스 재구축: '{self.alias}' {old_name}({source_type}/{source_dimension}) -> "
+              f"{new_name}({target_type}/{target_dimension}, M={self.hnsw_m}, EF_CONSTRUCTION={self.hnsw_ef_construction})")
+        new_index = VectorSearchIndex(
+            redis_client=self.redis_client,
+            index_name=new_name,
+            vector_dimension=target_dimension,
+            distance_metric="COSINE",
+            vector_type=target_type,
+            hnsw_m=self.hnsw_m,
+            hnsw_ef_construction=self.hnsw_ef_construction,
+            hnsw_initial_cap=self.hnsw_initial_cap or max(parse_num_docs(info), HNSW_INITIAL_CAP)
+        )
+        codec = _VectorRecoder(source_type, source_dimension, target_type, target_dimension)
+
+        # 2. 복사 (속도 제한)
+        self.progress["phase"] = "copying"
+        copied, skipped = self._copy(old_prefix, new_index.key_prefix, codec, only_missing=False)
+        self.progress.update({"copied": copied, "skipped": skipped})
+
+        # 3. 색인 완료 대기 (끝나기 전에는 전환하지 않음)
+        self.progress["phase"] = "indexing"
+        if not wait_for_indexing(self.redis_client, new_name):
+            raise TimeoutError(f"'{new_name}' 색인이 끝나지 않아 별칭을 전환하지 않았습니다 (이전 인덱스로 계속 검색).")
+
+        # 복사 중 삭제된 문서를 새 버전에서도 삭제 (전환 후 삭제된 문서가 검색되지 않도록)
+        deleted = self._apply_deletes(old_prefix, new_index.key_prefix)
+
+        # 4. 별칭 전환
+        self.progress["phase"] = "switching"
+        self._check_lock()
+        self._switch_alias(old_name, new_name)
+        # 이전 인덱스 키를 가리키는 검색 결과 캐시 무효화
+        self.redis_client.incr(generation_key_for(self.alias))
+        print(f"🔀 별칭 '{self.alias}' -> '{new_name}' 전환 완료")
+        if self.on_switched is not None:
+            self.on_switched(new_name)
+
+        # 5. 유예 시간 뒤 복사 중 새로 저장된 문서 추가 복사
+        self.progress["phase"] = "catching_up"
+        time.sleep(self.grace_seconds)
+        caught_up = self._catch_up(old_prefix, new_index.key_prefix, codec)
+        deleted += self._apply_deletes(old_prefix, new_index.key_prefix)
+
+        # 6. 이전 버전 정리
+        if not self.keep_old:
+            self.progress["phase"] = "dropping_old"
+            self._check_lock()
+            self._drop_old(old_name, old_prefix)
+
+        report = {
+            "alias": self.alias,
+            "old_index": old_name,
+            "new_index": new_name,
+            "copied": copied,
+            "skipped": skipped,
+            "caught_up": caught_up,
+            "deleted": deleted,
+            "kept_old": self.keep_old,
+            "elapsed": time.perf_counter() - started,
+        }
+        self.progress = {"phase": "done", **report}
+        print(f"✅ 인덱스 재구축 완료: {copied}개 복사, {skipped}개 건너뜀, 추가 복사 {caught_up}개, "
+              f"삭제 반영 {deleted}개 ({report['elapsed']:.1f}초)")
+        return report
+
+    # --- 클러스터 락 ---
+
+    def _acquire_lock(self):
+        """재구축 락 획득 (SET NX PX, 이미 다른 곳에서 잡고 있으면 RuntimeError) 후 갱신 스레드 시작"""
+        lock = self.redis_client.lock(rebuild_lock_key(self.alias), timeout=REBUILD_LOCK_TIMEOUT,
+                                      blocking=False, thread_local=False)
+        if not lock.acquire():
+            raise RuntimeError(f"'{self.alias}' 재구축이 다른 프로세스에서 진행 중입니다.")
+        self._lock = lock
+        self._lock_lost = False
+        self._lock_stop.clear()
+        self._lock_refresher = threading.Thread(target=self._refresh_lock, name=f"index-rebuild-lock-{self.alias}",
+                                                daemon=True)
+        self._lock_refresher.start()
+
+    def _refresh_lock(self):
+        while not self._lock_stop.wait(REBUILD_LOCK_TIMEOUT / 3):
+            try:
+                self._lock.reacquire()
+            except redis.exceptions.LockNotOwnedError:
+                self._lock_lost = True
+                print(f"❌ 인덱스 재구축 락을 잃었습니다 ({self.alias})")
+                return
+            except redis.exceptions.RedisError as e:
+                # 일시적 오류는 다음 주기에 다시 갱신 (만료 전에 성공하면 유지)
+                print(f"⚠️ 인덱스 재구축 락 갱신 오류 ({self.alias}): {e}")
+
+    def _check_lock(self):
+        """락을 잃었으면 별칭 전환/삭제 전에 중단 (다른 재구축과 겹치지 않도록)"""
+        if self._lock_lost:
+            raise RuntimeError(f"'{self.alias}' 재구축 락을 잃어 중단합니다.")
+
+    def _release_lock(self):
+        self._lock_stop.set()
+        if self._lock_refresher is not None:
+            self._lock_refresher.join()
+            self._lock_refresher = None
+        lock, self._lock = self._lock, None
+        if lock is not None:
+            try:
+                lock.release()
+            except redis.exceptions.LockError:
+                pass
+
+    # --- 단계별 처리 ---
+
+    def _copy(self, old_prefix: str, new_prefix: str, codec: "_VectorRecoder", only_missing: bool):
+        """기존 접두사의 Hash를 재인코딩하여 새 접두사로 복사 (TTL과 접근 점수 유지)"""
+        copied, skipped = 0, 0
+        started = time.monotonic()
+        keys = self.redis_client.scan_iter(match=f"{old_prefix}*", count=self.batch_size)
+        for batch in iter_chunks(keys, self.batch_size):
+            targets = [new_prefix.encode("utf-8") + key[len(old_prefix):] for key in batch]
+            if only_missing:
+                pipe = self.redis_client.pipeline(transaction=False)
+                for target in targets:
+                    pipe.exists(target)
+                pairs = [(key, target) for key, target, found in zip(batch, targets, pipe.execute()) if not found]
+            else:
+                pairs = list(zip(batch, targets))
+            if not pairs:
+                continue
+
+            read = self.redis_client.pipeline(transaction=False)
+            for key, _ in pairs:
+                read.hgetall(key)
+                read.pttl(key)
+                if self.score_key:
+                    read.zscore(self.score_key, key)
+            values = read.execute()
+            step = 3 if self.score_key else 2
+
+            write = self.redis_client.pipeline(transaction=False)
+            for i, (key, target) in enumerate(pairs):
+                fields, ttl_ms = values[i * step], values[i * step + 1]
+                document = codec.recode(fields) if fields else None
+                if document is None:
+                    skipped += 1
+                    continue
+                write.hset(target, mapping=document)
+                if ttl_ms and ttl_ms > 0:
+                    write.pexpire(target, ttl_ms)
+                if self.score_key and values[i * step + 2] is not None:
+                    write.zadd(self.score_key, {target: values[i * step + 2]})
+                copied += 1
+            write.execute()
+
+            if not only_missing:
+                self.progress.update({"copied": copied, "skipped": skipped})
+            self._throttle(copied, started)
+        return copied, skipped
+
+    def _catch_up(self, old_prefix: str, new_prefix: str, codec: "_VectorRecoder") -> int:
+        """
+        이전 접두사에만 있는 문서 추가 복사를 새로 복사할 문서가 없을 때까지 반복
+
+        마지막 패스가 0개이면 이전 접두사로 쓰는 워커가 없다는 뜻이므로 바로 이전 버전을 지워도 된다.
+        """
+        caught_up = 0
+        for _ in range(CATCH_UP_MAX_PASSES):
+            copied, _ = self._copy(old_prefix, new_prefix, codec, only_missing=True)
+            caught_up += copied
+            self.progress["caught_up"] = caught_up
+            if copied == 0:
+                return caught_up
+        print(f"⚠️ 추가 복사 {CATCH_UP_MAX_PASSES}회 후에도 이전 접두사({old_prefix})에 새 문서가 저장되고 있습니다.")
+        return caught_up
+
+    def _apply_deletes(self, old_prefix: str, new_prefix: str) -> int:
+        """
+        재구축 중 삭제된 문서 키를 꺼내 새 접두사의 복사본과 접근 점수 삭제
+
+        Returns:
+            int: 새 접두사에서 실제로 삭제한 문서 수
+        """
+        deleted = 0
+        old = old_prefix.encode("utf-8")
+        while True:
+            keys = self.redis_client.spop(rebuild_deletes_key(self.alias), self.batch_size)
+            if not keys:
+                break
+            # 이미 새 접두사로 쓰는 워커의 삭제는 새 버전에 바로 반영되어 있음
+            targets = [new_prefix.encode("utf-8") + key[len(old):] for key in keys if key.startswith(old)]
+            if not targets:
+                continue
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.delete(*targets)
+            if self.score_key:
+                pipe.zrem(self.score_key, *targets)
+            deleted += pipe.execute()[0]
+        self.progress["deleted"] = self.progress.get("deleted", 0) + deleted
+        return deleted
+
+    def _throttle(self, copied: int, started: float):
+        """초당 문서 수 제한을 넘지 않도록 대기"""
+        if not self.max_docs_per_second:
+            return
+        ahead = copied / self.max_docs_per_second - (time.monotonic() - started)
+        if ahead > 0:
+            time.sleep(ahead)
+
+    def _switch_alias(self, old_name: str, new_name: str):
+        """별칭을 새 인덱스로 원자적으로 전환"""
+        if old_name == self.alias:
+            # 별칭 도입 전 인덱스: 같은 이름의 별칭을 만들려면 인덱스를 지워야 하므로 한 트랜잭션으로 처리 (문서 유지)
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.execute_command("FT.DROPINDEX", old_name)
+            pipe.execute_command("FT.ALIASADD", self.alias, new_name)
+            pipe.execute()
+        else:
+            self.redis_client.execute_command("FT.ALIASUPDATE", self.alias, new_name)
+
+    def _drop_old(self, old_name: str, old_prefix: str):
+        """이전 버전 인덱스와 문서, 접근 점수 삭제 (별칭 도입 전 인덱스는 이미 삭제됐으므로 키만 지움)"""
+        if old_name != self.alias:
+            # 문서와 함께 지워질 키의 접근 점수를 먼저 제거
+            if self.score_key:
+                keys = self.redis_client.scan_iter(match=f"{old_prefix}*", count=self.batch_size)
+                for batch in iter_chunks(keys, self.batch_size):
+                    self.redis_client.zrem(self.score_key, *batch)
+            self.redis_client.ft(old_name).dropindex(delete_documents=True)
+            return
+        keys = self.redis_client.scan_iter(match=f"{old_prefix}*", count=self.batch_size)
+        for batch in iter_chunks(keys, self.batch_size):
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.unlink(*batch)
+            if self.score_key:
+                pipe.zrem(self.score_key, *batch)
+            pipe.execute()
+
+
+class _VectorRecoder:
+    """복사하는 Hash의 벡터 재인코딩과 필터 TAG 값 보충"""
+
+    def __init__(self, source_type: str, source_dimension: int, target_type: str, target_dimension: int):
+        self.source_type = source_type
+        self.source_dimension = source_dimension
+        self.target_type = target_type
+        self.target_dimension = target_dimension
+        self.expected_size = bytes_per_vector(source_dimension, source_type)
+        self.unchanged = (source_type, source_dimension) == (target_type, target_dimension)
+
+    def recode(self, fields: Dict[bytes, bytes]) -> Optional[Dict[bytes, Any]]:
+        """새 인덱스에 저장할 Hash (벡터 형식이 맞지 않으면 None)"""
+        vector = fields.get(_VECTOR_FIELD)
+        if vector is None or len(vector) != self.expected_size:
+            return None
+        document = dict(fields)
+        if not self.unchanged:
+            decoded = decode_vector(vector, self.source_type)
+            if self.target_dimension < self.source_dimension:
+                decoded = reduce_dimension(decoded, self.target_dimension)
+            document[_VECTOR_FIELD] = encode_vector(decoded, self.target_type)
+        # 필터 TAG 필드 도입 전에 저장된 문서는 값을 채워 새 인덱스에서 필터 대상이 되도록 함
+        if b"domain" not in document and document.get(b"source_url"):
+            document[b"domain"] = domain_tags(_text(document[b"source_url"]))
+        if b"language" not in document and document.get(b"text"):
+            document[b"language"] = detect_language(_text(document[b"text"]))
+        return document
+
+
+def _text(value: bytes) -> str:
+    return value.decode("utf-8", errors="ignore")
+
+
+def main():
+    from app.config import settings
+
+    parser = argparse.ArgumentParser(description="별칭 기반 블루/그린 인덱스 재구축")
+    parser.add_argument("--index", required=True, help="별칭(애플리케이션이 쓰는 인덱스 이름, 예: document_index)")
+    parser.add_argument("--type", default=settings.vector_type, help="새 벡터 타입 (FLOAT32/FLOAT16/BFLOAT16)")
+    parser.add_argument("--dim", type=int, default=settings.embedding_dimensions, help="새 벡터 차원 (생략 시 유지)")
+    parser.add_argument("--m", type=int, default=settings.hnsw_m, help="HNSW M")
+    parser.add_argument("--ef-construction", type=int, default=settings.hnsw_ef_construction, help="HNSW EF_CONSTRUCTION")
+    parser.add_argument("--rate", type=float, default=DEFAULT_MAX_DOCS_PER_SECOND, help="초당 복사 문서 수 제한 (0이면 제한 없음)")
+    parser.add_argument("--grace", type=float, default=settings.vector_index_state_refresh_seconds,
+                        help="전환 후 추가 복사 전 대기 시간 (초)")
+    parser.add_argument("--keep-old", action="store_true", help="이전 버전 인덱스와 문서 유지")
+    parser.add_argument("--redis-url", default=settings.redis_url)
+    args = parser.parse_args()
+
+    IndexRebuilder(
+        get_redis_client(args.redis_url),
+        alias=args.index,
+        vector_dimension=args.dim,
+        vector_type=args.type,
+        hnsw_m=args.m,
+        hnsw_ef_construction=args.ef_construction,
+        max_docs_per_second=args.rate or None,
+        grace_seconds=args.grace,
+        keep_old=args.keep_old,
+    ).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+# local_cache.py
+"""
+워커 프로세스 내 L1 답변 캐시 (Redis 시멘틱 캐시 앞단)
+
+같은 질문이 짧은 시간에 반복될 때 Redis 왕복 없이 답변을 돌려주기 위한 메모리 제한 LRU + TTL 캐시.
+- 정확 일치: 정규화 질문의 정확 일치 키(semantic_cache:<index>:exact:<hash>)로 조회
+  (벡터 검색 히트로 저장된 항목은 다른 질문의 답변이므로 정확 일치로 돌려주지 않음)
+- 벡터: 이번 요청에서 이미 계산한 쿼리 벡터와 저장된 벡터의 코사인 유사도로 조회
+  저장된 벡터는 캐시 항목의 질문 벡터가 아니라 그 항목에 히트했던 이전 쿼리 벡터이므로,
+  이전 쿼리와 항목 사이의 각도만큼 여유를 빼고(각거리 삼각부등식) 보수적으로 비교한다.
+L1 히트는 Redis 접근 점수(LRU/LFU)에 바로 반영되지 않으므로 모아 두었다가 스위퍼가 한 번에 기록한다 (drain_hits).
+Redis에서 항목이 덮어써지거나 축출되면 무효화 채널(Pub/Sub) 메시지로 모든 워커의 항목을 제거한다.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+import redis
+
+from app.redis.vector_search import SearchHit
+
+
+DEFAULT_LOCAL_CACHE_MAX_ENTRIES = 1000
+DEFAULT_LOCAL_CACHE_MAX_MB = 32.0
+DEFAULT_LOCAL_CACHE_TTL_SECONDS = 30.0
+
+_MB = 1024 * 1024
+# 항목당 고정 오버헤드 추정치 (키, dict, 파이썬 객체)
+_ENTRY_OVERHEAD_BYTES = 512
+
+
+class _LocalEntry:
+    __slots__ = ("exact_key", "doc_key", "answer", "vector", "slack", "exact", "expires_at", "size")
+
+    def __init__(self, exact_key: str, doc_key: str, answer: str,
+                 vector: Optional[np.ndarray], slack: float, exact: bool, expires_at: float):
+        self.exact_key = exact_key
+        self.doc_key = doc_key
+        self.answer = answer
+        self.vector = vector
+        # 저장된 쿼리 벡터와 캐시 항목 질문 벡터 사이의 각도 (라디안)
+        self.slack = slack
+        # 정확 일치 조회로 얻은 항목인지 (False면 벡터 검색 히트, get_exact에서 제외)
+        self.exact = exact
+        self.expires_at = expires_at
+        self.size = (_ENTRY_OVERHEAD_BYTES + len(answer.encode("utf-8"))
+                     + (vector.nbytes if vector is not None else 0))
+
+
+class LocalAnswerCache:
+    """메모리 상한이 있는 LRU + TTL 답변 캐시 (스레드 안전)"""
+
+    def __init__(self,
+                 max_entries: int = DEFAULT_LOCAL_CACHE_MAX_ENTRIES,
+                 max_mb: float = DEFAULT_LOCAL_CACHE_MAX_MB,
+                 ttl_seconds: float = DEFAULT_LOCAL_CACHE_TTL_SECONDS):
+        """
+        Args:
+            max_entries: 최대 항목 수
+            max_mb: 답변/벡터 추정 메모리 상한 (MB)
+            ttl_seconds: 항목 유효 시간 (초, 다른 워커의 변경이 반영되는 최대 지연)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = int(max_mb * _MB)
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, _LocalEntry]" = OrderedDict()
+        # Redis 캐시 항목 키 -> 그 항목을 가리키는 L1 키들 (다른 표현의 질문이 같은 항목에 히트할 수 있음)
+        self._by_doc_key: Dict[str, Set[str]] = {}
+        self._bytes = 0
+        # 벡터 조회용 정규화 행렬 (변경 시 다시 만듦)
+        self._matrix: Optional[np.ndarray] = None
+        self._matrix_keys: List[str] = []
+        self._matrix_slacks: Optional[np.ndarray] = None
+        # 아직 Redis 접근 점수에 반영하지 않은 L1 히트 (캐시 항목 키 -> [횟수, 마지막 히트 시각])
+        self._pending_hits: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+        self._counters = {"exact_hits": 0, "exact_misses": 0, "vector_hits": 0, "vector_misses": 0,
+                          "evictions": 0, "expirations": 0, "invalidations": 0}
+
+    def get_exact(self, exact_key: Optional[str]) -> Optional[SearchHit]:
+        """정확 일치 키로 조회 (정확 일치로 저장된 항목만)"""
+        if exact_key is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(exact_key)
+            if entry is not None and entry.exact and not self._expire_if_stale(entry):
+                self._entries.move_to_end(exact_key)
+                self._counters["exact_hits"] += 1
+                self._note_hit(entry.doc_key)
+                return SearchHit(entry.doc_key, 1.0, {"answer": entry.answer})
+            self._counters["exact_misses"] += 1
+            return None
+
+    def get_similar(self, vector, score_threshold: float) -> Optional[SearchHit]:
+        """
+        캐시 항목 질문과의 유사도 하한이 score_threshold 이상인 가장 가까운 항목 조회
+
+        하한은 cos(쿼리와 저장 벡터 사이 각도 + 저장 벡터와 항목 질문 사이 각도)이며, 결과 유사도로 돌려준다.
+        """
+        if vector is None:
+            return None
+        query = _normalize(np.asarray(vector, dtype=np.float32))
+        with self._lock:
+            matrix = self._vector_matrix(len(query))
+            if matrix is not None:
+                angles = np.arccos(np.clip(matrix @ query, -1.0, 1.0)) + self._matrix_slacks
+                bounds = np.cos(np.minimum(angles, np.pi))
+                best = int(np.argmax(bounds))
+                entry = self._entries.get(self._matrix_keys[best])
+                if (entry is not None and bounds[best] >= score_threshold
+                        and not self._expire_if_stale(entry)):
+                    self._entries.move_to_end(entry.exact_key)
+                    self._counters["vector_hits"] += 1
+                    self._note_hit(entry.doc_key)
+                    return SearchHit(entry.doc_key, float(bounds[best]), {"answer": entry.answer})
+            self._counters["vector_misses"] += 1
+            return None
+
+    def put(self, exact_key: Optional[str], doc_key: str, answer: Optional[str], vector=None,
+            similarity: float = 1.0, exact: bool = True):
+        """
+        Redis 캐시 히트 결과 저장 (같은 키는 덮어씀, 상한 초과 시 오래된 항목부터 제거)
+
+        Args:
+            vector: 이 항목에 히트한 쿼리 벡터 (None이면 정확 일치 조회만 가능)
+            similarity: vector와 캐시 항목 질문 벡터의 코사인 유사도 (Redis 검색 결과의 유사도)
+            exact: 정확 일치 조회 결과인지 (False면 벡터 조회에만 쓰고 정확 일치 항목을 덮어쓰지 않음)
+        """
+        if exact_key is None or not answer:
+            return
+        if vector is not None:
+            vector = _normalize(np.asarray(vector, dtype=np.float32))
+        slack = float(np.arccos(np.clip(similarity, -1.0, 1.0)))
+        entry = _LocalEntry(exact_key, doc_key, answer, vector, slack, exact, time.monotonic() + self.ttl_seconds)
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            current = self._entries.get(exact_key)
+            if not exact and current is not None and current.exact:
+                return
+            self._remove(exact_key)
+            self._entries[exact_key] = entry
+            self._by_doc_key.setdefault(doc_key, set()).add(exact_key)
+            self._bytes += entry.size
+            if vector is not None:
+                self._matrix = None
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._counters["evictions"] += 1
+
+    def invalidate(self, keys: Iterable[str]) -> int:
+        """정확 일치 키 또는 캐시 항목(doc) 키에 해당하는 항목 제거"""
+        removed = 0
+        with self._lock:
+            for key in keys:
+                for exact_key in list(self._by_doc_key.get(key, ())) or [key]:
+                    if self._remove(exact_key):
+                        removed += 1
+            self._counters["invalidations"] += removed
+        return removed
+
+    def drain_hits(self) -> Dict[str, Tuple[int, float]]:
+        """
+        마지막 호출 이후의 L1 히트를 꺼냄 (스위퍼가 Redis 접근 점수에 반영)
+
+        Returns:
+            Dict: 캐시 항목 키 -> (히트 횟수, 마지막 히트 시각 time.time())
+        """
+        with self._lock:
+            pending, self._pending_hits = self._pending_hits, {}
+        return {key: (int(count), last_hit) for key, (count, last_hit) in pending.items()}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_doc_key.clear()
+            self._bytes = 0
+            self._matrix = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            size, used = len(self._entries), self._bytes
+        exact_lookups = counters["exact_hits"] + counters["exact_misses"]
+        vector_lookups = counters["vector_hits"] + counters["vector_misses"]
+        return {
+            **counters,
+            "exact_hit_rate": counters["exact_hits"] / exact_lookups if exact_lookups else 0.0,
+            "vector_hit_rate": counters["vector_hits"] / vector_lookups if vector_lookups else 0.0,
+            "entries": size,
+            "max_entries": self.max_entries,
+            "estimated_mb": used / _MB,
+            "max_mb": self.max_bytes / _MB,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+    def _note_hit(self, doc_key: str):
+        """L1 히트를 접근 점수 반영 대기 목록에 추가 (락 안에서 호출)"""
+        pending = self._pending_hits.get(doc_key)
+        if pending is None:
+            self._pending_hits[doc_key] = [1, time.time()]
+        else:
+            pending[0] += 1
+            pending[1] = time.time()
+
+    def _expire_if_stale(self, entry: _LocalEntry) -> bool:
+        """TTL이 지난 항목이면 제거하고 True (락 안에서 호출)"""
+        if entry.expires_at > time.monotonic():
+            return False
+        self._remove(entry.exact_key)
+        self._counters["expirations"] += 1
+        return True
+
+    def _remove(self, exact_key: str) -> bool:
+        """항목 제거 (락 안에서 호출)"""
+        entry = self._entries.pop(exact_key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry.size
+        linked = self._by_doc_key.get(entry.doc_key)
+        if linked is not None:
+            linked.discard(exact_key)
+            if not linked:
+                del self._by_doc_key[entry.doc_key]
+        if entry.vector is not None:
+            self._matrix = None
+        return True
+
+    def _vector_matrix(self, dimension: int) -> Optional[np.ndarray]:
+        """벡터가 있는 항목들의 정규화 행렬 (락 안에서 호출, 변경이 없으면 재사용)"""
+        if self._matrix is None:
+            keys = [key for key, entry in self._entries.items()
+                    if entry.vector is not None and len(entry.vector) == dimension]
+            if not keys:
+                return None
+            self._matrix_keys = keys
+            self._matrix = np.vstack([self._entries[key].vector for key in keys])
+            self._matrix_slacks = np.array([self._entries[key].slack for key in keys], dtype=np.float32)
+        return self._matrix
+
+
+def _normalize(vector: np.ndarray) -> np.ndarray:
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class LocalCacheInvalidationListener:
+    """
+    Redis 무효화 채널을 구독해 L1 캐시 항목을 제거하는 백그라운드 스레드
+
+    메시지는 정확 일치 키 또는 캐시 항목 키의 JSON 배열이다.
+    """
+
+    def __init__(self, redis_client: redis.Redis, channel: str, cache: LocalAnswerCache):
+        self.redis_client = redis_client
+        self.channel = channel
+        self.cache = cache
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="local-cache-invalidation", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(self.channel)
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is not None:
+                        self.cache.invalidate(json.loads(message["data"]))
+            except Exception as e:
+                # 구독이 끊긴 동안의 변경은 반영되지 않으므로 L1을 비우고 다시 구독
+                print(f"⚠️ [LocalCache] 무효화 채널 오류: {e}")
+                self.cache.clear()
+                self._stop.wait(1.0)
+            finally:
+                pubsub.close()
@@ -1,8 +1,10 @@
 # main_processor.py (LangChain 버전)
 import sys
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import time
 import asyncio
+import threading
+from contextlib import contextmanager
 
 # import os
 
@@ -12,10 +14,35 @@ import asyncio
 
 # 로컬 모듈 임포트
 from app.redis.embedding_generator import EmbeddingGenerator
-from app.redis.redis_handler import RedisVectorSearchHandler, SemanticCacheHandler
+from app.redis.redis_handler import (
+    RedisVectorSearchHandler,
+    SemanticCacheHandler,
+    AsyncRedisVectorSearchHandler,
+    AsyncSemanticCacheHandler,
+    DEFAULT_VECTOR_DIMENSION,
+)
+from app.redis.vector_search import SearchHit
+from app.redis.client_registry import (
+    configure_redis_pools,
+    close_async_redis_clients,
+    get_async_redis_client,
+    get_pool_stats,
+    get_redis_client,
+)
+from app.redis.cache_eviction import CacheEvictionPolicy, AsyncCacheEvictionPolicy, CacheSweeper
+from app.redis.exact_match import CacheHitStats
+from app.redis.local_cache import LocalAnswerCache, LocalCacheInvalidationListener
+from app.redis.document_ingestion import DocumentIngestor
+from app.redis.numpy_backend import NumpyVectorIndex
+from app.redis.search_filter import SearchFilter
 from app.redis.debug_utils import RedisIndexDebugger
+from app.redis.index_rebuild import IndexRebuilder
+from app.config import settings
 from app.scrap_mcp.mcp_module import search_scrap
-from app.scrap_mcp.tool.gen_ans import ans_with_mcp
+from app.scrap_mcp.tool.browser_pool import close_browser_pool
+from app.scrap_mcp.tool.http_client import close_http_client
+from app.scrap_mcp.brave_search_module.brave_search_impl import ALLOWED_SITES
+from app.scrap_mcp.tool.gen_ans import ans_with_mcp, aans_with_mcp
 
 
 # 개발자 수정 가능 변수 (예시)
@@ -24,39 +51,170 @@ user_query = "해수면 상승으로 실제 우리나라 해안가 도시들이
 # 유사도 임계값 (이 값 이상의 유사도를 가진 결과가 있으면 유사한 것으로 간주)
 SIMILARITY_THRESHOLD = 0.4
 
+# 답변 생성에 사용하는 문서 필드 (벡터 검색 시 RETURN으로 이 필드만 요청)
+DOCUMENT_RETURN_FIELDS = ("text", "source_url")
+
 
 class MainProcessor:
     """LangChain 기반 RAG 시스템의 메인 처리 로직을 담당하는 클래스 (리팩토링)"""
 
-    def __init__(self, redis_url: str = 'redis://localhost:6379'):
+    def __init__(self, redis_url: str = 'redis://localhost:6379', startup_diagnostics: str = None):
         """
         메인 프로세서 초기화
 
         Args:
             redis_url (str): Redis 서버 URL
+            startup_diagnostics (str): 시작 시 전체 진단 방식 (lazy/background/full, None이면 config 값)
         """
         try:
             print("\n🚀 MainProcessor 초기화 시작")
+            started = time.perf_counter()
+            self.startup_timings: Dict[str, float] = {}
+            self.last_diagnosis: Optional[Dict[str, Any]] = None
+            if startup_diagnostics is None:
+                startup_diagnostics = settings.redis_startup_diagnostics
+
+            # 모든 핸들러가 공유할 Redis 커넥션 풀 설정 (URL당 풀 하나)
+            configure_redis_pools(
+                max_connections=settings.redis_max_connections,
+                timeout=settings.redis_pool_timeout_seconds,
+                health_check_interval=settings.redis_health_check_interval,
+                socket_keepalive=settings.redis_socket_keepalive
+            )
             
             # 임베딩 생성기 및 Redis 핸들러 초기화
-            self.embedding_generator = EmbeddingGenerator()
+            with self._startup_phase("embedding_generator"):
+                self.embedding_generator = EmbeddingGenerator(
+                    model_name=settings.embedding_model,
+                    dimensions=settings.embedding_dimensions,
+                    vector_type=settings.vector_type
+                )
+            vector_options = {
+                "vector_dimension": settings.embedding_dimensions or DEFAULT_VECTOR_DIMENSION,
+                "vector_type": settings.vector_type,
+                "index_options": {
+                    "hnsw_m": settings.hnsw_m,
+                    "hnsw_ef_construction": settings.hnsw_ef_construction,
+                    "hnsw_initial_cap": settings.hnsw_initial_cap,
+                    "ef_runtime": settings.hnsw_ef_runtime,
+                    "epsilon": settings.hnsw_epsilon,
+                },
+            }
+            # document_index만 검색 결과 캐시 사용 (시멘틱 캐시는 L1 캐시와 축출이 따로 있음)
+            document_options = {
+                **vector_options,
+                "index_options": {
+                    **vector_options["index_options"],
+                    "result_cache_ttl": settings.vector_search_cache_ttl_seconds or None,
+                },
+            }
+            # numpy 백엔드는 인덱스별로 하나를 만들어 동기/비동기 핸들러가 공유
+            document_backend = self._create_vector_backend("document_index")
+            cache_backend = self._create_vector_backend("semantic_cache_index")
+            self.vector_backends = [backend for backend in (document_backend, cache_backend) if backend is not None]
+            
+            with self._startup_phase("document_index"):
+                self.redis_handler = RedisVectorSearchHandler(
+                    embedding_model=self.embedding_generator,
+                    redis_url=redis_url,
+                    index_name="document_index",
+                    index_state_refresh_interval=settings.vector_index_state_refresh_seconds,
+                    vector_backend=document_backend,
+                    **document_options
+                )
+            
+            # 문서 검색 사전 필터 (신뢰 도메인/언어/최신성, 조건이 없으면 None)
+            self.document_filter = SearchFilter(
+                domains=ALLOWED_SITES if settings.document_filter_allowed_sites else None,
+                languages=settings.document_filter_languages,
+                max_age_days=settings.document_filter_max_age_days
+            ) or None
+
+            # 벡터 검색 MISS 시 스크랩한 문서를 document_index에 적재 (백그라운드)
+            self.document_ingestor = None
+            if settings.document_ingestion_enabled:
+                self.document_ingestor = DocumentIngestor(
+                    self.redis_handler,
+                    chunk_size=settings.document_chunk_size,
+                    chunk_overlap=settings.document_chunk_overlap
+                )
+            
+            # 시멘틱 캐시 용량 관리 (TTL, 최대 항목 수, LRU/LFU 축출, 메모리 예산)
+            eviction_options = {
+                "index_name": "semantic_cache_index",
+                "policy": settings.semantic_cache_eviction_policy,
+                "max_entries": settings.semantic_cache_max_entries,
+                "ttl_seconds": settings.semantic_cache_ttl_seconds,
+                "memory_budget_mb": settings.semantic_cache_memory_budget_mb,
+            }
+            self.cache_eviction = CacheEvictionPolicy(get_redis_client(redis_url), vector_backend=cache_backend,
+                                                      **eviction_options)
+            # 요청별 캐시 조회 결과 (정확 일치 / 시멘틱 / 미스)
+            self.cache_hit_stats = CacheHitStats()
+
+            # 워커 내 L1 답변 캐시 (Redis에서 덮어쓰기/축출되면 Pub/Sub으로 무효화)
+            self.local_cache = None
+            self.local_cache_listener = None
+            if settings.local_answer_cache_enabled:
+                self.local_cache = LocalAnswerCache(
+                    max_entries=settings.local_answer_cache_max_entries,
+                    max_mb=settings.local_answer_cache_max_mb,
+                    ttl_seconds=settings.local_answer_cache_ttl_seconds
+                )
+                self.local_cache_listener = LocalCacheInvalidationListener(
+                    get_redis_client(redis_url), self.cache_eviction.invalidation_channel, self.local_cache
+                )
+                self.local_cache_listener.start()
+
+            with self._startup_phase("semantic_cache_index"):
+                self.semantic_cache = SemanticCacheHandler(
+                    embedding_model=self.embedding_generator,
+                    redis_url=redis_url,
+                    index_state_refresh_interval=settings.vector_index_state_refresh_seconds,
+                    eviction_policy=self.cache_eviction,
+                    vector_backend=cache_backend,
+                    local_cache=self.local_cache,
+                    **vector_options
+                )
             
-            self.redis_handler = RedisVectorSearchHandler(
-                embedding_model=self.embedding_generator.embeddings,
+            # 비동기 핸들러 (FastAPI 라우트에서 aprocess로 사용, 연결은 첫 요청 시 생성)
+            self.async_redis_handler = AsyncRedisVectorSearchHandler(
+                embedding_model=self.embedding_generator,
                 redis_url=redis_url,
-                index_name="document_index"
+                index_name="document_index",
+                index_state_refresh_interval=settings.vector_index_state_refresh_seconds,
+                vector_backend=document_backend,
+                **document_options
             )
-            
-            self.semantic_cache = SemanticCacheHandler(
-                embedding_model=self.embedding_generator.embeddings,
-                redis_url=redis_url
+            self.async_semantic_cache = AsyncSemanticCacheHandler(
+                embedding_model=self.embedding_generator,
+                redis_url=redis_url,
+                index_state_refresh_interval=settings.vector_index_state_refresh_seconds,
+                eviction_policy=AsyncCacheEvictionPolicy(get_async_redis_client(redis_url),
+                                                         vector_backend=cache_backend, **eviction_options),
+                vector_backend=cache_backend,
+                local_cache=self.local_cache,
+                **vector_options
             )
+
+            # 만료 항목 정리 및 최대 항목 수/메모리 예산 초과분 축출 (백그라운드 스레드)
+            self.cache_sweeper = CacheSweeper(self.cache_eviction, settings.semantic_cache_sweep_interval_seconds,
+                                              local_cache=self.local_cache)
+            self.cache_sweeper.start()
+
+            # 별칭 기반 인덱스 재구축 (관리자 API로 시작, 한 번에 하나)
+            self.index_rebuilder: Optional[IndexRebuilder] = None
             
-            # 전체 시스템 상태 점검
-            debugger = RedisIndexDebugger(self.redis_handler.redis_client)
-            debugger.full_diagnosis(["document_index", "semantic_cache_index"])
-            
-            print("✅ 메인 프로세서 초기화 완료")
+            # 전체 시스템 상태 점검 (기본은 생략, 관리자 API로 필요할 때 실행)
+            if startup_diagnostics == "full":
+                with self._startup_phase("diagnosis"):
+                    self.run_diagnosis()
+            elif startup_diagnostics == "background":
+                threading.Thread(target=self.run_diagnosis, name="redis-diagnosis", daemon=True).start()
+
+            self.startup_timings["total"] = time.perf_counter() - started
+            timings = ", ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in self.startup_timings.items())
+            print(f"✅ 메인 프로세서 초기화 완료 ({timings})")
             
         except Exception as e:
             print(f"❌ 메인 프로세서 초기화 오류: {e}")
@@ -64,17 +222,135 @@ class MainProcessor:
             traceback.print_exc()
             sys.exit(1)
 
-    def process(self, query: str) -> Dict[str, Any]:
+    @staticmethod
+    def _create_vector_backend(index_name: str) -> Optional[NumpyVectorIndex]:
+        """설정이 numpy이면 프로세스 내 인덱스 생성 (redis이면 None, 핸들러가 RediSearch 인덱스 사용)"""
+        if settings.vector_backend == "redis":
+            return None
+        if settings.vector_backend != "numpy":
+            raise ValueError(f"지원하지 않는 벡터 백엔드: {settings.vector_backend} (가능: redis, numpy)")
+        return NumpyVectorIndex(
+            index_name=index_name,
+            vector_dimension=settings.embedding_dimensions or DEFAULT_VECTOR_DIMENSION,
+            persist_dir=settings.numpy_index_dir,
+            ann=settings.numpy_index_ann,
+            flush_interval=settings.numpy_index_flush_interval_seconds
+        )
+
+    @contextmanager
+    def _startup_phase(self, name: str):
+        """시작 단계별 소요 시간 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.startup_timings[name] = time.perf_counter() - started
+
+    def run_diagnosis(self) -> Dict[str, Any]:
         """
-        주어진 텍스트를 임베딩하고 유사도 검색 또는 저장을 수행
+        Redis 전체 진단 실행 (FT._LIST, 인덱스별 FT.INFO, 키 개수 SCAN)
 
-        Args:
-            query (str): 사용자 질문
+        키 공간 전체를 순회하므로 시작 시가 아니라 필요할 때(관리자 API, 백그라운드)만 실행한다.
+        """
+        started = time.perf_counter()
+        debugger = RedisIndexDebugger(self.redis_handler.redis_client)
+        diagnosis = debugger.full_diagnosis(["document_index", "semantic_cache_index"])
+        diagnosis["elapsed"] = time.perf_counter() - started
+        self.last_diagnosis = diagnosis
+        return diagnosis
 
-        Returns:
-            Dict[str, Any]: 처리 결과 정보
+    async def ainitialize(self):
+        """
+        비동기 핸들러 인덱스 상태 초기화 (이벤트 루프 안에서 호출)
+
+        동기 핸들러가 이미 확인한 상태를 그대로 사용하고, 없는 경우에만 비동기로 확인/생성한다.
+        """
+        for sync_handler, async_handler in (
+            (self.redis_handler, self.async_redis_handler),
+            (self.semantic_cache, self.async_semantic_cache),
+        ):
+            sync_state = sync_handler.vector_index.state
+            if sync_state.exists:
+                async_handler.vector_index.state.update(True, sync_state.doc_count)
+            else:
+                await async_handler.initialize()
+
+    async def aclose(self):
+        """시멘틱 캐시 스위퍼/L1 무효화 구독/문서 적재 중지, numpy 인덱스 기록 및 비동기 Redis 커넥션 풀 정리"""
+        await asyncio.to_thread(self.cache_sweeper.stop)
+        if self.document_ingestor is not None:
+            await asyncio.to_thread(self.document_ingestor.close)
+        if self.local_cache_listener is not None:
+            await asyncio.to_thread(self.local_cache_listener.stop)
+        for backend in self.vector_backends:
+            await asyncio.to_thread(backend.close)
+        await close_async_redis_clients()
+
+    def start_index_rebuild(self, index_name: str, **options) -> Dict[str, Any]:
+        """
+        인덱스를 현재 설정(차원/벡터 타입/HNSW)으로 백그라운드 재구축 (별칭 전환까지 검색 중단 없음)
+
+        Args:
+            index_name: document_index 또는 semantic_cache_index
+            options: IndexRebuilder 옵션 (max_docs_per_second, keep_old 등)
         """
-        result = {
+        handlers = {
+            "document_index": (self.redis_handler, self.async_redis_handler),
+            "semantic_cache_index": (self.semantic_cache, self.async_semantic_cache),
+        }
+        if index_name not in handlers:
+            raise ValueError(f"재구축할 수 없는 인덱스: {index_name} (가능: {', '.join(handlers)})")
+        if settings.vector_backend != "redis":
+            raise ValueError("인덱스 재구축은 redis 벡터 백엔드에서만 지원합니다.")
+        if self.index_rebuilder is not None and self.index_rebuilder.is_running:
+            raise RuntimeError(f"'{self.index_rebuilder.alias}' 재구축이 이미 진행 중입니다.")
+
+        def invalidate_handlers(_new_name: str):
+            for handler in handlers[index_name]:
+                handler.vector_index.state.invalidate()
+
+        options.setdefault("grace_seconds", settings.vector_index_state_refresh_seconds)
+        rebuilder = IndexRebuilder(
+            self.redis_handler.redis_client,
+            alias=index_name,
+            vector_dimension=settings.embedding_dimensions,
+            vector_type=settings.vector_type,
+            hnsw_m=settings.hnsw_m,
+            hnsw_ef_construction=settings.hnsw_ef_construction,
+            score_key=self.cache_eviction.access_key if index_name == "semantic_cache_index" else None,
+            on_switched=invalidate_handlers,
+            **options
+        )
+        # 다른 워커/프로세스가 같은 별칭을 재구축 중이면 클러스터 락에서 RuntimeError
+        rebuilder.start()
+        self.index_rebuilder = rebuilder
+        return self.get_index_rebuild_status()
+
+    def get_index_rebuild_status(self) -> Dict[str, Any]:
+        """마지막 인덱스 재구축 진행 상황 (단계, 복사 문서 수 등)"""
+        if self.index_rebuilder is None:
+            return {"phase": "idle"}
+        return {"alias": self.index_rebuilder.alias, "running": self.index_rebuilder.is_running,
+                **self.index_rebuilder.progress}
+
+    def get_semantic_cache_stats(self) -> Dict[str, Any]:
+        """시멘틱 캐시 현재 크기, 누적 축출 횟수, 정책 설정, 정확 일치/시멘틱 히트율, L1/문서 검색 결과 캐시 통계 (히트율/L1/결과 캐시는 워커 단위)"""
+        stats = self.cache_eviction.get_stats()
+        stats["hit_rates"] = self.cache_hit_stats.to_dict()
+        stats["local_cache"] = self.local_cache.stats() if self.local_cache is not None else None
+        result_cache = getattr(self.async_redis_handler.vector_index, "result_cache", None)
+        stats["document_result_cache"] = result_cache.stats() if result_cache is not None else None
+        return stats
+
+    @staticmethod
+    def get_pool_stats() -> Dict[str, Any]:
+        """Redis 커넥션 풀 사용 현황"""
+        return get_pool_stats()
+
+    @staticmethod
+    def _new_result() -> Dict[str, Any]:
+        """처리 결과 기본 구조"""
+        return {
             "success": False,
             "operation": None,
             "message": "",
@@ -83,73 +359,229 @@ class MainProcessor:
             "vector_search_results": [],
             "final_answer": None
         }
+
+    @staticmethod
+    def _apply_exact_hit(result: Dict[str, Any], hit: SearchHit) -> Dict[str, Any]:
+        """정확 일치 캐시 HIT 결과 반영 (임베딩/벡터 검색 없이 반환)"""
+        answer = hit.get("answer")
+        print(f"🎯 [정확 일치 캐시 HIT] ({hit.key})")
+        result["operation"] = "exact_cache_hit"
+        result["cache_answer"] = answer
+        result["success"] = True
+        result["message"] = "정확 일치 캐시에서 답변을 반환했습니다."
+        result["final_answer"] = answer
+        return result
+
+    @staticmethod
+    def _apply_cache_hit(result: Dict[str, Any], cache_results: List[SearchHit]) -> Dict[str, Any]:
+        """시멘틱 캐시 HIT 결과 반영"""
+        best = max(cache_results, key=lambda hit: hit.similarity)
+        answer = best.get("answer")
+        print(f"🎯 [시멘틱 캐시 HIT] 유사도: {best.similarity:.3f} ({best.key})")
+        result["operation"] = "cache_hit"
+        result["cache_answer"] = answer
+        result["success"] = True
+        result["message"] = "시멘틱 캐시에서 답변을 반환했습니다."
+        result["final_answer"] = answer
+        return result
+
+    @staticmethod
+    def _docs_from_hits(vector_results: List[SearchHit]) -> List[Dict[str, str]]:
+        """벡터 검색 결과를 답변 생성용 문서(url, content) 목록으로 변환"""
+        return [
+            {"url": hit.get("source_url") or hit.key, "content": hit.get("text", "")}
+            for hit in vector_results
+        ]
+
+    @staticmethod
+    def _log_scraped_docs(query_ans_pool: List[Dict[str, Any]]):
+        """MCP로 수집된 문서 내용 확인용 로그"""
+        print(f"📄 MCP 문서 수집 완료: {len(query_ans_pool)}개")
+        
+        # 🔧 수집된 문서 내용 확인
+        print("\n=== 수집된 문서 내용 확인 ===")
+        for i, doc in enumerate(query_ans_pool, 1):
+            print(f"📄 문서 {i}:")
+            print(f"   URL: {doc.get('url', 'N/A')}")
+            print(f"   내용 길이: {len(doc.get('content', ''))}")
+            print(f"   내용 미리보기: {doc.get('content', '')[:200]}...")
+            print("-" * 50)
+        print("=" * 60)
+
+    @staticmethod
+    async def _search_scrap_once(query: str) -> List[Dict[str, Any]]:
+        """
+        동기 처리(process)용 검색/스크랩 (asyncio.run 한 번 안에서 실행)
+
+        공유 브라우저 풀/HTTP 클라이언트는 이벤트 루프에 묶이므로 루프가 끝나기 전에 닫는다.
+        """
+        try:
+            return await search_scrap(query, target_docs=settings.scrap_target_docs,
+                                      scrape_concurrency=settings.scrap_concurrency,
+                                      all_sources=settings.scrap_all_sources)
+        finally:
+            await close_browser_pool()
+            await close_http_client()
+
+    def _ingest_scraped_docs(self, query_ans_pool: List[Dict[str, Any]]):
+        """스크랩 문서를 document_index에 백그라운드로 적재 (응답은 기다리지 않음)"""
+        if self.document_ingestor is None:
+            return
+        future = self.document_ingestor.submit(query_ans_pool)
+        if future is not None:
+            # 동기 핸들러로 저장하므로 비동기 핸들러의 인덱스 상태(문서 수)는 다음 검색 때 다시 확인
+            future.add_done_callback(lambda _: self.async_redis_handler.vector_index.state.invalidate())
+
+    @staticmethod
+    def _apply_generated_answer(result: Dict[str, Any], generated_answer: str) -> Dict[str, Any]:
+        """새로 생성한 답변 결과 반영"""
+        print(f"✅ GPT 답변 생성 완료")
+        print(f"📝 답변 길이: {len(generated_answer)}")
+        print(f"📝 답변 내용: {generated_answer}")
+        result["operation"] = "cache_miss_saved"
+        result["cache_answer"] = generated_answer
+        result["success"] = True
+        result["message"] = "새 답변을 생성하여 시멘틱 캐시에 저장했습니다."
+        result["final_answer"] = generated_answer
+        return result
+
+    def process(self, query: str) -> Dict[str, Any]:
+        """
+        주어진 텍스트를 임베딩하고 유사도 검색 또는 저장을 수행
+
+        Args:
+            query (str): 사용자 질문
+
+        Returns:
+            Dict[str, Any]: 처리 결과 정보
+        """
+        result = self._new_result()
+
+        # 0. 정확 일치 캐시 (GET 1회, 임베딩/벡터 검색 생략)
+        exact_hit = self.semantic_cache.search_exact_question(query)
+        if exact_hit is not None:
+            self.cache_hit_stats.record("exact")
+            return self._apply_exact_hit(result, exact_hit)
+
+        # 쿼리 임베딩 (요청당 한 번만 계산하여 캐시 검색/문서 검색/캐시 저장에 공유)
+        query_embedding = self.embedding_generator.embed(query)
+
         # 1. 시멘틱 캐시 검색
         cache_results = self.semantic_cache.search_similar_question(
             query=query,
-            score_threshold=0.85
+            score_threshold=0.85,
+            embedding=query_embedding
         )
         print(f"🔍 시멘틱 캐시 검색 결과: {len(cache_results)}개 (임계값: 0.85)")
         if cache_results:
-            best = max(cache_results, key=lambda x: x["similarity"])
-            print(f"🎯 [시멘틱 캐시 HIT] 유사도: {best['similarity']:.3f}")
-            print(f"📝 유사 질문: {best['question']}")
-            result["operation"] = "cache_hit"
-            result["cache_answer"] = best["answer"]
-            result["success"] = True
-            result["message"] = "시멘틱 캐시에서 답변을 반환했습니다."
-            result["final_answer"] = best["answer"]
-            return result
+            self.cache_hit_stats.record("semantic")
+            return self._apply_cache_hit(result, cache_results)
+        self.cache_hit_stats.record("miss")
 
         # 2. 벡터 검색 (문서 기반 근거 탐색)
         vector_results = self.redis_handler.search_similar_embeddings(
             query_text=query,
             top_k=3,
-            similarity_threshold=0.4
+            similarity_threshold=0.4,
+            query_embedding=query_embedding,
+            return_fields=DOCUMENT_RETURN_FIELDS,
+            search_filter=self.document_filter
         )
         result["vector_search_results"] = vector_results
 
         if vector_results:
             print("[벡터 DB HIT] 유사 문서로 답변 생성")
-            query_ans_pool = [item["metadata"]["text"] for item in vector_results]
+            query_ans_pool = self._docs_from_hits(vector_results)
         else:
             print("🔍 MCP 검색 시작...")
-            query_ans_pool = asyncio.run(search_scrap(query))
-            print(f"📄 MCP 문서 수집 완료: {len(query_ans_pool)}개")
-            
-            # 🔧 수집된 문서 내용 확인
-            print("\n=== 수집된 문서 내용 확인 ===")
-            for i, doc in enumerate(query_ans_pool, 1):
-                print(f"📄 문서 {i}:")
-                print(f"   URL: {doc.get('url', 'N/A')}")
-                print(f"   내용 길이: {len(doc.get('content', ''))}")
-                print(f"   내용 미리보기: {doc.get('content', '')[:200]}...")
-                print("-" * 50)
-            print("=" * 60)
+            query_ans_pool = asyncio.run(self._search_scrap_once(query))
+            self._log_scraped_docs(query_ans_pool)
+            self._ingest_scraped_docs(query_ans_pool)
 
         # 3. GPT 기반 답변 생성
         print("🤖 GPT 답변 생성 시작...")
         print(f"📝 전달할 문서 개수: {len(query_ans_pool)}")
         
         generated_answer = ans_with_mcp(query=query, docs=query_ans_pool)
-        
-        print(f"✅ GPT 답변 생성 완료")
-        print(f"📝 답변 길이: {len(generated_answer)}")
-        print(f"📝 답변 내용: {generated_answer}")
-        # # 3. 답변 생성 (여기선 임시 답변)
-        # generated_answer = f"[임시 답변] '{query}'에 대한 답변입니다."
 
         # 4. 캐시에 저장
         self.semantic_cache.save_qa_pair(
             question=query,
             answer=generated_answer,
-            metadata={"source": "gpt", "timestamp": time.time()}
+            metadata={"source": "gpt", "timestamp": time.time()},
+            embedding=query_embedding
         )
-        result["operation"] = "cache_miss_saved"
-        result["cache_answer"] = generated_answer
-        result["success"] = True
-        result["message"] = "새 답변을 생성하여 시멘틱 캐시에 저장했습니다."
-        result["final_answer"] = generated_answer
-        return result
+        return self._apply_generated_answer(result, generated_answer)
+
+    async def aprocess(self, query: str) -> Dict[str, Any]:
+        """
+        process의 비동기 버전 (redis.asyncio 핸들러 사용, 스레드 전환 없이 이벤트 루프에서 실행)
+
+        Args:
+            query (str): 사용자 질문
+
+        Returns:
+            Dict[str, Any]: 처리 결과 정보
+        """
+        result = self._new_result()
+
+        # 0. 정확 일치 캐시 (GET 1회, 임베딩/벡터 검색 생략)
+        exact_hit = await self.async_semantic_cache.search_exact_question(query)
+        if exact_hit is not None:
+            self.cache_hit_stats.record("exact")
+            return self._apply_exact_hit(result, exact_hit)
+
+        # 쿼리 임베딩 (요청당 한 번)
+        query_embedding = await self.embedding_generator.aembed(query)
+
+        # 1. 시멘틱 캐시 검색
+        cache_results = await self.async_semantic_cache.search_similar_question(
+            query=query,
+            score_threshold=0.85,
+            embedding=query_embedding
+        )
+        print(f"🔍 시멘틱 캐시 검색 결과: {len(cache_results)}개 (임계값: 0.85)")
+        if cache_results:
+            self.cache_hit_stats.record("semantic")
+            return self._apply_cache_hit(result, cache_results)
+        self.cache_hit_stats.record("miss")
+
+        # 2. 벡터 검색 (문서 기반 근거 탐색)
+        vector_results = await self.async_redis_handler.search_similar_embeddings(
+            query_text=query,
+            top_k=3,
+            similarity_threshold=0.4,
+            query_embedding=query_embedding,
+            return_fields=DOCUMENT_RETURN_FIELDS,
+            search_filter=self.document_filter
+        )
+        result["vector_search_results"] = vector_results
+
+        if vector_results:
+            print("[벡터 DB HIT] 유사 문서로 답변 생성")
+            query_ans_pool = self._docs_from_hits(vector_results)
+        else:
+            print("🔍 MCP 검색 시작...")
+            query_ans_pool = await search_scrap(query, target_docs=settings.scrap_target_docs,
+                                                scrape_concurrency=settings.scrap_concurrency,
+                                                all_sources=settings.scrap_all_sources)
+            self._log_scraped_docs(query_ans_pool)
+            self._ingest_scraped_docs(query_ans_pool)
+
+        # 3. GPT 기반 답변 생성
+        print("🤖 GPT 답변 생성 시작...")
+        print(f"📝 전달할 문서 개수: {len(query_ans_pool)}")
+
+        generated_answer = await aans_with_mcp(query=query, docs=query_ans_pool)
+
+        # 4. 캐시에 저장
+        await self.async_semantic_cache.save_qa_pair(
+            question=query,
+            answer=generated_answer,
+            metadata={"source": "gpt", "timestamp": time.time()},
+            embedding=query_embedding
+        )
+        return self._apply_generated_answer(result, generated_answer)
 
     def display_results(self, result: Dict[str, Any]) -> None:
         """
@@ -162,7 +594,12 @@ class MainProcessor:
             print(f"\n❌ 오류: {result['message']}")
             return
 
-        if result["operation"] == "cache_hit":
+        if result["operation"] == "exact_cache_hit":
+            print("\n🔍 [정확 일치 캐시 HIT] 답변:")
+            print("-" * 80)
+            print(result["cache_answer"])
+            print("-" * 80)
+        elif result["operation"] == "cache_hit":
             print("\n🔍 [시멘틱 캐시 HIT] 답변:")
             print("-" * 80)
             print(result["cache_answer"])
@@ -174,7 +611,7 @@ class MainProcessor:
             print("-" * 80)
             print("\n[벡터 검색 결과]")
             for idx, item in enumerate(result["vector_search_results"], 1):
-                print(f"{idx}. {item['metadata'].get('text', '')} (유사도: {item['similarity']:.2f})")
+                print(f"{idx}. {item.get('text', '')} (유사도: {item.similarity:.2f})")
             print("-" * 80)
 
 
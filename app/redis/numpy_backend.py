@@ -0,0 +1,461 @@
+# numpy_backend.py
+"""
+프로세스 내 NumPy 벡터 인덱스 (Redis Stack 없이 동작하는 VectorBackend 구현)
+
+단위 테스트, 로컬 개발, 소규모 단일 노드 배포용.
+- 연속된 float32 행렬에 정규화 벡터를 저장하고 행렬-벡터 곱 + argpartition으로 top-k 계산
+- persist_dir를 지정하면 벡터는 memmap(.npy), 키/메타데이터는 JSON으로 디스크에 유지
+  (단건 쓰기는 변경 표시만 하고 백그라운드 스레드가 flush_interval마다 기록, add_documents와 close는 즉시 기록)
+- ann=True이면 문서 수가 ann_min_size 이상일 때 IVF(k-means 클러스터) 근사 검색 사용
+  (학습은 쓰기 후 백그라운드 스레드에서 하고, 끝나기 전까지는 정확 검색)
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.redis.search_filter import SearchFilter
+from app.redis.vector_backend import VectorBackend
+from app.redis.vector_search import (
+    BULK_CHUNK_SIZE,
+    BULK_MAX_IN_FLIGHT,
+    DEFAULT_RETURN_FIELDS,
+    IndexStateTracker,
+    SearchHit,
+    iter_chunks,
+    new_bulk_report,
+)
+
+
+# 초기 행렬 용량 (가득 차면 두 배로 늘림)
+INITIAL_CAPACITY = 1024
+
+# ANN(IVF) 기본값: 적용 최소 문서 수, 클러스터 수 계산 기준, 검색 시 탐색할 클러스터 수, k-means 반복 횟수
+ANN_MIN_SIZE = 10000
+ANN_POINTS_PER_LIST = 256
+ANN_NPROBE = 8
+ANN_KMEANS_ITERATIONS = 10
+
+SUPPORTED_METRICS = ("COSINE", "IP")
+
+# 단건 쓰기 변경분을 디스크에 기록하는 기본 주기 (초)
+DEFAULT_FLUSH_INTERVAL = 5.0
+
+
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class NumpyVectorIndex(VectorBackend):
+    """NumPy 행렬 기반 플랫(정확) 검색 + 선택적 IVF 근사 검색 인덱스 (스레드 안전)"""
+
+    def __init__(self,
+                 index_name: str = "climate_vectors",
+                 vector_dimension: int = 1536,
+                 distance_metric: str = "COSINE",
+                 persist_dir: Optional[str] = None,
+                 ann: bool = False,
+                 ann_min_size: int = ANN_MIN_SIZE,
+                 ann_nprobe: int = ANN_NPROBE,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        """
+        Args:
+            index_name: 인덱스 이름 (검색 결과 키 doc:<index>:<id>와 저장 파일명에 사용)
+            vector_dimension: 벡터 차원
+            distance_metric: COSINE(벡터 정규화 후 내적) 또는 IP(내적)
+            persist_dir: 저장 디렉터리 (None이면 메모리에만 유지)
+            ann: IVF 근사 검색 사용 여부
+            ann_min_size: 근사 검색을 적용할 최소 문서 수 (미만이면 정확 검색)
+            ann_nprobe: 근사 검색 시 탐색할 클러스터 수 (높을수록 정확하지만 느림)
+            flush_interval: 단건 쓰기 변경분 기록 주기 (초, 0이면 add_documents/close 때만 기록)
+        """
+        distance_metric = distance_metric.upper()
+        if distance_metric not in SUPPORTED_METRICS:
+            raise ValueError(f"지원하지 않는 거리 함수: {distance_metric} (가능: {', '.join(SUPPORTED_METRICS)})")
+        self.index_name = index_name
+        self.vector_dimension = vector_dimension
+        self.distance_metric = distance_metric
+        self.persist_dir = persist_dir
+        self.ann = ann
+        self.ann_min_size = ann_min_size
+        self.ann_nprobe = ann_nprobe
+        self.flush_interval = flush_interval
+        # 프로세스 내 인덱스이므로 상태는 항상 정확 (재확인 불필요)
+        self.state = IndexStateTracker(refresh_interval=None)
+
+        self._lock = threading.RLock()
+        self._vectors = np.zeros((0, vector_dimension), dtype=np.float32)
+        self._size = 0
+        self._ids: List[str] = []
+        self._metadata: List[Dict[str, Any]] = []
+        self._rows: Dict[str, int] = {}
+        # IVF 상태 (학습 시점 문서 수의 두 배가 되면 다시 학습)
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments = np.zeros(0, dtype=np.int32)
+        self._trained_size = 0
+        # 백그라운드 학습 스레드 / 학습 중 행 배치가 바뀌었는지 확인하는 버전 (삭제·덮어쓰기마다 증가)
+        self._trainer: Optional[threading.Thread] = None
+        self._layout_version = 0
+        self._opened = False
+        # 디스크 기록 대기 중인 변경 여부 / 기록 직렬화 락 (순서: _flush_lock -> _lock) / 주기 기록 스레드
+        self._dirty = False
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+
+        self.ensure_index_exists()
+
+    # --- 저장소 ---
+
+    def _vectors_path(self) -> str:
+        return os.path.join(self.persist_dir, f"{self.index_name}.vectors.npy")
+
+    def _meta_path(self) -> str:
+        return os.path.join(self.persist_dir, f"{self.index_name}.meta.json")
+
+    def ensure_index_exists(self):
+        """저장된 인덱스가 있으면 불러오고, 없으면 빈 인덱스 생성 (이미 열려 있으면 그대로 사용)"""
+        with self._lock:
+            if self._opened:
+                return
+            self._opened = True
+            if self.persist_dir and os.path.exists(self._meta_path()):
+                self._load()
+                print(f"✅ NumPy 인덱스 '{self.index_name}' 불러옴 ({self._size}개 문서)")
+                self._schedule_training()
+            else:
+                self._allocate(INITIAL_CAPACITY)
+                print(f"NumPy 인덱스 '{self.index_name}' 생성 완료")
+            self.state.update(True, self._size)
+
+    def _allocate(self, capacity: int):
+        """capacity 행의 행렬 할당 (persist_dir가 있으면 memmap 파일) 후 기존 행 복사"""
+        if self.persist_dir:
+            os.makedirs(self.persist_dir, exist_ok=True)
+            tmp_path = self._vectors_path() + ".tmp"
+            matrix = np.lib.format.open_memmap(
+                tmp_path, mode="w+", dtype=np.float32, shape=(capacity, self.vector_dimension)
+            )
+            matrix[:self._size] = self._vectors[:self._size]
+            matrix.flush()
+            del matrix
+            os.replace(tmp_path, self._vectors_path())
+            self._vectors = np.load(self._vectors_path(), mmap_mode="r+")
+        else:
+            matrix = np.zeros((capacity, self.vector_dimension), dtype=np.float32)
+            matrix[:self._size] = self._vectors[:self._size]
+            self._vectors = matrix
+        assignments = np.full(capacity, -1, dtype=np.int32)
+        assignments[:self._size] = self._assignments[:self._size]
+        self._assignments = assignments
+
+    def _load(self):
+        with open(self._meta_path(), encoding="utf-8") as f:
+            meta = json.load(f)
+        self._ids = meta["ids"]
+        self._metadata = meta["metadata"]
+        self._size = len(self._ids)
+        self._rows = {doc_id: row for row, doc_id in enumerate(self._ids)}
+        self._vectors = np.load(self._vectors_path(), mmap_mode="r+")
+        self._assignments = np.full(len(self._vectors), -1, dtype=np.int32)
+        self._centroids = None
+
+    def flush(self):
+        """memmap 벡터와 키/메타데이터를 디스크에 기록 (persist_dir가 없으면 아무것도 안 함)"""
+        if not self.persist_dir:
+            return
+        with self._flush_lock:
+            # 목록만 복사하고 JSON 직렬화는 락 밖에서 (메타데이터 dict는 덮어쓸 때 교체되므로 얕은 복사로 충분)
+            with self._lock:
+                if isinstance(self._vectors, np.memmap):
+                    self._vectors.flush()
+                ids, metadata = list(self._ids), list(self._metadata)
+                self._dirty = False
+            tmp_path = self._meta_path() + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"ids": ids, "metadata": metadata}, f, ensure_ascii=False)
+            os.replace(tmp_path, self._meta_path())
+
+    def close(self):
+        """주기 기록·학습 스레드 중지 후 남은 변경분 기록"""
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        trainer = self._trainer
+        if trainer is not None:
+            trainer.join()
+        if self._dirty:
+            self.flush()
+
+    def _mark_dirty(self):
+        """단건 쓰기 후 변경 표시 (락 안에서 호출, 처음이면 주기 기록 스레드 시작)"""
+        if not self.persist_dir:
+            return
+        self._dirty = True
+        if self._flusher is None and self.flush_interval and not self._stop.is_set():
+            self._flusher = threading.Thread(target=self._run_flusher, name=f"numpy-flush-{self.index_name}",
+                                             daemon=True)
+            self._flusher.start()
+
+    def _run_flusher(self):
+        while not self._stop.wait(self.flush_interval):
+            if not self._dirty:
+                continue
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"⚠️ NumPy 인덱스 '{self.index_name}' 기록 오류: {e}")
+
+    # --- 쓰기 ---
+
+    def _prepare_vector(self, embedding) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        if vector.shape != (self.vector_dimension,):
+            raise ValueError(f"벡터 차원 불일치: {vector.shape} (인덱스 {self.vector_dimension})")
+        if self.distance_metric == "COSINE":
+            vector = _normalize_rows(vector)
+        return vector
+
+    def _put(self, doc_id: str, vector: np.ndarray, metadata: Dict[str, Any]) -> bool:
+        """한 건 저장 (락 안에서 호출, 새 문서면 True)"""
+        fields = dict(metadata)
+        fields["custom_key"] = doc_id
+        fields["id"] = doc_id
+        row = self._rows.get(doc_id)
+        is_new = row is None
+        if is_new:
+            if self._size == len(self._vectors):
+                self._allocate(max(INITIAL_CAPACITY, len(self._vectors) * 2))
+            row = self._size
+            self._size += 1
+            self._rows[doc_id] = row
+            self._ids.append(doc_id)
+            self._metadata.append(fields)
+        else:
+            self._metadata[row] = fields
+            self._layout_version += 1
+        self._vectors[row] = vector
+        if self._centroids is not None:
+            self._assignments[row] = int(np.argmax(self._centroids @ vector))
+        return is_new
+
+    def add_document(self, doc_id: str, embedding: List[float], metadata: Dict[str, Any]) -> bool:
+        """문서와 임베딩 벡터를 인덱스에 추가 (같은 ID는 덮어씀)"""
+        try:
+            vector = self._prepare_vector(embedding)
+            with self._lock:
+                if self._put(doc_id, vector, metadata):
+                    self.state.record_add()
+                self._mark_dirty()
+                self._schedule_training()
+            return True
+        except Exception as e:
+            print(f"문서 추가 오류: {e}")
+            return False
+
+    def add_documents(self,
+                      documents: Iterable[Tuple[str, List[float], Dict[str, Any]]],
+                      chunk_size: int = BULK_CHUNK_SIZE,
+                      max_in_flight: int = BULK_MAX_IN_FLIGHT) -> Dict[str, Any]:
+        """
+        여러 문서를 청크 단위로 추가 (디스크 기록은 마지막에 한 번)
+
+        max_in_flight는 인터페이스 호환용이며 사용하지 않는다.
+        """
+        report = new_bulk_report()
+        started = time.perf_counter()
+        with self._lock:
+            for chunk in iter_chunks(documents, chunk_size):
+                report["total"] += len(chunk)
+                report["chunks"] += 1
+                for doc_id, embedding, metadata in chunk:
+                    try:
+                        if self._put(doc_id, self._prepare_vector(embedding), metadata):
+                            self.state.record_add()
+                        report["succeeded"] += 1
+                    except Exception as e:
+                        report["failed"].append({"key": doc_id, "error": str(e)})
+            self._schedule_training()
+        self.flush()
+        report["elapsed"] = time.perf_counter() - started
+        print(f"📦 대량 저장 완료 ({self.index_name}): 성공 {report['succeeded']}개 / "
+              f"실패 {len(report['failed'])}개 / 청크 {report['chunks']}개 ({report['elapsed']:.2f}초)")
+        return report
+
+    def delete_document(self, doc_id: str) -> bool:
+        """문서 삭제 (마지막 행을 빈자리로 옮겨 행렬을 연속으로 유지)"""
+        with self._lock:
+            row = self._rows.pop(doc_id, None)
+            if row is None:
+                return False
+            last = self._size - 1
+            if row != last:
+                moved_id = self._ids[last]
+                self._vectors[row] = self._vectors[last]
+                self._assignments[row] = self._assignments[last]
+                self._ids[row] = moved_id
+                self._metadata[row] = self._metadata[last]
+                self._rows[moved_id] = row
+            self._ids.pop()
+            self._metadata.pop()
+            self._assignments[last] = -1
+            self._size = last
+            self._layout_version += 1
+            self.state.record_delete()
+            self._mark_dirty()
+            return True
+
+    def has_documents(self, doc_ids: Sequence[str]) -> List[bool]:
+        """문서 ID별 저장 여부"""
+        with self._lock:
+            return [doc_id in self._rows for doc_id in doc_ids]
+
+    # --- 검색 ---
+
+    def _schedule_training(self):
+        """IVF (재)학습이 필요하면 백그라운드 학습 스레드 시작 (락 안에서 호출, 학습 중이면 무시)"""
+        if not self.ann or self._size < self.ann_min_size or self._stop.is_set():
+            return
+        if self._centroids is not None and self._size < 2 * self._trained_size:
+            return
+        if self._trainer is not None:
+            return
+        self._trainer = threading.Thread(target=self._run_training, name=f"numpy-ivf-{self.index_name}",
+                                         daemon=True)
+        self._trainer.start()
+
+    def _run_training(self):
+        """스냅샷으로 락 밖에서 학습한 뒤 클러스터 중심과 행 배정을 교체"""
+        try:
+            with self._lock:
+                vectors = np.array(self._vectors[:self._size])
+                version = self._layout_version
+            centroids = self._fit_centroids(vectors)
+            if centroids is None:
+                return
+            assignments = np.argmax(vectors @ centroids.T, axis=1)
+            with self._lock:
+                # 학습 중 삭제·덮어쓰기가 없었으면 스냅샷 배정을 쓰고 새로 추가된 행만 배정
+                assigned = len(vectors) if version == self._layout_version else 0
+                self._assignments[:assigned] = assignments
+                if self._size > assigned:
+                    self._assignments[assigned:self._size] = np.argmax(
+                        self._vectors[assigned:self._size] @ centroids.T, axis=1
+                    )
+                self._centroids = centroids
+                self._trained_size = len(vectors)
+            print(f"✅ NumPy 인덱스 '{self.index_name}' IVF 학습 완료 ({len(centroids)}개 클러스터)")
+        except Exception as e:
+            print(f"⚠️ NumPy 인덱스 '{self.index_name}' IVF 학습 오류: {e}")
+        finally:
+            with self._lock:
+                self._trainer = None
+                # 학습 중 문서가 두 배 이상 늘었으면 이어서 다시 학습
+                if self._centroids is not None:
+                    self._schedule_training()
+
+    def _fit_centroids(self, vectors: np.ndarray) -> Optional[np.ndarray]:
+        """k-means로 IVF 클러스터 중심 학습 (종료 요청을 받으면 None)"""
+        size = len(vectors)
+        n_lists = max(1, int(np.sqrt(size)), size // ANN_POINTS_PER_LIST)
+        n_lists = min(n_lists, size)
+        rng = np.random.default_rng(0)
+        centroids = vectors[rng.choice(size, n_lists, replace=False)].copy()
+        for _ in range(ANN_KMEANS_ITERATIONS):
+            if self._stop.is_set():
+                return None
+            assignments = np.argmax(vectors @ centroids.T, axis=1)
+            for cluster in range(n_lists):
+                members = vectors[assignments == cluster]
+                if len(members):
+                    centroids[cluster] = members.mean(axis=0)
+            centroids = _normalize_rows(centroids)
+        return centroids
+
+    def _candidate_rows(self, query: np.ndarray) -> Optional[np.ndarray]:
+        """근사 검색 후보 행 (정확 검색이면 None, 락 안에서 호출, 학습 전이면 정확 검색)"""
+        if not self.ann or self._size < self.ann_min_size or self._centroids is None:
+            return None
+        nprobe = min(self.ann_nprobe, len(self._centroids))
+        probes = np.argpartition(-(self._centroids @ query), nprobe - 1)[:nprobe]
+        return np.flatnonzero(np.isin(self._assignments[:self._size], probes))
+
+    def search_similar(self,
+                       query_vector: List[float],
+                       top_k: int = 5,
+                       score_threshold: float = 0.7,
+                       return_fields: Optional[Sequence[str]] = None,
+                       ef_runtime: Optional[int] = None,
+                       epsilon: Optional[float] = None,
+                       search_filter: Optional[SearchFilter] = None) -> List[SearchHit]:
+        """
+        유사한 벡터 검색 (행렬-벡터 곱 + argpartition top-k)
+
+        Args:
+            query_vector: 검색할 벡터
+            top_k: 반환할 최대 결과 수
+            score_threshold: 유사도 임계값
+            return_fields: 돌려받을 메타데이터 필드 (None이면 DEFAULT_RETURN_FIELDS)
+            ef_runtime, epsilon: HNSW 전용 파라미터 (무시, 근사 검색 정확도는 ann_nprobe로 조정)
+            search_filter: 사전 필터 (조건에 맞는 행 안에서 top-k 계산)
+
+        Returns:
+            List[SearchHit]: 유사도 내림차순 검색 결과
+        """
+        if return_fields is None:
+            return_fields = DEFAULT_RETURN_FIELDS
+        try:
+            query = self._prepare_vector(query_vector)
+        except ValueError as e:
+            print(f"벡터 검색 오류: {e}")
+            return []
+        with self._lock:
+            if self._size == 0 or top_k <= 0:
+                return []
+            if search_filter:
+                # 필터를 통과한 행 안에서 정확 검색 (IVF 목록으로 먼저 좁히면 결과가 모자랄 수 있음)
+                rows = np.array([row for row in range(self._size) if search_filter.matches(self._metadata[row])],
+                                dtype=np.int64)
+            else:
+                rows = self._candidate_rows(query)
+            matrix = self._vectors[:self._size] if rows is None else self._vectors[rows]
+            scores = matrix @ query
+            k = min(top_k, len(scores))
+            if k == 0:
+                return []
+            top = np.argpartition(-scores, k - 1)[:k] if k < len(scores) else np.arange(len(scores))
+            top = top[np.argsort(-scores[top])]
+            hits = []
+            for position in top:
+                similarity = float(scores[position])
+                if similarity < score_threshold:
+                    break
+                row = int(position if rows is None else rows[position])
+                metadata = self._metadata[row]
+                fields = {name: metadata[name] for name in return_fields if name in metadata}
+                hits.append(SearchHit(self.doc_key(self._ids[row]), similarity, fields))
+            return hits
+
+    def get_index_info(self) -> Dict[str, Any]:
+        """인덱스 정보 (FT.INFO와 같은 num_docs 키 포함)"""
+        with self._lock:
+            return {
+                "index_name": self.index_name,
+                "backend": "numpy",
+                "num_docs": self._size,
+                "dimension": self.vector_dimension,
+                "distance_metric": self.distance_metric,
+                "capacity": len(self._vectors),
+                "vector_memory_mb": self._vectors[:self._size].nbytes / (1024 * 1024),
+                "persist_dir": self.persist_dir,
+                "ann": self.ann,
+                "ann_lists": 0 if self._centroids is None else len(self._centroids),
+                "ann_training": self._trainer is not None,
+            }
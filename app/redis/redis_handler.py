@@ -1,18 +1,105 @@
 import redis
-from app.redis.vector_search import VectorSearchIndex
+import redis.asyncio
+from app.redis.client_registry import get_redis_client, get_async_redis_client
+from app.redis.vector_search import (
+    VectorSearchIndex,
+    AsyncVectorSearchIndex,
+    SearchHit,
+    INDEX_STATE_REFRESH_INTERVAL,
+    BULK_CHUNK_SIZE,
+    BULK_MAX_IN_FLIGHT,
+    iter_chunks,
+)
+from app.redis.vector_codec import encode_vector, decode_vector
+from app.redis.cache_eviction import CacheEvictionPolicy, AsyncCacheEvictionPolicy
+from app.redis.exact_match import question_hash
+from app.redis.local_cache import LocalAnswerCache
+from app.redis.vector_backend import VectorBackend, AsyncVectorBackendAdapter
+from app.redis.search_filter import SearchFilter, detect_language, domain_tags
 from app.redis.debug_utils import RedisIndexDebugger
 import numpy as np
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Sequence, Tuple
 import time
 import uuid
 import hashlib
+import json
 
 
-def get_redis_client(redis_url: str) -> redis.Redis:
+def _build_document_metadata(text: str, metadata: dict) -> dict:
+    """문서 저장용 메타데이터 구성 (사전 필터용 domain/language TAG 값이 없으면 채움)"""
+    doc_metadata = metadata.copy()
+    doc_metadata["text"] = text
+    doc_metadata["timestamp"] = doc_metadata.get("timestamp", time.time())
+    if "domain" not in doc_metadata and doc_metadata.get("source_url"):
+        doc_metadata["domain"] = domain_tags(doc_metadata["source_url"])
+    if "language" not in doc_metadata:
+        doc_metadata["language"] = detect_language(text)
+    return doc_metadata
+
+
+def _build_qa_metadata(question: str, answer: str, metadata: Optional[dict]) -> dict:
+    """시멘틱 캐시 저장용 질문-답변 메타데이터 구성"""
+    doc_metadata = metadata.copy() if metadata else {}
+    doc_metadata["question"] = question
+    doc_metadata["answer"] = answer
+    doc_metadata["timestamp"] = doc_metadata.get("timestamp", time.time())
+    doc_metadata["type"] = "semantic_cache"
+    return doc_metadata
+
+
+def _exact_cache_key(index_name: str, question: str) -> Optional[str]:
+    """정규화한 질문의 정확 일치 캐시 키 (정규화 결과가 비어 있으면 None)"""
+    digest = question_hash(question)
+    if digest is None:
+        return None
+    return f"semantic_cache:{index_name}:exact:{digest}"
+
+
+def _parse_exact_entry(value) -> Optional[SearchHit]:
+    """정확 일치 캐시 값(JSON)을 SearchHit으로 변환 (유사도 1.0)"""
+    if value is None:
+        return None
+    entry = json.loads(value)
+    return SearchHit(entry["key"], 1.0, {"answer": entry["answer"]})
+
+
+def _queue_exact_and_policy(pipe, eviction_policy, doc_key: str, exact_key: Optional[str], answer: str):
+    """정확 일치 키 저장(캐시 항목과 같은 TTL)과 축출 정책 등록 명령을 파이프라인에 추가"""
+    if exact_key:
+        ttl = eviction_policy.ttl_seconds if eviction_policy is not None else None
+        pipe.set(exact_key, json.dumps({"key": doc_key, "answer": answer}, ensure_ascii=False), ex=ttl or None)
+    if eviction_policy is not None:
+        eviction_policy.queue_insert(pipe, doc_key, exact_key)
+        # 같은 질문의 이전 답변을 들고 있는 워커별 L1 항목 무효화
+        if exact_key:
+            eviction_policy.queue_invalidation(pipe, [exact_key])
+
+
+def _remember_best_hit(local_cache: Optional[LocalAnswerCache], index_name: str, query: str,
+                       results: List[SearchHit], embedding) -> None:
     """
-    Redis 클라이언트 생성 유틸 함수 (decode_responses=False 고정)
+    Redis 시멘틱 캐시 히트 중 가장 유사한 결과를 L1에 저장 (쿼리 벡터와 그 항목과의 유사도 포함)
+
+    다른 질문의 답변이므로 정확 일치 항목이 아닌 벡터 조회 전용 항목으로 저장한다.
     """
-    return redis.Redis.from_url(redis_url, decode_responses=False)
+    if local_cache is None or not results:
+        return
+    best = max(results, key=lambda hit: hit.similarity)
+    local_cache.put(_exact_cache_key(index_name, query), best.key, best.get("answer"),
+                    vector=embedding, similarity=best.similarity, exact=False)
+
+
+# 문서 내보내기 시 SCAN/HMGET 배치 크기와 가져올 필드 (embedding_vector 제외)
+EXPORT_BATCH_SIZE = 500
+DOCUMENT_EXPORT_FIELDS = (
+    "custom_key", "id", "text", "source_url", "timestamp", "question", "answer", "type", "source"
+)
+
+# 시멘틱 캐시 검색 시 돌려받을 필드 (답변만 필요, 점수는 항상 포함)
+CACHE_RETURN_FIELDS = ("answer",)
+
+# 기본 벡터 차원 (OpenAI text-embedding-3-small)
+DEFAULT_VECTOR_DIMENSION = 1536
 
 
 class RedisVectorSearchHandler:
@@ -20,15 +107,25 @@ class RedisVectorSearchHandler:
     
     def __init__(self, 
                  embedding_model,
-                 redis_url: str = "redis://localhost:6379",
-                 index_name: str = "document_index"):
+                 redis_url: Optional[str] = "redis://localhost:6379",
+                 index_name: str = "document_index",
+                 index_state_refresh_interval: Optional[float] = INDEX_STATE_REFRESH_INTERVAL,
+                 vector_dimension: int = DEFAULT_VECTOR_DIMENSION,
+                 vector_type: str = "FLOAT32",
+                 vector_backend: Optional[VectorBackend] = None,
+                 index_options: Optional[Dict[str, Any]] = None):
         """
         Redis Vector Search 핸들러 초기화
         
         Args:
-            embedding_model: LangChain 임베딩 모델
-            redis_url: Redis 서버 URL
+            embedding_model: EmbeddingGenerator 인스턴스 (캐시 우선 embed_many 사용)
+            redis_url: Redis 서버 URL (None이면 Redis 없이 vector_backend만 사용)
             index_name: 벡터 검색 인덱스 이름
+            index_state_refresh_interval: 인덱스 상태 재확인 주기 (초)
+            vector_dimension: 임베딩 벡터 차원 (EmbeddingGenerator의 dimensions와 같아야 함)
+            vector_type: 벡터 저장 타입 (FLOAT32, FLOAT16, BFLOAT16)
+            vector_backend: 사용할 벡터 백엔드 (None이면 RediSearch VectorSearchIndex 생성)
+            index_options: VectorSearchIndex 추가 옵션 (hnsw_m, hnsw_ef_construction, hnsw_initial_cap, ef_runtime, epsilon, result_cache_ttl)
         """
         try:
             self.embedding_model = embedding_model
@@ -36,23 +133,24 @@ class RedisVectorSearchHandler:
             self.index_name = index_name
             
             # Redis 클라이언트 생성 (유틸 함수 사용)
-            self.redis_client = get_redis_client(redis_url)
+            self.redis_client = get_redis_client(redis_url) if redis_url else None
             
             # Vector Search 인덱스 초기화
-            self.vector_index = VectorSearchIndex(
+            self.vector_index = vector_backend or VectorSearchIndex(
                 redis_client=self.redis_client,
                 index_name=index_name,
-                vector_dimension=1536,  # OpenAI text-embedding-3-small
-                distance_metric="COSINE"
+                vector_dimension=vector_dimension,
+                distance_metric="COSINE",
+                state_refresh_interval=index_state_refresh_interval,
+                vector_type=vector_type,
+                **(index_options or {})
             )
             
             # 디버깅 유틸리티 초기화
-            self.debugger = RedisIndexDebugger(self.redis_client)
-            
-            print(f"Redis Vector Search 핸들러 초기화 완료: {redis_url}")
+            self.debugger = RedisIndexDebugger(self.redis_client) if self.redis_client is not None else None
             
-            # 초기화 후 간단한 상태 확인
-            self.debugger.full_diagnosis([index_name])
+            # 전체 진단은 시작 시 실행하지 않음 (MainProcessor.run_diagnosis / 관리자 API에서 필요할 때 실행)
+            print(f"Redis Vector Search 핸들러 초기화 완료: {redis_url or type(self.vector_index).__name__}")
             
         except Exception as e:
             print(f"Redis Vector Search 핸들러 초기화 오류: {e}")
@@ -71,13 +169,11 @@ class RedisVectorSearchHandler:
             bool: 저장 성공 여부
         """
         try:
-            # 텍스트를 임베딩 벡터로 변환
-            embedding = self.embedding_model.embed_query(text)
+            # 텍스트를 임베딩 벡터로 변환 (캐시 우선)
+            embedding = self.embedding_model.embed_many([text])[0]
             
             # 메타데이터 준비
-            doc_metadata = metadata.copy()
-            doc_metadata["text"] = text
-            doc_metadata["timestamp"] = doc_metadata.get("timestamp", time.time())
+            doc_metadata = _build_document_metadata(text, metadata)
             
             # Vector Search 인덱스에 추가
             success = self.vector_index.add_document(
@@ -97,10 +193,54 @@ class RedisVectorSearchHandler:
             traceback.print_exc()
             return False
     
+    def save_embeddings_bulk(self,
+                             items: Iterable[Tuple[str, str, dict]],
+                             chunk_size: int = BULK_CHUNK_SIZE,
+                             max_in_flight: int = BULK_MAX_IN_FLIGHT) -> Dict[str, Any]:
+        """
+        여러 문서를 청크 단위로 임베딩하여 대량 저장
+
+        입력을 chunk_size 단위로 스트리밍하면서 청크마다 embed_many 한 번으로 임베딩하고,
+        VectorSearchIndex.add_documents로 파이프라인 저장한다.
+        임베딩에 실패한 청크의 문서는 결과의 failed에 기록하고 다음 청크를 계속 처리한다.
+
+        Args:
+            items: (문서 키, 텍스트, 메타데이터) 이터러블 (지연 생성 가능)
+            chunk_size: 임베딩/파이프라인 한 번에 처리할 문서 수
+            max_in_flight: 동시에 실행할 최대 파이프라인 수
+
+        Returns:
+            Dict: total/succeeded/failed(문서 키, 오류)/chunks/elapsed
+        """
+        embed_failures = []
+
+        def embedded_documents():
+            for chunk in iter_chunks(items, chunk_size):
+                try:
+                    embeddings = self.embedding_model.embed_many([text for _, text, _ in chunk])
+                except Exception as e:
+                    print(f"청크 임베딩 오류 ({len(chunk)}개 문서): {e}")
+                    embed_failures.extend({"key": key, "error": f"임베딩 실패: {e}"} for key, _, _ in chunk)
+                    continue
+                for (key, text, metadata), embedding in zip(chunk, embeddings):
+                    yield key, embedding, _build_document_metadata(text, metadata or {})
+
+        report = self.vector_index.add_documents(
+            embedded_documents(),
+            chunk_size=chunk_size,
+            max_in_flight=max_in_flight
+        )
+        report["total"] += len(embed_failures)
+        report["failed"].extend(embed_failures)
+        return report
+
     def search_similar_embeddings(self, 
                                  query_text: str,
                                  top_k: int = 5,
-                                 similarity_threshold: float = 0.7) -> List[Dict[str, Any]]:
+                                 similarity_threshold: float = 0.7,
+                                 query_embedding: Optional[List[float]] = None,
+                                 return_fields: Optional[Sequence[str]] = None,
+                                 search_filter: Optional[SearchFilter] = None) -> List[SearchHit]:
         """
         텍스트 쿼리로 유사한 문서 검색
         
@@ -108,21 +248,27 @@ class RedisVectorSearchHandler:
             query_text: 검색할 텍스트
             top_k: 반환할 최대 결과 수
             similarity_threshold: 유사도 임계값
+            query_embedding: 미리 계산된 쿼리 임베딩 (있으면 재임베딩하지 않음)
+            return_fields: 돌려받을 필드 (None이면 벡터를 제외한 기본 필드)
+            search_filter: 사전 필터 (허용 도메인/언어/문서 유형/최신성, KNN 쿼리 안에서 적용)
             
         Returns:
-            List[Dict]: 검색 결과 리스트
+            List[SearchHit]: 검색 결과 리스트
         """
         # 검색 시작 로그 생략
         
         try:
-            # 쿼리 텍스트를 임베딩으로 변환
-            query_embedding = self.embedding_model.embed_query(query_text)
+            # 쿼리 텍스트를 임베딩으로 변환 (미리 계산된 벡터가 없을 때만)
+            if query_embedding is None:
+                query_embedding = self.embedding_model.embed_many([query_text])[0]
             
             # Vector Search로 유사 문서 검색
             results = self.vector_index.search_similar(
                 query_vector=query_embedding,
                 top_k=top_k,
-                score_threshold=similarity_threshold
+                score_threshold=similarity_threshold,
+                return_fields=return_fields,
+                search_filter=search_filter
             )
             
             print(f"✅ 검색 완료: {len(results)}개 결과 (임계값: {similarity_threshold})")
@@ -134,9 +280,10 @@ class RedisVectorSearchHandler:
             import traceback
             traceback.print_exc()
             
-            # 오류 발생 시 간단한 진단
+            # 오류 발생 시 간단한 진단 (연결/인덱스 존재만 확인, 전체 키 순회 없음)
             print(f"🩺 검색 오류로 인한 진단:")
-            self.debugger.full_diagnosis([self.index_name])
+            if self.debugger is not None and self.debugger.check_redis_connection():
+                self.debugger.check_index_exists(self.index_name)
             
             return []
     
@@ -161,62 +308,88 @@ class RedisVectorSearchHandler:
         """
         return self.vector_index.get_index_info()
 
-    def get_all_stored_documents(self) -> list:
-        """Redis에 저장된 모든 문서를 조회"""
-        try:
-            all_keys = self.redis_client.keys(f"doc:{self.index_name}:*".encode('utf-8'))
+    def iter_documents(self,
+                       batch_size: int = EXPORT_BATCH_SIZE,
+                       fields: Sequence[str] = DOCUMENT_EXPORT_FIELDS) -> Iterator[Dict[str, Any]]:
+        """
+        저장된 문서를 SCAN 커서로 배치 단위로 순회하며 하나씩 생성
 
-            all_documents = []
-            for key in all_keys:
-                try:
-                    key_str = key.decode('utf-8')
-                    hash_data = self.redis_client.hgetall(key)
-
-                    metadata = {}
-                    text_content = None
-
-                    for field, value in hash_data.items():
-                        try:
-                            field_str = field.decode('utf-8') if isinstance(field, bytes) else str(field)
-
-                            # 임베딩 벡터 필드들은 제외 (바이너리 데이터)
-                            if field_str in ['embedding_vector', 'content_vector']:
-                                continue
-
-                            # UTF-8 디코딩 시도
-                            if isinstance(value, bytes):
-                                try:
-                                    value_str = value.decode('utf-8')
-                                except UnicodeDecodeError:
-                                    # 디코딩 실패시 건너뛰기
-                                    continue
-                            else:
-                                value_str = str(value)
-
-                            if field_str == 'text':
-                                text_content = value_str
-                            else:
-                                metadata[field_str] = value_str
-
-                        except Exception as e:
-                            # 개별 필드 처리 오류는 무시하고 계속 진행
-                            continue
-
-                    document_info = {
-                        "redis_key": key_str,
-                        "key": metadata.get("custom_key", metadata.get("id", "unknown")),
-                        "metadata": metadata,
-                        "text": text_content or "N/A"
-                    }
-
-                    all_documents.append(document_info)
+        KEYS 대신 SCAN을 사용하므로 Redis 서버를 오래 막지 않고,
+        배치마다 파이프라인 HMGET으로 벡터를 제외한 필드만 가져오므로 메모리 사용량이 일정하다.
 
-                except Exception as e:
-                    print(f"문서 처리 오류 ({key}): {e}")
+        Args:
+            batch_size: SCAN COUNT 힌트이자 파이프라인 하나에 담을 키 수
+            fields: 가져올 Hash 필드 (embedding_vector 제외)
+
+        Yields:
+            Dict: redis_key, key, metadata, text
+        """
+        if self.redis_client is None:
+            raise RuntimeError("iter_documents는 Redis 백엔드에서만 지원합니다.")
+        fields = list(fields)
+        # 별칭 인덱스는 재구축 후 물리 인덱스 접두사가 바뀌므로 백엔드의 현재 접두사 사용
+        pattern = f"{self.vector_index.doc_key('')}*"
+        keys = self.redis_client.scan_iter(match=pattern, count=batch_size)
+        for batch in iter_chunks(keys, batch_size):
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key in batch:
+                pipe.hmget(key, fields)
+            try:
+                rows = pipe.execute()
+            except Exception as e:
+                print(f"문서 배치 조회 오류 ({len(batch)}개): {e}")
+                continue
+
+            for key, values in zip(batch, rows):
+                metadata = {}
+                text_content = None
+                for field, value in zip(fields, values):
+                    if value is None:
+                        continue
+                    try:
+                        value_str = value.decode('utf-8') if isinstance(value, bytes) else str(value)
+                    except UnicodeDecodeError:
+                        # 디코딩 실패시 건너뛰기
+                        continue
+                    if field == 'text':
+                        text_content = value_str
+                    else:
+                        metadata[field] = value_str
+                if not metadata and text_content is None:
+                    # SCAN과 HMGET 사이에 삭제된 키
                     continue
 
-            return all_documents
+                yield {
+                    "redis_key": key.decode('utf-8') if isinstance(key, bytes) else str(key),
+                    "key": metadata.get("custom_key", metadata.get("id", "unknown")),
+                    "metadata": metadata,
+                    "text": text_content or "N/A"
+                }
+
+    def export_documents_jsonl(self, path: str, batch_size: int = EXPORT_BATCH_SIZE) -> int:
+        """
+        저장된 문서를 JSONL 파일로 내보내기 (iter_documents 기반 스트리밍)
 
+        Args:
+            path: 출력 파일 경로
+            batch_size: SCAN/HMGET 배치 크기
+
+        Returns:
+            int: 내보낸 문서 수
+        """
+        count = 0
+        with open(path, "w", encoding="utf-8") as f:
+            for document in self.iter_documents(batch_size=batch_size):
+                f.write(json.dumps(document, ensure_ascii=False))
+                f.write("\n")
+                count += 1
+        print(f"📤 문서 내보내기 완료 ({self.index_name}): {count}개 → {path}")
+        return count
+
+    def get_all_stored_documents(self) -> list:
+        """Redis에 저장된 모든 문서를 조회 (전체를 리스트로 반환, 대량 조회는 iter_documents 사용)"""
+        try:
+            return list(self.iter_documents())
         except Exception as e:
             print(f"전체 문서 조회 오류: {e}")
             return []
@@ -224,106 +397,422 @@ class RedisVectorSearchHandler:
 class SemanticCacheHandler:
     """
     Redis 8 기반 시멘틱 캐시 핸들러 (질문-답변 쌍, 벡터 유사도 기반)
+    embedding_model은 EmbeddingGenerator 인스턴스 (캐시 우선 embed_many 사용)
     """
-    def __init__(self, embedding_model, redis_url: str = "redis://localhost:6379", index_name: str = "semantic_cache_index"):
+    def __init__(self, embedding_model, redis_url: Optional[str] = "redis://localhost:6379",
+                 index_name: str = "semantic_cache_index",
+                 index_state_refresh_interval: Optional[float] = INDEX_STATE_REFRESH_INTERVAL,
+                 vector_dimension: int = DEFAULT_VECTOR_DIMENSION,
+                 vector_type: str = "FLOAT32",
+                 eviction_policy: Optional[CacheEvictionPolicy] = None,
+                 local_cache: Optional[LocalAnswerCache] = None,
+                 vector_backend: Optional[VectorBackend] = None,
+                 index_options: Optional[Dict[str, Any]] = None):
         self.embedding_model = embedding_model
         self.redis_url = redis_url
         self.index_name = index_name
-        self.redis_client = get_redis_client(redis_url)
+        # redis_url이 None이면 vector_backend만 사용 (정확 일치 키/축출 정책은 Redis 필요)
+        self.redis_client = get_redis_client(redis_url) if redis_url else None
+        # TTL/최대 항목 수/LRU·LFU 축출 (None이면 무제한)
+        self.eviction_policy = eviction_policy
+        # 워커 내 L1 답변 캐시 (None이면 사용 안 함)
+        self.local_cache = local_cache
         
         # 디버깅 유틸리티 초기화
-        self.debugger = RedisIndexDebugger(self.redis_client)
+        self.debugger = RedisIndexDebugger(self.redis_client) if self.redis_client is not None else None
         
-        self.vector_index = VectorSearchIndex(
+        self.vector_index = vector_backend or VectorSearchIndex(
             redis_client=self.redis_client,
             index_name=index_name,
-            vector_dimension=1536,  # OpenAI text-embedding-3-small
-            distance_metric="COSINE"
+            vector_dimension=vector_dimension,
+            distance_metric="COSINE",
+            state_refresh_interval=index_state_refresh_interval,
+            vector_type=vector_type,
+            **(index_options or {})
         )
-        
-        # 초기화 후 간단한 상태 확인
-        self.debugger.full_diagnosis([index_name])
 
-    def save_qa_pair(self, question: str, answer: str, metadata: dict = None) -> bool:
+    def save_qa_pair(self, question: str, answer: str, metadata: dict = None,
+                     embedding: Optional[List[float]] = None) -> bool:
         """
         질문-답변 쌍을 임베딩하여 벡터 인덱스에 저장
+        (embedding이 주어지면 질문을 다시 임베딩하지 않고 그대로 사용)
         """
         try:
-            embedding = self.embedding_model.embed_query(question)
-            doc_metadata = metadata.copy() if metadata else {}
-            doc_metadata["question"] = question
-            doc_metadata["answer"] = answer
-            doc_metadata["timestamp"] = doc_metadata.get("timestamp", time.time())
-            doc_metadata["type"] = "semantic_cache"
+            if embedding is None:
+                embedding = self.embedding_model.embed_many([question])[0]
+            doc_metadata = _build_qa_metadata(question, answer, metadata)
             key = str(uuid.uuid4())
-            return self.vector_index.add_document(
+            exact_key = _exact_cache_key(self.index_name, question)
+            if exact_key:
+                doc_metadata["exact_key"] = exact_key
+            saved = self.vector_index.add_document(
                 doc_id=key,
                 embedding=embedding,
                 metadata=doc_metadata
             )
+            if saved and self.redis_client is not None:
+                # 정확 일치 키와 TTL/축출 점수를 파이프라인 한 번으로 기록
+                pipe = self.redis_client.pipeline(transaction=False)
+                _queue_exact_and_policy(pipe, self.eviction_policy, self.vector_index.doc_key(key), exact_key, answer)
+                pipe.execute()
+            return saved
         except Exception as e:
             print(f"[SemanticCache] 저장 오류: {e}")
             import traceback; traceback.print_exc()
             return False
 
-    def search_similar_question(self, query: str, top_k: int = 3, score_threshold: float = 0.05):
+    def search_exact_question(self, query: str) -> Optional[SearchHit]:
+        """
+        정규화한 질문이 정확히 같은 캐시 항목 조회 (GET 1회, 임베딩/KNN 없음)
+
+        Returns:
+            Optional[SearchHit]: answer 필드와 유사도 1.0을 담은 결과 (없으면 None)
+        """
+        exact_key = _exact_cache_key(self.index_name, query)
+        if exact_key is None:
+            return None
+        # L1 (Redis 왕복 없음)
+        if self.local_cache is not None:
+            hit = self.local_cache.get_exact(exact_key)
+            if hit is not None:
+                return hit
+        if self.redis_client is None:
+            return None
+        try:
+            hit = _parse_exact_entry(self.redis_client.get(exact_key))
+        except Exception as e:
+            print(f"⚠️ [SemanticCache] 정확 일치 조회 오류: {e}")
+            return None
+        if hit is not None:
+            if self.eviction_policy is not None:
+                self.eviction_policy.record_hits([hit.key])
+            if self.local_cache is not None:
+                self.local_cache.put(exact_key, hit.key, hit.get("answer"))
+        return hit
+
+    def search_similar_question(self, query: str, top_k: int = 3, score_threshold: float = 0.05,
+                                embedding: Optional[List[float]] = None) -> List[SearchHit]:
         """
         쿼리와 유사한 질문-답변 쌍을 score_threshold 기준으로 검색
+        (embedding이 주어지면 쿼리를 다시 임베딩하지 않고 그대로 사용)
+
+        Returns:
+            List[SearchHit]: answer 필드와 유사도만 담은 결과
         """
         # 검색 시작 로그 생략
         
         try:
-            embedding = self.embedding_model.embed_query(query)
+            if embedding is None:
+                embedding = self.embedding_model.embed_many([query])[0]
+            # L1에서 이미 계산된 쿼리 벡터로 먼저 조회
+            if self.local_cache is not None:
+                local_hit = self.local_cache.get_similar(embedding, score_threshold)
+                if local_hit is not None:
+                    return [local_hit]
+            # answer 필드만 요청
             results = self.vector_index.search_similar(
                 query_vector=embedding,
                 top_k=top_k,
-                score_threshold=score_threshold
+                score_threshold=score_threshold,
+                return_fields=CACHE_RETURN_FIELDS
             )
+            if results and self.eviction_policy is not None:
+                # 실제로 답변에 쓰이는 가장 유사한 항목만 히트로 기록
+                self.eviction_policy.record_hits([max(results, key=lambda hit: hit.similarity).key])
+            _remember_best_hit(self.local_cache, self.index_name, query, results, embedding)
             
-            # answer 필드만 추출
-            formatted_results = [
-                {
-                    "question": r["metadata"].get("question"),
-                    "answer": r["metadata"].get("answer"),
-                    "similarity": r["similarity"]
-                }
-                for r in results
-            ]
-            
-            print(f"✅ 시멘틱 캐시 검색 완료: {len(formatted_results)}개 결과")
-            return formatted_results
+            print(f"✅ 시멘틱 캐시 검색 완료: {len(results)}개 결과")
+            return results
             
         except Exception as e:
             print(f"❌ [SemanticCache] 검색 오류: {e}")
             import traceback; traceback.print_exc()
             
-            # 오류 발생 시 간단한 진단
+            # 오류 발생 시 간단한 진단 (연결/인덱스 존재만 확인, 전체 키 순회 없음)
             print(f"🩺 시멘틱 캐시 오류로 인한 진단:")
-            self.debugger.full_diagnosis([self.index_name])
+            if self.debugger is not None and self.debugger.check_redis_connection():
+                self.debugger.check_index_exists(self.index_name)
             
             return []
 
 
+def _make_cache_key(prefix: str, namespace: Optional[str], text: str) -> str:
+    """임베딩 캐시 키 (namespace가 있으면 모델/차원/타입별로 키 공간 분리)"""
+    h = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    if namespace:
+        return f"{prefix}:{namespace}:{h}"
+    return f"{prefix}:{h}"
+
+
 class EmbeddingsCacheHandler:
     """
-    Redis 기반 임베딩 캐시 핸들러 (텍스트-SHA256 해시를 key, 임베딩 bytes를 value)
+    Redis 기반 임베딩 캐시 핸들러 (텍스트-SHA256 해시를 key, vector_type으로 인코딩한 임베딩 bytes를 value)
+
+    namespace를 비워 두면 기존(FLOAT32, 기본 차원) 키 형식을 그대로 사용한다.
     """
-    def __init__(self, redis_url: str = "redis://localhost:6379", prefix: str = "embeddings_cache"):
+    def __init__(self, redis_url: str = "redis://localhost:6379", prefix: str = "embeddings_cache",
+                 vector_type: str = "FLOAT32", namespace: Optional[str] = None):
         self.redis_url = redis_url
         self.prefix = prefix
+        self.vector_type = vector_type
+        self.namespace = namespace
         self.redis_client = get_redis_client(redis_url)
 
     def _make_key(self, text: str) -> str:
-        h = hashlib.sha256(text.encode("utf-8")).hexdigest()
-        return f"{self.prefix}:{h}"
+        return _make_cache_key(self.prefix, self.namespace, text)
 
     def get_embedding(self, text: str):
         key = self._make_key(text)
         value = self.redis_client.get(key)
         if value is not None:
-            return np.frombuffer(value, dtype=np.float32)
+            return decode_vector(value, self.vector_type)
         return None
 
     def set_embedding(self, text: str, embedding: np.ndarray):
         key = self._make_key(text)
-        self.redis_client.set(key, embedding.astype(np.float32).tobytes())
+        self.redis_client.set(key, encode_vector(embedding, self.vector_type))
+
+    def get_embeddings(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """여러 텍스트의 캐시된 임베딩을 MGET 한 번으로 조회 (없으면 None)"""
+        if not texts:
+            return []
+        values = self.redis_client.mget([self._make_key(text) for text in texts])
+        return [
+            decode_vector(value, self.vector_type) if value is not None else None
+            for value in values
+        ]
+
+    def set_embeddings(self, embeddings: Dict[str, np.ndarray]):
+        """여러 텍스트의 임베딩을 파이프라인 MSET 한 번으로 저장"""
+        if not embeddings:
+            return
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.mset({
+            self._make_key(text): encode_vector(embedding, self.vector_type)
+            for text, embedding in embeddings.items()
+        })
+        pipe.execute()
+
+
+
+class AsyncEmbeddingsCacheHandler:
+    """
+    redis.asyncio 기반 임베딩 캐시 핸들러 (EmbeddingsCacheHandler의 비동기 버전, 키 형식 동일)
+    """
+    def __init__(self, redis_url: str = "redis://localhost:6379", prefix: str = "embeddings_cache",
+                 vector_type: str = "FLOAT32", namespace: Optional[str] = None):
+        self.redis_url = redis_url
+        self.prefix = prefix
+        self.vector_type = vector_type
+        self.namespace = namespace
+        self.redis_client = get_async_redis_client(redis_url)
+
+    def _make_key(self, text: str) -> str:
+        return _make_cache_key(self.prefix, self.namespace, text)
+
+    async def get_embeddings(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """여러 텍스트의 캐시된 임베딩을 MGET 한 번으로 조회 (없으면 None)"""
+        if not texts:
+            return []
+        values = await self.redis_client.mget([self._make_key(text) for text in texts])
+        return [
+            decode_vector(value, self.vector_type) if value is not None else None
+            for value in values
+        ]
+
+    async def set_embeddings(self, embeddings: Dict[str, np.ndarray]):
+        """여러 텍스트의 임베딩을 파이프라인 MSET 한 번으로 저장"""
+        if not embeddings:
+            return
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.mset({
+            self._make_key(text): encode_vector(embedding, self.vector_type)
+            for text, embedding in embeddings.items()
+        })
+        await pipe.execute()
+
+
+class AsyncRedisVectorSearchHandler:
+    """
+    redis.asyncio 기반 문서 벡터 검색 핸들러 (RedisVectorSearchHandler의 비동기 버전)
+    embedding_model은 EmbeddingGenerator 인스턴스 (aembed_many 사용)
+    """
+    def __init__(self,
+                 embedding_model,
+                 redis_url: str = "redis://localhost:6379",
+                 index_name: str = "document_index",
+                 index_state_refresh_interval: Optional[float] = INDEX_STATE_REFRESH_INTERVAL,
+                 vector_dimension: int = DEFAULT_VECTOR_DIMENSION,
+                 vector_type: str = "FLOAT32",
+                 vector_backend: Optional[VectorBackend] = None,
+                 index_options: Optional[Dict[str, Any]] = None):
+        self.embedding_model = embedding_model
+        self.redis_url = redis_url
+        self.index_name = index_name
+        self.redis_client = get_async_redis_client(redis_url) if redis_url else None
+        # vector_backend가 주어지면 프로세스 내 백엔드를 그대로 사용 (동기 핸들러와 공유 가능)
+        self.vector_index = AsyncVectorBackendAdapter(vector_backend) if vector_backend else AsyncVectorSearchIndex(
+            redis_client=self.redis_client,
+            index_name=index_name,
+            vector_dimension=vector_dimension,
+            distance_metric="COSINE",
+            state_refresh_interval=index_state_refresh_interval,
+            vector_type=vector_type,
+            **(index_options or {})
+        )
+
+    async def initialize(self):
+        """인덱스 존재 확인 (없으면 생성)"""
+        await self.vector_index.ensure_index_exists()
+
+    async def save_embedding(self, key: str, text: str, metadata: dict) -> bool:
+        """텍스트와 메타데이터를 임베딩하여 Vector Search 인덱스에 저장"""
+        try:
+            embedding = (await self.embedding_model.aembed_many([text]))[0]
+            return await self.vector_index.add_document(
+                doc_id=key,
+                embedding=embedding,
+                metadata=_build_document_metadata(text, metadata)
+            )
+        except Exception as e:
+            print(f"임베딩 저장 오류: {e}")
+            return False
+
+    async def search_similar_embeddings(self,
+                                        query_text: str,
+                                        top_k: int = 5,
+                                        similarity_threshold: float = 0.7,
+                                        query_embedding: Optional[List[float]] = None,
+                                        return_fields: Optional[Sequence[str]] = None,
+                                        search_filter: Optional[SearchFilter] = None) -> List[SearchHit]:
+        """텍스트 쿼리로 유사한 문서 검색 (query_embedding이 있으면 재임베딩하지 않음, search_filter는 사전 필터)"""
+        try:
+            if query_embedding is None:
+                query_embedding = (await self.embedding_model.aembed_many([query_text]))[0]
+            results = await self.vector_index.search_similar(
+                query_vector=query_embedding,
+                top_k=top_k,
+                score_threshold=similarity_threshold,
+                return_fields=return_fields,
+                search_filter=search_filter
+            )
+            print(f"✅ 검색 완료: {len(results)}개 결과 (임계값: {similarity_threshold})")
+            return results
+        except Exception as e:
+            print(f"❌ 유사 임베딩 검색 오류: {e}")
+            import traceback; traceback.print_exc()
+            return []
+
+    async def delete_embedding(self, key: str) -> bool:
+        """저장된 임베딩 삭제"""
+        return await self.vector_index.delete_document(key)
+
+
+class AsyncSemanticCacheHandler:
+    """
+    redis.asyncio 기반 시멘틱 캐시 핸들러 (SemanticCacheHandler의 비동기 버전)
+    embedding_model은 EmbeddingGenerator 인스턴스 (aembed_many 사용)
+    """
+    def __init__(self, embedding_model, redis_url: str = "redis://localhost:6379", index_name: str = "semantic_cache_index",
+                 index_state_refresh_interval: Optional[float] = INDEX_STATE_REFRESH_INTERVAL,
+                 vector_dimension: int = DEFAULT_VECTOR_DIMENSION,
+                 vector_type: str = "FLOAT32",
+                 eviction_policy: Optional[AsyncCacheEvictionPolicy] = None,
+                 local_cache: Optional[LocalAnswerCache] = None,
+                 vector_backend: Optional[VectorBackend] = None,
+                 index_options: Optional[Dict[str, Any]] = None):
+        self.embedding_model = embedding_model
+        self.redis_url = redis_url
+        self.index_name = index_name
+        self.redis_client = get_async_redis_client(redis_url) if redis_url else None
+        self.eviction_policy = eviction_policy
+        self.local_cache = local_cache
+        self.vector_index = AsyncVectorBackendAdapter(vector_backend) if vector_backend else AsyncVectorSearchIndex(
+            redis_client=self.redis_client,
+            index_name=index_name,
+            vector_dimension=vector_dimension,
+            distance_metric="COSINE",
+            state_refresh_interval=index_state_refresh_interval,
+            vector_type=vector_type,
+            **(index_options or {})
+        )
+
+    async def initialize(self):
+        """인덱스 존재 확인 (없으면 생성)"""
+        await self.vector_index.ensure_index_exists()
+
+    async def save_qa_pair(self, question: str, answer: str, metadata: dict = None,
+                           embedding: Optional[List[float]] = None) -> bool:
+        """질문-답변 쌍을 임베딩하여 벡터 인덱스에 저장"""
+        try:
+            if embedding is None:
+                embedding = (await self.embedding_model.aembed_many([question]))[0]
+            key = str(uuid.uuid4())
+            doc_metadata = _build_qa_metadata(question, answer, metadata)
+            exact_key = _exact_cache_key(self.index_name, question)
+            if exact_key:
+                doc_metadata["exact_key"] = exact_key
+            saved = await self.vector_index.add_document(
+                doc_id=key,
+                embedding=embedding,
+                metadata=doc_metadata
+            )
+            if saved and self.redis_client is not None:
+                pipe = self.redis_client.pipeline(transaction=False)
+                _queue_exact_and_policy(pipe, self.eviction_policy, self.vector_index.doc_key(key), exact_key, answer)
+                await pipe.execute()
+            return saved
+        except Exception as e:
+            print(f"[SemanticCache] 저장 오류: {e}")
+            import traceback; traceback.print_exc()
+            return False
+
+    async def search_exact_question(self, query: str) -> Optional[SearchHit]:
+        """정규화한 질문이 정확히 같은 캐시 항목 조회 (GET 1회, 임베딩/KNN 없음)"""
+        exact_key = _exact_cache_key(self.index_name, query)
+        if exact_key is None:
+            return None
+        if self.local_cache is not None:
+            hit = self.local_cache.get_exact(exact_key)
+            if hit is not None:
+                return hit
+        if self.redis_client is None:
+            return None
+        try:
+            hit = _parse_exact_entry(await self.redis_client.get(exact_key))
+        except Exception as e:
+            print(f"⚠️ [SemanticCache] 정확 일치 조회 오류: {e}")
+            return None
+        if hit is not None:
+            if self.eviction_policy is not None:
+                await self.eviction_policy.record_hits([hit.key])
+            if self.local_cache is not None:
+                self.local_cache.put(exact_key, hit.key, hit.get("answer"))
+        return hit
+
+    async def search_similar_question(self, query: str, top_k: int = 3, score_threshold: float = 0.05,
+                                      embedding: Optional[List[float]] = None) -> List[SearchHit]:
+        """쿼리와 유사한 질문-답변 쌍을 score_threshold 기준으로 검색 (answer 필드와 유사도만 반환)"""
+        try:
+            if embedding is None:
+                embedding = (await self.embedding_model.aembed_many([query]))[0]
+            if self.local_cache is not None:
+                local_hit = self.local_cache.get_similar(embedding, score_threshold)
+                if local_hit is not None:
+                    return [local_hit]
+            results = await self.vector_index.search_similar(
+                query_vector=embedding,
+                top_k=top_k,
+                score_threshold=score_threshold,
+                return_fields=CACHE_RETURN_FIELDS
+            )
+            if results and self.eviction_policy is not None:
+                # 실제로 답변에 쓰이는 가장 유사한 항목만 히트로 기록
+                await self.eviction_policy.record_hits([max(results, key=lambda hit: hit.similarity).key])
+            _remember_best_hit(self.local_cache, self.index_name, query, results, embedding)
+            print(f"✅ 시멘틱 캐시 검색 완료: {len(results)}개 결과")
+            return results
+        except Exception as e:
+            print(f"❌ [SemanticCache] 검색 오류: {e}")
+            import traceback; traceback.print_exc()
+            return []
@@ -0,0 +1,128 @@
+# search_filter.py
+"""
+벡터 검색 사전 필터 (출처 도메인 / 언어 / 문서 유형 / 최신성)
+
+SearchFilter 하나로 RediSearch 쿼리 식(KNN의 사전 필터)과 프로세스 내 백엔드용 메타데이터 검사를 함께 만든다.
+필터는 KNN 쿼리 안에서 적용되므로 Redis가 후보를 미리 거르고, 파이썬에서 넉넉히 가져와 거를 필요가 없다.
+
+저장 시 문서 메타데이터에 채우는 TAG 값도 여기서 만든다.
+- domain: URL 호스트와 상위 도메인들 ("news.kbs.co.kr" -> "news.kbs.co.kr,kbs.co.kr,co.kr")
+- language: 한글 비율로 판별한 "ko" / "en"
+"""
+
+import time
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+
+# TAG 필드 값 구분자 (RediSearch 기본값)
+TAG_SEPARATOR = ","
+
+# 한글 비율이 이 값 이상이면 한국어 문서로 판단
+KOREAN_RATIO_THRESHOLD = 0.3
+
+_DAY_SECONDS = 24 * 3600
+
+
+def domain_tags(url: Optional[str]) -> str:
+    """URL 호스트와 상위 도메인(두 단계까지)을 TAG 값으로 변환 (허용 도메인 목록과 접미사 일치용)"""
+    if not url:
+        return ""
+    host = (urlparse(url).hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    labels = [label for label in host.split(".") if label]
+    if not labels:
+        return ""
+    return TAG_SEPARATOR.join(".".join(labels[i:]) for i in range(max(len(labels) - 1, 1)))
+
+
+def detect_language(text: Optional[str]) -> str:
+    """글자 중 한글 비율로 언어 판별 (ko / en, 글자가 없으면 빈 문자열)"""
+    if not text:
+        return ""
+    letters = [ch for ch in text if ch.isalpha()]
+    if not letters:
+        return ""
+    hangul = sum(1 for ch in letters if "가" <= ch <= "힣" or "ㄱ" <= ch <= "ㆎ")
+    return "ko" if hangul / len(letters) >= KOREAN_RATIO_THRESHOLD else "en"
+
+
+def escape_tag(value: str) -> str:
+    """TAG 쿼리 값 이스케이프 (영숫자/밑줄/비ASCII 외 문자 앞에 역슬래시)"""
+    return "".join(ch if ch.isalnum() or ch == "_" else f"\\{ch}" for ch in value)
+
+
+class SearchFilter:
+    """
+    벡터 검색 사전 필터
+
+    조건은 모두 AND로 결합하고, 한 조건 안의 여러 값은 OR로 결합한다.
+    TAG 값이 없는(필드 도입 전에 저장된) 문서는 해당 조건이 있으면 제외된다.
+    """
+
+    def __init__(self,
+                 domains: Optional[Iterable[str]] = None,
+                 languages: Optional[Iterable[str]] = None,
+                 doc_types: Optional[Iterable[str]] = None,
+                 max_age_days: Optional[float] = None,
+                 min_timestamp: Optional[float] = None):
+        """
+        Args:
+            domains: 허용 도메인 (하위 도메인 포함, 예: brave_search_impl.ALLOWED_SITES)
+            languages: 허용 언어 (ko, en)
+            doc_types: 허용 문서 유형 (type 필드, 예: scraped)
+            max_age_days: 최근 N일 안에 수집/저장된 문서만 (검색 시점 기준)
+            min_timestamp: 이 시각(epoch 초) 이후 문서만 (max_age_days와 함께 주면 더 최근 쪽)
+        """
+        self.domains = [domain.lower() for domain in domains or () if domain]
+        self.languages = [language.lower() for language in languages or () if language]
+        self.doc_types = [doc_type.lower() for doc_type in doc_types or () if doc_type]
+        self.max_age_days = max_age_days
+        self.min_timestamp = min_timestamp
+
+    def __bool__(self) -> bool:
+        return bool(self.domains or self.languages or self.doc_types
+                    or self.max_age_days is not None or self.min_timestamp is not None)
+
+    def __repr__(self) -> str:
+        return (f"SearchFilter(domains={self.domains}, languages={self.languages}, doc_types={self.doc_types}, "
+                f"max_age_days={self.max_age_days}, min_timestamp={self.min_timestamp})")
+
+    def effective_min_timestamp(self) -> Optional[float]:
+        """최신성 조건의 하한 시각 (없으면 None)"""
+        bounds = [self.min_timestamp] if self.min_timestamp is not None else []
+        if self.max_age_days is not None:
+            bounds.append(time.time() - self.max_age_days * _DAY_SECONDS)
+        return max(bounds) if bounds else None
+
+    def to_query(self) -> str:
+        """RediSearch 쿼리 식 (조건이 없으면 "*")"""
+        clauses = []
+        for field, values in (("domain", self.domains), ("language", self.languages), ("type", self.doc_types)):
+            if values:
+                clauses.append(f"@{field}:{{{'|'.join(escape_tag(value) for value in values)}}}")
+        min_timestamp = self.effective_min_timestamp()
+        if min_timestamp is not None:
+            clauses.append(f"@timestamp:[{min_timestamp} +inf]")
+        return f"({' '.join(clauses)})" if clauses else "*"
+
+    def matches(self, metadata: Dict[str, Any]) -> bool:
+        """메타데이터가 조건을 만족하는지 검사 (프로세스 내 백엔드용, to_query와 같은 의미)"""
+        for field, values in (("domain", self.domains), ("language", self.languages), ("type", self.doc_types)):
+            if values and not set(_split_tags(metadata.get(field))) & set(values):
+                return False
+        min_timestamp = self.effective_min_timestamp()
+        if min_timestamp is not None:
+            try:
+                if float(metadata.get("timestamp", 0)) < min_timestamp:
+                    return False
+            except (TypeError, ValueError):
+                return False
+        return True
+
+
+def _split_tags(value: Any) -> List[str]:
+    if not value:
+        return []
+    return [tag.strip().lower() for tag in str(value).split(TAG_SEPARATOR) if tag.strip()]
@@ -0,0 +1,116 @@
+# search_result_cache.py
+"""
+벡터 검색 결과 캐시 (같은 KNN 쿼리 반복 시 FT.SEARCH 생략)
+
+인기 질문은 같은 쿼리 벡터로 같은 KNN 검색을 반복하므로, 결과를 짧은 TTL로 Redis에 저장해 두고
+모든 워커가 공유한다. 캐시 조회는 GET 수준 비용이라 트래픽이 몰릴 때 Redis의 검색 CPU를 줄인다.
+- 키: 정규화 후 int8로 양자화한 쿼리 벡터 + top_k + 임계값 + 반환 필드 + 검색 파라미터 + 필터의 해시
+  (임베딩 API의 미세한 부동소수점 차이는 같은 키로 모임)
+- 무효화: 인덱스별 세대 카운터(search_cache:<index>:generation)를 문서 추가/삭제 시 INCR하고,
+  캐시 값에 저장한 세대가 현재 세대와 다르면 버림 (세대와 캐시 값을 MGET 한 번으로 함께 조회)
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.redis.search_filter import SearchFilter
+
+
+# 결과 캐시 기본 유효 시간 (초, 세대 카운터로 놓친 변경(TTL 만료 등)이 반영되는 최대 지연)
+DEFAULT_SEARCH_CACHE_TTL_SECONDS = 30.0
+
+# 쿼리 벡터 양자화 단계 (정규화한 성분에 곱해 반올림, int8 범위)
+QUANTIZATION_SCALE = 127
+
+
+def generation_key_for(index_name: str) -> str:
+    """인덱스별 검색 결과 세대 카운터 키 (문서 추가/삭제 시 증가)"""
+    return f"search_cache:{index_name}:generation"
+
+
+def quantize_vector(query_vector: Sequence[float]) -> bytes:
+    """코사인 검색용 쿼리 벡터를 정규화한 뒤 int8로 양자화한 바이트"""
+    vector = np.asarray(query_vector, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector = vector / norm
+    return np.round(vector * QUANTIZATION_SCALE).astype(np.int8).tobytes()
+
+
+class SearchResultCache:
+    """
+    인덱스 하나의 검색 결과 캐시 키/값 변환과 히트 통계
+
+    Redis I/O는 인덱스(동기/비동기)가 하고, 이 클래스는 키 생성과 세대 확인만 담당한다.
+    """
+
+    def __init__(self, index_name: str, ttl_seconds: float = DEFAULT_SEARCH_CACHE_TTL_SECONDS):
+        """
+        Args:
+            index_name: 인덱스 이름 (별칭이면 별칭 기준, 재구축 후 세대를 올림)
+            ttl_seconds: 결과 유효 시간 (초)
+        """
+        self.index_name = index_name
+        self.ttl_seconds = ttl_seconds
+        self.generation_key = generation_key_for(index_name)
+        self._key_prefix = f"search_cache:{index_name}:result:"
+        self._counters = {"hits": 0, "misses": 0, "stale": 0}
+
+    def result_key(self,
+                   query_vector: Sequence[float],
+                   top_k: int,
+                   score_threshold: float,
+                   return_fields: Optional[Sequence[str]],
+                   ef_runtime: Optional[int],
+                   epsilon: Optional[float],
+                   search_filter: Optional[SearchFilter]) -> str:
+        """검색 조건 전체를 반영한 캐시 키"""
+        digest = hashlib.sha1(quantize_vector(query_vector))
+        options = (top_k, round(score_threshold, 4), list(return_fields) if return_fields is not None else None,
+                   ef_runtime, epsilon, repr(search_filter) if search_filter else None)
+        digest.update(json.dumps(options).encode("utf-8"))
+        return f"{self._key_prefix}{digest.hexdigest()}"
+
+    def decode(self, generation: Optional[bytes], cached: Optional[bytes]) -> Optional[list]:
+        """
+        MGET(세대, 캐시 값) 결과에서 유효한 검색 결과 복원 (없거나 세대가 다르면 None)
+
+        Returns:
+            Optional[list]: (키, 유사도, 필드) 목록
+        """
+        if cached is None:
+            self._counters["misses"] += 1
+            return None
+        payload = json.loads(cached)
+        if payload["generation"] != _generation_value(generation):
+            self._counters["stale"] += 1
+            return None
+        self._counters["hits"] += 1
+        return payload["hits"]
+
+    @staticmethod
+    def encode(generation: Optional[bytes], hits: List[Any]) -> str:
+        """
+        검색 결과를 조회 시점 세대와 함께 직렬화
+
+        검색 전에 읽은 세대를 저장하므로, 검색 도중 문서가 바뀌었다면 다음 조회에서 버려진다.
+        """
+        return json.dumps({
+            "generation": _generation_value(generation),
+            "hits": [[hit.key, hit.similarity, hit.fields] for hit in hits],
+        }, ensure_ascii=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """히트/미스/세대 불일치 횟수와 히트율 (워커 단위)"""
+        stats = dict(self._counters)
+        lookups = sum(stats.values())
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        stats["ttl_seconds"] = self.ttl_seconds
+        return stats
+
+
+def _generation_value(generation: Optional[bytes]) -> int:
+    return int(generation) if generation is not None else 0
@@ -0,0 +1,113 @@
+# vector_backend.py
+"""
+벡터 인덱스 백엔드 인터페이스
+
+핸들러(RedisVectorSearchHandler, SemanticCacheHandler)는 이 인터페이스만 사용하므로
+RediSearch(VectorSearchIndex)와 프로세스 내 NumPy 엔진(NumpyVectorIndex) 중 어느 쪽에서도 그대로 동작한다.
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.redis.search_filter import SearchFilter
+
+
+class VectorBackend(ABC):
+    """
+    벡터 인덱스 백엔드 공통 인터페이스 (동기)
+
+    구현체는 index_name, vector_dimension, state(IndexStateTracker) 속성을 가진다.
+    """
+
+    index_name: str
+    vector_dimension: int
+
+    @abstractmethod
+    def ensure_index_exists(self):
+        """인덱스가 없으면 생성"""
+
+    @abstractmethod
+    def add_document(self, doc_id: str, embedding: List[float], metadata: Dict[str, Any]) -> bool:
+        """문서와 임베딩 벡터 추가 (같은 ID는 덮어씀)"""
+
+    @abstractmethod
+    def add_documents(self,
+                      documents: Iterable[Tuple[str, List[float], Dict[str, Any]]],
+                      chunk_size: int,
+                      max_in_flight: int) -> Dict[str, Any]:
+        """여러 문서 대량 추가 (total/succeeded/failed/chunks/elapsed 결과 반환)"""
+
+    @abstractmethod
+    def search_similar(self,
+                       query_vector: List[float],
+                       top_k: int = 5,
+                       score_threshold: float = 0.7,
+                       return_fields: Optional[Sequence[str]] = None,
+                       ef_runtime: Optional[int] = None,
+                       epsilon: Optional[float] = None,
+                       search_filter: Optional[SearchFilter] = None) -> list:
+        """
+        코사인 유사도 상위 top_k 검색 (List[SearchHit])
+
+        ef_runtime/epsilon은 HNSW 쿼리별 검색 파라미터 (해당 개념이 없는 구현은 무시)
+        search_filter는 top_k를 고르기 전에 적용하는 사전 필터
+        """
+
+    @abstractmethod
+    def delete_document(self, doc_id: str) -> bool:
+        """문서 삭제"""
+
+    @abstractmethod
+    def has_documents(self, doc_ids: Sequence[str]) -> List[bool]:
+        """문서 ID별 저장 여부 (입력 순서대로)"""
+
+    @abstractmethod
+    def get_index_info(self) -> Dict[str, Any]:
+        """인덱스 정보 (문서 수 등)"""
+
+    def doc_key(self, doc_id: str) -> str:
+        """문서 ID에 해당하는 키 (검색 결과 SearchHit.key와 같은 형식)"""
+        return f"doc:{self.index_name}:{doc_id}"
+
+    def close(self):
+        """남은 변경분 기록 등 종료 처리 (기본은 아무것도 안 함)"""
+
+
+class AsyncVectorBackendAdapter:
+    """
+    동기 VectorBackend를 비동기 핸들러에서 쓰기 위한 어댑터
+
+    행렬 연산·디스크 기록이 이벤트 루프를 막지 않도록 백엔드 호출은 asyncio.to_thread로 실행한다.
+    """
+
+    def __init__(self, backend: VectorBackend):
+        self.backend = backend
+        self.index_name = backend.index_name
+
+    @property
+    def state(self):
+        return self.backend.state
+
+    def doc_key(self, doc_id: str) -> str:
+        return self.backend.doc_key(doc_id)
+
+    async def ensure_index_exists(self):
+        await asyncio.to_thread(self.backend.ensure_index_exists)
+
+    async def add_document(self, doc_id: str, embedding: List[float], metadata: Dict[str, Any]) -> bool:
+        return await asyncio.to_thread(self.backend.add_document, doc_id, embedding, metadata)
+
+    async def search_similar(self,
+                             query_vector: List[float],
+                             top_k: int = 5,
+                             score_threshold: float = 0.7,
+                             return_fields: Optional[Sequence[str]] = None,
+                             ef_runtime: Optional[int] = None,
+                             epsilon: Optional[float] = None,
+                             search_filter: Optional[SearchFilter] = None) -> list:
+        return await asyncio.to_thread(self.backend.search_similar, query_vector, top_k, score_threshold,
+                                       return_fields, ef_runtime, epsilon, search_filter)
+
+    async def delete_document(self, doc_id: str) -> bool:
+        return await asyncio.to_thread(self.backend.delete_document, doc_id)
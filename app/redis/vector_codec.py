@@ -0,0 +1,72 @@
+# vector_codec.py
+"""
+벡터 바이트 인코딩 유틸리티
+
+인덱스 벡터 필드 TYPE(FLOAT32/FLOAT16/BFLOAT16)에 맞춰 벡터를 바이트로 변환하고,
+저장된 바이트를 float32 벡터로 복원한다. 쿼리 벡터도 인덱스와 같은 TYPE으로 보내야 한다.
+"""
+
+from typing import List, Union
+
+import numpy as np
+
+
+VECTOR_TYPES = ("FLOAT32", "FLOAT16", "BFLOAT16")
+
+# 타입별 원소당 바이트 수
+_BYTES_PER_ELEMENT = {"FLOAT32": 4, "FLOAT16": 2, "BFLOAT16": 2}
+
+
+def validate_vector_type(vector_type: str) -> str:
+    """지원하는 벡터 타입인지 확인하고 대문자로 정규화"""
+    normalized = vector_type.upper()
+    if normalized not in VECTOR_TYPES:
+        raise ValueError(f"지원하지 않는 벡터 타입: {vector_type} (가능: {', '.join(VECTOR_TYPES)})")
+    return normalized
+
+
+def bytes_per_vector(dimension: int, vector_type: str = "FLOAT32") -> int:
+    """벡터 하나를 저장하는 데 필요한 바이트 수"""
+    return dimension * _BYTES_PER_ELEMENT[validate_vector_type(vector_type)]
+
+
+def encode_vector(vector: Union[List[float], np.ndarray], vector_type: str = "FLOAT32") -> bytes:
+    """벡터를 지정한 타입의 바이트 배열로 변환"""
+    vector_type = validate_vector_type(vector_type)
+    array = np.asarray(vector, dtype=np.float32)
+    if vector_type == "FLOAT32":
+        return array.tobytes()
+    if vector_type == "FLOAT16":
+        return array.astype(np.float16).tobytes()
+    # BFLOAT16: float32 상위 16비트 (round-to-nearest-even)
+    bits = array.view(np.uint32).astype(np.uint64)
+    rounding = ((bits >> 16) & 1) + 0x7FFF
+    rounded = (bits + rounding) >> 16
+    # NaN은 반올림하면 inf나 0이 될 수 있으므로 상위 비트만 자르고 quiet 비트를 세움
+    rounded = np.where(np.isnan(array), (bits >> 16) | 0x0040, rounded)
+    return rounded.astype(np.uint16).tobytes()
+
+
+def decode_vector(data: bytes, vector_type: str = "FLOAT32") -> np.ndarray:
+    """지정한 타입의 바이트 배열을 float32 벡터로 복원"""
+    vector_type = validate_vector_type(vector_type)
+    if vector_type == "FLOAT32":
+        return np.frombuffer(data, dtype=np.float32)
+    if vector_type == "FLOAT16":
+        return np.frombuffer(data, dtype=np.float16).astype(np.float32)
+    return (np.frombuffer(data, dtype=np.uint16).astype(np.uint32) << 16).view(np.float32)
+
+
+def reduce_dimension(vectors: np.ndarray, dimension: int) -> np.ndarray:
+    """
+    text-embedding-3 계열 벡터를 앞쪽 dimension개 성분으로 줄이고 다시 L2 정규화
+
+    OpenAI API의 dimensions 파라미터와 같은 방식이므로 재임베딩 없이 기존 벡터를 축소할 수 있다.
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.shape[-1] < dimension:
+        raise ValueError(f"벡터 차원({vectors.shape[-1]})보다 큰 차원({dimension})으로 늘릴 수 없습니다.")
+    reduced = vectors[..., :dimension]
+    norms = np.linalg.norm(reduced, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return np.ascontiguousarray(reduced / norms, dtype=np.float32)
@@ -0,0 +1,250 @@
+# vector_migration.py
+"""
+벡터 저장 형식 마이그레이션 도구
+
+기존 인덱스의 embedding_vector를 새 타입(FLOAT16/BFLOAT16 등)과 축소 차원으로 재인코딩하고
+인덱스를 다시 만든 뒤, float32 원본 기준 브루트포스 결과와 비교한 recall@k를 보고한다.
+
+사용 예:
+    python -m app.redis.vector_migration --index document_index --type FLOAT16 --dim 512 --sample 50 --k 5
+
+주의: 인덱스를 삭제(문서 Hash는 유지)한 뒤 다시 만들기 때문에, 재색인이 끝날 때까지 검색 결과가 비어 있을 수 있다.
+운영 중인 인덱스는 검색 공백이 없는 app.redis.index_rebuild(별칭 기반 블루/그린 재구축)를 사용한다.
+"""
+
+import argparse
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import redis
+
+from app.redis.client_registry import get_redis_client
+from app.redis.debug_utils import RedisIndexDebugger, parse_index_name, parse_index_prefix, parse_vector_field_spec
+from app.redis.vector_codec import bytes_per_vector, encode_vector, reduce_dimension, validate_vector_type
+from app.redis.vector_scan import iter_doc_keys, normalize_rows, read_vectors
+from app.redis.vector_search import VectorSearchIndex, iter_chunks
+
+
+# SCAN/파이프라인 한 번에 처리할 문서 수
+MIGRATION_BATCH_SIZE = 500
+
+# 재색인 완료 대기 기본값 (초)
+INDEXING_TIMEOUT = 600.0
+INDEXING_POLL_INTERVAL = 1.0
+
+
+def wait_for_indexing(redis_client: redis.Redis, index_name: str,
+                      timeout: float = INDEXING_TIMEOUT,
+                      poll_interval: float = INDEXING_POLL_INTERVAL) -> bool:
+    """FT.INFO의 indexing 플래그가 꺼질 때까지 대기 (제한 시간 내 완료 여부 반환)"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        indexing = redis_client.ft(index_name).info().get("indexing", 0)
+        if isinstance(indexing, bytes):
+            indexing = indexing.decode("utf-8")
+        if int(float(indexing)) == 0:
+            return True
+        time.sleep(poll_interval)
+    return False
+
+
+class _BruteForceTopK:
+    """샘플 쿼리별 정확한 top-k를 배치 단위로 누적 계산 (전체 벡터를 메모리에 올리지 않음)"""
+
+    def __init__(self, queries: np.ndarray, k: int):
+        self.queries = normalize_rows(queries)
+        self.k = k
+        self.scores = np.full((len(queries), 0), -np.inf, dtype=np.float32)
+        self.keys = np.empty((len(queries), 0), dtype=object)
+
+    def update(self, keys: List[bytes], vectors: np.ndarray):
+        if not len(keys):
+            return
+        batch_scores = self.queries @ normalize_rows(vectors).T
+        batch_keys = np.broadcast_to(np.array(keys, dtype=object), batch_scores.shape)
+        scores = np.hstack([self.scores, batch_scores])
+        all_keys = np.hstack([self.keys, batch_keys])
+        keep = min(self.k, scores.shape[1])
+        top = np.argpartition(-scores, keep - 1, axis=1)[:, :keep]
+        self.scores = np.take_along_axis(scores, top, axis=1)
+        self.keys = np.take_along_axis(all_keys, top, axis=1)
+
+    def results(self) -> List[set]:
+        return [{_key_str(key) for key in row} for row in self.keys]
+
+
+def _key_str(key) -> str:
+    return key.decode("utf-8") if isinstance(key, bytes) else str(key)
+
+
+def _sample_queries(redis_client: redis.Redis, key_prefix: str, sample_size: int,
+                    source_type: str, source_dimension: int) -> np.ndarray:
+    """SCAN 앞쪽 문서 벡터를 샘플 쿼리로 사용 (SCAN 순서는 해시 기반이라 사실상 임의 표본)"""
+    keys = []
+    for key in iter_doc_keys(redis_client, key_prefix, MIGRATION_BATCH_SIZE):
+        keys.append(key)
+        if len(keys) >= sample_size:
+            break
+    _, vectors = read_vectors(redis_client, keys, source_type, source_dimension)
+    return vectors
+
+
+def migrate_index(redis_client: redis.Redis,
+                  index_name: str,
+                  target_type: str,
+                  target_dimension: Optional[int] = None,
+                  source_type: Optional[str] = None,
+                  sample_size: int = 50,
+                  k: int = 5,
+                  batch_size: int = MIGRATION_BATCH_SIZE,
+                  distance_metric: str = "COSINE") -> Dict[str, Any]:
+    """
+    인덱스의 모든 문서 벡터를 target_type/target_dimension으로 재인코딩하고 인덱스를 재생성
+
+    Args:
+        redis_client: Redis 클라이언트 (decode_responses=False)
+        index_name: 대상 인덱스 이름
+        target_type: 새 벡터 타입 (FLOAT32, FLOAT16, BFLOAT16)
+        target_dimension: 새 차원 (None이면 유지, 작으면 앞쪽 성분만 남기고 재정규화)
+        source_type: 기존 벡터 타입 (None이면 FT.INFO에서 확인)
+        sample_size: recall 측정에 사용할 샘플 쿼리 수 (0이면 측정 안 함)
+        k: recall@k의 k
+        batch_size: SCAN/파이프라인 배치 크기
+        distance_metric: 새 인덱스의 거리 함수
+
+    Returns:
+        Dict: 마이그레이션 결과 (변환/건너뜀 문서 수, 저장 크기, recall@k, 소요 시간)
+    """
+    target_type = validate_vector_type(target_type)
+    debugger = RedisIndexDebugger(redis_client)
+    info = debugger.get_index_info_or_none(index_name)
+    if info is None:
+        raise ValueError(f"인덱스 '{index_name}'가 존재하지 않습니다.")
+    if parse_index_name(info) not in (None, index_name):
+        # 별칭 뒤의 버전 인덱스는 삭제 없이 새 버전을 만들어 전환
+        raise ValueError(f"'{index_name}'는 별칭입니다. python -m app.redis.index_rebuild 로 재구축하세요.")
+    key_prefix = parse_index_prefix(info) or f"doc:{index_name}:"
+
+    spec = parse_vector_field_spec(info, "embedding_vector")
+    source_type = validate_vector_type(source_type or spec.get("type", "FLOAT32"))
+    source_dimension = spec.get("dim")
+    if source_dimension is None:
+        raise ValueError(f"인덱스 '{index_name}'의 벡터 차원을 확인할 수 없습니다.")
+    target_dimension = target_dimension or source_dimension
+    if target_dimension > source_dimension:
+        raise ValueError(f"차원을 늘릴 수 없습니다: {source_dimension} -> {target_dimension}")
+
+    if (target_type, target_dimension) == (source_type, source_dimension):
+        print(f"✅ '{index_name}'는 이미 {target_type}/{target_dimension} 형식입니다.")
+        return {"index": index_name, "converted": 0, "skipped": 0, "recall_at_k": None}
+
+    started = time.perf_counter()
+    print(f"🔄 '{index_name}' 마이그레이션: {source_type}/{source_dimension} -> {target_type}/{target_dimension}")
+
+    # 1. recall 기준선용 샘플 쿼리 (원본 벡터)
+    queries = np.empty((0, source_dimension), dtype=np.float32)
+    if sample_size > 0:
+        queries = _sample_queries(redis_client, key_prefix, sample_size, source_type, source_dimension)
+    baseline = _BruteForceTopK(queries, k) if len(queries) else None
+
+    # 2. 기존 인덱스 삭제 (문서 Hash는 유지) - 재인코딩 중 잘못된 크기의 벡터가 색인되지 않도록
+    redis_client.ft(index_name).dropindex(delete_documents=False)
+
+    # 3. SCAN + 파이프라인 HGET/HSET으로 재인코딩 (기준선 top-k도 같은 패스에서 누적)
+    # SCAN은 같은 키를 여러 번 돌려줄 수 있음: 바이트 크기가 바뀌면 크기 검사로 걸러지지만,
+    # 같으면(FLOAT16 <-> BFLOAT16) 이중 변환을 막기 위해 처리한 키를 기록
+    seen = set() if bytes_per_vector(target_dimension, target_type) == \
+        bytes_per_vector(source_dimension, source_type) else None
+    converted, skipped = 0, 0
+    for keys in iter_chunks(iter_doc_keys(redis_client, key_prefix, batch_size), batch_size):
+        if seen is not None:
+            keys = [key for key in keys if key not in seen]
+            seen.update(keys)
+        valid_keys, vectors = read_vectors(redis_client, keys, source_type, source_dimension)
+        skipped += len(keys) - len(valid_keys)
+        if not valid_keys:
+            continue
+        if baseline is not None:
+            baseline.update(valid_keys, vectors)
+        if target_dimension < source_dimension:
+            vectors = reduce_dimension(vectors, target_dimension)
+        pipe = redis_client.pipeline(transaction=False)
+        for key, vector in zip(valid_keys, vectors):
+            pipe.hset(key, "embedding_vector", encode_vector(vector, target_type))
+        pipe.execute()
+        converted += len(valid_keys)
+
+    # 4. 새 스키마로 인덱스 재생성 후 재색인 대기
+    index = VectorSearchIndex(
+        redis_client=redis_client,
+        index_name=index_name,
+        vector_dimension=target_dimension,
+        distance_metric=distance_metric,
+        vector_type=target_type
+    )
+    if not wait_for_indexing(redis_client, index_name):
+        print(f"⚠️ 재색인이 {INDEXING_TIMEOUT:.0f}초 안에 끝나지 않았습니다 (recall 값이 낮게 나올 수 있음)")
+    index._refresh_state()
+
+    # 5. recall@k: 원본 float32 브루트포스 top-k 대비 새 인덱스 KNN 결과
+    recall = None
+    if baseline is not None:
+        expected = baseline.results()
+        search_queries = reduce_dimension(queries, target_dimension) \
+            if target_dimension < source_dimension else queries
+        matched, total = 0, 0
+        for query, truth in zip(search_queries, expected):
+            hits = index.search_similar(query, top_k=k, score_threshold=-1.0, return_fields=())
+            matched += len(truth & {hit.key for hit in hits})
+            total += len(truth)
+        recall = matched / total if total else None
+
+    report = {
+        "index": index_name,
+        "source": {"type": source_type, "dim": source_dimension},
+        "target": {"type": target_type, "dim": target_dimension},
+        "converted": converted,
+        "skipped": skipped,
+        "bytes_per_vector": {
+            "before": bytes_per_vector(source_dimension, source_type),
+            "after": bytes_per_vector(target_dimension, target_type),
+        },
+        "recall_at_k": recall,
+        "k": k,
+        "sample_size": len(queries),
+        "elapsed": time.perf_counter() - started,
+    }
+    recall_text = f"{recall:.4f}" if recall is not None else "측정 안 함"
+    print(f"✅ 마이그레이션 완료: {converted}개 변환, {skipped}개 건너뜀, "
+          f"벡터 {report['bytes_per_vector']['before']}B -> {report['bytes_per_vector']['after']}B, "
+          f"recall@{k} {recall_text} ({report['elapsed']:.1f}초)")
+    return report
+
+
+def main():
+    from app.config import settings
+
+    parser = argparse.ArgumentParser(description="벡터 인덱스 저장 형식 마이그레이션")
+    parser.add_argument("--index", required=True, help="대상 인덱스 이름 (예: document_index)")
+    parser.add_argument("--type", default=settings.vector_type, help="새 벡터 타입 (FLOAT32/FLOAT16/BFLOAT16)")
+    parser.add_argument("--dim", type=int, default=settings.embedding_dimensions, help="새 벡터 차원 (생략 시 유지)")
+    parser.add_argument("--source-type", default=None, help="기존 벡터 타입 (생략 시 FT.INFO에서 확인)")
+    parser.add_argument("--sample", type=int, default=50, help="recall 측정 샘플 쿼리 수 (0이면 생략)")
+    parser.add_argument("--k", type=int, default=5, help="recall@k의 k")
+    parser.add_argument("--redis-url", default=settings.redis_url)
+    args = parser.parse_args()
+
+    migrate_index(
+        get_redis_client(args.redis_url),
+        index_name=args.index,
+        target_type=args.type,
+        target_dimension=args.dim,
+        source_type=args.source_type,
+        sample_size=args.sample,
+        k=args.k,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# vector_scan.py
+"""
+인덱스에 저장된 벡터 일괄 읽기 유틸리티
+
+마이그레이션(vector_migration), HNSW 벤치마크(hnsw_benchmark) 같은 오프라인 도구가
+인덱스 접두사의 문서 키를 SCAN으로 순회하고 embedding_vector를 float32로 복원할 때 공유한다.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+import redis
+
+from app.redis.vector_codec import bytes_per_vector, decode_vector
+
+
+def iter_doc_keys(redis_client: redis.Redis, key_prefix: str, batch_size: int):
+    """인덱스 접두사의 문서 키를 SCAN으로 순회"""
+    return redis_client.scan_iter(match=f"{key_prefix}*", count=batch_size)
+
+
+def read_vectors(redis_client: redis.Redis, keys: List[bytes], source_type: str,
+                 source_dimension: int) -> Tuple[List[bytes], np.ndarray]:
+    """파이프라인 HGET으로 벡터를 읽어 float32로 복원 (형식이 다른 값은 제외)"""
+    pipe = redis_client.pipeline(transaction=False)
+    for key in keys:
+        pipe.hget(key, "embedding_vector")
+    expected_size = bytes_per_vector(source_dimension, source_type)
+    valid_keys, vectors = [], []
+    for key, value in zip(keys, pipe.execute()):
+        if value is None or len(value) != expected_size:
+            continue
+        valid_keys.append(key)
+        vectors.append(decode_vector(value, source_type))
+    if not vectors:
+        return valid_keys, np.empty((0, source_dimension), dtype=np.float32)
+    return valid_keys, np.vstack(vectors)
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """코사인 유사도 계산용 L2 정규화"""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
@@ -5,23 +5,373 @@ HNSW (Hierarchical Navigable Small World) 알고리즘을 사용하여 빠른 
 """
 
 import redis
-from redis.commands.search.field import VectorField, TextField, NumericField
+import redis.asyncio
+from redis.commands.search.field import VectorField, TextField, NumericField, TagField
 from redis.commands.search.indexDefinition import IndexDefinition, IndexType
 from redis.commands.search.query import Query
 import numpy as np
-from typing import List, Dict, Any
-from app.redis.debug_utils import RedisIndexDebugger
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Sequence, Tuple
+from app.redis.debug_utils import (
+    RedisIndexDebugger,
+    parse_field_names,
+    parse_index_name,
+    parse_index_prefix,
+    parse_num_docs,
+    parse_vector_field_spec,
+)
+from app.redis.vector_codec import encode_vector, validate_vector_type
+from app.redis.vector_backend import VectorBackend
+from app.redis.search_filter import TAG_SEPARATOR, SearchFilter
+from app.redis.search_result_cache import SearchResultCache, generation_key_for
 
 
+# 인덱스 상태(존재/문서 수)를 FT.INFO로 다시 확인하는 기본 주기 (초)
+INDEX_STATE_REFRESH_INTERVAL = 60.0
 
-class VectorSearchIndex:
-    """Redis Vector Search를 위한 인덱스 관리 클래스"""
+
+# RETURN 미지정 시 돌려받을 필드 (embedding_vector 제외)
+DEFAULT_RETURN_FIELDS = ("question", "answer", "source_url", "text", "timestamp", "type", "custom_key")
+
+# 사전 필터용 TAG 필드 (기존 인덱스에 없으면 FT.ALTER로 추가)
+FILTER_TAG_FIELDS = ("domain", "language", "type")
+
+# 대량 저장 기본값: 파이프라인 하나에 담을 문서 수 / 동시에 실행할 파이프라인 수
+BULK_CHUNK_SIZE = 256
+BULK_MAX_IN_FLIGHT = 2
+
+# HNSW 인덱스 구축 파라미터 기본값 (변경하려면 인덱스를 다시 만들어야 함, python -m app.redis.hnsw_benchmark로 비교)
+HNSW_M = 16                  # 각 노드의 최대 연결 수
+HNSW_EF_CONSTRUCTION = 200   # 인덱스 구축 시 탐색 범위
+HNSW_INITIAL_CAP = 10000     # 초기 벡터 용량
+
+# 숫자로 변환해 돌려줄 필드
+_NUMERIC_FIELDS = {"timestamp"}
+
+
+def iter_chunks(items: Iterable, chunk_size: int) -> Iterator[list]:
+    """이터러블을 chunk_size 단위 리스트로 나누어 순서대로 생성 (전체를 메모리에 올리지 않음)"""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, max(1, chunk_size)))
+        if not chunk:
+            return
+        yield chunk
+
+
+def rebuild_lock_key(alias: str) -> str:
+    """별칭별 재구축 락 키 (모든 워커/CLI가 공유, 키가 있으면 재구축 중)"""
+    return f"index_rebuild:{alias}:lock"
+
+
+def rebuild_deletes_key(alias: str) -> str:
+    """재구축 중 삭제된 문서 키 Set (재구축 작업이 별칭 전환 전에 새 버전 접두사에도 반영)"""
+    return f"index_rebuild:{alias}:deleted"
+
+
+def new_bulk_report() -> Dict[str, Any]:
+    """대량 저장 결과 기본 구조 (failed: 실패한 문서 ID와 오류 메시지)"""
+    return {"total": 0, "succeeded": 0, "failed": [], "chunks": 0, "elapsed": 0.0}
+
+
+def _to_str(value) -> str:
+    """Redis 응답 값(bytes)을 문자열로 변환"""
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    return str(value)
+
+
+class SearchHit:
+    """
+    KNN 검색 결과 한 건 (RETURN으로 요청한 필드만 담는 경량 레코드)
+
+    Attributes:
+        key: 문서의 Redis 키 (doc:<index>:<id>)
+        similarity: 코사인 유사도 (1 - distance)
+        fields: 요청한 필드 값
+    """
+
+    __slots__ = ("key", "similarity", "fields")
+
+    def __init__(self, key: str, similarity: float, fields: Dict[str, Any]):
+        self.key = key
+        self.similarity = similarity
+        self.fields = fields
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """필드 값 조회 (요청하지 않았거나 없는 필드는 default)"""
+        return self.fields.get(name, default)
+
+    def __repr__(self) -> str:
+        return f"SearchHit(key={self.key!r}, similarity={self.similarity:.4f}, fields={list(self.fields)})"
+
+
+class IndexStateTracker:
+    """
+    인덱스 존재 여부와 (근사) 문서 수를 프로세스 내에서 추적하는 클래스
+
+    검색마다 FT.INFO를 호출하지 않도록 상태를 한 번 확인해 두고,
+    add/delete 시 갱신하며 refresh_interval이 지나면 다시 확인한다.
+    """
+
+    def __init__(self, refresh_interval: Optional[float] = INDEX_STATE_REFRESH_INTERVAL):
+        """
+        Args:
+            refresh_interval: 상태 재확인 주기 (초, None이면 명시적 무효화 전까지 재확인하지 않음)
+        """
+        self.refresh_interval = refresh_interval
+        self.exists = False
+        self.doc_count = 0
+        self.checked_at: Optional[float] = None
+
+    def needs_refresh(self) -> bool:
+        """상태를 FT.INFO로 다시 확인해야 하는지 여부"""
+        if self.checked_at is None:
+            return True
+        if self.refresh_interval is None:
+            return False
+        return time.monotonic() - self.checked_at >= self.refresh_interval
+
+    def update(self, exists: bool, doc_count: int):
+        """FT.INFO로 확인한 상태 반영"""
+        self.exists = exists
+        self.doc_count = doc_count if exists else 0
+        self.checked_at = time.monotonic()
+
+    def invalidate(self):
+        """다음 검색 시 상태를 다시 확인하도록 표시"""
+        self.checked_at = None
+
+    def record_add(self):
+        """문서 추가 반영 (추가에 성공했다면 인덱스는 비어 있지 않음)"""
+        self.exists = True
+        self.doc_count += 1
+
+    def record_delete(self):
+        """문서 삭제 반영 (0이 되면 다른 워커의 추가분이 있을 수 있으므로 재확인)"""
+        self.doc_count = max(0, self.doc_count - 1)
+        if self.doc_count == 0:
+            self.invalidate()
+
+    @property
+    def is_searchable(self) -> bool:
+        """인덱스가 존재하고 문서가 있는지 여부"""
+        return self.exists and self.doc_count > 0
+
+
+class _VectorIndexBase:
+    """동기/비동기 Vector Search 인덱스가 공유하는 스키마 정의와 쿼리/결과 변환 로직"""
+
+    def _init_common(self,
+                     redis_client,
+                     index_name: str,
+                     vector_dimension: int,
+                     distance_metric: str,
+                     state_refresh_interval: Optional[float],
+                     vector_type: str = "FLOAT32",
+                     hnsw_m: int = HNSW_M,
+                     hnsw_ef_construction: int = HNSW_EF_CONSTRUCTION,
+                     hnsw_initial_cap: int = HNSW_INITIAL_CAP,
+                     ef_runtime: Optional[int] = None,
+                     epsilon: Optional[float] = None,
+                     result_cache_ttl: Optional[float] = None):
+        self.redis_client = redis_client
+        self.index_name = index_name
+        self.vector_dimension = vector_dimension
+        self.vector_type = validate_vector_type(vector_type)
+        self.distance_metric = distance_metric
+        # 문서 키 접두사와 실제 인덱스 이름 (index_name이 별칭이면 FT.INFO로 확인한 물리 인덱스 기준으로 갱신)
+        self.key_prefix = f"doc:{index_name}:"
+        self.physical_index_name = index_name
+        self.hnsw_m = hnsw_m
+        self.hnsw_ef_construction = hnsw_ef_construction
+        self.hnsw_initial_cap = hnsw_initial_cap
+        # 쿼리별 값을 주지 않았을 때 쓰는 기본 검색 파라미터 (None이면 서버 기본값)
+        self.ef_runtime = ef_runtime
+        self.epsilon = epsilon
+        # 검색 결과 캐시 (None이면 사용 안 함) / 세대 카운터 (캐시 사용 여부와 관계없이 문서 변경 시 증가)
+        self.result_cache = SearchResultCache(index_name, result_cache_ttl) if result_cache_ttl else None
+        self.generation_key = generation_key_for(index_name)
+
+        # 인덱스 상태 추적기 (검색 시 FT.INFO 호출 최소화)
+        self.state = IndexStateTracker(refresh_interval=state_refresh_interval)
+
+    def _build_schema(self) -> tuple:
+        """인덱스 스키마 정의"""
+        return (
+            # 벡터 필드 - HNSW 알고리즘 사용
+            VectorField("embedding_vector",
+                "HNSW",  # 알고리즘 
+                {
+                    "TYPE": self.vector_type,
+                    "DIM": self.vector_dimension,
+                    "DISTANCE_METRIC": self.distance_metric,
+                    # HNSW 파라미터
+                    "INITIAL_CAP": self.hnsw_initial_cap,
+                    "M": self.hnsw_m,  # 각 노드의 최대 연결 수
+                    "EF_CONSTRUCTION": self.hnsw_ef_construction  # 인덱스 구축 시 탐색 범위
+                }
+            ),
+            # 메타데이터 필드들
+            TextField("question", sortable=True),
+            TextField("source_url"),
+            TextField("text"),
+            NumericField("timestamp", sortable=True),
+            TextField("custom_key"),
+            TextField("id"),
+            # 사전 필터용 TAG 필드 (SearchFilter)
+            *self._build_tag_fields()
+        )
+
+    @staticmethod
+    def _build_tag_fields() -> list:
+        return [TagField(name, separator=TAG_SEPARATOR) for name in FILTER_TAG_FIELDS]
+
+    def _build_definition(self) -> IndexDefinition:
+        """인덱스 정의 (Hash, 키 접두사 기반)"""
+        return IndexDefinition(
+            prefix=[self.key_prefix],
+            index_type=IndexType.HASH
+        )
+
+    def doc_key(self, doc_id: str) -> str:
+        """문서 ID에 해당하는 Redis 키 (현재 물리 인덱스의 접두사 기준)"""
+        return f"{self.key_prefix}{doc_id}"
+
+    def _apply_index_info(self, info):
+        """
+        FT.INFO 결과로 상태와 물리 인덱스/키 접두사 갱신
+
+        index_name이 별칭이면 재구축(app.redis.index_rebuild) 후 별칭이 새 버전을 가리키게 되므로,
+        상태를 다시 확인할 때 새 접두사로 쓰기 시작한다.
+        """
+        self.state.update(True, parse_num_docs(info))
+        physical_name = parse_index_name(info) or self.index_name
+        key_prefix = parse_index_prefix(info) or self.key_prefix
+        if (physical_name, key_prefix) != (self.physical_index_name, self.key_prefix):
+            if self.physical_index_name != physical_name:
+                print(f"🔀 인덱스 '{self.index_name}' -> '{physical_name}' (키 접두사 {key_prefix})")
+            self.physical_index_name = physical_name
+            self.key_prefix = key_prefix
+
+    def _prepare_document(self, doc_id: str, embedding: List[float], metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Redis Hash로 저장할 데이터 준비 (벡터는 인덱스 TYPE의 바이트 배열로 변환)"""
+        doc_data = metadata.copy()
+        doc_data["embedding_vector"] = encode_vector(embedding, self.vector_type)
+        doc_data["custom_key"] = doc_id
+        doc_data["id"] = doc_id
+        return doc_data
+
+    def _build_search_args(self,
+                           query_vector: List[float],
+                           top_k: int,
+                           return_fields: Optional[Sequence[str]],
+                           score_threshold: float = -1.0,
+                           ef_runtime: Optional[int] = None,
+                           epsilon: Optional[float] = None,
+                           search_filter: Optional[SearchFilter] = None) -> list:
+        """
+        FT.SEARCH 명령 인자 생성 (사전 필터 + KNN 쿼리 + RETURN 필드 제한 + 쿼리 파라미터)
+
+        RETURN으로 지정한 필드와 점수만 돌려받으므로 벡터/불필요한 원문이 전송되지 않는다.
+        검색 파라미터는 전역 설정(FT.CONFIG)이 아니라 이 쿼리에만 적용되는 쿼리 속성으로 전달한다.
+        - ef_runtime: KNN 쿼리의 EF_RUNTIME (높을수록 정확하지만 느림)
+        - epsilon: 지정하면 유사도 임계값을 반경으로 하는 VECTOR_RANGE 쿼리로 바꾸고 EPSILON 적용
+          (RediSearch는 EPSILON을 범위 쿼리에서만 받음, 결과는 점수순 상위 top_k)
+        - search_filter: KNN 쿼리의 사전 필터 식 (Redis가 조건에 맞는 후보 안에서 top_k를 찾음)
+        """
+        if return_fields is None:
+            return_fields = DEFAULT_RETURN_FIELDS
+        if ef_runtime is None:
+            ef_runtime = self.ef_runtime
+        if epsilon is None:
+            epsilon = self.epsilon
+        filter_query = search_filter.to_query() if search_filter else "*"
+        params = {"vector": encode_vector(query_vector, self.vector_type)}
+        if epsilon is not None:
+            # 코사인 거리 = 1 - 유사도
+            params["radius"] = max(0.0, 1 - score_threshold)
+            params["epsilon"] = epsilon
+            base_query = "(@embedding_vector:[VECTOR_RANGE $radius $vector]=>{$EPSILON: $epsilon; $YIELD_DISTANCE_AS: score})"
+            if filter_query != "*":
+                base_query = f"{base_query} {filter_query}"
+        elif ef_runtime is not None:
+            params["ef_runtime"] = int(ef_runtime)
+            base_query = f"{filter_query}=>[KNN {top_k} @embedding_vector $vector EF_RUNTIME $ef_runtime AS score]"
+        else:
+            base_query = f"{filter_query}=>[KNN {top_k} @embedding_vector $vector AS score]"
+        query = Query(base_query)\
+            .return_fields(*return_fields, "score")\
+            .sort_by("score")\
+            .paging(0, top_k)\
+            .dialect(2)
+        param_args = [item for name, value in params.items() for item in (name, value)]
+        return [self.index_name, *query.get_args(), "PARAMS", len(param_args), *param_args]
+
+    def _result_cache_key(self, query_vector, top_k, score_threshold, return_fields,
+                          ef_runtime, epsilon, search_filter) -> Optional[str]:
+        """결과 캐시 키 (캐시를 쓰지 않으면 None, 검색 파라미터는 인덱스 기본값을 반영)"""
+        if self.result_cache is None:
+            return None
+        return self.result_cache.result_key(
+            query_vector, top_k, score_threshold, return_fields,
+            self.ef_runtime if ef_runtime is None else ef_runtime,
+            self.epsilon if epsilon is None else epsilon,
+            search_filter
+        )
+
+    def _cached_hits(self, generation, cached) -> Optional[List[SearchHit]]:
+        """MGET(세대, 캐시 값) 결과를 SearchHit 목록으로 복원 (미스/세대 불일치면 None)"""
+        entries = self.result_cache.decode(generation, cached)
+        if entries is None:
+            return None
+        return [SearchHit(key, similarity, fields) for key, similarity, fields in entries]
+
+    @staticmethod
+    def _parse_search_response(response, score_threshold: float) -> List[SearchHit]:
+        """FT.SEARCH 원시 응답을 임계값으로 거르고 SearchHit 목록으로 변환"""
+        hits = []
+        # 응답 형식: [전체 개수, key1, [field, value, ...], key2, [...], ...]
+        for i in range(1, len(response) - 1, 2):
+            raw_fields = response[i + 1] or []
+            fields = {}
+            distance = None
+            for name, value in zip(raw_fields[::2], raw_fields[1::2]):
+                name = _to_str(name)
+                if name == "score":
+                    distance = float(value)
+                elif name in _NUMERIC_FIELDS:
+                    fields[name] = float(value)
+                else:
+                    fields[name] = _to_str(value)
+            if distance is None:
+                continue
+            # 코사인 유사도 점수 (1 - distance), 임계값 체크
+            similarity_score = 1 - distance
+            if similarity_score >= score_threshold:
+                hits.append(SearchHit(_to_str(response[i]), similarity_score, fields))
+        return hits
+
+
+class VectorSearchIndex(_VectorIndexBase, VectorBackend):
+    """Redis Vector Search(RediSearch FT.*)를 사용하는 VectorBackend 구현"""
     
     def __init__(self, 
                  redis_client: redis.Redis,
                  index_name: str = "climate_vectors",
                  vector_dimension: int = 1536,
-                 distance_metric: str = "COSINE"):
+                 distance_metric: str = "COSINE",
+                 state_refresh_interval: Optional[float] = INDEX_STATE_REFRESH_INTERVAL,
+                 vector_type: str = "FLOAT32",
+                 hnsw_m: int = HNSW_M,
+                 hnsw_ef_construction: int = HNSW_EF_CONSTRUCTION,
+                 hnsw_initial_cap: int = HNSW_INITIAL_CAP,
+                 ef_runtime: Optional[int] = None,
+                 epsilon: Optional[float] = None,
+                 result_cache_ttl: Optional[float] = None):
         """
         Vector Search 인덱스 초기화
         
@@ -30,11 +380,18 @@ class VectorSearchIndex:
             index_name: 인덱스 이름
             vector_dimension: 벡터 차원 (OpenAI text-embedding-3-small은 1536)
             distance_metric: 거리 측정 방식 (COSINE, L2, IP)
+            state_refresh_interval: 인덱스 상태 재확인 주기 (초)
+            vector_type: 벡터 저장 타입 (FLOAT32, FLOAT16, BFLOAT16)
+            hnsw_m: HNSW 노드당 최대 연결 수 (인덱스 생성 시에만 적용)
+            hnsw_ef_construction: HNSW 구축 시 탐색 범위 (인덱스 생성 시에만 적용)
+            hnsw_initial_cap: 초기 벡터 용량 (인덱스 생성 시에만 적용)
+            ef_runtime: 검색 기본 EF_RUNTIME (None이면 서버 기본값, 쿼리별로 덮어쓸 수 있음)
+            epsilon: 검색 기본 EPSILON (None이면 KNN 쿼리, 지정하면 VECTOR_RANGE 쿼리)
+            result_cache_ttl: 검색 결과 캐시 유효 시간 (초, None이면 캐시 사용 안 함)
         """
-        self.redis_client = redis_client
-        self.index_name = index_name
-        self.vector_dimension = vector_dimension
-        self.distance_metric = distance_metric
+        self._init_common(redis_client, index_name, vector_dimension, distance_metric, state_refresh_interval,
+                          vector_type, hnsw_m, hnsw_ef_construction, hnsw_initial_cap, ef_runtime, epsilon,
+                          result_cache_ttl)
         
         # 디버깅 유틸리티 초기화
         self.debugger = RedisIndexDebugger(redis_client)
@@ -42,64 +399,64 @@ class VectorSearchIndex:
         # 인덱스 생성 또는 확인
         self._ensure_index_exists()
         
+    def ensure_index_exists(self):
+        """인덱스가 없으면 생성 (VectorBackend 인터페이스)"""
+        self._ensure_index_exists()
+
     def _ensure_index_exists(self):
-        """인덱스가 존재하는지 확인하고, 없으면 생성"""
-        print(f"\n🔍 인덱스 '{self.index_name}' 상태 확인 중...")
+        """인덱스가 존재하는지 확인하고, 없으면 생성 (FT.INFO 1회로 존재 여부와 문서 수를 함께 확인)"""
+        info = self.debugger.get_index_info_or_none(self.index_name)
         
-        # 상세 진단 실행
-        exists = self.debugger.check_index_exists(self.index_name)
-        
-        if exists:
-            doc_count = self.debugger.count_documents_in_index(self.index_name)
-            print(f"✅ 인덱스 '{self.index_name}' 존재 ({doc_count}개 문서)")
+        if info is not None:
+            self._apply_index_info(info)
+            print(f"✅ 인덱스 '{self.index_name}' 존재 ({self.state.doc_count}개 문서)")
+            self._warn_if_vector_spec_differs(info)
+            self._add_missing_tag_fields(info)
         else:
             # 인덱스가 없으면 생성
             print(f"🔧 인덱스 '{self.index_name}' 생성 중...")
             self._create_index()
-            
-            # 생성 후 다시 확인
-            if self.debugger.check_index_exists(self.index_name):
-                print(f"✅ 인덱스 '{self.index_name}' 생성 완료")
+            self.state.update(True, 0)
+
+    def _warn_if_vector_spec_differs(self, info):
+        """기존 인덱스의 벡터 TYPE/DIM이 설정과 다르면 마이그레이션 안내 (검색 시 오류 발생)"""
+        spec = parse_vector_field_spec(info, "embedding_vector")
+        current = (spec.get("type"), spec.get("dim"))
+        if None not in current and current != (self.vector_type, self.vector_dimension):
+            print(f"⚠️ 인덱스 '{self.index_name}' 벡터 설정 불일치: 현재 {current[0]}/{current[1]}, "
+                  f"설정 {self.vector_type}/{self.vector_dimension} "
+                  f"(python -m app.redis.vector_migration 으로 재인코딩 필요)")
+
+    def _add_missing_tag_fields(self, info):
+        """필터 TAG 필드가 없는 기존 인덱스에 FT.ALTER로 추가 (기존 문서는 Redis가 백그라운드로 색인)"""
+        existing = parse_field_names(info)
+        missing = [field for field in self._build_tag_fields() if field.name not in existing]
+        if not missing:
+            return
+        try:
+            self.redis_client.ft(self.index_name).alter_schema_add(missing)
+            print(f"🔧 인덱스 '{self.index_name}'에 필터 필드 추가: {', '.join(field.name for field in missing)}")
+        except Exception as e:
+            print(f"⚠️ 필터 필드 추가 오류 ({self.index_name}): {e}")
+
+    def _refresh_state(self):
+        """FT.INFO 한 번으로 인덱스 상태를 다시 확인하여 추적기에 반영"""
+        try:
+            info = self.debugger.get_index_info_or_none(self.index_name)
+            if info is None:
+                self.state.update(False, 0)
             else:
-                print(f"❌ 인덱스 '{self.index_name}' 생성 실패!")
-            
+                self._apply_index_info(info)
+        except Exception as e:
+            print(f"인덱스 상태 확인 오류: {e}")
+            self.state.invalidate()
+
     def _create_index(self):
         """Vector Search 인덱스 생성"""
         try:
-            # 인덱스 스키마 정의
-            schema = (
-                # 벡터 필드 - HNSW 알고리즘 사용
-                VectorField("embedding_vector",
-                    "HNSW",  # 알고리즘 
-                    {
-                        "TYPE": "FLOAT32",
-                        "DIM": self.vector_dimension,
-                        "DISTANCE_METRIC": self.distance_metric,
-                        # HNSW 파라미터
-                        "INITIAL_CAP": 10000,
-                        "M": 16,  # 각 노드의 최대 연결 수
-                        "EF_CONSTRUCTION": 200  # 인덱스 구축 시 탐색 범위
-                    }
-                ),
-                # 메타데이터 필드들
-                TextField("question", sortable=True),
-                TextField("source_url"),
-                TextField("text"),
-                NumericField("timestamp", sortable=True),
-                TextField("custom_key"),
-                TextField("id")
-            )
-            
-            # 인덱스 정의
-            definition = IndexDefinition(
-                prefix=[f"doc:{self.index_name}:"],
-                index_type=IndexType.HASH
-            )
-            
-            # 인덱스 생성
             self.redis_client.ft(self.index_name).create_index(
-                fields=schema,
-                definition=definition
+                fields=self._build_schema(),
+                definition=self._build_definition()
             )
             
             print(f"인덱스 '{self.index_name}' 생성 완료")
@@ -124,18 +481,15 @@ class VectorSearchIndex:
             bool: 성공 여부
         """
         try:
-            # 벡터를 바이트 배열로 변환
-            embedding_bytes = np.array(embedding, dtype=np.float32).tobytes()
-            
-            # Redis에 저장할 데이터 준비
-            doc_data = metadata.copy()
-            doc_data["embedding_vector"] = embedding_bytes
-            doc_data["custom_key"] = doc_id
-            doc_data["id"] = doc_id
-            
             # Redis Hash로 저장
-            redis_key = f"doc:{self.index_name}:{doc_id}"
-            self.redis_client.hset(redis_key, mapping=doc_data)
+            doc_data = self._prepare_document(doc_id, embedding, metadata)
+            # 저장과 세대 증가(검색 결과 캐시 무효화)를 한 번에 전송
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.hset(self.doc_key(doc_id), mapping=doc_data)
+            pipe.incr(self.generation_key)
+            added_fields, _ = pipe.execute()
+            if added_fields:
+                self.state.record_add()
             
             return True
             
@@ -146,7 +500,11 @@ class VectorSearchIndex:
     def search_similar(self,
                       query_vector: List[float],
                       top_k: int = 5,
-                      score_threshold: float = 0.7) -> List[Dict[str, Any]]:
+                      score_threshold: float = 0.7,
+                      return_fields: Optional[Sequence[str]] = None,
+                      ef_runtime: Optional[int] = None,
+                      epsilon: Optional[float] = None,
+                      search_filter: Optional[SearchFilter] = None) -> List[SearchHit]:
         """
         유사한 벡터 검색 (HNSW 알고리즘 사용)
         
@@ -154,101 +512,143 @@ class VectorSearchIndex:
             query_vector: 검색할 벡터
             top_k: 반환할 최대 결과 수
             score_threshold: 유사도 임계값
+            return_fields: 돌려받을 Hash 필드 (FT.SEARCH RETURN, None이면 DEFAULT_RETURN_FIELDS)
+            ef_runtime: 이 쿼리의 EF_RUNTIME (None이면 인덱스 기본값)
+            epsilon: 이 쿼리의 EPSILON (None이면 인덱스 기본값, 지정 시 VECTOR_RANGE 쿼리)
+            search_filter: 사전 필터 (도메인/언어/문서 유형/최신성, KNN 쿼리 안에서 적용)
             
         Returns:
-            List[Dict]: 검색 결과 리스트
+            List[SearchHit]: 검색 결과 리스트
         """
-        # 검색 전 간단한 인덱스 상태 확인
-        if not self.debugger.check_index_exists(self.index_name):
+        # 검색 전 인덱스 상태 확인 (추적기가 오래된 경우에만 FT.INFO 호출)
+        if self.state.needs_refresh():
+            self._refresh_state()
+        if not self.state.exists:
             print(f"❌ 검색 실패: 인덱스 '{self.index_name}' 없음")
             return []
-        
-        doc_count = self.debugger.count_documents_in_index(self.index_name)
-        if doc_count == 0:
-            print(f"⚠️ 인덱스 '{self.index_name}' 비어있음")
+        if not self.state.is_searchable:
             return []
         
         try:
-            # 쿼리 벡터를 바이트 배열로 변환
-            query_bytes = np.array(query_vector, dtype=np.float32).tobytes()
-            
-            # 검색 쿼리 생성
-            base_query = f"*=>[KNN {top_k} @embedding_vector $vector AS score]"
-            query = Query(base_query)\
-                .sort_by("score")\
-                .paging(0, top_k)\
-                .dialect(2)
-            
-            # 검색 로그 생략 가능
-            
-            # 검색 실행
-            results = self.redis_client.ft(self.index_name).search(
-                query,
-                query_params={"vector": query_bytes}
+            # 결과 캐시 조회 (세대 카운터와 함께 MGET 1회)
+            cache_key = self._result_cache_key(query_vector, top_k, score_threshold, return_fields,
+                                               ef_runtime, epsilon, search_filter)
+            if cache_key is not None:
+                generation, cached = self.redis_client.mget(self.generation_key, cache_key)
+                hits = self._cached_hits(generation, cached)
+                if hits is not None:
+                    return hits
+
+            # 검색 실행 (FT.SEARCH 1회)
+            response = self.redis_client.execute_command(
+                "FT.SEARCH", *self._build_search_args(query_vector, top_k, return_fields, score_threshold,
+                                                     ef_runtime, epsilon, search_filter)
             )
             
-            # 결과 포맷팅
-            formatted_results = []
-            for doc in results.docs:
-                # 코사인 유사도 점수 (1 - distance)
-                similarity_score = 1 - float(doc.score)
-                
-                # 임계값 체크
-                if similarity_score >= score_threshold:
-                    # Redis에 저장된 원본 메타데이터를 그대로 가져오거나
-                    # 필요한 모든 필드를 명시적으로 포함시켜야 합니다.
-                    # 현재 코드는 doc.question, doc.source_url 등 일부만 가져오고 있을 수 있습니다.
-                    
-                    # 예시: 저장 시 사용한 모든 메타데이터 필드를 가져오도록 수정
-                    # Redisearch 결과 객체 (doc)에서 모든 필드를 바로 딕셔너리로 변환하거나,
-                    # add_document 시 저장한 필드 이름들을 정확히 명시해서 가져와야 합니다.
-                    
-                    # 현재 코드에서 메타데이터를 구성하는 방식 (수정 필요)
-                    metadata_from_doc = {
-                        "question": getattr(doc, 'question', None),
-                        "source_url": getattr(doc, 'source_url', None),
-                        "text": getattr(doc, 'text', None),
-                        "timestamp": float(getattr(doc, 'timestamp', 0)) if hasattr(doc, 'timestamp') else None,
-                        "id": getattr(doc, 'id', None),
-                        "custom_key": getattr(doc, 'custom_key', None),
-                        "answer": getattr(doc, 'answer', None),
-                        "type": getattr(doc, 'type', None)
-                    }
-
-                    result_item = {
-                        "key": getattr(doc, 'id', None),
-                        "similarity": similarity_score,
-                        "metadata": metadata_from_doc,
-                        "redis_key": getattr(doc, 'id', None),
-                        "question": getattr(doc, 'question', None),
-                        "answer": getattr(doc, 'answer', None)
-                    }
-                    
-                    formatted_results.append(result_item)
-                    
-            return formatted_results
+            hits = self._parse_search_response(response, score_threshold)
+            if cache_key is not None:
+                self.redis_client.set(cache_key, self.result_cache.encode(generation, hits),
+                                      px=int(self.result_cache.ttl_seconds * 1000))
+            return hits
             
+        except redis.exceptions.ResponseError as e:
+            # 인덱스가 삭제된 경우 상태를 다시 확인
+            if "no such index" in str(e).lower():
+                print(f"❌ 검색 실패: 인덱스 '{self.index_name}' 없음")
+                self._refresh_state()
+                return []
+            print(f"벡터 검색 오류: {e}")
+            return []
         except Exception as e:
             print(f"벡터 검색 오류: {e}")
             import traceback
             traceback.print_exc()
             return []
             
-    def update_ef_runtime(self, ef_runtime: int = 10):
+    def add_documents(self,
+                      documents: Iterable[Tuple[str, List[float], Dict[str, Any]]],
+                      chunk_size: int = BULK_CHUNK_SIZE,
+                      max_in_flight: int = BULK_MAX_IN_FLIGHT) -> Dict[str, Any]:
+        """
+        여러 문서를 비트랜잭션 파이프라인으로 대량 저장
+
+        입력을 chunk_size 단위로 읽어 청크마다 파이프라인 하나로 HSET을 보내며,
+        최대 max_in_flight개의 파이프라인을 동시에 실행한다 (가득 차면 가장 오래된 것을 기다림).
+        실패한 문서는 결과에 기록하고 나머지는 계속 저장한다.
+
+        Args:
+            documents: (문서 ID, 임베딩 벡터, 메타데이터) 이터러블 (지연 생성 가능)
+            chunk_size: 파이프라인 하나에 담을 문서 수
+            max_in_flight: 동시에 실행할 최대 파이프라인 수
+
+        Returns:
+            Dict: total/succeeded/failed(문서 ID, 오류)/chunks/elapsed
         """
-        런타임 검색 성능 파라미터 조정
+        report = new_bulk_report()
+        started = time.perf_counter()
+        in_flight = deque()
+
+        def collect(future, doc_ids):
+            try:
+                results = future.result()
+            except Exception as e:
+                # 파이프라인 전체 실패 (연결 오류 등)
+                report["failed"].extend({"key": doc_id, "error": str(e)} for doc_id in doc_ids)
+                return
+            for doc_id, result in zip(doc_ids, results):
+                if isinstance(result, Exception):
+                    report["failed"].append({"key": doc_id, "error": str(result)})
+                else:
+                    report["succeeded"] += 1
+                    if result:
+                        self.state.record_add()
+
+        with ThreadPoolExecutor(max_workers=max(1, max_in_flight)) as executor:
+            for chunk in iter_chunks(documents, chunk_size):
+                doc_ids = []
+                pipe = self.redis_client.pipeline(transaction=False)
+                for doc_id, embedding, metadata in chunk:
+                    try:
+                        doc_data = self._prepare_document(doc_id, embedding, metadata)
+                    except Exception as e:
+                        report["failed"].append({"key": doc_id, "error": str(e)})
+                        continue
+                    pipe.hset(self.doc_key(doc_id), mapping=doc_data)
+                    doc_ids.append(doc_id)
+                report["total"] += len(chunk)
+                report["chunks"] += 1
+                if not doc_ids:
+                    continue
+
+                # 백프레셔: 실행 중인 파이프라인이 가득 차면 가장 오래된 것 완료 대기
+                if len(in_flight) >= max(1, max_in_flight):
+                    collect(*in_flight.popleft())
+                in_flight.append((executor.submit(pipe.execute, raise_on_error=False), doc_ids))
+
+            while in_flight:
+                collect(*in_flight.popleft())
+
+        # 모든 청크 저장 후 세대를 한 번만 올려 검색 결과 캐시 무효화
+        if report["succeeded"]:
+            self.redis_client.incr(self.generation_key)
+        report["elapsed"] = time.perf_counter() - started
+        print(f"📦 대량 저장 완료 ({self.index_name}): 성공 {report['succeeded']}개 / "
+              f"실패 {len(report['failed'])}개 / 청크 {report['chunks']}개 ({report['elapsed']:.2f}초)")
+        return report
+
+    def update_ef_runtime(self, ef_runtime: Optional[int] = 10):
+        """
+        이 인덱스 검색의 기본 EF_RUNTIME 변경
+
+        FT.CONFIG SET은 서버의 모든 인덱스에 적용되는 전역 설정이므로 사용하지 않고,
+        이후 search_similar 쿼리의 KNN 속성(EF_RUNTIME)으로 전달한다. 쿼리마다 다르게 하려면
+        search_similar(ef_runtime=...)를 사용한다.
         
         Args:
-            ef_runtime: 검색 시 탐색할 이웃 수 (높을수록 정확하지만 느림)
+            ef_runtime: 검색 시 탐색할 이웃 수 (높을수록 정확하지만 느림, None이면 서버 기본값)
         """
-        try:
-            # HNSW 런타임 파라미터 업데이트
-            self.redis_client.ft(self.index_name).config_set(
-                "HNSW_EF_RUNTIME", ef_runtime
-            )
-            print(f"EF_RUNTIME을 {ef_runtime}으로 설정했습니다.")
-        except Exception as e:
-            print(f"EF_RUNTIME 설정 오류: {e}")
+        self.ef_runtime = ef_runtime
+        print(f"EF_RUNTIME을 {ef_runtime}으로 설정했습니다. ({self.index_name} 쿼리 기본값)")
             
     def get_index_info(self) -> Dict[str, Any]:
         """인덱스 정보 조회"""
@@ -262,8 +662,187 @@ class VectorSearchIndex:
     def delete_document(self, doc_id: str) -> bool:
         """문서 삭제"""
         try:
-            redis_key = f"doc:{self.index_name}:{doc_id}"
-            result = self.redis_client.delete(redis_key)
+            key = self.doc_key(doc_id)
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.delete(key)
+            pipe.incr(self.generation_key)
+            pipe.exists(rebuild_lock_key(self.index_name))
+            result, _, rebuilding = pipe.execute()
+            if result > 0:
+                self.state.record_delete()
+                # 재구축 중이면 이미 복사된 새 버전 문서도 지워지도록 기록
+                if rebuilding:
+                    self.redis_client.sadd(rebuild_deletes_key(self.index_name), key)
+            return result > 0
+        except Exception as e:
+            print(f"문서 삭제 오류: {e}")
+            return False
+
+    def has_documents(self, doc_ids: Sequence[str]) -> List[bool]:
+        """문서 ID별 저장 여부 (파이프라인 EXISTS 1회 왕복)"""
+        if not doc_ids:
+            return []
+        pipe = self.redis_client.pipeline(transaction=False)
+        for doc_id in doc_ids:
+            pipe.exists(self.doc_key(doc_id))
+        return [bool(result) for result in pipe.execute()]
+
+
+
+class AsyncVectorSearchIndex(_VectorIndexBase):
+    """
+    redis.asyncio 클라이언트 기반 Vector Search 인덱스 (이벤트 루프를 막지 않는 비동기 버전)
+
+    스키마/쿼리/결과 변환은 VectorSearchIndex와 공유하며,
+    생성자에서는 I/O를 하지 않고 ensure_index_exists()에서 인덱스를 확인/생성한다.
+    """
+
+    def __init__(self,
+                 redis_client: redis.asyncio.Redis,
+                 index_name: str = "climate_vectors",
+                 vector_dimension: int = 1536,
+                 distance_metric: str = "COSINE",
+                 state_refresh_interval: Optional[float] = INDEX_STATE_REFRESH_INTERVAL,
+                 vector_type: str = "FLOAT32",
+                 hnsw_m: int = HNSW_M,
+                 hnsw_ef_construction: int = HNSW_EF_CONSTRUCTION,
+                 hnsw_initial_cap: int = HNSW_INITIAL_CAP,
+                 ef_runtime: Optional[int] = None,
+                 epsilon: Optional[float] = None,
+                 result_cache_ttl: Optional[float] = None):
+        """
+        Args:
+            redis_client: redis.asyncio 클라이언트 인스턴스
+            index_name: 인덱스 이름
+            vector_dimension: 벡터 차원 (OpenAI text-embedding-3-small은 1536)
+            distance_metric: 거리 측정 방식 (COSINE, L2, IP)
+            state_refresh_interval: 인덱스 상태 재확인 주기 (초)
+            vector_type: 벡터 저장 타입 (FLOAT32, FLOAT16, BFLOAT16)
+            hnsw_m: HNSW 노드당 최대 연결 수 (인덱스 생성 시에만 적용)
+            hnsw_ef_construction: HNSW 구축 시 탐색 범위 (인덱스 생성 시에만 적용)
+            hnsw_initial_cap: 초기 벡터 용량 (인덱스 생성 시에만 적용)
+            ef_runtime: 검색 기본 EF_RUNTIME (None이면 서버 기본값, 쿼리별로 덮어쓸 수 있음)
+            epsilon: 검색 기본 EPSILON (None이면 KNN 쿼리, 지정하면 VECTOR_RANGE 쿼리)
+            result_cache_ttl: 검색 결과 캐시 유효 시간 (초, None이면 캐시 사용 안 함)
+        """
+        self._init_common(redis_client, index_name, vector_dimension, distance_metric, state_refresh_interval,
+                          vector_type, hnsw_m, hnsw_ef_construction, hnsw_initial_cap, ef_runtime, epsilon,
+                          result_cache_ttl)
+
+    async def _refresh_state(self):
+        """FT.INFO 한 번으로 인덱스 상태를 다시 확인하여 추적기에 반영"""
+        try:
+            info = await self.redis_client.ft(self.index_name).info()
+            self._apply_index_info(info)
+        except redis.exceptions.ResponseError as e:
+            if "no such index" in str(e).lower():
+                self.state.update(False, 0)
+            else:
+                print(f"인덱스 상태 확인 오류: {e}")
+                self.state.invalidate()
+        except Exception as e:
+            print(f"인덱스 상태 확인 오류: {e}")
+            self.state.invalidate()
+
+    async def ensure_index_exists(self):
+        """인덱스가 존재하는지 확인하고, 없으면 생성"""
+        await self._refresh_state()
+        if self.state.exists:
+            return
+        try:
+            await self.redis_client.ft(self.index_name).create_index(
+                fields=self._build_schema(),
+                definition=self._build_definition()
+            )
+            print(f"인덱스 '{self.index_name}' 생성 완료")
+        except redis.exceptions.ResponseError as e:
+            # 다른 워커가 먼저 생성한 경우
+            if "index already exists" not in str(e).lower():
+                print(f"인덱스 생성 오류: {e}")
+                raise
+        await self._refresh_state()
+
+    async def add_document(self,
+                           doc_id: str,
+                           embedding: List[float],
+                           metadata: Dict[str, Any]) -> bool:
+        """문서와 임베딩 벡터를 인덱스에 추가 (VectorSearchIndex.add_document의 비동기 버전)"""
+        try:
+            doc_data = self._prepare_document(doc_id, embedding, metadata)
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.hset(self.doc_key(doc_id), mapping=doc_data)
+            pipe.incr(self.generation_key)
+            added_fields, _ = await pipe.execute()
+            if added_fields:
+                self.state.record_add()
+            return True
+        except Exception as e:
+            print(f"문서 추가 오류: {e}")
+            return False
+
+    async def search_similar(self,
+                             query_vector: List[float],
+                             top_k: int = 5,
+                             score_threshold: float = 0.7,
+                             return_fields: Optional[Sequence[str]] = None,
+                             ef_runtime: Optional[int] = None,
+                             epsilon: Optional[float] = None,
+                             search_filter: Optional[SearchFilter] = None) -> List[SearchHit]:
+        """유사한 벡터 검색 (VectorSearchIndex.search_similar의 비동기 버전)"""
+        if self.state.needs_refresh():
+            await self._refresh_state()
+        if not self.state.exists:
+            print(f"❌ 검색 실패: 인덱스 '{self.index_name}' 없음")
+            return []
+        if not self.state.is_searchable:
+            return []
+
+        try:
+            cache_key = self._result_cache_key(query_vector, top_k, score_threshold, return_fields,
+                                               ef_runtime, epsilon, search_filter)
+            if cache_key is not None:
+                generation, cached = await self.redis_client.mget(self.generation_key, cache_key)
+                hits = self._cached_hits(generation, cached)
+                if hits is not None:
+                    return hits
+
+            response = await self.redis_client.execute_command(
+                "FT.SEARCH", *self._build_search_args(query_vector, top_k, return_fields, score_threshold,
+                                                     ef_runtime, epsilon, search_filter)
+            )
+            hits = self._parse_search_response(response, score_threshold)
+            if cache_key is not None:
+                await self.redis_client.set(cache_key, self.result_cache.encode(generation, hits),
+                                            px=int(self.result_cache.ttl_seconds * 1000))
+            return hits
+
+        except redis.exceptions.ResponseError as e:
+            if "no such index" in str(e).lower():
+                print(f"❌ 검색 실패: 인덱스 '{self.index_name}' 없음")
+                await self._refresh_state()
+                return []
+            print(f"벡터 검색 오류: {e}")
+            return []
+        except Exception as e:
+            print(f"벡터 검색 오류: {e}")
+            import traceback
+            traceback.print_exc()
+            return []
+
+    async def delete_document(self, doc_id: str) -> bool:
+        """문서 삭제"""
+        try:
+            key = self.doc_key(doc_id)
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.delete(key)
+            pipe.incr(self.generation_key)
+            pipe.exists(rebuild_lock_key(self.index_name))
+            result, _, rebuilding = await pipe.execute()
+            if result > 0:
+                self.state.record_delete()
+                # 재구축 중이면 이미 복사된 새 버전 문서도 지워지도록 기록
+                if rebuilding:
+                    await self.redis_client.sadd(rebuild_deletes_key(self.index_name), key)
             return result > 0
         except Exception as e:
             print(f"문서 삭제 오류: {e}")
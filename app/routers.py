@@ -1,16 +1,113 @@
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import JSONResponse
 import traceback
-
-# asyncio 임포트 추가
 import asyncio
+import secrets
+
+from app.config import settings
 
 router = APIRouter()
 
+def require_admin_token(req: Request):
+    """/admin/* 공통 인증 (X-Admin-Token 헤더가 admin_api_token과 일치해야 함)"""
+    if not settings.admin_api_token:
+        raise HTTPException(status_code=403, detail="admin_api_token이 설정되지 않아 관리자 API를 사용할 수 없습니다.")
+    if not secrets.compare_digest(req.headers.get("X-Admin-Token", ""), settings.admin_api_token):
+        raise HTTPException(status_code=401, detail="관리자 토큰이 유효하지 않습니다.")
+
+# /admin/* 라우트 공통 의존성
+admin_only = [Depends(require_admin_token)]
+
 @router.get("/health")
 def health_check():
     return {"status": "ok"}
 
+@router.get("/admin/redis/pools", dependencies=admin_only)
+def redis_pool_stats():
+    """Redis 커넥션 풀 사용 현황 (사용 중/최대 연결 수, 대기 시간, 고갈 횟수)"""
+    import main
+    if main.processor is None:
+        return JSONResponse(
+            status_code=500,
+            content={"error": "MainProcessor가 초기화되지 않았습니다."}
+        )
+    return main.processor.get_pool_stats()
+
+@router.get("/admin/redis/semantic-cache", dependencies=admin_only)
+async def semantic_cache_stats():
+    """시멘틱 캐시 현재 크기, 누적 축출 횟수(만료/최대 항목 수/메모리 예산), 마지막 정리 결과, 정확 일치/시멘틱 히트율"""
+    import main
+    if main.processor is None:
+        return JSONResponse(
+            status_code=500,
+            content={"error": "MainProcessor가 초기화되지 않았습니다."}
+        )
+    return await asyncio.to_thread(main.processor.get_semantic_cache_stats)
+
+@router.get("/admin/redis/diagnosis", dependencies=admin_only)
+async def redis_diagnosis():
+    """Redis 전체 진단을 요청 시 실행 (시작 단계별 소요 시간 포함)"""
+    import main
+    if main.processor is None:
+        return JSONResponse(
+            status_code=500,
+            content={"error": "MainProcessor가 초기화되지 않았습니다."}
+        )
+    # 동기 Redis 명령과 키 순회가 포함되므로 별도 스레드에서 실행
+    diagnosis = await asyncio.to_thread(main.processor.run_diagnosis)
+    return {
+        "startup_timings": main.processor.startup_timings,
+        "diagnosis": diagnosis
+    }
+
+@router.get("/admin/scrap/browser-pool", dependencies=admin_only)
+def browser_pool_stats():
+    """스크래핑 브라우저 풀 사용 현황 (컨텍스트 생성/재활용/폐기 횟수, 대기 시간)"""
+    from app.scrap_mcp.tool.browser_pool import get_browser_pool_stats
+    stats = get_browser_pool_stats()
+    return stats if stats is not None else {"running": False}
+
+@router.get("/admin/scrap/http-client", dependencies=admin_only)
+def http_client_stats():
+    """스크래핑 공유 HTTP 클라이언트 설정과 상태 (HTTP/2 사용 여부, 동시 요청 한도)"""
+    from app.scrap_mcp.tool.http_client import get_http_client_stats
+    return get_http_client_stats()
+
+@router.get("/admin/scrap/extraction", dependencies=admin_only)
+def extraction_stats():
+    """스크랩 본문 추출 단계별(정적/Google/브라우저) 실행·성공 횟수"""
+    from app.scrap_mcp.main import get_extraction_stats
+    return get_extraction_stats()
+
+@router.post("/admin/redis/indexes/{index_name}/rebuild", dependencies=admin_only)
+async def rebuild_index(index_name: str, req: Request):
+    """인덱스를 현재 설정으로 새 버전에 재구축하고 별칭 전환 (백그라운드, 검색 중단 없음)"""
+    import main
+    if main.processor is None:
+        return JSONResponse(
+            status_code=500,
+            content={"error": "MainProcessor가 초기화되지 않았습니다."}
+        )
+    body = await req.json() if await req.body() else {}
+    options = {name: body[name] for name in ("max_docs_per_second", "grace_seconds", "keep_old") if name in body}
+    try:
+        return await asyncio.to_thread(main.processor.start_index_rebuild, index_name, **options)
+    except ValueError as e:
+        return JSONResponse(status_code=400, content={"error": str(e)})
+    except RuntimeError as e:
+        return JSONResponse(status_code=409, content={"error": str(e)})
+
+@router.get("/admin/redis/indexes/rebuild", dependencies=admin_only)
+def index_rebuild_status():
+    """마지막 인덱스 재구축 진행 상황"""
+    import main
+    if main.processor is None:
+        return JSONResponse(
+            status_code=500,
+            content={"error": "MainProcessor가 초기화되지 않았습니다."}
+        )
+    return main.processor.get_index_rebuild_status()
+
 @router.post("/im-fact/ask")
 async def ask_factcheck(req: Request):
     try:
@@ -31,8 +128,8 @@ async def ask_factcheck(req: Request):
                 content={"error": "MainProcessor가 초기화되지 않았습니다."}
             )
 
-        # 비동기 처리를 위해 별도 스레드에서 실행
-        result = await asyncio.to_thread(main.processor.process, quest)
+        # redis.asyncio 기반 파이프라인을 이벤트 루프에서 직접 실행
+        result = await main.processor.aprocess(quest)
         
         if result["success"]:
             ans = result["final_answer"]
@@ -1,15 +1,11 @@
-import requests
-from typing import List, Dict
+from typing import List, Dict, Optional
 import os
 
-def brave_search_impl(query: str, api_key: str, count: int=3) -> List[Dict[str, str]]:
-    url="https://api.search.brave.com/res/v1/web/search"
-    headers={
-        "Accept": "application/json",
-        "X-Subscription-Token": api_key
-    }
-    
-    allowed_sites=["ipcc.ch",
+from app.scrap_mcp.tool.http_client import fetch
+
+
+# 검색 대상으로 허용하는 신뢰 출처 (document_index 검색의 도메인 필터에도 사용)
+ALLOWED_SITES = ["ipcc.ch",
     "nasa.gov",
     "kma.go.kr",
     "me.go.kr",
@@ -24,14 +20,27 @@ def brave_search_impl(query: str, api_key: str, count: int=3) -> List[Dict[str,
     "yna.co.kr",
     "mbc.co.kr"]
 
-    # "nature.com",
-    # "sciencemag.org",
-    # "kbs.co.kr",
-    # "mbc.co.kr",
-    # "sbs.co.kr",
-    # "yna.co.kr",
-    # "ytn.co.kr"
+# "nature.com",
+# "sciencemag.org",
+# "kbs.co.kr",
+# "mbc.co.kr",
+# "sbs.co.kr",
+# "yna.co.kr",
+# "ytn.co.kr"
+
+
+BRAVE_SEARCH_HOST = "api.search.brave.com"
+BRAVE_SEARCH_URL = f"https://{BRAVE_SEARCH_HOST}/res/v1/web/search"
+
 
+def _build_request(query: str, api_key: str, count: int, allowed_sites: Optional[List[str]]):
+    headers={
+        "Accept": "application/json",
+        "X-Subscription-Token": api_key
+    }
+
+    if allowed_sites is None:
+        allowed_sites = ALLOWED_SITES
 
     if allowed_sites:
         site_filter = " OR ".join([f"site:{site}" for site in allowed_sites])
@@ -41,9 +50,11 @@ def brave_search_impl(query: str, api_key: str, count: int=3) -> List[Dict[str,
         "q": query,
         "count": count
     }
+    return headers, params
 
-    response = requests.get(url, headers=headers, params=params)
-    results = response.json().get("web", {}).get("results", [])
+
+def _parse_results(data: dict) -> List[Dict[str, str]]:
+    results = data.get("web", {}).get("results", [])
     return [
         {
             "title":res.get("title",""),
@@ -51,4 +62,19 @@ def brave_search_impl(query: str, api_key: str, count: int=3) -> List[Dict[str,
             "url": res.get("url", "")
         }
         for res in results
-    ]
\ No newline at end of file
+    ]
+
+
+async def brave_search_impl(query: str, api_key: str, count: int=3,
+                            allowed_sites: Optional[List[str]] = None,
+                            timeout: Optional[float] = None) -> List[Dict[str, str]]:
+    """
+    Brave 웹 검색 (공유 HTTP 클라이언트 사용, 여러 쿼리를 동시에 보낼 수 있음)
+
+    동시 요청 수는 http_client의 api.search.brave.com 호스트 한도를 따른다.
+    429/5xx 등 오류 응답은 httpx.HTTPStatusError로 올려 호출자가 건너뛰도록 한다.
+    """
+    headers, params = _build_request(query, api_key, count, allowed_sites)
+    response = await fetch("GET", BRAVE_SEARCH_URL, timeout=timeout, headers=headers, params=params)
+    response.raise_for_status()
+    return _parse_results(response.json())
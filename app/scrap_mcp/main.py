@@ -1,41 +1,127 @@
 from mcp.server.fastmcp import FastMCP
-from typing import Union
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Union
 import json
 import asyncio
 import sys
 import io
 import re
 
-from app.scrap_mcp.tool.text import use_tra
+from app.scrap_mcp.tool.text import extract_static
 from app.scrap_mcp.tool.bing import use_bing_n_page
 from app.scrap_mcp.tool.goo_api import use_google
+from app.scrap_mcp.tool.browser_pool import close_browser_pool, get_browser_pool
+from app.scrap_mcp.tool.page_fetch import PageFetcher
+from app.scrap_mcp.tool.http_client import close_http_client
 
 # FastAPI 환경에서는 stdout/stderr 설정 제거
 # sys.stdout = io.TextIOWrapper(sys.stdout.detach(), encoding='utf-8')
 # sys.stderr = io.TextIOWrapper(sys.stderr.detach(), encoding='utf-8')
 
-mcp = FastMCP("Scraper")
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """MCP 서버로 단독 실행될 때 브라우저 풀과 HTTP 클라이언트를 서버 수명 동안 유지 (FastAPI 앱에서는 앱 lifespan이 관리)"""
+    await get_browser_pool().start()
+    try:
+        yield
+    finally:
+        await close_browser_pool()
+        await close_http_client()
+
+mcp = FastMCP("Scraper", lifespan=lifespan)
+
+# 추출 단계 (비용이 낮은 순서): 정적 HTML → Google 검색 스니펫 → 브라우저 렌더링
+EXTRACTION_TIERS = ("static", "google", "browser")
+
+# 단계별 실행/성공 횟수와 호출 방식별 횟수 (프로세스 단위)
+_tier_counters = {tier: {"used": 0, "succeeded": 0} for tier in EXTRACTION_TIERS}
+_mode_counters = {"tiered": 0, "all_sources": 0, "failed": 0}
+
+_SKIPPED = "Skipped : earlier tier succeeded"
+
 
 @mcp.tool()
-async def scrape_web(url: str, keyword: Union[str, list[str]] = "default") -> str:
+async def scrape_web(url: str, keyword: Union[str, list[str]] = "default", all_sources: bool = False) -> str:
     """
     Scrape a website of given URL and extract context of given keyword and return all text in JSON style.
     URL of contents is in "url" field.
     Google search results on URL are in "google" field.
     General HTTP Request result is in "normal" field.
-    Using web browser to get the content of the page is in "page" field. 
+    Using web browser to get the content of the page is in "page" field.
     In page field, title and description field is on Bing search result.
     Content field is extracted text from the page.
+    By default sources are tried in order (normal, google, page) and later ones are "Skipped" once one succeeds.
+    Set all_sources to true to always run all three.
+    """
+    return await scrape_page(url, keyword, all_sources=all_sources)
+
+
+def _static_ok(normal) -> bool:
+    return isinstance(normal, str) and bool(normal.strip()) and normal != "Fail"
+
+
+def _google_ok(google) -> bool:
+    return isinstance(google, dict) and bool(str(google.get("description") or "").strip())
+
+
+def _browser_ok(page) -> bool:
+    return isinstance(page, dict) and bool(str(page.get("content") or page.get("descrption") or "").strip())
+
+
+def _record_tier(tier: str, succeeded: bool):
+    _tier_counters[tier]["used"] += 1
+    if succeeded:
+        _tier_counters[tier]["succeeded"] += 1
+
+
+def get_extraction_stats() -> dict:
+    """추출 단계별 실행/성공 횟수와 모드별 호출 수 (프로세스 단위)"""
+    return {"tiers": {tier: dict(counts) for tier, counts in _tier_counters.items()}, "modes": dict(_mode_counters)}
+
+
+async def scrape_page(url: str, keyword: Union[str, list[str]] = "default",
+                      fetcher: PageFetcher | None = None, all_sources: bool = False) -> str:
+    """
+    scrape_web 본체 (search_scrap은 URL 확인 때 받은 응답을 fetcher로 넘겨 다시 다운로드하지 않음)
+
+    기본(단계별) 모드는 정적 HTML 추출이 실패한 경우에만 Google 스니펫을, 그것도 없으면 브라우저 렌더링을 사용한다.
+    all_sources=True이면 이전처럼 세 가지를 모두 동시에 실행한다.
     """
+    if fetcher is None:
+        fetcher = PageFetcher()
+
+    async def static_extract() -> str:
+        page = await fetcher.get(url)
+        if not page.ok:
+            return "Fail"
+        try:
+            return await asyncio.to_thread(extract_static, page.content)
+        except Exception:
+            return "Fail"
 
     result = {}
     result["url"] = url
-    tasks = [use_bing_n_page(url), use_google(url), asyncio.to_thread(use_tra, url)]
-    results = await asyncio.gather(*tasks)
-
-    result["page"] = results[0]
-    result["google"] = results[1]
-    result["normal"] = results[2]
+    if all_sources:
+        _mode_counters["all_sources"] += 1
+        result["normal"], result["google"], result["page"] = await asyncio.gather(
+            static_extract(), use_google(url), use_bing_n_page(url)
+        )
+        for tier, ok in zip(EXTRACTION_TIERS,
+                            (_static_ok(result["normal"]), _google_ok(result["google"]), _browser_ok(result["page"]))):
+            _record_tier(tier, ok)
+    else:
+        _mode_counters["tiered"] += 1
+        result["normal"] = await static_extract()
+        result["google"] = result["page"] = _SKIPPED
+        _record_tier("static", _static_ok(result["normal"]))
+        if not _static_ok(result["normal"]):
+            result["google"] = await use_google(url)
+            _record_tier("google", _google_ok(result["google"]))
+            if not _google_ok(result["google"]):
+                result["page"] = await use_bing_n_page(url)
+                _record_tier("browser", _browser_ok(result["page"]))
+                if not _browser_ok(result["page"]):
+                    _mode_counters["failed"] += 1
 
     
     response = json.dumps(result, ensure_ascii=False)
@@ -1,8 +1,8 @@
 import sys
 import os
-import requests
 import asyncio
 import json
+import time
 
 # FastAPI config 사용
 from app.config import settings
@@ -12,62 +12,152 @@ project_root = os.path.abspath(os.path.join(current_dir, ".."))
 sys.path.append(project_root)
 
 from app.scrap_mcp.brave_search_module.brave_search_impl import brave_search_impl
+from app.scrap_mcp.tool.page_fetch import PageFetcher
 from app.scrap_mcp.tool.rewrite_query import rewrite_query
-from app.scrap_mcp.main import scrape_web
+from app.scrap_mcp.main import scrape_page
 
 # FastAPI config에서 API 키 가져오기
 api_key = settings.brave_ai_api_key
 
-# URL 유효성 검사
-def is_url_alive(url: str) -> bool:
-    try:
-        if "jsessionid" in url.lower():
-            return False
-        headers = {"User-Agent": "Mozilla/5.0"}
-        res = requests.get(url, headers=headers, timeout=5)
-        if res.status_code != 200:
-            return False
-        error_keywords = ["존재하지 않는", "not found", "세션이 만료"]
-        return not any(keyword in res.text.lower() for keyword in error_keywords)
-    except requests.RequestException:
+# 요청별 타임아웃 (초)
+BRAVE_SEARCH_TIMEOUT = 10.0
+URL_ALIVE_TIMEOUT = 5.0
+
+# 스크랩 기본값: 모을 문서 수 / 동시에 스크랩할 URL 수
+DEFAULT_TARGET_DOCS = 3
+DEFAULT_SCRAPE_CONCURRENCY = 4
+
+# URL 유효성 검사 (fetcher로 받은 응답 본문은 이후 본문 추출에서 재사용)
+async def is_url_alive(url: str, fetcher: PageFetcher | None = None) -> bool:
+    if "jsessionid" in url.lower():
+        return False
+    if fetcher is None:
+        fetcher = PageFetcher(timeout=URL_ALIVE_TIMEOUT)
+    page = await fetcher.get(url)
+    if not page.ok:
         return False
+    error_keywords = ["존재하지 않는", "not found", "세션이 만료"]
+    return not any(keyword in page.text.lower() for keyword in error_keywords)
 
-# 검색 + 스크래핑 연동 함수
-async def search_scrap(query: str) -> list[dict]:
-    kor_queries, eng_queries = rewrite_query(query)
-    rewritten_query_list = kor_queries + eng_queries
-    print(f"\nrewritten_query_list: {rewritten_query_list}")
+async def _search_all(queries: list[str]) -> list[dict]:
+    """재작성 쿼리별 Brave 검색을 동시에 실행하고 URL 기준으로 중복 제거 (실패한 쿼리는 건너뜀)"""
+    responses = await asyncio.gather(
+        *(brave_search_impl(query=r_q, api_key=api_key, count=2, timeout=BRAVE_SEARCH_TIMEOUT) for r_q in queries),
+        return_exceptions=True
+    )
     results = []
-    for r_q in rewritten_query_list:
-        partial_results = brave_search_impl(query=r_q, api_key=api_key, count=2)
-        results.extend(partial_results)
+    seen = set()
+    for r_q, response in zip(queries, responses):
+        if isinstance(response, Exception):
+            print(f"Brave 검색 실패 ({r_q}): {response}")
+            continue
+        for res in response:
+            if res["url"] and res["url"] not in seen:
+                seen.add(res["url"])
+                results.append(res)
+    return results
 
-    valid_results = [res for res in results if is_url_alive(res["url"])]
+def _select_content(result: dict) -> str:
+    """
+    scrape_web 결과에서 본문 선택 (없으면 빈 문자열)
 
-    all_scrap_list = []
-    for item in valid_results:
-        try:
-            result_json = await scrape_web(item["url"], rewritten_query_list)
-            result = json.loads(result_json)
+    우선순위는 추출 단계 순서와 같음: normal(정적 HTML) → google 스니펫 → page(브라우저 렌더링) 본문 → page 설명
+    """
+    google = result.get("google")
+    google = google if isinstance(google, dict) else {}
+    page = result.get("page")
+    page = page if isinstance(page, dict) else {}
+    for content in (result.get("normal"), google.get("description"), page.get("content"), page.get("descrption")):
+        if isinstance(content, str) and content.strip() and content != "Fail":
+            return content.strip()
+    return ""
 
-            # 우선순위: normal → google → page.description
-            content = result.get("normal")
-            if not content or not isinstance(content, str) or len(content.strip()) == 0:
-                content = result.get("google")
-            if not content or not isinstance(content, str) or len(content.strip()) == 0:
-                content = result.get("page", {}).get("description", "")
+async def _scrape_one(url: str, keywords: list[str], fetcher: PageFetcher | None = None,
+                      all_sources: bool = False) -> dict | None:
+    """URL 하나를 스크랩해 문서로 변환 (본문이 없거나 실패하면 None)"""
+    try:
+        result = json.loads(await scrape_page(url, keywords, fetcher, all_sources=all_sources))
+        content = _select_content(result)
+        if content:
+            return {"url": url, "content": content, "fetched_at": time.time()}
+    except Exception as e:
+        print(f"{url} 스크랩 실패: {e}")
+    return None
 
-            if content and isinstance(content, str) and len(content.strip()) > 0:
-                all_scrap_list.append({
-                    "url": item["url"],
-                    "content": content.strip()
-                })
+async def scrape_until(urls: list[str], keywords: list[str],
+                       target_docs: int = DEFAULT_TARGET_DOCS,
+                       concurrency: int = DEFAULT_SCRAPE_CONCURRENCY,
+                       fetcher: PageFetcher | None = None,
+                       all_sources: bool = False) -> list[dict]:
+    """
+    URL들을 최대 concurrency개씩 동시에 스크랩하고, 문서가 target_docs개 모이면 남은 작업을 취소
 
+    결과는 URL 순서(검색 순위)대로 돌려준다. fetcher를 주면 이미 받은 페이지는 다시 다운로드하지 않는다.
+    all_sources=True이면 URL마다 정적 추출/Google/브라우저를 모두 실행한다 (기본은 단계별).
+    """
+    docs: dict[int, dict] = {}
+    pending: dict[asyncio.Task, int] = {}
+    queue = iter(enumerate(urls))
+    try:
+        while True:
+            # 목표 수에 도달하지 않았으면 동시 실행 한도까지 새 작업 예약
+            while len(pending) < max(1, concurrency) and len(docs) < target_docs:
+                next_item = next(queue, None)
+                if next_item is None:
+                    break
+                rank, url = next_item
+                pending[asyncio.create_task(_scrape_one(url, keywords, fetcher, all_sources))] = rank
+            if not pending or len(docs) >= target_docs:
+                break
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                rank = pending.pop(task)
+                doc = task.result()
+                if doc is not None:
+                    docs[rank] = doc
+    finally:
+        # 목표 도달/호출 취소 시 진행 중인 스크랩 취소
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            print(f"⏹️ 문서 {len(docs)}개 수집, 진행 중인 스크랩 {len(pending)}개 취소")
+    return [docs[rank] for rank in sorted(docs)][:target_docs]
+
+# 검색 + 스크래핑 연동 함수
+# (검색/URL 확인은 공유 HTTP 클라이언트로 동시에 실행, 전체 동시 요청 수는 http_client에서 제한)
+async def search_scrap(query: str,
+                       target_docs: int = DEFAULT_TARGET_DOCS,
+                       scrape_concurrency: int = DEFAULT_SCRAPE_CONCURRENCY,
+                       all_sources: bool = False) -> list[dict]:
+    """
+    질문을 재작성해 검색하고, 살아 있는 URL을 동시에 스크랩해 문서 target_docs개를 모음
 
-        except Exception as e:
-            print(f"{item['url']} 스크랩 실패: {e}")
+    Args:
+        query: 사용자 질문
+        target_docs: 모을 문서 수 (모이면 남은 스크랩 취소)
+        scrape_concurrency: 동시에 스크랩할 URL 수
+        all_sources: URL마다 모든 추출 방식을 실행 (기본은 정적 추출 실패 시에만 Google/브라우저 사용)
+    """
+    kor_queries, eng_queries = await asyncio.to_thread(rewrite_query, query)
+    rewritten_query_list = kor_queries + eng_queries
+    print(f"\nrewritten_query_list: {rewritten_query_list}")
+    results = await _search_all(rewritten_query_list)
+
+    # URL마다 한 번만 다운로드하여 확인과 본문 추출에 같은 응답 사용
+    fetcher = PageFetcher(timeout=URL_ALIVE_TIMEOUT)
+    try:
+        alive = await asyncio.gather(*(is_url_alive(res["url"], fetcher) for res in results), return_exceptions=True)
+        valid_results = [res for res, ok in zip(results, alive) if ok is True]
 
-    docs = all_scrap_list[:3]
+        docs = await scrape_until([item["url"] for item in valid_results], rewritten_query_list,
+                                  target_docs=target_docs, concurrency=scrape_concurrency, fetcher=fetcher,
+                                  all_sources=all_sources)
+    finally:
+        # 취소된 스크랩이 남긴 다운로드가 HTTP 슬롯을 계속 차지하지 않도록 정리
+        await fetcher.aclose()
     for doc in docs:
+        # 답변 생성에는 앞부분만 사용, 원문 전체는 document_index 적재용으로 보관
+        doc["full_content"] = doc["content"]
         doc["content"] = doc["content"][:5000]
     return docs
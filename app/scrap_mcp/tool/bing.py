@@ -1,18 +1,19 @@
-from playwright.async_api import async_playwright
 from bs4 import BeautifulSoup
 from trafilatura import extract
 import asyncio
 import lxml
 import time
 
+from app.scrap_mcp.tool.browser_pool import get_browser_pool, close_browser_pool
+
 async def use_bing_n_page(url: str):
     result = {}
-    async with async_playwright() as playwright:
-        browser = await playwright.chromium.launch(headless=True)
-        try:
-            page = await browser.new_page()
+    # 공유 브라우저 풀의 컨텍스트 사용 (URL마다 브라우저를 새로 띄우지 않음, 오류 시 컨텍스트는 풀에서 폐기)
+    try:
+        async with get_browser_pool().context() as context:
+            page = await context.new_page()
             
-            page2 = await browser.new_page()
+            page2 = await context.new_page()
             await page2.goto(url)
 
             await page.goto("https://www.bing.com")
@@ -55,13 +56,16 @@ async def use_bing_n_page(url: str):
             content = await page2.content()
             result["content"] = extract(content)
                 
-        except Exception as e:
-            result = "해당 링크가 파일 다운로드이거나, 런타임에 오류가 발생했습니다."
-            result += f"Error: {e}"
-        finally: 
-            await browser.close()
+    except Exception as e:
+        result = "해당 링크가 파일 다운로드이거나, 런타임에 오류가 발생했습니다."
+        result += f"Error: {e}"
     return result
 
 
 if __name__ == "__main__":
-    print(asyncio.run(use_bing_n_page("https://news.kbs.co.kr/news/pc/view/view.do?ncd=5528082")))
\ No newline at end of file
+    async def _main():
+        try:
+            print(await use_bing_n_page("https://news.kbs.co.kr/news/pc/view/view.do?ncd=5528082"))
+        finally:
+            await close_browser_pool()
+    asyncio.run(_main())
\ No newline at end of file
@@ -0,0 +1,206 @@
+# browser_pool.py
+"""
+스크래핑용 장기 실행 Playwright 브라우저 풀
+
+URL마다 async_playwright()를 시작하고 Chromium을 새로 띄우면 매번 수백 ms의 콜드 스타트와 큰 RSS가 든다.
+프로세스(FastAPI 앱 / FastMCP 서버)당 브라우저 하나를 띄워 두고, 브라우저 컨텍스트를 재사용한다.
+- 동시 사용 컨텍스트 수를 세마포어로 제한 (대기 시간 통계 기록)
+- 컨텍스트는 max_uses회 사용하면 닫고 새로 만듦 (쿠키/캐시/메모리 누적 방지)
+- 사용 중 예외가 나거나 페이지가 크래시하면 그 컨텍스트는 버림, 브라우저 연결이 끊기면 다시 띄움
+
+사용 예:
+    async with get_browser_pool().context() as context:
+        page = await context.new_page()
+        await page.goto(url)
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+
+
+# 동시에 사용할 수 있는 최대 컨텍스트 수
+DEFAULT_BROWSER_MAX_CONCURRENCY = 4
+# 컨텍스트 하나를 재사용하는 최대 횟수
+DEFAULT_CONTEXT_MAX_USES = 20
+
+
+class _ContextSlot:
+    """풀이 관리하는 브라우저 컨텍스트와 사용 횟수/크래시 여부"""
+
+    __slots__ = ("context", "uses", "broken")
+
+    def __init__(self, context: BrowserContext):
+        self.context = context
+        self.uses = 0
+        self.broken = False
+        # 이 컨텍스트에서 연 페이지가 크래시하면 반납 시 폐기
+        context.on("page", lambda page: page.on("crash", lambda _: self._mark_broken()))
+
+    def _mark_broken(self):
+        self.broken = True
+
+
+class BrowserPool:
+    """헤드리스 Chromium 하나와 재사용 컨텍스트 풀 (이벤트 루프 하나에서 사용)"""
+
+    def __init__(self,
+                 max_concurrency: int = DEFAULT_BROWSER_MAX_CONCURRENCY,
+                 max_uses: int = DEFAULT_CONTEXT_MAX_USES,
+                 headless: bool = True):
+        """
+        Args:
+            max_concurrency: 동시에 사용할 수 있는 최대 컨텍스트 수
+            max_uses: 컨텍스트 재사용 최대 횟수 (넘으면 닫고 새로 만듦)
+            headless: 헤드리스 모드 여부
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_uses = max(1, max_uses)
+        self.headless = headless
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._idle: List[_ContextSlot] = []
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._launch_lock = asyncio.Lock()
+        self._in_use = 0
+        self._counters = {"acquisitions": 0, "browser_launches": 0, "contexts_created": 0,
+                          "contexts_recycled": 0, "contexts_discarded": 0}
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    async def start(self):
+        """브라우저 실행 (이미 실행 중이면 그대로, 연결이 끊겼으면 다시 실행)"""
+        async with self._launch_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            started = time.perf_counter()
+            self._browser = await self._playwright.chromium.launch(headless=self.headless)
+            # 이전 브라우저의 컨텍스트는 더 이상 쓸 수 없음
+            self._idle.clear()
+            self._counters["browser_launches"] += 1
+            print(f"🌐 브라우저 풀 시작 (Chromium {(time.perf_counter() - started) * 1000:.0f}ms, "
+                  f"동시 {self.max_concurrency}개, 컨텍스트당 {self.max_uses}회 재사용)")
+
+    async def close(self):
+        """컨텍스트/브라우저/Playwright 종료"""
+        async with self._launch_lock:
+            idle, self._idle = self._idle, []
+            for slot in idle:
+                await _close_quietly(slot.context)
+            if self._browser is not None:
+                await _close_quietly(self._browser)
+                self._browser = None
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+    @asynccontextmanager
+    async def context(self) -> AsyncIterator[BrowserContext]:
+        """
+        컨텍스트 하나를 빌려 사용 (블록을 나오면 열린 페이지를 닫고 반납)
+
+        블록 안에서 예외가 나거나 페이지가 크래시한 컨텍스트는 반납하지 않고 닫는다.
+        """
+        wait_started = time.perf_counter()
+        async with self._semaphore:
+            self._record_wait(time.perf_counter() - wait_started)
+            slot = await self._checkout()
+            self._in_use += 1
+            failed = False
+            try:
+                yield slot.context
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                self._in_use -= 1
+                await self._checkin(slot, failed)
+
+    async def _checkout(self) -> _ContextSlot:
+        if self._browser is None or not self._browser.is_connected():
+            await self.start()
+        if self._idle:
+            return self._idle.pop()
+        slot = _ContextSlot(await self._browser.new_context())
+        self._counters["contexts_created"] += 1
+        return slot
+
+    async def _checkin(self, slot: _ContextSlot, failed: bool):
+        slot.uses += 1
+        if failed or slot.broken or not self._browser or not self._browser.is_connected():
+            self._counters["contexts_discarded"] += 1
+            await _close_quietly(slot.context)
+            return
+        if slot.uses >= self.max_uses:
+            self._counters["contexts_recycled"] += 1
+            await _close_quietly(slot.context)
+            return
+        for page in list(slot.context.pages):
+            await _close_quietly(page)
+        self._idle.append(slot)
+
+    def _record_wait(self, waited: float):
+        self._counters["acquisitions"] += 1
+        self._wait_total += waited
+        self._wait_max = max(self._wait_max, waited)
+
+    def stats(self) -> Dict[str, Any]:
+        """컨텍스트 사용/재활용 횟수와 세마포어 대기 시간 (프로세스 단위)"""
+        acquisitions = self._counters["acquisitions"]
+        return {
+            **self._counters,
+            "running": self._browser is not None and self._browser.is_connected(),
+            "in_use": self._in_use,
+            "idle": len(self._idle),
+            "max_concurrency": self.max_concurrency,
+            "max_uses": self.max_uses,
+            "wait_avg_ms": self._wait_total / acquisitions * 1000 if acquisitions else 0.0,
+            "wait_max_ms": self._wait_max * 1000,
+        }
+
+
+async def _close_quietly(target):
+    try:
+        await target.close()
+    except Exception:
+        pass
+
+
+# 프로세스 공유 브라우저 풀 (configure_browser_pool로 설정, 첫 사용 시 브라우저 실행)
+_pool: Optional[BrowserPool] = None
+_pool_options: Dict[str, Any] = {}
+
+
+def configure_browser_pool(max_concurrency: Optional[int] = None, max_uses: Optional[int] = None):
+    """공유 브라우저 풀 설정 (풀을 만들기 전에 호출, None인 값은 기본값 사용)"""
+    _pool_options.clear()
+    if max_concurrency is not None:
+        _pool_options["max_concurrency"] = max_concurrency
+    if max_uses is not None:
+        _pool_options["max_uses"] = max_uses
+
+
+def get_browser_pool() -> BrowserPool:
+    """공유 브라우저 풀 (없으면 생성, 브라우저는 첫 사용 시 실행)"""
+    global _pool
+    if _pool is None:
+        _pool = BrowserPool(**_pool_options)
+    return _pool
+
+
+def get_browser_pool_stats() -> Optional[Dict[str, Any]]:
+    """공유 브라우저 풀 통계 (아직 만들지 않았으면 None)"""
+    return _pool.stats() if _pool is not None else None
+
+
+async def close_browser_pool():
+    """공유 브라우저 풀 종료 (앱/MCP 서버 lifespan 종료 시)"""
+    global _pool
+    pool, _pool = _pool, None
+    if pool is not None:
+        await pool.close()
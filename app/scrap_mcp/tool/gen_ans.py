@@ -1,10 +1,11 @@
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
 import os
 from app.config import settings
 import json
 from typing import List, Dict
 
 client = OpenAI(api_key=settings.openai_api_key)
+async_client = AsyncOpenAI(api_key=settings.openai_api_key)
 
 def load_prompt(filename):
     root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -13,27 +14,44 @@ def load_prompt(filename):
     with open(filepath, 'r', encoding='utf-8') as f:
         return f.read()
 
-# GPT-4.1을 사용하여 MCP 수집 문서 기반 질문 답변 생성
-def ans_with_mcp(query: str, docs: List[Dict[str, str]]) -> str:
-    try:
-        action_prompt = load_prompt("generate_ans_prompt.txt")
-        pool = "\n\n".join(f"[출처] {doc['url']}\n{doc['content']}" for doc in docs)
+def build_ans_messages(query: str, docs: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    action_prompt = load_prompt("generate_ans_prompt.txt")
+    pool = "\n\n".join(f"[출처] {doc['url']}\n{doc['content']}" for doc in docs)
+
 
+    user_prompt = f"""{action_prompt}
+                    [문서 정보] {pool}
+                    [질문] {query} """
 
-        user_prompt = f"""{action_prompt}
-                        [문서 정보] {pool}
-                        [질문] {query} """
+    return [
+        {"role": "system", "content": action_prompt},
+        {"role": "user", "content": user_prompt}
+    ]
 
+# GPT-4.1을 사용하여 MCP 수집 문서 기반 질문 답변 생성
+def ans_with_mcp(query: str, docs: List[Dict[str, str]]) -> str:
+    try:
         response = client.chat.completions.create(
             model="gpt-4-turbo-2024-04-09",
-            messages=[
-                {"role": "system", "content": action_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
+            messages=build_ans_messages(query, docs),
+            temperature=0,
+        )
+        return response.choices[0].message.content.strip()
+    except Exception as e:
+        print("GPT 4.1 답변 생성 실패")
+        print(e)
+        return "답변 생성 실패"
+
+# ans_with_mcp의 비동기 버전 (이벤트 루프를 막지 않음)
+async def aans_with_mcp(query: str, docs: List[Dict[str, str]]) -> str:
+    try:
+        response = await async_client.chat.completions.create(
+            model="gpt-4-turbo-2024-04-09",
+            messages=build_ans_messages(query, docs),
             temperature=0,
         )
         return response.choices[0].message.content.strip()
     except Exception as e:
         print("GPT 4.1 답변 생성 실패")
         print(e)
-        return "답변 생성 실패"
\ No newline at end of file
+        return "답변 생성 실패"
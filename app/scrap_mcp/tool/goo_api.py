@@ -1,23 +1,26 @@
 from dotenv import load_dotenv
-import aiohttp
 import asyncio
 import os
 import json
 
+from app.scrap_mcp.tool.http_client import fetch, close_http_client
+
 load_dotenv()
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
+GOOGLE_SEARCH_TIMEOUT = 10.0
 
 async def use_google(url: str):
     try:
-        async with aiohttp.ClientSession() as session:
-            params = {
-                "key": GOOGLE_API_KEY,
-                "cx": "f14293bc90ca74970",
-                "q": url,
-                "num": 8,
-            }
-            async with session.get("https://www.googleapis.com/customsearch/v1", params=params) as response:
-                data = await response.json()
+        params = {
+            "key": GOOGLE_API_KEY,
+            "cx": "f14293bc90ca74970",
+            "q": url,
+            "num": 8,
+        }
+        # 공유 HTTP 클라이언트 사용 (호출마다 세션/연결을 새로 만들지 않음)
+        response = await fetch("GET", "https://www.googleapis.com/customsearch/v1",
+                               timeout=GOOGLE_SEARCH_TIMEOUT, params=params)
+        data = response.json()
         response : str = {}
         for q in data["items"]:
             if q["link"] == url:
@@ -37,4 +40,9 @@ async def use_google(url: str):
         return str(e)
 
 if __name__ == "__main__":
-    print(asyncio.run(use_google("https://www.me.go.kr/home/file/readDownloadFile.do?fileId=97828&fileSeq=1&openYn=Y")))
\ No newline at end of file
+    async def _main():
+        try:
+            print(await use_google("https://www.me.go.kr/home/file/readDownloadFile.do?fileId=97828&fileSeq=1&openYn=Y"))
+        finally:
+            await close_http_client()
+    asyncio.run(_main())
\ No newline at end of file
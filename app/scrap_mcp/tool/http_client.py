@@ -0,0 +1,144 @@
+# http_client.py
+"""
+스크래핑 도구가 공유하는 비동기 HTTP 클라이언트 (Brave 검색, Google 검색, 페이지 다운로드)
+
+요청마다 DNS/TCP/TLS 연결을 새로 맺지 않도록 httpx.AsyncClient 하나를 프로세스에서 공유한다.
+- 연결 풀: keep-alive 연결 재사용, 전체 연결 수 제한
+- 동시 요청 수: 전체 한도와 호스트별 한도를 세마포어로 제한 (한 사이트에 요청이 몰리지 않도록)
+  요청 한도가 낮은 API 호스트(Brave 검색)는 호스트별 한도를 따로 낮게 둔다 (host_limits)
+- HTTP/2: h2 패키지가 설치되어 있으면 사용
+- 타임아웃: 연결/전체 기본값, 요청별로 fetch(timeout=...)로 지정
+FastAPI 앱과 FastMCP 서버의 lifespan 종료 시 close_http_client()로 닫는다.
+"""
+
+import asyncio
+import importlib.util
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+
+# 동시에 보낼 수 있는 최대 요청 수 (Brave 검색 + 페이지 다운로드 + Google 검색 전체)
+DEFAULT_HTTP_MAX_CONCURRENCY = 16
+# 호스트 하나에 동시에 보낼 수 있는 최대 요청 수
+DEFAULT_HTTP_MAX_PER_HOST = 4
+# 호스트별 한도 예외 (요청 수 제한이 있는 유료 API, 초과하면 429)
+DEFAULT_HOST_LIMITS = {"api.search.brave.com": 2}
+# 요청 기본 타임아웃 / 연결 타임아웃 (초)
+DEFAULT_HTTP_TIMEOUT_SECONDS = 10.0
+DEFAULT_HTTP_CONNECT_TIMEOUT_SECONDS = 3.0
+# 유휴 keep-alive 연결 유지 시간 (초)
+KEEPALIVE_EXPIRY_SECONDS = 30.0
+
+DEFAULT_HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+
+_client: Optional[httpx.AsyncClient] = None
+_semaphore: Optional[asyncio.Semaphore] = None
+_host_semaphores: Dict[str, asyncio.Semaphore] = {}
+_options: Dict[str, Any] = {
+    "max_concurrency": DEFAULT_HTTP_MAX_CONCURRENCY,
+    "max_per_host": DEFAULT_HTTP_MAX_PER_HOST,
+    "host_limits": dict(DEFAULT_HOST_LIMITS),
+    "timeout": DEFAULT_HTTP_TIMEOUT_SECONDS,
+    "connect_timeout": DEFAULT_HTTP_CONNECT_TIMEOUT_SECONDS,
+}
+
+
+def http2_available() -> bool:
+    """HTTP/2 지원 패키지(h2) 설치 여부"""
+    return importlib.util.find_spec("h2") is not None
+
+
+def configure_http_client(max_concurrency: Optional[int] = None,
+                          timeout: Optional[float] = None,
+                          max_per_host: Optional[int] = None,
+                          connect_timeout: Optional[float] = None,
+                          host_limits: Optional[Dict[str, int]] = None):
+    """
+    공유 클라이언트 설정 (클라이언트를 만들기 전에 호출, None인 값은 기본값 유지)
+
+    host_limits는 호스트 이름 -> 동시 요청 수로, 주어진 호스트만 기존 값에 덮어쓴다.
+    """
+    if max_concurrency is not None:
+        _options["max_concurrency"] = max(1, max_concurrency)
+    if max_per_host is not None:
+        _options["max_per_host"] = max(1, max_per_host)
+    if timeout is not None:
+        _options["timeout"] = timeout
+    if connect_timeout is not None:
+        _options["connect_timeout"] = connect_timeout
+    if host_limits:
+        _options["host_limits"].update({host.lower(): max(1, limit) for host, limit in host_limits.items()})
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """공유 비동기 HTTP 클라이언트 (없으면 생성)"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            headers=DEFAULT_HEADERS,
+            timeout=httpx.Timeout(_options["timeout"], connect=_options["connect_timeout"]),
+            limits=httpx.Limits(
+                max_connections=_options["max_concurrency"],
+                max_keepalive_connections=_options["max_concurrency"],
+                keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS
+            ),
+            http2=http2_available(),
+            follow_redirects=True
+        )
+    return _client
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(_options["max_concurrency"])
+    return _semaphore
+
+
+def _get_host_semaphore(url: str) -> asyncio.Semaphore:
+    host = (urlsplit(url).hostname or "").lower()
+    semaphore = _host_semaphores.get(host)
+    if semaphore is None:
+        limit = _options["host_limits"].get(host, _options["max_per_host"])
+        semaphore = _host_semaphores[host] = asyncio.Semaphore(limit)
+    return semaphore
+
+
+async def fetch(method: str, url: str, timeout: Optional[float] = None, **kwargs) -> httpx.Response:
+    """
+    공유 클라이언트로 요청 (전체/호스트별 동시 요청 수 제한 적용, 본문까지 읽은 응답 반환)
+
+    Args:
+        method: HTTP 메서드
+        url: 요청 URL
+        timeout: 이 요청의 타임아웃 (초, None이면 클라이언트 기본값)
+        kwargs: httpx.AsyncClient.request 인자 (params, headers 등)
+    """
+    if timeout is not None:
+        kwargs["timeout"] = httpx.Timeout(timeout, connect=min(timeout, _options["connect_timeout"]))
+    # 호스트 슬롯을 먼저 잡아, 한 호스트를 기다리는 요청이 전체 슬롯을 차지하지 않도록 함
+    async with _get_host_semaphore(url):
+        async with _get_semaphore():
+            return await get_http_client().request(method, url, **kwargs)
+
+
+def get_http_client_stats() -> Dict[str, Any]:
+    """공유 클라이언트 설정과 상태"""
+    return {
+        "open": _client is not None and not _client.is_closed,
+        "http2": http2_available(),
+        "hosts": len(_host_semaphores),
+        **_options,
+    }
+
+
+async def close_http_client():
+    """공유 클라이언트 종료 (FastAPI 앱 / FastMCP 서버 lifespan 종료 시)"""
+    global _client, _semaphore
+    client, _client, _semaphore = _client, None, None
+    _host_semaphores.clear()
+    if client is not None:
+        await client.aclose()
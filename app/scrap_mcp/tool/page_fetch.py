@@ -0,0 +1,87 @@
+# page_fetch.py
+"""
+요청 단위 페이지 다운로드 (URL 하나를 한 번만 받아 여러 단계가 공유)
+
+search_scrap 한 번 안에서 URL 확인(is_url_alive)과 trafilatura 본문 추출이 같은 응답 본문을 쓰도록,
+URL별 다운로드 작업을 PageFetcher에 보관한다. 같은 URL을 동시에 요청해도 다운로드는 한 번이다.
+다운로드는 호출자 취소와 무관하게 계속되므로 요청이 끝나면 aclose()로 남은 다운로드를 취소한다.
+브라우저 렌더링은 정적 HTML에서 본문을 추출하지 못한 경우에만 사용한다 (app.scrap_mcp.main.scrape_page).
+"""
+
+import asyncio
+from typing import Dict, Optional
+
+import httpx
+
+from app.scrap_mcp.tool.http_client import fetch
+
+
+# 페이지 다운로드 타임아웃 (초)
+PAGE_FETCH_TIMEOUT = 5.0
+
+
+class FetchedPage:
+    """다운로드 결과 (실패하면 status_code=None, error에 사유)"""
+
+    __slots__ = ("url", "status_code", "content", "encoding", "error")
+
+    def __init__(self, url: str, status_code: Optional[int] = None, content: bytes = b"",
+                 encoding: Optional[str] = None, error: Optional[str] = None):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.encoding = encoding
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.status_code == 200
+
+    @property
+    def text(self) -> str:
+        """본문 문자열 (응답 헤더의 charset, 없으면 UTF-8로 디코딩)"""
+        try:
+            return self.content.decode(self.encoding or "utf-8", errors="replace")
+        except LookupError:
+            return self.content.decode("utf-8", errors="replace")
+
+
+class PageFetcher:
+    """요청 하나(search_scrap 1회) 동안 URL별 다운로드를 공유하는 캐시"""
+
+    def __init__(self, timeout: float = PAGE_FETCH_TIMEOUT):
+        """
+        Args:
+            timeout: 페이지 다운로드 타임아웃 (초)
+        """
+        self.timeout = timeout
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    async def get(self, url: str) -> FetchedPage:
+        """URL 다운로드 결과 (이미 받았거나 받는 중이면 그 결과를 공유)"""
+        task = self._tasks.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._download(url))
+            self._tasks[url] = task
+        # 한 호출자가 취소되어도 같은 URL을 기다리는 다른 단계의 다운로드는 계속
+        return await asyncio.shield(task)
+
+    async def _download(self, url: str) -> FetchedPage:
+        try:
+            response = await fetch("GET", url, timeout=self.timeout)
+            return FetchedPage(url, response.status_code, response.content, response.charset_encoding)
+        except (httpx.HTTPError, httpx.InvalidURL) as e:
+            return FetchedPage(url, error=str(e) or type(e).__name__)
+
+    async def aclose(self):
+        """끝나지 않은 다운로드 취소 (HTTP 동시 요청 슬롯 반환, 요청 처리가 끝날 때 호출)"""
+        unfinished = [task for task in self._tasks.values() if not task.done()]
+        for task in unfinished:
+            task.cancel()
+        if unfinished:
+            await asyncio.gather(*unfinished, return_exceptions=True)
+
+    @property
+    def downloads(self) -> int:
+        """실제로 시작한 다운로드 수"""
+        return len(self._tasks)
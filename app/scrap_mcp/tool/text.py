@@ -1,17 +1,29 @@
 from trafilatura import extract
-import requests
+import asyncio
 
-def use_tra(url: str):
+from app.scrap_mcp.tool.http_client import fetch, close_http_client
+
+def extract_static(html) -> str:
+    """정적 HTML(str 또는 bytes, bytes면 trafilatura가 인코딩 판별)에서 본문 추출 (실패하면 "Fail")"""
+    text = extract(html)
+    if text is None:
+        return "Fail"
+    return text
+
+async def use_tra(url: str):
     try:
-        qht = requests.get(url)
-        text = extract(qht.text)
-        if text is None:
-            return "Fail"
-        return text
+        # 공유 HTTP 클라이언트로 받고, 추출은 스레드에서 실행 (이벤트 루프를 막지 않음)
+        qht = await fetch("GET", url)
+        return await asyncio.to_thread(extract_static, qht.content)
 
     except Exception as e:
         return str(e)
-    
+
 
 if __name__ == "__main__":
-    print(use_tra("https://www.kma.go.kr/kids/231.jsp"))
\ No newline at end of file
+    async def _main():
+        try:
+            print(await use_tra("https://www.kma.go.kr/kids/231.jsp"))
+        finally:
+            await close_http_client()
+    asyncio.run(_main())
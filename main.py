@@ -9,6 +9,9 @@ from fastapi.exceptions import RequestValidationError
 from fastapi import HTTPException
 from app.logging_config import logger
 from app.redis.main_processor import MainProcessor
+from app.scrap_mcp.tool.browser_pool import configure_browser_pool, close_browser_pool
+from app.scrap_mcp.tool.http_client import configure_http_client, close_http_client
+from app.scrap_mcp.brave_search_module.brave_search_impl import BRAVE_SEARCH_HOST
 import sys
 import asyncio
 
@@ -40,13 +43,35 @@ async def startup_event():
     """애플리케이션 시작 시 MainProcessor 초기화"""
     global processor
     try:
+        # 스크래핑 브라우저 풀 설정 (브라우저는 첫 스크래핑 시 실행되어 앱 종료까지 유지)
+        configure_browser_pool(
+            max_concurrency=settings.browser_pool_max_concurrency,
+            max_uses=settings.browser_pool_context_max_uses
+        )
+        configure_http_client(
+            max_concurrency=settings.scrap_http_max_concurrency,
+            timeout=settings.scrap_http_timeout_seconds,
+            max_per_host=settings.scrap_http_max_per_host,
+            connect_timeout=settings.scrap_http_connect_timeout_seconds,
+            host_limits={BRAVE_SEARCH_HOST: settings.scrap_brave_max_concurrency}
+        )
         logger.info("MainProcessor 초기화 시작")
         processor = MainProcessor(redis_url=settings.redis_url)
+        await processor.ainitialize()
         logger.info("MainProcessor 초기화 완료")
     except Exception as e:
         logger.error(f"MainProcessor 초기화 실패: {e}")
         raise e
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """애플리케이션 종료 시 비동기 Redis 커넥션 풀과 스크래핑 브라우저 풀/HTTP 클라이언트 정리"""
+    if processor is not None:
+        await processor.aclose()
+        logger.info("MainProcessor 리소스 정리 완료")
+    await close_browser_pool()
+    await close_http_client()
+
 # 로깅 설정 (이미 app/logging_config.py에서 적용됨)
 logger.info("IM.FACT 백엔드 서버 시작")
 
@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from app.scrap_mcp.tool.browser_pool import BrowserPool
+
+
+class StubPage:
+    def __init__(self):
+        self.handlers = {}
+        self.closed = False
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    async def close(self):
+        self.closed = True
+
+
+class StubContext:
+    """Playwright BrowserContext 대체 (page 이벤트와 열린 페이지, 종료 여부 기록)"""
+
+    def __init__(self, number):
+        self.number = number
+        self.handlers = {}
+        self.pages = []
+        self.closed = False
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    async def new_page(self):
+        page = StubPage()
+        self.pages.append(page)
+        self.handlers["page"](page)
+        return page
+
+    async def close(self):
+        self.closed = True
+
+
+class StubBrowser:
+    def __init__(self):
+        self.contexts = []
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self):
+        context = StubContext(len(self.contexts))
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.connected = False
+
+
+def _pool(**kwargs):
+    # 실제 Chromium 대신 스텁 브라우저를 실행된 상태로 주입
+    pool = BrowserPool(**kwargs)
+    pool._browser = StubBrowser()
+    return pool
+
+
+async def test_context_is_reused_until_max_uses():
+    pool = _pool(max_uses=3)
+    used = []
+    for _ in range(4):
+        async with pool.context() as context:
+            await context.new_page()
+            used.append(context.number)
+
+    assert used == [0, 0, 0, 1]
+    first = pool._browser.contexts[0]
+    # 재사용 전에는 열린 페이지를 닫고, max_uses회 사용하면 컨텍스트째 닫음
+    assert [page.closed for page in first.pages] == [True, True, False]
+    assert first.closed
+    stats = pool.stats()
+    assert stats["contexts_created"] == 2 and stats["contexts_recycled"] == 1
+    assert stats["idle"] == 1 and stats["acquisitions"] == 4
+
+
+async def test_context_is_discarded_after_exception():
+    pool = _pool()
+    with pytest.raises(ValueError):
+        async with pool.context():
+            raise ValueError("navigation failed")
+
+    async with pool.context() as context:
+        assert context.number == 1
+
+    assert pool._browser.contexts[0].closed
+    assert pool.stats()["contexts_discarded"] == 1
+
+
+async def test_context_is_discarded_after_page_crash():
+    pool = _pool()
+    async with pool.context() as context:
+        page = await context.new_page()
+        page.handlers["crash"](page)
+
+    assert context.closed
+    assert pool.stats()["idle"] == 0 and pool.stats()["contexts_discarded"] == 1
+    async with pool.context() as context:
+        assert context.number == 1
+
+
+async def test_concurrent_contexts_are_limited_by_max_concurrency():
+    pool = _pool(max_concurrency=2)
+    active, peak = [0], [0]
+
+    async def use():
+        async with pool.context():
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.01)
+            active[0] -= 1
+
+    await asyncio.gather(*(use() for _ in range(6)))
+
+    assert peak[0] == 2
+    # 동시에 쓰인 컨텍스트는 두 개뿐이고 이후 요청은 반납된 컨텍스트를 재사용
+    assert len(pool._browser.contexts) == 2
+    stats = pool.stats()
+    assert stats["in_use"] == 0 and stats["idle"] == 2 and stats["wait_max_ms"] > 0
@@ -0,0 +1,178 @@
+import json
+import threading
+
+import fakeredis
+import numpy as np
+import pytest
+
+from app.redis import redis_handler
+from app.redis.numpy_backend import NumpyVectorIndex
+from app.redis.redis_handler import RedisVectorSearchHandler
+from app.redis.search_result_cache import generation_key_for
+from app.redis.vector_codec import decode_vector
+from app.redis.vector_search import VectorSearchIndex
+from tests.test_vector_backend import FakeEmbeddingModel
+
+
+class FlakyEmbeddingModel(FakeEmbeddingModel):
+    """fail_on에 든 텍스트가 있는 청크는 임베딩에 실패하는 모델 (청크별 요청 기록)"""
+
+    def __init__(self, fail_on=()):
+        super().__init__()
+        self.fail_on = set(fail_on)
+        self.calls = []
+
+    def embed_many(self, texts):
+        self.calls.append(list(texts))
+        if self.fail_on & set(texts):
+            raise RuntimeError("embedding API error")
+        return super().embed_many(texts)
+
+
+@pytest.fixture
+def redis_client(monkeypatch):
+    client = fakeredis.FakeRedis()
+    # fakeredis에는 FT.* 명령이 없으므로 인덱스 생성은 건너뜀 (Hash 저장/조회만 사용)
+    monkeypatch.setattr(VectorSearchIndex, "_ensure_index_exists", lambda self: None)
+    monkeypatch.setattr(redis_handler, "get_redis_client", lambda url: client)
+    return client
+
+
+def _handler(model, index_name="bulk"):
+    return RedisVectorSearchHandler(embedding_model=model, redis_url="redis://fake", index_name=index_name,
+                                    vector_dimension=model.dimension)
+
+
+def test_add_documents_pipelines_chunks_and_reports_bad_documents(redis_client):
+    index = VectorSearchIndex(redis_client, index_name="bulk", vector_dimension=4)
+    vectors = np.random.default_rng(0).normal(size=(7, 4)).astype(np.float32)
+    documents = [(f"d{i}", vector, {"text": f"문서 {i}"}) for i, vector in enumerate(vectors)]
+    documents.insert(3, ("bad", "not a vector", {"text": "x"}))
+
+    report = index.add_documents(iter(documents), chunk_size=3, max_in_flight=2)
+
+    assert (report["total"], report["succeeded"], report["chunks"]) == (8, 7, 3)
+    assert [failure["key"] for failure in report["failed"]] == ["bad"]
+    for i, vector in enumerate(vectors):
+        stored = redis_client.hgetall(f"doc:bulk:d{i}")
+        assert stored[b"custom_key"] == f"d{i}".encode() and stored[b"text"] == f"문서 {i}".encode()
+        np.testing.assert_array_equal(decode_vector(stored[b"embedding_vector"]), vector)
+    # 검색 결과 캐시 세대는 대량 저장 한 번에 한 번만 증가
+    assert redis_client.get(generation_key_for("bulk")) == b"1"
+    assert index.state.doc_count == 7
+
+
+def test_add_documents_bounds_pipelines_in_flight_and_records_failed_pipeline(redis_client, monkeypatch):
+    index = VectorSearchIndex(redis_client, index_name="bulk", vector_dimension=4)
+    active, peak, executed = [0], [0], []
+    lock = threading.Lock()
+    original_pipeline = redis_client.pipeline
+
+    def tracking_pipeline(*args, **kwargs):
+        pipe = original_pipeline(*args, **kwargs)
+        original_execute = pipe.execute
+
+        def execute(raise_on_error=True):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+                executed.append(len(pipe.command_stack))
+                number = len(executed)
+            try:
+                if number == 2:
+                    raise ConnectionError("connection reset")
+                return original_execute(raise_on_error=raise_on_error)
+            finally:
+                with lock:
+                    active[0] -= 1
+
+        pipe.execute = execute
+        return pipe
+
+    monkeypatch.setattr(redis_client, "pipeline", tracking_pipeline)
+    documents = [(f"d{i}", np.ones(4, dtype=np.float32), {}) for i in range(10)]
+
+    report = index.add_documents(documents, chunk_size=2, max_in_flight=2)
+
+    assert peak[0] <= 2
+    assert executed == [2, 2, 2, 2, 2]
+    # 두 번째 파이프라인 전체 실패는 그 청크 문서만 실패로 기록
+    assert sorted(failure["key"] for failure in report["failed"]) == ["d2", "d3"]
+    assert report["succeeded"] == 8
+    assert not redis_client.exists("doc:bulk:d2") and redis_client.exists("doc:bulk:d4")
+
+
+def test_save_embeddings_bulk_embeds_per_chunk_and_skips_failed_chunks(redis_client):
+    model = FlakyEmbeddingModel(fail_on={"text 3"})
+    handler = _handler(model)
+    items = ((f"k{i}", f"text {i}", {"source_url": f"https://{i}.example"}) for i in range(7))
+
+    report = handler.save_embeddings_bulk(items, chunk_size=3)
+
+    # 청크마다 embed_many 한 번, 실패한 청크는 건너뛰고 다음 청크 계속
+    assert model.calls == [["text 0", "text 1", "text 2"], ["text 3", "text 4", "text 5"], ["text 6"]]
+    assert report["total"] == 7 and report["succeeded"] == 4
+    assert sorted(failure["key"] for failure in report["failed"]) == ["k3", "k4", "k5"]
+    assert all(failure["error"].startswith("임베딩 실패") for failure in report["failed"])
+    assert sorted(key.decode() for key in redis_client.scan_iter(match="doc:bulk:*")) == \
+        ["doc:bulk:k0", "doc:bulk:k1", "doc:bulk:k2", "doc:bulk:k6"]
+    stored = redis_client.hgetall("doc:bulk:k6")
+    assert stored[b"text"] == b"text 6"
+    assert stored[b"source_url"] == b"https://6.example"
+    np.testing.assert_allclose(decode_vector(stored[b"embedding_vector"]), model.embed_many(["text 6"])[0])
+
+
+def _store(handler, count):
+    items = [(f"k{i}", f"text {i}", {"source_url": f"https://{i}.example"}) for i in range(count)]
+    assert handler.save_embeddings_bulk(items, chunk_size=4)["succeeded"] == count
+
+
+def test_iter_documents_streams_every_document_without_vectors(redis_client):
+    handler = _handler(FakeEmbeddingModel())
+    _store(handler, 11)
+    # 다른 인덱스 문서는 순회하지 않음
+    redis_client.hset("doc:other:x", mapping={"custom_key": "x", "text": "other"})
+
+    documents = list(handler.iter_documents(batch_size=3))
+
+    assert sorted(document["key"] for document in documents) == sorted(f"k{i}" for i in range(11))
+    for document in documents:
+        number = document["key"][1:]
+        assert document["redis_key"] == f"doc:bulk:k{number}"
+        assert document["text"] == f"text {number}"
+        assert document["metadata"]["source_url"] == f"https://{number}.example"
+        assert "embedding_vector" not in document["metadata"] and "text" not in document["metadata"]
+
+
+def test_iter_documents_skips_keys_deleted_after_scan(redis_client, monkeypatch):
+    handler = _handler(FakeEmbeddingModel())
+    _store(handler, 3)
+    scanned = list(redis_client.scan_iter(match="doc:bulk:*"))
+    # SCAN 이후 HMGET 전에 삭제된 키
+    monkeypatch.setattr(redis_client, "scan_iter", lambda match=None, count=None: iter(scanned + [b"doc:bulk:gone"]))
+
+    keys = [document["key"] for document in handler.iter_documents(batch_size=2)]
+
+    assert sorted(keys) == ["k0", "k1", "k2"]
+
+
+def test_export_documents_jsonl_writes_one_line_per_document(redis_client, tmp_path):
+    handler = _handler(FakeEmbeddingModel())
+    _store(handler, 5)
+    path = tmp_path / "export.jsonl"
+
+    assert handler.export_documents_jsonl(str(path), batch_size=2) == 5
+
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert sorted(line["key"] for line in lines) == [f"k{i}" for i in range(5)]
+    assert all("embedding_vector" not in line["metadata"] for line in lines)
+
+
+def test_iter_documents_requires_redis_backend():
+    model = FakeEmbeddingModel()
+    backend = NumpyVectorIndex(index_name="bulk", vector_dimension=model.dimension)
+    handler = RedisVectorSearchHandler(embedding_model=model, redis_url=None, index_name="bulk",
+                                       vector_backend=backend)
+
+    with pytest.raises(RuntimeError):
+        next(handler.iter_documents())
@@ -0,0 +1,131 @@
+import fakeredis
+
+from app.redis import cache_eviction
+from app.redis.cache_eviction import CacheEvictionPolicy, CacheSweeper
+from app.redis.vector_search import rebuild_deletes_key, rebuild_lock_key
+
+
+def _policy(redis_client, **options):
+    return CacheEvictionPolicy(redis_client, "cache", **options)
+
+
+def test_sweeper_skips_when_another_worker_holds_the_lock():
+    redis_client = fakeredis.FakeRedis()
+    policy = _policy(redis_client, max_entries=1)
+    for key in ("doc:a", "doc:b", "doc:c"):
+        redis_client.hset(key, "answer", key)
+        policy.record_insert(key)
+
+    redis_client.set(policy.sweep_lock_key, "other-worker", nx=True, px=30000)
+    assert CacheSweeper(policy, interval=0).sweep_once() is None
+    assert redis_client.zcard(policy.access_key) == 3
+
+    redis_client.delete(policy.sweep_lock_key)
+    result = CacheSweeper(policy, interval=0).sweep_once()
+    assert result["evicted_size"] == 2
+    # 실행 후 잠금 해제
+    assert redis_client.get(policy.sweep_lock_key) is None
+
+
+def test_sweeper_does_not_release_lock_taken_over_by_another_worker(monkeypatch):
+    redis_client = fakeredis.FakeRedis()
+    policy = _policy(redis_client)
+
+    def slow_sweep():
+        # 잠금이 만료되어 다른 워커가 잡은 상황
+        redis_client.set(policy.sweep_lock_key, "other-worker")
+        return {}
+
+    monkeypatch.setattr(policy, "sweep", slow_sweep)
+    CacheSweeper(policy, interval=0).sweep_once()
+    assert redis_client.get(policy.sweep_lock_key) == b"other-worker"
+
+
+def _insert(redis_client, policy, keys):
+    for key in keys:
+        redis_client.hset(key, mapping={"answer": key, "exact_key": f"exact:{key}"})
+        redis_client.set(f"exact:{key}", key)
+        policy.record_insert(key)
+
+
+def test_lru_evicts_least_recently_hit(monkeypatch):
+    redis_client = fakeredis.FakeRedis()
+    policy = _policy(redis_client, policy="lru", max_entries=2)
+    now = [1000.0]
+    monkeypatch.setattr(cache_eviction.time, "time", lambda: now[0])
+    for key in ("doc:a", "doc:b", "doc:c"):
+        now[0] += 1
+        _insert(redis_client, policy, [key])
+    # 가장 먼저 저장한 a에 히트하면 가장 오래 전에 쓰인 항목은 b
+    now[0] += 1
+    policy.record_hits(["doc:a"])
+
+    result = policy.sweep()
+
+    assert result["evicted_size"] == 1
+    assert not redis_client.exists("doc:b") and not redis_client.exists("exact:doc:b")
+    assert redis_client.exists("doc:a") and redis_client.exists("doc:c")
+    assert redis_client.zscore(policy.access_key, "doc:a") == 1004.0
+
+
+def test_lfu_evicts_least_frequently_hit():
+    redis_client = fakeredis.FakeRedis()
+    policy = _policy(redis_client, policy="lfu", max_entries=2)
+    _insert(redis_client, policy, ["doc:a", "doc:b", "doc:c"])
+    policy.record_hits(["doc:a", "doc:c"])
+    policy.record_hits(["doc:a"])
+    # 이미 축출된 항목의 히트는 점수를 다시 만들지 않음
+    policy.record_hits(["doc:gone"])
+
+    result = policy.sweep()
+
+    assert result["evicted_size"] == 1
+    assert not redis_client.exists("doc:b")
+    assert redis_client.zscore(policy.access_key, "doc:a") == 3
+    assert redis_client.zscore(policy.access_key, "doc:c") == 2
+    assert redis_client.zscore(policy.access_key, "doc:gone") is None
+    assert policy.get_stats()["evictions"]["evicted_size"] == 1
+
+
+def test_ttl_is_set_and_expired_keys_are_pruned():
+    redis_client = fakeredis.FakeRedis()
+    policy = _policy(redis_client, ttl_seconds=60, max_entries=0)
+    _insert(redis_client, policy, ["doc:a", "doc:b"])
+    assert 0 < redis_client.ttl("doc:a") <= 60
+
+    # TTL로 만료된 것과 같은 상태
+    redis_client.delete("doc:a")
+    result = policy.sweep()
+
+    assert result["expired"] == 1
+    assert result["evicted_size"] == 0
+    assert redis_client.zrange(policy.access_key, 0, -1) == [b"doc:b"]
+
+
+def test_adopt_untracked_registers_existing_entries_once():
+    redis_client = fakeredis.FakeRedis()
+    policy = _policy(redis_client, policy="lfu", ttl_seconds=60)
+    redis_client.hset("doc:cache:old1", "answer", "1")
+    redis_client.hset("doc:cache:old2", "answer", "2")
+    redis_client.hset("doc:other:x", "answer", "x")
+    _insert(redis_client, policy, ["doc:cache:tracked"])
+    policy.record_hits(["doc:cache:tracked"])
+
+    assert policy.adopt_untracked() == 2
+    assert policy.adopt_untracked() == 0
+    assert redis_client.zscore(policy.access_key, "doc:cache:old1") == 1
+    # 이미 등록된 항목의 점수는 유지
+    assert redis_client.zscore(policy.access_key, "doc:cache:tracked") == 2
+    assert redis_client.zscore(policy.access_key, "doc:other:x") is None
+    assert 0 < redis_client.ttl("doc:cache:old1") <= 60
+
+
+def test_evictions_during_rebuild_are_recorded_for_the_new_version():
+    redis_client = fakeredis.FakeRedis()
+    policy = _policy(redis_client, policy="lfu", max_entries=1)
+    _insert(redis_client, policy, ["doc:a", "doc:b"])
+    policy.record_hits(["doc:b"])
+    redis_client.set(rebuild_lock_key("cache"), "rebuilder")
+
+    assert policy.sweep()["evicted_size"] == 1
+    assert redis_client.smembers(rebuild_deletes_key("cache")) == {b"doc:a"}
@@ -0,0 +1,37 @@
+from app.redis.document_ingestion import DocumentIngestor, build_chunk_items, chunk_text
+from app.redis.numpy_backend import NumpyVectorIndex
+from app.redis.redis_handler import RedisVectorSearchHandler
+from tests.test_vector_backend import FakeEmbeddingModel
+
+
+def test_chunk_text_overlaps_within_size():
+    text = " ".join(f"문장 {i}번은 해수면 상승에 관한 내용입니다." for i in range(100))
+    chunks = chunk_text(text, chunk_size=200, chunk_overlap=50)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 200 for chunk in chunks)
+    # 인접 청크는 앞 청크의 끝부분을 공유
+    for previous, current in zip(chunks, chunks[1:]):
+        assert current[:20] in previous
+
+
+def test_ingest_dedupes_by_content_hash():
+    model = FakeEmbeddingModel()
+    backend = NumpyVectorIndex(index_name="ingest", vector_dimension=model.dimension)
+    handler = RedisVectorSearchHandler(embedding_model=model, redis_url=None, index_name="ingest",
+                                       vector_backend=backend)
+    ingestor = DocumentIngestor(handler, chunk_size=200, chunk_overlap=50)
+    content = " ".join(f"기후 변화 문단 {i}의 설명입니다." for i in range(60))
+    docs = [{"url": "https://a.example", "content": content, "fetched_at": 1.0},
+            {"url": "https://b.example", "content": content}]
+
+    first = ingestor.ingest(docs)
+    assert first["stored"] == first["chunks"] == len(build_chunk_items(docs[:1], 200, 50))
+
+    second = ingestor.ingest(docs)
+    assert second["stored"] == 0
+    assert second["duplicates"] == second["chunks"]
+    assert backend.get_index_info()["num_docs"] == first["stored"]
+
+    hit = handler.search_similar_embeddings(chunk_text(content, 200, 50)[0], similarity_threshold=0.99)[0]
+    assert hit.get("source_url") == "https://a.example"
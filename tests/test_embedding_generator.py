@@ -0,0 +1,132 @@
+import fakeredis
+import fakeredis.aioredis
+import numpy as np
+import pytest
+
+# EmbeddingGenerator는 설정(app.config)과 langchain_openai가 필요
+_REQUIRED_SETTINGS = ("POSTGRES_PASSWORD", "DATABASE_URL", "SYNC_DATABASE_URL", "REDIS_URL", "SECRET_KEY",
+                      "OPENAI_API_KEY", "BRAVE_AI_API_KEY", "GOOGLE_API_KEY")
+
+
+def _fake_vector(text):
+    return np.random.default_rng(sum(text.encode("utf-8"))).normal(size=4).astype(np.float32).tolist()
+
+
+class FakeOpenAIEmbeddings:
+    """배치별 요청 텍스트를 기록하고, fail_on에 든 텍스트가 있는 배치는 실패시키는 임베딩 모델"""
+
+    def __init__(self, model=None, openai_api_key=None, dimensions=None):
+        self.calls = []
+        self.fail_on = set()
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        if self.fail_on & set(texts):
+            raise RuntimeError("embedding API error")
+        return [_fake_vector(text) for text in texts]
+
+    async def aembed_documents(self, texts):
+        return self.embed_documents(texts)
+
+
+@pytest.fixture
+def make_generator(monkeypatch):
+    for module in ("pydantic_settings", "langchain_openai"):
+        pytest.importorskip(module)
+    for name in _REQUIRED_SETTINGS:
+        monkeypatch.setenv(name, "test")
+    from app.redis import embedding_generator, redis_handler
+
+    server = fakeredis.FakeServer()
+    sync_client = fakeredis.FakeRedis(server=server)
+    mget_calls = []
+    original_mget = sync_client.mget
+    monkeypatch.setattr(sync_client, "mget", lambda keys: mget_calls.append(list(keys)) or original_mget(keys))
+    monkeypatch.setattr(redis_handler, "get_redis_client", lambda url: sync_client)
+    monkeypatch.setattr(redis_handler, "get_async_redis_client",
+                        lambda url: fakeredis.aioredis.FakeRedis(server=server))
+    monkeypatch.setattr(embedding_generator, "OpenAIEmbeddings", FakeOpenAIEmbeddings)
+
+    def factory(**options):
+        generator = embedding_generator.EmbeddingGenerator(redis_url="redis://fake", **options)
+        generator.mget_calls = mget_calls
+        return generator
+
+    return factory
+
+
+def test_embed_many_keeps_input_order_with_duplicates(make_generator):
+    generator = make_generator()
+    texts = ["b", "a", "b", "c", "a"]
+
+    matrix = generator.embed_many(texts)
+
+    # 중복은 한 번만 요청
+    assert generator.embeddings.calls == [["b", "a", "c"]]
+    assert matrix.dtype == np.float32 and matrix.flags["C_CONTIGUOUS"]
+    np.testing.assert_array_equal(matrix, np.array([_fake_vector(text) for text in texts], dtype=np.float32))
+
+
+def test_embed_many_requests_only_cache_misses(make_generator):
+    generator = make_generator(batch_size=2)
+    generator.embed_many(["a", "b"])
+    generator.embeddings.calls.clear()
+    generator.mget_calls.clear()
+
+    matrix = generator.embed_many(["x", "a", "y", "b", "z"])
+
+    # 캐시 조회는 MGET 한 번, 미스만 batch_size 단위로 요청
+    assert len(generator.mget_calls) == 1 and len(generator.mget_calls[0]) == 5
+    assert generator.embeddings.calls == [["x", "y"], ["z"]]
+    np.testing.assert_array_equal(matrix[1], np.array(_fake_vector("a"), dtype=np.float32))
+
+
+def test_failed_batch_raises_but_caches_earlier_batches(make_generator):
+    generator = make_generator(batch_size=2)
+    generator.embeddings.fail_on = {"c"}
+
+    with pytest.raises(RuntimeError):
+        generator.embed_many(["a", "b", "c", "d", "e"])
+    assert generator.embeddings.calls == [["a", "b"], ["c", "d"]]
+    cached = generator.cache.get_embeddings(["a", "b", "c", "d", "e"])
+    assert [vector is not None for vector in cached] == [True, True, False, False, False]
+
+    # 재시도하면 실패한 배치부터만 다시 요청
+    generator.embeddings.fail_on = set()
+    generator.embeddings.calls.clear()
+    matrix = generator.embed_many(["a", "b", "c", "d", "e"])
+    assert generator.embeddings.calls == [["c", "d"], ["e"]]
+    assert matrix.shape == (5, 4)
+
+
+def test_embed_many_rejects_empty_text(make_generator):
+    generator = make_generator()
+    with pytest.raises(ValueError):
+        generator.embed_many(["a", " "])
+    assert generator.embeddings.calls == []
+
+
+async def test_aembed_many_shares_cache_with_sync_path(make_generator):
+    generator = make_generator(batch_size=2)
+    generator.embed_many(["a"])
+    generator.embeddings.calls.clear()
+
+    matrix = await generator.aembed_many(["b", "a", "b", "c", "d"])
+
+    assert generator.embeddings.calls == [["b", "c"], ["d"]]
+    np.testing.assert_array_equal(matrix[0], matrix[2])
+    np.testing.assert_array_equal(matrix[1], np.array(_fake_vector("a"), dtype=np.float32))
+    # 비동기 경로에서 저장한 벡터는 동기 경로에서도 히트
+    generator.embeddings.calls.clear()
+    generator.embed_many(["b", "c", "d"])
+    assert generator.embeddings.calls == []
+
+
+async def test_aembed_many_failed_batch_caches_earlier_batches(make_generator):
+    generator = make_generator(batch_size=1)
+    generator.embeddings.fail_on = {"b"}
+
+    with pytest.raises(RuntimeError):
+        await generator.aembed_many(["a", "b"])
+
+    assert [vector is not None for vector in generator.cache.get_embeddings(["a", "b"])] == [True, False]
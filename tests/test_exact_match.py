@@ -0,0 +1,31 @@
+import pytest
+
+from app.redis.exact_match import normalize_question, question_hash
+
+
+@pytest.mark.parametrize("left, right", [
+    ("지구 온난화란?", "지구   온난화란"),
+    ("What is El Niño?!", "what is el niño"),
+    ("“탄소중립”이란 무엇인가요？", "탄소중립 이란 무엇인가요"),
+    ("해수면 상승... 얼마나?", "해수면 상승 얼마나"),
+])
+def test_sentence_punctuation_and_whitespace_are_folded(left, right):
+    assert question_hash(left) == question_hash(right)
+
+
+@pytest.mark.parametrize("left, right", [
+    ("기온이 -2°C 오르면?", "기온이 2°C 오르면?"),
+    ("C++ vs C#", "C vs C"),
+    ("기온 1.5도 상승", "기온 15도 상승"),
+    ("1,000년 전 기후", "1 000년 전 기후"),
+    ("배출량 40% 감축", "배출량 40 감축"),
+    ("+3도와 -3도", "3도와 3도"),
+])
+def test_meaningful_symbols_do_not_collide(left, right):
+    assert question_hash(left) != question_hash(right)
+
+
+def test_normalize_question_keeps_numbers_and_signs():
+    assert normalize_question("기온이 -2.5°C, 오르면?") == "기온이 -2.5°c 오르면"
+    assert normalize_question("1,000톤.") == "1,000톤"
+    assert question_hash("?!") is None
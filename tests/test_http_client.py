@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from app.scrap_mcp.tool import http_client
+
+
+class InFlightRecorder:
+    """MockTransport 핸들러 (전체/호스트별 동시 요청 수의 최댓값 기록)"""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.active_by_host = {}
+        self.peak_by_host = {}
+
+    async def __call__(self, request):
+        host = request.url.host
+        self.active += 1
+        self.active_by_host[host] = self.active_by_host.get(host, 0) + 1
+        self.peak = max(self.peak, self.active)
+        self.peak_by_host[host] = max(self.peak_by_host.get(host, 0), self.active_by_host[host])
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+            self.active_by_host[host] -= 1
+        return httpx.Response(200, text=host)
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    recorder = InFlightRecorder()
+    # 설정과 세마포어는 테스트마다 새로 시작, 클라이언트는 MockTransport로 교체
+    monkeypatch.setattr(http_client, "_options", {**http_client._options, "host_limits": {}})
+    monkeypatch.setattr(http_client, "_semaphore", None)
+    monkeypatch.setattr(http_client, "_host_semaphores", {})
+    monkeypatch.setattr(http_client, "_client", httpx.AsyncClient(transport=httpx.MockTransport(recorder)))
+    return recorder
+
+
+async def test_fetch_limits_concurrent_requests_per_host(recorder):
+    http_client.configure_http_client(max_concurrency=10, max_per_host=2)
+
+    responses = await asyncio.gather(*(http_client.fetch("GET", f"https://a.example/{i}") for i in range(6)))
+
+    assert all(response.status_code == 200 for response in responses)
+    assert recorder.peak_by_host == {"a.example": 2}
+    await http_client.close_http_client()
+
+
+async def test_fetch_limits_concurrent_requests_globally(recorder):
+    http_client.configure_http_client(max_concurrency=3, max_per_host=2)
+    urls = [f"https://{host}.example/{i}" for host in ("a", "b", "c", "d") for i in range(3)]
+
+    await asyncio.gather(*(http_client.fetch("GET", url) for url in urls))
+
+    assert recorder.peak == 3
+    assert max(recorder.peak_by_host.values()) <= 2
+    await http_client.close_http_client()
+
+
+async def test_host_limits_override_per_host_default(recorder):
+    http_client.configure_http_client(max_concurrency=10, max_per_host=4,
+                                      host_limits={"API.Search.Brave.com": 1})
+    urls = [f"https://api.search.brave.com/q{i}" for i in range(3)] + [f"https://a.example/{i}" for i in range(6)]
+
+    await asyncio.gather(*(http_client.fetch("GET", url) for url in urls))
+
+    assert recorder.peak_by_host == {"api.search.brave.com": 1, "a.example": 4}
+    assert http_client.get_http_client_stats()["hosts"] == 2
+    await http_client.close_http_client()
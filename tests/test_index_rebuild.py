@@ -0,0 +1,201 @@
+import uuid
+
+import fakeredis
+import numpy as np
+import pytest
+import redis
+
+from app.redis import index_rebuild
+from app.redis.cache_eviction import access_key_for
+from app.redis.index_rebuild import IndexRebuilder
+from app.redis.search_result_cache import generation_key_for
+from app.redis.vector_codec import decode_vector, encode_vector
+from app.redis.vector_search import VectorSearchIndex, rebuild_deletes_key, rebuild_lock_key
+
+ALIAS = "docs"
+OLD_PREFIX = "doc:docs_v1:"
+NEW_PREFIX = "doc:docs_v2:"
+
+
+class StubLock:
+    """redis-py Lock과 같은 SET NX PX 잠금 (fakeredis에는 release/reacquire가 쓰는 Lua가 없음)"""
+
+    def __init__(self, redis_client, name, timeout, blocking=False, thread_local=False):
+        self.redis_client = redis_client
+        self.name = name
+        self.timeout = timeout
+        self.token = uuid.uuid4().hex.encode()
+
+    def acquire(self):
+        return bool(self.redis_client.set(self.name, self.token, nx=True, px=int(self.timeout * 1000)))
+
+    def reacquire(self):
+        if self.redis_client.get(self.name) != self.token:
+            raise redis.exceptions.LockNotOwnedError("lock not owned")
+        self.redis_client.pexpire(self.name, int(self.timeout * 1000))
+
+    def release(self):
+        if self.redis_client.get(self.name) != self.token:
+            raise redis.exceptions.LockNotOwnedError("lock not owned")
+        self.redis_client.delete(self.name)
+
+
+class FakeFT:
+    def __init__(self, redis_client, name, dropped):
+        self.redis_client = redis_client
+        self.name = name
+        self.dropped = dropped
+
+    def dropindex(self, delete_documents=False):
+        self.dropped.append((self.name, delete_documents))
+        if delete_documents:
+            for key in list(self.redis_client.scan_iter(match=f"doc:{self.name}:*")):
+                self.redis_client.delete(key)
+
+
+@pytest.fixture
+def redis_client(monkeypatch):
+    client = fakeredis.FakeRedis()
+    monkeypatch.setattr(client, "lock", lambda name, **options: StubLock(client, name, **options))
+    return client
+
+
+def _vector(seed, dimension=8):
+    return np.random.default_rng(seed).normal(size=dimension).astype(np.float32)
+
+
+def _install_index_stubs(monkeypatch, redis_client, on_indexing=None):
+    """fakeredis에 없는 FT.* 명령 대신 호출을 기록하는 대체물 설치"""
+    ft_commands, dropped = [], []
+    info = {
+        "index_name": "docs_v1",
+        "num_docs": 4,
+        "index_definition": ["key_type", "HASH", "prefixes", [OLD_PREFIX]],
+        "attributes": [["identifier", "embedding_vector", "attribute", "embedding_vector", "type", "VECTOR",
+                        "data_type", "FLOAT32", "dim", 8]],
+    }
+    monkeypatch.setattr(index_rebuild.RedisIndexDebugger, "get_index_info_or_none", lambda self, name: info)
+    monkeypatch.setattr(index_rebuild, "next_version", lambda client, alias: 2)
+    monkeypatch.setattr(VectorSearchIndex, "_ensure_index_exists", lambda self: None)
+
+    def fake_wait_for_indexing(client, name):
+        if on_indexing is not None:
+            on_indexing()
+        return True
+
+    monkeypatch.setattr(index_rebuild, "wait_for_indexing", fake_wait_for_indexing)
+    original_execute = redis_client.execute_command
+
+    def execute_command(*args, **options):
+        if str(args[0]).startswith("FT."):
+            ft_commands.append(args)
+            return b"OK"
+        return original_execute(*args, **options)
+
+    monkeypatch.setattr(redis_client, "execute_command", execute_command)
+    monkeypatch.setattr(redis_client, "ft", lambda name: FakeFT(redis_client, name, dropped))
+    return ft_commands, dropped
+
+
+def _worker_index(redis_client):
+    """아직 이전 버전 접두사로 쓰는 워커의 인덱스"""
+    worker = VectorSearchIndex(redis_client, index_name=ALIAS, vector_dimension=8)
+    worker.key_prefix = OLD_PREFIX
+    return worker
+
+
+def _keys(redis_client, prefix):
+    return sorted(key.decode()[len(prefix):] for key in redis_client.scan_iter(match=f"{prefix}*"))
+
+
+def test_rebuild_copies_switches_alias_and_propagates_deletes(redis_client, monkeypatch):
+    access_key = access_key_for(ALIAS)
+    for i, doc_id in enumerate("abcd"):
+        redis_client.hset(f"{OLD_PREFIX}{doc_id}", mapping={"text": doc_id, "embedding_vector": encode_vector(_vector(i))})
+        redis_client.zadd(access_key, {f"{OLD_PREFIX}{doc_id}": 10 + i})
+    redis_client.expire(f"{OLD_PREFIX}a", 600)
+    # 복사 중(전환 전) 삭제
+    ft_commands, dropped = _install_index_stubs(monkeypatch, redis_client,
+                                                on_indexing=lambda: worker.delete_document("b"))
+    worker = _worker_index(redis_client)
+
+    switched = []
+
+    def on_switched(new_name):
+        switched.append(new_name)
+        # 유예 시간 동안 아직 이전 접두사로 쓰는 워커의 저장과 삭제
+        redis_client.hset(f"{OLD_PREFIX}e", mapping={"text": "e", "embedding_vector": encode_vector(_vector(9))})
+        worker.delete_document("c")
+
+    rebuilder = IndexRebuilder(redis_client, ALIAS, vector_dimension=4, vector_type="FLOAT16",
+                               max_docs_per_second=None, grace_seconds=0, on_switched=on_switched)
+    report = rebuilder.run()
+
+    assert (report["copied"], report["caught_up"], report["deleted"]) == (4, 1, 2)
+    assert ("FT.ALIASUPDATE", ALIAS, "docs_v2") in ft_commands
+    assert switched == ["docs_v2"]
+    assert redis_client.get(generation_key_for(ALIAS)) is not None
+    assert dropped == [("docs_v1", True)]
+    # 삭제된 b, c는 새 버전에도 없고, 유예 시간에 저장된 e는 추가 복사됨
+    assert _keys(redis_client, NEW_PREFIX) == ["a", "d", "e"]
+    assert _keys(redis_client, OLD_PREFIX) == []
+    # 새 버전 접근 점수에서도 삭제 반영 (이전 접두사의 남은 점수는 스위퍼가 정리)
+    members = [member.decode() for member in redis_client.zrange(access_key, 0, -1)]
+    assert sorted(member for member in members if member.startswith(NEW_PREFIX)) == \
+        [f"{NEW_PREFIX}a", f"{NEW_PREFIX}d"]
+    assert redis_client.zscore(access_key, f"{NEW_PREFIX}d") == 13
+    assert 0 < redis_client.ttl(f"{NEW_PREFIX}a") <= 600
+    vector = decode_vector(redis_client.hget(f"{NEW_PREFIX}a", "embedding_vector"), "FLOAT16")
+    assert vector.shape == (4,)
+    # 락과 삭제 기록은 정리됨
+    assert redis_client.get(rebuild_lock_key(ALIAS)) is None
+    assert not redis_client.exists(rebuild_deletes_key(ALIAS))
+
+
+def test_deletes_are_recorded_only_while_rebuild_lock_is_held(redis_client, monkeypatch):
+    monkeypatch.setattr(VectorSearchIndex, "_ensure_index_exists", lambda self: None)
+    worker = _worker_index(redis_client)
+    for doc_id in "ab":
+        redis_client.hset(f"{OLD_PREFIX}{doc_id}", "text", doc_id)
+
+    assert worker.delete_document("a")
+    assert not redis_client.exists(rebuild_deletes_key(ALIAS))
+
+    redis_client.set(rebuild_lock_key(ALIAS), "rebuilder")
+    assert worker.delete_document("b")
+    assert redis_client.smembers(rebuild_deletes_key(ALIAS)) == {f"{OLD_PREFIX}b".encode()}
+
+
+def test_rebuild_lock_blocks_concurrent_rebuilds(redis_client, monkeypatch):
+    _install_index_stubs(monkeypatch, redis_client)
+    first = IndexRebuilder(redis_client, ALIAS, grace_seconds=0)
+    first._acquire_lock()
+
+    second = IndexRebuilder(redis_client, ALIAS, grace_seconds=0)
+    with pytest.raises(RuntimeError):
+        second.start()
+    with pytest.raises(RuntimeError):
+        second.run()
+    assert not second.is_running
+
+    first._release_lock()
+    assert redis_client.get(rebuild_lock_key(ALIAS)) is None
+    second._acquire_lock()
+    second._release_lock()
+
+
+def test_lost_lock_stops_before_alias_switch(redis_client, monkeypatch):
+    redis_client.hset(f"{OLD_PREFIX}a", mapping={"text": "a", "embedding_vector": encode_vector(_vector(0))})
+    rebuilder = IndexRebuilder(redis_client, ALIAS, max_docs_per_second=None, grace_seconds=0)
+
+    def lose_lock():
+        # 락이 만료되어 다른 프로세스가 잡은 상황 (갱신 스레드가 알아챘다고 가정)
+        rebuilder._lock_lost = True
+
+    ft_commands, dropped = _install_index_stubs(monkeypatch, redis_client, on_indexing=lose_lock)
+
+    with pytest.raises(RuntimeError):
+        rebuilder.run()
+    assert not any(command[0] == "FT.ALIASUPDATE" for command in ft_commands)
+    assert dropped == []
+    assert _keys(redis_client, OLD_PREFIX) == ["a"]
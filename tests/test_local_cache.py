@@ -0,0 +1,144 @@
+import fakeredis
+import numpy as np
+
+from app.redis import local_cache as local_cache_module
+from app.redis.cache_eviction import CacheEvictionPolicy, CacheSweeper
+from app.redis.local_cache import LocalAnswerCache
+from app.redis.numpy_backend import NumpyVectorIndex
+from app.redis.redis_handler import SemanticCacheHandler
+from tests.test_vector_backend import FakeEmbeddingModel
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+def test_ttl_expiry(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(local_cache_module.time, "monotonic", clock.monotonic)
+    cache = LocalAnswerCache(ttl_seconds=10)
+    cache.put("exact:a", "doc:a", "answer a", vector=[1, 0, 0])
+
+    assert cache.get_exact("exact:a").get("answer") == "answer a"
+    clock.now += 11
+    assert cache.get_exact("exact:a") is None
+    assert cache.get_similar([1, 0, 0], 0.9) is None
+    assert cache.stats()["expirations"] == 1
+    assert cache.stats()["entries"] == 0
+
+
+def test_entry_cap_evicts_least_recently_used():
+    cache = LocalAnswerCache(max_entries=2)
+    cache.put("exact:a", "doc:a", "a")
+    cache.put("exact:b", "doc:b", "b")
+    cache.get_exact("exact:a")
+    cache.put("exact:c", "doc:c", "c")
+
+    assert cache.get_exact("exact:b") is None
+    assert cache.get_exact("exact:a") is not None
+    assert cache.get_exact("exact:c") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_byte_cap():
+    answer = "x" * 4000
+    entry_mb = (local_cache_module._ENTRY_OVERHEAD_BYTES + len(answer)) / local_cache_module._MB
+    cache = LocalAnswerCache(max_entries=100, max_mb=entry_mb * 2.5)
+    for name in "abcd":
+        cache.put(f"exact:{name}", f"doc:{name}", answer)
+
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["estimated_mb"] <= stats["max_mb"]
+    assert cache.get_exact("exact:a") is None
+    assert cache.get_exact("exact:d") is not None
+
+    # 상한보다 큰 답변은 저장하지 않음
+    cache.put("exact:big", "doc:big", "x" * int(entry_mb * 3 * local_cache_module._MB))
+    assert cache.get_exact("exact:big") is None
+
+
+def test_invalidate_by_doc_key_removes_every_linked_entry():
+    cache = LocalAnswerCache()
+    cache.put("exact:q1", "doc:shared", "answer", vector=[1, 0, 0])
+    cache.put("exact:q2", "doc:shared", "answer", vector=[0, 1, 0])
+    cache.put("exact:other", "doc:other", "other")
+
+    assert cache.invalidate(["doc:shared"]) == 2
+    assert cache.get_exact("exact:q1") is None
+    assert cache.get_exact("exact:q2") is None
+    assert cache.get_similar([1, 0, 0], 0.5) is None
+    assert cache.get_exact("exact:other") is not None
+    # 정확 일치 키로도 무효화
+    assert cache.invalidate(["exact:other"]) == 1
+    assert cache.stats()["invalidations"] == 3
+
+
+def test_similar_lookup_accounts_for_distance_to_cached_question():
+    cache = LocalAnswerCache()
+    # 이전 쿼리는 캐시 항목 질문과 유사도 0.9로 히트했음
+    cache.put("exact:q", "doc:a", "answer", vector=[1, 0], similarity=0.9)
+
+    # 이전 쿼리와 같은 방향이면 항목 질문과의 유사도 하한은 0.9
+    hit = cache.get_similar([1, 0], 0.85)
+    assert hit is not None and abs(hit.similarity - 0.9) < 1e-5
+
+    # 이전 쿼리와 0.9 유사한 쿼리는 항목 질문과 0.9 미만일 수 있으므로 히트하지 않음
+    angle = np.arccos(0.9)
+    assert cache.get_similar([np.cos(angle), np.sin(angle)], 0.85) is None
+
+
+def test_similar_entries_are_not_returned_as_exact():
+    cache = LocalAnswerCache()
+    cache.put("exact:q", "doc:a", "다른 질문의 답변", vector=[1, 0], similarity=0.9, exact=False)
+
+    assert cache.get_exact("exact:q") is None
+    hit = cache.get_similar([1, 0], 0.85)
+    assert hit is not None and abs(hit.similarity - 0.9) < 1e-5
+
+    # 정확 일치 항목은 벡터 검색 결과로 덮어쓰지 않음
+    cache.put("exact:q", "doc:q", "정확한 답변")
+    cache.put("exact:q", "doc:a", "다른 질문의 답변", vector=[1, 0], similarity=0.9, exact=False)
+    assert cache.get_exact("exact:q").get("answer") == "정확한 답변"
+
+
+def test_semantic_hit_is_not_reported_as_exact_on_repeat():
+    model = FakeEmbeddingModel()
+    backend = NumpyVectorIndex(index_name="l1", vector_dimension=model.dimension)
+    cache = LocalAnswerCache()
+    handler = SemanticCacheHandler(embedding_model=model, redis_url=None, index_name="l1",
+                                   vector_backend=backend, local_cache=cache)
+    assert handler.save_qa_pair("해수면 상승 원인은?", "답변")
+
+    first = handler.search_similar_question("지구 온난화란?", score_threshold=-1.0)
+    assert first and first[0].similarity < 1.0
+
+    # 같은 질문을 다시 물어도 정확 일치 히트가 아니고, 원래 유사도로 L1에서 돌려줌
+    assert handler.search_exact_question("지구 온난화란?") is None
+    repeat = handler.search_similar_question("지구 온난화란?", score_threshold=-1.0)
+    assert repeat[0].key == first[0].key
+    assert abs(repeat[0].similarity - first[0].similarity) < 1e-3
+    assert cache.stats()["vector_hits"] == 1
+
+
+def test_local_hits_are_flushed_to_eviction_scores():
+    redis_client = fakeredis.FakeRedis()
+    policy = CacheEvictionPolicy(redis_client, "cache", policy="lfu")
+    policy.record_insert("doc:a")
+    policy.record_insert("doc:b")
+    cache = LocalAnswerCache()
+    cache.put("exact:a", "doc:a", "a", vector=[1, 0])
+    for _ in range(3):
+        assert cache.get_exact("exact:a") is not None
+    assert cache.get_similar([1, 0], 0.9) is not None
+
+    sweeper = CacheSweeper(policy, interval=0, local_cache=cache)
+    sweeper.flush_local_hits()
+
+    assert redis_client.zscore(policy.access_key, "doc:a") == 5
+    assert redis_client.zscore(policy.access_key, "doc:b") == 1
+    assert cache.drain_hits() == {}
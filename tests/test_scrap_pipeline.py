@@ -0,0 +1,245 @@
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from app.scrap_mcp.tool import page_fetch
+from app.scrap_mcp.tool.page_fetch import FetchedPage, PageFetcher
+
+
+async def test_page_fetcher_aclose_cancels_shielded_downloads(monkeypatch):
+    started = asyncio.Event()
+    cancelled = []
+
+    async def slow_fetch(method, url, timeout=None, **kwargs):
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(url)
+            raise
+
+    monkeypatch.setattr(page_fetch, "fetch", slow_fetch)
+    fetcher = PageFetcher()
+    caller = asyncio.ensure_future(fetcher.get("https://slow.example"))
+    await started.wait()
+
+    # 호출자를 취소해도 다운로드는 계속됨 (shield)
+    caller.cancel()
+    await asyncio.gather(caller, return_exceptions=True)
+    assert cancelled == []
+
+    await fetcher.aclose()
+    assert cancelled == ["https://slow.example"]
+    assert fetcher.downloads == 1
+
+
+async def test_page_fetcher_shares_one_download_per_url(monkeypatch):
+    calls = []
+
+    async def fake_fetch(method, url, timeout=None, **kwargs):
+        calls.append(url)
+        await asyncio.sleep(0)
+        return type("Response", (), {"status_code": 200, "content": b"ok", "charset_encoding": None})()
+
+    monkeypatch.setattr(page_fetch, "fetch", fake_fetch)
+    fetcher = PageFetcher()
+    pages = await asyncio.gather(*(fetcher.get("https://a.example") for _ in range(3)))
+
+    assert calls == ["https://a.example"]
+    assert all(isinstance(page, FetchedPage) and page.ok and page.text == "ok" for page in pages)
+    await fetcher.aclose()
+
+
+# mcp_module은 설정(app.config)과 검색/스크랩 도구 의존성이 필요
+_REQUIRED_SETTINGS = ("POSTGRES_PASSWORD", "DATABASE_URL", "SYNC_DATABASE_URL", "REDIS_URL", "SECRET_KEY",
+                      "OPENAI_API_KEY", "BRAVE_AI_API_KEY", "GOOGLE_API_KEY")
+
+
+@pytest.fixture
+def mcp_module(monkeypatch):
+    for module in ("pydantic_settings", "mcp", "trafilatura", "playwright", "openai", "bs4", "lxml", "dotenv"):
+        pytest.importorskip(module)
+    for name in _REQUIRED_SETTINGS:
+        monkeypatch.setenv(name, "test")
+    from app.scrap_mcp import mcp_module
+    return mcp_module
+
+
+class FakeScraper:
+    """URL별 지연과 결과를 정해 둔 _scrape_one 대체 (동시 실행 수와 취소 기록)"""
+
+    def __init__(self, delays, empty=()):
+        self.delays = delays
+        self.empty = set(empty)
+        self.started = []
+        self.cancelled = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, url, keywords, fetcher=None, all_sources=False):
+        self.started.append(url)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays[url])
+        except asyncio.CancelledError:
+            self.cancelled.append(url)
+            raise
+        finally:
+            self.in_flight -= 1
+        if url in self.empty:
+            return None
+        return {"url": url, "content": f"{url} 본문", "fetched_at": 0.0}
+
+
+async def test_scrape_until_returns_docs_in_rank_order(mcp_module, monkeypatch):
+    # 뒤 순위 URL이 먼저 끝나도 결과는 검색 순위대로
+    scraper = FakeScraper({"u0": 0.05, "u1": 0.01, "u2": 0.03, "u3": 0.02})
+    monkeypatch.setattr(mcp_module, "_scrape_one", scraper)
+
+    docs = await mcp_module.scrape_until(["u0", "u1", "u2", "u3"], ["k"], target_docs=4, concurrency=4)
+
+    assert [doc["url"] for doc in docs] == ["u0", "u1", "u2", "u3"]
+
+
+async def test_scrape_until_respects_concurrency_and_skips_empty(mcp_module, monkeypatch):
+    # 끝나는 순서: u0(빈 결과) → u2 → u1 → u4 (세 번째 문서에서 중단, u3는 취소)
+    delays = {"u0": 0.01, "u1": 0.03, "u2": 0.01, "u3": 0.05, "u4": 0.01, "u5": 0.01}
+    scraper = FakeScraper(delays, empty={"u0"})
+    monkeypatch.setattr(mcp_module, "_scrape_one", scraper)
+
+    docs = await mcp_module.scrape_until(list(delays), ["k"], target_docs=3, concurrency=2)
+
+    assert scraper.max_in_flight == 2
+    assert [doc["url"] for doc in docs] == ["u1", "u2", "u4"]
+    assert scraper.cancelled == ["u3"]
+    # 목표에 도달하면 남은 URL은 예약하지 않음
+    assert "u5" not in scraper.started
+
+
+async def test_scrape_until_cancels_pending_after_target(mcp_module, monkeypatch):
+    scraper = FakeScraper({"fast0": 0.01, "fast1": 0.01, "slow": 10.0})
+    monkeypatch.setattr(mcp_module, "_scrape_one", scraper)
+
+    docs = await asyncio.wait_for(
+        mcp_module.scrape_until(["slow", "fast0", "fast1"], ["k"], target_docs=2, concurrency=3), timeout=5
+    )
+
+    assert [doc["url"] for doc in docs] == ["fast0", "fast1"]
+    assert scraper.cancelled == ["slow"]
+
+
+async def test_scrape_until_cancels_tasks_when_caller_is_cancelled(mcp_module, monkeypatch):
+    scraper = FakeScraper({"a": 10.0, "b": 10.0})
+    monkeypatch.setattr(mcp_module, "_scrape_one", scraper)
+
+    task = asyncio.ensure_future(mcp_module.scrape_until(["a", "b"], ["k"], target_docs=1, concurrency=2))
+    while len(scraper.started) < 2:
+        await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert sorted(scraper.cancelled) == ["a", "b"]
+    assert scraper.in_flight == 0
+
+
+@pytest.fixture
+def scrap_main(monkeypatch):
+    for module in ("mcp", "trafilatura", "playwright", "bs4", "lxml", "dotenv"):
+        pytest.importorskip(module)
+    from app.scrap_mcp import main as scrap_main
+    # 프로세스 단위 카운터는 테스트마다 새로 시작
+    monkeypatch.setattr(scrap_main, "_tier_counters",
+                        {tier: {"used": 0, "succeeded": 0} for tier in scrap_main.EXTRACTION_TIERS})
+    monkeypatch.setattr(scrap_main, "_mode_counters", {"tiered": 0, "all_sources": 0, "failed": 0})
+    return scrap_main
+
+
+class FakeFetcher:
+    def __init__(self, status_code=200, content=b"<html>body</html>"):
+        self.status_code = status_code
+        self.content = content
+
+    async def get(self, url):
+        return FetchedPage(url, self.status_code, self.content)
+
+
+def _install_sources(monkeypatch, scrap_main, static, google, page):
+    """단계별 추출 결과를 고정하고 호출된 단계를 기록"""
+    calls = []
+
+    def fake_static(html):
+        calls.append("static")
+        return static
+
+    async def fake_google(url):
+        calls.append("google")
+        return google
+
+    async def fake_page(url):
+        calls.append("browser")
+        return page
+
+    monkeypatch.setattr(scrap_main, "extract_static", fake_static)
+    monkeypatch.setattr(scrap_main, "use_google", fake_google)
+    monkeypatch.setattr(scrap_main, "use_bing_n_page", fake_page)
+    return calls
+
+
+async def test_scrape_page_stops_at_static_tier(scrap_main, monkeypatch):
+    calls = _install_sources(monkeypatch, scrap_main, "정적 본문", {"description": "g"}, {"content": "p"})
+
+    result = json.loads(await scrap_main.scrape_page("https://a.example", "k", FakeFetcher()))
+
+    assert calls == ["static"]
+    assert result["normal"] == "정적 본문"
+    assert result["google"] == result["page"] == scrap_main._SKIPPED
+    stats = scrap_main.get_extraction_stats()
+    assert stats["tiers"]["static"] == {"used": 1, "succeeded": 1}
+    assert stats["tiers"]["google"]["used"] == stats["tiers"]["browser"]["used"] == 0
+    assert stats["modes"] == {"tiered": 1, "all_sources": 0, "failed": 0}
+
+
+async def test_scrape_page_escalates_to_google_when_static_fails(scrap_main, monkeypatch):
+    calls = _install_sources(monkeypatch, scrap_main, "Fail", {"description": "스니펫"}, {"content": "p"})
+
+    result = json.loads(await scrap_main.scrape_page("https://a.example", "k", FakeFetcher()))
+
+    assert calls == ["static", "google"]
+    assert result["google"] == {"description": "스니펫"}
+    assert result["page"] == scrap_main._SKIPPED
+    stats = scrap_main.get_extraction_stats()["tiers"]
+    assert stats["static"] == {"used": 1, "succeeded": 0}
+    assert stats["google"] == {"used": 1, "succeeded": 1}
+    assert stats["browser"]["used"] == 0
+
+
+async def test_scrape_page_falls_back_to_browser_and_counts_failure(scrap_main, monkeypatch):
+    # 다운로드 실패면 정적 추출은 실행하지 않고 실패로 처리
+    calls = _install_sources(monkeypatch, scrap_main, "정적 본문", {"description": ""}, {"content": ""})
+
+    result = json.loads(await scrap_main.scrape_page("https://a.example", "k", FakeFetcher(status_code=404)))
+
+    assert calls == ["google", "browser"]
+    assert result["normal"] == "Fail"
+    stats = scrap_main.get_extraction_stats()
+    assert all(counts == {"used": 1, "succeeded": 0} for counts in stats["tiers"].values())
+    assert stats["modes"] == {"tiered": 1, "all_sources": 0, "failed": 1}
+
+
+async def test_scrape_page_all_sources_runs_every_tier(scrap_main, monkeypatch):
+    calls = _install_sources(monkeypatch, scrap_main, "정적 본문", {"description": "g"}, {"content": ""})
+
+    result = json.loads(await scrap_main.scrape_page("https://a.example", "k", FakeFetcher(), all_sources=True))
+
+    assert sorted(calls) == ["browser", "google", "static"]
+    assert result["google"] == {"description": "g"}
+    stats = scrap_main.get_extraction_stats()
+    assert stats["tiers"]["static"] == {"used": 1, "succeeded": 1}
+    assert stats["tiers"]["google"] == {"used": 1, "succeeded": 1}
+    assert stats["tiers"]["browser"] == {"used": 1, "succeeded": 0}
+    assert stats["modes"] == {"tiered": 0, "all_sources": 1, "failed": 0}
@@ -0,0 +1,256 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from app.redis.numpy_backend import NumpyVectorIndex
+from app.redis.redis_handler import RedisVectorSearchHandler, SemanticCacheHandler
+from app.redis.search_filter import SearchFilter
+
+
+class FakeEmbeddingModel:
+    """텍스트별로 고정된 난수 벡터를 돌려주는 테스트용 임베딩 모델"""
+
+    def __init__(self, dimension=8):
+        self.dimension = dimension
+
+    def embed_many(self, texts):
+        return np.vstack([
+            np.random.default_rng(abs(hash(text)) % (2 ** 32)).normal(size=self.dimension).astype(np.float32)
+            for text in texts
+        ])
+
+
+def test_numpy_index_topk_matches_brute_force():
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(500, 16)).astype(np.float32)
+    index = NumpyVectorIndex(index_name="test", vector_dimension=16)
+    report = index.add_documents((str(i), v, {"text": f"doc {i}"}) for i, v in enumerate(vectors))
+    assert report["succeeded"] == 500
+
+    query = rng.normal(size=16).astype(np.float32)
+    hits = index.search_similar(query, top_k=5, score_threshold=-1.0)
+
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    expected = np.argsort(-(normalized @ (query / np.linalg.norm(query))))[:5]
+    assert [hit.key for hit in hits] == [f"doc:test:{i}" for i in expected]
+    assert hits[0].similarity >= hits[-1].similarity
+    assert hits[0].get("text") == f"doc {expected[0]}"
+
+
+def test_numpy_index_delete_and_persistence(tmp_path):
+    index = NumpyVectorIndex(index_name="persist", vector_dimension=4, persist_dir=str(tmp_path))
+    index.add_document("a", [1, 0, 0, 0], {"text": "a"})
+    index.add_document("b", [0, 1, 0, 0], {"text": "b"})
+    index.add_document("c", [0, 0, 1, 0], {"text": "c"})
+    assert index.delete_document("a")
+    assert not index.delete_document("a")
+    index.close()
+
+    reloaded = NumpyVectorIndex(index_name="persist", vector_dimension=4, persist_dir=str(tmp_path))
+    assert reloaded.get_index_info()["num_docs"] == 2
+    hits = reloaded.search_similar([0, 0, 1, 0], top_k=1, score_threshold=0.9)
+    assert [hit.key for hit in hits] == ["doc:persist:c"]
+
+
+def test_numpy_index_single_writes_flush_in_background(tmp_path, monkeypatch):
+    index = NumpyVectorIndex(index_name="lazy", vector_dimension=4, persist_dir=str(tmp_path), flush_interval=0.05)
+    flushes = []
+    original_flush = index.flush
+    monkeypatch.setattr(index, "flush", lambda: flushes.append(1) or original_flush())
+    for i in range(20):
+        index.add_document(str(i), [1, i, 0, 0], {"text": str(i)})
+    # 단건 쓰기마다 기록하지 않음
+    assert len(flushes) < 20
+
+    deadline = time.monotonic() + 2.0
+    while not flushes and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert flushes
+    index.close()
+    reloaded = NumpyVectorIndex(index_name="lazy", vector_dimension=4, persist_dir=str(tmp_path))
+    assert reloaded.get_index_info()["num_docs"] == 20
+
+
+def _wait_for_ann(index, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not index.get_index_info()["ann_lists"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert index.get_index_info()["ann_lists"]
+
+
+def test_numpy_index_ann_recall():
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(2000, 16)).astype(np.float32)
+    exact = NumpyVectorIndex(index_name="exact", vector_dimension=16)
+    approx = NumpyVectorIndex(index_name="exact", vector_dimension=16, ann=True, ann_min_size=100, ann_nprobe=16)
+    documents = [(str(i), v, {}) for i, v in enumerate(vectors)]
+    exact.add_documents(documents)
+    approx.add_documents(documents)
+    _wait_for_ann(approx)
+
+    queries = vectors[:20] + rng.normal(scale=0.1, size=(20, 16)).astype(np.float32)
+    matched = 0
+    for query in queries:
+        truth = {hit.key for hit in exact.search_similar(query, top_k=10, score_threshold=-1.0)}
+        matched += len(truth & {hit.key for hit in approx.search_similar(query, top_k=10, score_threshold=-1.0)})
+    assert matched / 200 >= 0.8
+
+
+def test_numpy_index_search_does_not_train_ann(monkeypatch):
+    rng = np.random.default_rng(2)
+    index = NumpyVectorIndex(index_name="ivf", vector_dimension=8, ann=True, ann_min_size=50)
+    release = threading.Event()
+    fits = []
+    original_fit = index._fit_centroids
+
+    def blocking_fit(vectors):
+        fits.append(len(vectors))
+        release.wait(5)
+        return original_fit(vectors)
+
+    monkeypatch.setattr(index, "_fit_centroids", blocking_fit)
+    vectors = rng.normal(size=(100, 8)).astype(np.float32)
+    index.add_documents((str(i), v, {}) for i, v in enumerate(vectors))
+    deadline = time.monotonic() + 5.0
+    while not fits and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # 학습이 끝나기 전에도 검색은 막히지 않고 정확 검색 결과를 돌려줌
+    for query in vectors[:10]:
+        hits = index.search_similar(query, top_k=1, score_threshold=-1.0)
+        assert hits[0].similarity > 0.999
+    assert index.get_index_info()["ann_lists"] == 0
+    assert fits == [100]
+
+    release.set()
+    _wait_for_ann(index)
+    for query in vectors[:10]:
+        index.search_similar(query, top_k=1, score_threshold=-1.0)
+    # 검색은 재학습을 일으키지 않음 (쓰기로 문서 수가 두 배가 될 때만)
+    assert fits == [100]
+    index.add_documents((f"more{i}", v, {}) for i, v in enumerate(rng.normal(size=(100, 8)).astype(np.float32)))
+    deadline = time.monotonic() + 5.0
+    while len(fits) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert fits == [100, 200]
+    index.close()
+
+
+@pytest.mark.parametrize("handler_cls", [RedisVectorSearchHandler, SemanticCacheHandler])
+def test_handlers_run_on_numpy_backend(handler_cls):
+    model = FakeEmbeddingModel()
+    backend = NumpyVectorIndex(index_name="handler", vector_dimension=model.dimension)
+    handler = handler_cls(embedding_model=model, redis_url=None, index_name="handler", vector_backend=backend)
+
+    if handler_cls is SemanticCacheHandler:
+        assert handler.save_qa_pair("지구 온난화란?", "답변")
+        hits = handler.search_similar_question("지구 온난화란?", score_threshold=0.99)
+        assert hits[0].get("answer") == "답변"
+        assert backend.get_index_info()["num_docs"] == 1
+    else:
+        assert handler.save_embedding("k1", "해수면 상승", {"source_url": "https://example.com"})
+        hits = handler.search_similar_embeddings("해수면 상승", similarity_threshold=0.99)
+        assert hits[0].key == "doc:handler:k1"
+        assert hits[0].get("source_url") == "https://example.com"
+        assert handler.delete_embedding("k1")
+        assert handler.get_index_info()["num_docs"] == 0
+
+
+def test_search_filter_prefilters_before_topk():
+    model = FakeEmbeddingModel()
+    backend = NumpyVectorIndex(index_name="filtered", vector_dimension=model.dimension)
+    handler = RedisVectorSearchHandler(embedding_model=model, redis_url=None, index_name="filtered",
+                                       vector_backend=backend)
+    handler.save_embedding("ipcc", "sea level rise report", {"source_url": "https://www.ipcc.ch/report"})
+    handler.save_embedding("blog", "sea level rise report", {"source_url": "https://blog.example.com/post"})
+    handler.save_embedding("old", "해수면 상승 보고서", {"source_url": "https://news.kbs.co.kr/a", "timestamp": 0})
+
+    search_filter = SearchFilter(domains=["ipcc.ch", "kbs.co.kr"], languages=["en"])
+    hits = handler.search_similar_embeddings("sea level rise report", top_k=1, similarity_threshold=-1.0,
+                                             search_filter=search_filter)
+    assert [hit.key for hit in hits] == ["doc:filtered:ipcc"]
+    assert search_filter.to_query() == r"(@domain:{ipcc\.ch|kbs\.co\.kr} @language:{en})"
+
+    fresh_korean = SearchFilter(languages=["ko"], max_age_days=30)
+    assert handler.search_similar_embeddings("해수면", similarity_threshold=-1.0, search_filter=fresh_korean) == []
+
+
+def test_search_result_cache_key_and_generation():
+    from app.redis.search_result_cache import SearchResultCache
+    from app.redis.vector_search import SearchHit
+
+    cache = SearchResultCache("document_index", ttl_seconds=30)
+    vector = np.random.default_rng(2).normal(size=16).astype(np.float32)
+    key = cache.result_key(vector, 5, 0.7, None, None, None, None)
+    assert cache.result_key(vector * 2 + 1e-7, 5, 0.7, None, None, None, None) == key
+    assert cache.result_key(vector, 3, 0.7, None, None, None, None) != key
+    assert cache.result_key(vector, 5, 0.7, None, None, None, SearchFilter(languages=["ko"])) != key
+
+    stored = cache.encode(b"3", [SearchHit("doc:document_index:a", 0.9, {"text": "a"})])
+    assert cache.decode(b"3", stored) == [["doc:document_index:a", 0.9, {"text": "a"}]]
+    assert cache.decode(b"4", stored) is None
+    assert cache.decode(b"4", None) is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["stale"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_cache_eviction_on_numpy_backend(monkeypatch):
+    import fakeredis
+    from app.redis import redis_handler
+    from app.redis.cache_eviction import CacheEvictionPolicy
+
+    redis_client = fakeredis.FakeRedis()
+    monkeypatch.setattr(redis_handler, "get_redis_client", lambda url: redis_client)
+    model = FakeEmbeddingModel()
+    backend = NumpyVectorIndex(index_name="evict", vector_dimension=model.dimension)
+    policy = CacheEvictionPolicy(redis_client, "evict", max_entries=3, vector_backend=backend)
+    handler = SemanticCacheHandler(embedding_model=model, redis_url="redis://fake", index_name="evict",
+                                   eviction_policy=policy, vector_backend=backend)
+
+    questions = [f"질문 {i}" for i in range(5)]
+    for question in questions:
+        assert handler.save_qa_pair(question, f"{question} 답변")
+    # 가장 먼저 저장한 항목을 히트해 LRU 점수를 올림
+    assert handler.search_similar_question(questions[0], score_threshold=0.99)
+
+    # 항목이 Redis 키가 아니어도 만료 처리하지 않음
+    assert policy._prune_expired() == 0
+    result = policy.sweep()
+    assert result["evicted_size"] == 2
+    assert backend.get_index_info()["num_docs"] == 3
+    assert redis_client.zcard(policy.access_key) == 3
+    assert handler.search_exact_question(questions[0]) is not None
+    assert handler.search_exact_question(questions[1]) is None
+    assert handler.search_exact_question(questions[2]) is None
+
+    # 만료 시각이 지난 항목은 백엔드에서도 삭제
+    monkeypatch.setattr("app.redis.cache_eviction.time.time", lambda: 1e12)
+    assert policy.sweep()["expired"] == 3
+    assert backend.get_index_info()["num_docs"] == 0
+    assert redis_client.hlen(policy.entries_key) == 0
+
+
+def test_similar_search_records_hit_only_for_returned_answer(monkeypatch):
+    import fakeredis
+    from app.redis import redis_handler
+    from app.redis.cache_eviction import CacheEvictionPolicy
+
+    redis_client = fakeredis.FakeRedis()
+    monkeypatch.setattr(redis_handler, "get_redis_client", lambda url: redis_client)
+    model = FakeEmbeddingModel()
+    backend = NumpyVectorIndex(index_name="hits", vector_dimension=model.dimension)
+    policy = CacheEvictionPolicy(redis_client, "hits", policy="lfu", vector_backend=backend)
+    handler = SemanticCacheHandler(embedding_model=model, redis_url="redis://fake", index_name="hits",
+                                   eviction_policy=policy, vector_backend=backend)
+    for i in range(3):
+        assert handler.save_qa_pair(f"질문 {i}", f"답변 {i}")
+
+    results = handler.search_similar_question("질문 0", top_k=3, score_threshold=-1.0)
+
+    assert len(results) == 3
+    scores = {member.decode(): score for member, score in redis_client.zrange(policy.access_key, 0, -1,
+                                                                               withscores=True)}
+    best = max(results, key=lambda hit: hit.similarity).key
+    assert scores.pop(best) == 2
+    assert set(scores.values()) == {1}
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from app.redis.vector_codec import bytes_per_vector, decode_vector, encode_vector, reduce_dimension
+
+
+def _from_bits(bits):
+    return np.array(bits, dtype=np.uint32).view(np.float32)
+
+
+@pytest.mark.parametrize("vector_type", ["FLOAT32", "FLOAT16", "BFLOAT16"])
+def test_round_trip_keeps_special_values(vector_type):
+    vector = np.array([0.0, -0.0, 1.0, -2.5, np.inf, -np.inf, np.nan], dtype=np.float32)
+
+    data = encode_vector(vector, vector_type)
+    decoded = decode_vector(data, vector_type)
+
+    assert len(data) == bytes_per_vector(len(vector), vector_type)
+    assert decoded.dtype == np.float32
+    np.testing.assert_array_equal(decoded[:6], vector[:6])
+    assert np.signbit(decoded[1])
+    assert np.isnan(decoded[6])
+
+
+@pytest.mark.parametrize("vector_type, tolerance", [("FLOAT32", 0.0), ("FLOAT16", 1e-3), ("BFLOAT16", 8e-3)])
+def test_round_trip_relative_error(vector_type, tolerance):
+    vector = np.random.default_rng(0).normal(size=256).astype(np.float32)
+
+    decoded = decode_vector(encode_vector(vector, vector_type), vector_type)
+
+    assert np.max(np.abs(decoded - vector) / np.abs(vector)) <= tolerance
+
+
+def test_bfloat16_rounds_ties_to_even():
+    vector = _from_bits([
+        0x3F808000,  # 상위 0x3F80(짝수)와 0x3F81의 정확히 중간 -> 짝수로 내림
+        0x3F818000,  # 상위 0x3F81(홀수)와 0x3F82의 정확히 중간 -> 짝수로 올림
+        0x3F808001,  # 중간보다 크면 올림
+        0x3F807FFF,  # 중간보다 작으면 내림
+        0x7F7FFFFF,  # float32 최댓값은 bfloat16 범위를 넘어 inf
+    ])
+
+    encoded = np.frombuffer(encode_vector(vector, "BFLOAT16"), dtype=np.uint16)
+
+    assert encoded.tolist() == [0x3F80, 0x3F82, 0x3F81, 0x3F80, 0x7F80]
+
+
+def test_bfloat16_keeps_nan_payloads_as_nan():
+    # 하위 비트만 있는 NaN도 반올림으로 inf(0x7F80)나 0(자리올림)이 되지 않음
+    vector = _from_bits([0x7F800001, 0xFFFFFFFF, 0x7FC00000])
+
+    decoded = decode_vector(encode_vector(vector, "BFLOAT16"), "BFLOAT16")
+
+    assert np.isnan(decoded).all()
+    assert np.signbit(decoded[1])
+
+
+@pytest.mark.parametrize("vector_type", ["FLOAT32", "FLOAT16", "BFLOAT16"])
+def test_reduced_dimension_round_trip(vector_type):
+    vectors = np.random.default_rng(1).normal(size=(4, 64)).astype(np.float32)
+
+    reduced = reduce_dimension(vectors, 16)
+    decoded = np.vstack([decode_vector(encode_vector(row, vector_type), vector_type) for row in reduced])
+
+    assert reduced.shape == (4, 16)
+    np.testing.assert_allclose(np.linalg.norm(reduced, axis=1), 1.0, rtol=1e-6)
+    np.testing.assert_allclose(reduced, vectors[:, :16] / np.linalg.norm(vectors[:, :16], axis=1, keepdims=True),
+                               rtol=1e-6)
+    np.testing.assert_allclose(decoded, reduced, atol=1e-2)
+    # 축소한 뒤에도 같은 방향 (코사인 유사도 ~1)
+    cosine = np.sum(decoded * reduced, axis=1) / np.linalg.norm(decoded, axis=1)
+    assert np.all(cosine > 0.9999)
+
+
+def test_reduce_dimension_rejects_larger_dimension():
+    with pytest.raises(ValueError):
+        reduce_dimension(np.ones((2, 8), dtype=np.float32), 16)
@@ -0,0 +1,96 @@
+import fakeredis
+import numpy as np
+
+from app.redis import vector_migration
+from app.redis.vector_codec import decode_vector, encode_vector, reduce_dimension
+from app.redis.vector_scan import iter_doc_keys, normalize_rows, read_vectors
+from app.redis.vector_search import SearchHit
+
+PREFIX = "doc:mig:"
+
+
+class FakeFT:
+    """fakeredis에 없는 FT.* 중 마이그레이션이 쓰는 명령만 흉내"""
+
+    def __init__(self):
+        self.dropped = []
+
+    def dropindex(self, delete_documents=False):
+        self.dropped.append(delete_documents)
+
+    def info(self):
+        return {"indexing": 0}
+
+
+class BruteForceIndex:
+    """새 인덱스 대신 저장된 (재인코딩된) 벡터로 정확 검색"""
+
+    def __init__(self, redis_client, index_name, vector_dimension, distance_metric, vector_type):
+        self.redis_client = redis_client
+        self.vector_dimension = vector_dimension
+        self.vector_type = vector_type
+
+    def _refresh_state(self):
+        pass
+
+    def search_similar(self, query, top_k, score_threshold, return_fields):
+        keys, vectors = read_vectors(self.redis_client, list(iter_doc_keys(self.redis_client, PREFIX, 100)),
+                                     self.vector_type, self.vector_dimension)
+        scores = normalize_rows(vectors) @ (query / np.linalg.norm(query))
+        return [SearchHit(keys[i].decode(), float(scores[i]), {}) for i in np.argsort(-scores)[:top_k]]
+
+
+def _index_info(vector_type, dimension):
+    return {
+        "index_name": "mig",
+        "index_definition": ["key_type", "HASH", "prefixes", [PREFIX]],
+        "attributes": [["identifier", "embedding_vector", "attribute", "embedding_vector", "type", "VECTOR",
+                        "algorithm", "HNSW", "data_type", vector_type, "dim", dimension]],
+    }
+
+
+def test_migrate_index_reencodes_reduces_and_reports_recall(monkeypatch):
+    redis_client = fakeredis.FakeRedis()
+    vectors = np.random.default_rng(0).normal(size=(60, 32)).astype(np.float32)
+    # text-embedding-3처럼 앞쪽 성분에 정보가 몰린 벡터 (축소해도 이웃이 대부분 유지)
+    vectors[:, 16:] *= 0.1
+    for i, vector in enumerate(vectors):
+        redis_client.hset(f"{PREFIX}{i}", mapping={"text": str(i), "embedding_vector": encode_vector(vector)})
+    # 형식이 다른 벡터는 건너뜀
+    redis_client.hset(f"{PREFIX}broken", mapping={"text": "x", "embedding_vector": b"\x00" * 10})
+
+    ft = FakeFT()
+    monkeypatch.setattr(redis_client, "ft", lambda name: ft)
+    monkeypatch.setattr(vector_migration.RedisIndexDebugger, "get_index_info_or_none",
+                        lambda self, name: _index_info("FLOAT32", 32))
+    monkeypatch.setattr(vector_migration, "VectorSearchIndex", BruteForceIndex)
+
+    report = vector_migration.migrate_index(redis_client, "mig", "FLOAT16", target_dimension=16,
+                                            sample_size=10, k=5, batch_size=7)
+
+    assert ft.dropped == [False]
+    assert report["converted"] == 60
+    assert report["skipped"] == 1
+    assert report["bytes_per_vector"] == {"before": 128, "after": 32}
+    assert report["sample_size"] == 10
+    assert report["recall_at_k"] >= 0.8
+    expected = reduce_dimension(vectors, 16)
+    for i in (0, 17, 59):
+        stored = redis_client.hget(f"{PREFIX}{i}", "embedding_vector")
+        np.testing.assert_allclose(decode_vector(stored, "FLOAT16"), expected[i], atol=1e-3)
+    # 벡터 외 필드는 그대로
+    assert redis_client.hget(f"{PREFIX}0", "text") == b"0"
+
+
+def test_migrate_index_is_noop_when_format_already_matches(monkeypatch):
+    redis_client = fakeredis.FakeRedis()
+    redis_client.hset(f"{PREFIX}0", "embedding_vector", encode_vector(np.ones(8), "BFLOAT16"))
+    ft = FakeFT()
+    monkeypatch.setattr(redis_client, "ft", lambda name: ft)
+    monkeypatch.setattr(vector_migration.RedisIndexDebugger, "get_index_info_or_none",
+                        lambda self, name: _index_info("BFLOAT16", 8))
+
+    report = vector_migration.migrate_index(redis_client, "mig", "BFLOAT16")
+
+    assert report["converted"] == 0
+    assert ft.dropped == []